@@ -29,6 +29,8 @@ load_dotenv(project_root / '.env', override=False)  # Don't override .env.local
 REDDIT_PUBLIC = os.getenv("REDDIT_PUBLIC", "your_reddit_public_key_here")
 REDDIT_SECRET = os.getenv("REDDIT_SECRET", "your_reddit_secret_key_here")
 REDDIT_USER_AGENT = os.getenv("REDDIT_USER_AGENT", "project:RedditHarbor (by /u/your_username)")
+# Additional app credentials (REDDIT_PUBLIC_2 / REDDIT_SECRET_2 / REDDIT_USER_AGENT_2, ...)
+# are pooled by core.utils.reddit_client_pool.RedditClientPool to add their rate limits
 
 # Supabase Configuration
 SUPABASE_URL = os.getenv("SUPABASE_URL", "http://127.0.0.1:54321")
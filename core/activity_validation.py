@@ -10,6 +10,11 @@ Main Functions:
 - collect_activity_metrics(): Detailed metrics collection from Reddit API
 - calculate_trending_score(): Trending analysis based on activity patterns
 - get_active_subreddits(): Filter subreddits by minimum activity thresholds
+- snapshot_active_subreddits(): Measure candidates (concurrently with a
+  RedditClientPool), keeping the metrics and scores so callers never
+  re-collect them
+- prefetch_subreddits(): Hydrate subreddit metadata 100 names per request
+  through /api/info instead of one lazy fetch per subreddit
 
 Usage:
     from core.activity_validation import (
@@ -27,16 +32,29 @@ Usage:
 """
 
 import logging
-import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
 
 import praw
 
+from core.utils.rate_limiter import RequestRateLimiter
+from core.utils.reddit_client_pool import RedditClientPool
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Listing requests made by collect_activity_metrics() for one subreddit
+REQUESTS_PER_ACTIVITY_MEASUREMENT = 3
+
+# Request made by the first attribute access on a lazy PRAW Subreddit
+REQUESTS_PER_SUBREDDIT_FETCH = 1
+
+# Maximum subreddit names resolved by one /api/info request
+INFO_BATCH_SIZE = 100
+
 
 class TimeFilter(Enum):
     """Time filter options for Reddit API calls."""
@@ -110,42 +128,13 @@ def calculate_activity_score(
         # Collect detailed metrics
         metrics = collect_activity_metrics(subreddit, time_filter)
 
-        # Calculate weighted components
-        # Recent comments score (40% weight)
-        comments_score = min(
-            100, metrics.recent_comments_count / 10
-        )  # Normalize to 0-100
-        comments_weight = 0.40
-
-        # Post engagement score (30% weight)
-        engagement_score = min(100, metrics.post_engagement_score)
-        engagement_weight = 0.30
-
-        # Subscriber base score (20% weight) - logarithmic scaling
-        subscriber_score = min(100, min(90, metrics.subscriber_base_score))
-        subscriber_weight = 0.20
-
-        # Active users score (10% weight)
-        active_users_score = min(100, metrics.active_users_score)
-        active_users_weight = 0.10
-
-        # Calculate weighted average
-        activity_score = (
-            comments_score * comments_weight
-            + engagement_score * engagement_weight
-            + subscriber_score * subscriber_weight
-            + active_users_score * active_users_weight
-        )
+        activity_score = score_activity_metrics(metrics)
 
         logger.info(
             f"Activity score for r/{subreddit.display_name}: {activity_score:.2f}"
         )
-        logger.debug(
-            f"Components: comments={comments_score:.1f}, engagement={engagement_score:.1f}, "
-            f"subscribers={subscriber_score:.1f}, active_users={active_users_score:.1f}"
-        )
 
-        return round(activity_score, 2)
+        return activity_score
 
     except Exception as e:
         logger.error(
@@ -154,6 +143,54 @@ def calculate_activity_score(
         return 0.0
 
 
+def score_activity_metrics(metrics: ActivityMetrics) -> float:
+    """
+    Combine collected metrics into the weighted activity score.
+
+    Pure function over already-collected metrics, so callers that also need
+    the metrics themselves (e.g. the DLT source) can score without a second
+    round of API calls.
+
+    Args:
+        metrics: ActivityMetrics from collect_activity_metrics()
+
+    Returns:
+        Activity score between 0-100
+    """
+    # Recent comments score (40% weight)
+    comments_score = min(
+        100, metrics.recent_comments_count / 10
+    )  # Normalize to 0-100
+    comments_weight = 0.40
+
+    # Post engagement score (30% weight)
+    engagement_score = min(100, metrics.post_engagement_score)
+    engagement_weight = 0.30
+
+    # Subscriber base score (20% weight) - logarithmic scaling
+    subscriber_score = min(100, min(90, metrics.subscriber_base_score))
+    subscriber_weight = 0.20
+
+    # Active users score (10% weight)
+    active_users_score = min(100, metrics.active_users_score)
+    active_users_weight = 0.10
+
+    # Calculate weighted average
+    activity_score = (
+        comments_score * comments_weight
+        + engagement_score * engagement_weight
+        + subscriber_score * subscriber_weight
+        + active_users_score * active_users_weight
+    )
+
+    logger.debug(
+        f"Components: comments={comments_score:.1f}, engagement={engagement_score:.1f}, "
+        f"subscribers={subscriber_score:.1f}, active_users={active_users_score:.1f}"
+    )
+
+    return round(activity_score, 2)
+
+
 def collect_activity_metrics(
     subreddit: praw.models.Subreddit, time_filter: str = "day"
 ) -> ActivityMetrics:
@@ -602,55 +639,213 @@ def get_active_subreddits(
     Returns:
         List of PRAW Subreddit objects that meet the activity threshold
     """
+    snapshot = snapshot_active_subreddits(
+        reddit_client, candidate_subreddits, time_filter, min_activity_score, max_workers=1
+    )
+    return [activity.subreddit for activity in snapshot]
+
+
+@dataclass
+class SubredditActivity:
+    """Activity measurements for one subreddit, collected once and shared."""
+
+    subreddit: praw.models.Subreddit
+    metrics: ActivityMetrics
+    activity_score: float
+    trending_score: float
+
+
+def prefetch_subreddits(
+    reddit_client: praw.Reddit,
+    subreddit_names: Iterable[str],
+    rate_limiter: RequestRateLimiter | None = None,
+) -> dict[str, praw.models.Subreddit]:
+    """
+    Resolve subreddit metadata in batches through Reddit's /api/info endpoint.
+
+    A lazy ``reddit.subreddit(name)`` costs one /about request on its first
+    attribute access. ``reddit.info(subreddits=...)`` returns fully populated
+    Subreddit objects for up to INFO_BATCH_SIZE names per request, so reading
+    ``subscribers``, ``subreddit_type``, ``over18`` etc. afterwards is free.
+
+    Names Reddit does not return (nonexistent or banned subreddits) are left
+    out of the result. If the lookup fails, an empty dict is returned and
+    callers fall back to lazy objects.
+
+    Args:
+        reddit_client: PRAW Reddit client instance
+        subreddit_names: Subreddit names (without 'r/')
+        rate_limiter: Optional shared limiter; charged one request per batch
+
+    Returns:
+        Dict mapping lowercased subreddit name to hydrated PRAW Subreddit
+    """
+    names = list(dict.fromkeys(subreddit_names))
+    if not names:
+        return {}
+
+    if rate_limiter is not None:
+        rate_limiter.acquire(-(-len(names) // INFO_BATCH_SIZE))
+
+    try:
+        hydrated = {
+            subreddit.display_name.lower(): subreddit
+            for subreddit in reddit_client.info(subreddits=names)
+        }
+    except Exception as e:
+        logger.warning(f"Subreddit metadata prefetch failed, using lazy lookups: {e}")
+        return {}
+
     logger.info(
-        f"Filtering {len(candidate_subreddits)} candidate subreddits with min_score={min_activity_score}"
+        f"Prefetched metadata for {len(hydrated)}/{len(names)} subreddits "
+        f"in {-(-len(names) // INFO_BATCH_SIZE)} request(s)"
     )
+    return hydrated
 
-    active_subreddits = []
-    failed_subreddits = []
 
-    for subreddit_name in candidate_subreddits:
-        try:
-            # Get subreddit object
-            subreddit = reddit_client.subreddit(subreddit_name)
+def measure_subreddit_activity(
+    subreddit: praw.models.Subreddit,
+    time_filter: str = "day",
+    rate_limiter: RequestRateLimiter | None = None,
+    prefetched: bool = False,
+) -> SubredditActivity | None:
+    """
+    Collect metrics for one subreddit and score them.
 
-            # Validate subreddit exists and is accessible
-            if not validate_subreddit_accessible(subreddit):
-                logger.warning(f"Subreddit r/{subreddit_name} is not accessible")
-                failed_subreddits.append(subreddit_name)
-                continue
+    Metrics are collected exactly once; the activity and trending scores are
+    derived from them without further API calls.
 
-            # Calculate activity score
-            activity_score = calculate_activity_score(subreddit, time_filter)
+    Args:
+        subreddit: PRAW Subreddit object
+        time_filter: Time period for analysis
+        rate_limiter: Optional shared limiter; charged for the requests made
+        prefetched: True if the subreddit came from prefetch_subreddits(),
+            so reading its metadata makes no request
 
-            # Check if meets threshold
-            if activity_score >= min_activity_score:
-                logger.info(
-                    f"✅ r/{subreddit_name}: ACTIVE (score: {activity_score:.2f})"
-                )
-                active_subreddits.append(subreddit)
-            else:
-                logger.debug(
-                    f"❌ r/{subreddit_name}: Inactive (score: {activity_score:.2f} < {min_activity_score})"
-                )
+    Returns:
+        SubredditActivity, or None if the subreddit is not accessible
+    """
+    if rate_limiter is not None:
+        cost = REQUESTS_PER_ACTIVITY_MEASUREMENT
+        if not prefetched:
+            cost += REQUESTS_PER_SUBREDDIT_FETCH
+        rate_limiter.acquire(cost)
+
+    if not validate_subreddit_accessible(subreddit):
+        logger.warning(f"Subreddit r/{getattr(subreddit, 'display_name', 'unknown')} is not accessible")
+        return None
+
+    metrics = collect_activity_metrics(subreddit, time_filter)
+    return SubredditActivity(
+        subreddit=subreddit,
+        metrics=metrics,
+        activity_score=score_activity_metrics(metrics),
+        trending_score=calculate_trending_score(metrics),
+    )
 
-            # Rate limiting between requests
-            time.sleep(1)
 
-        except Exception as e:
-            logger.warning(f"Error processing subreddit r/{subreddit_name}: {e}")
-            failed_subreddits.append(subreddit_name)
+def snapshot_active_subreddits(
+    reddit_client: praw.Reddit | RedditClientPool,
+    candidate_subreddits: list[str],
+    time_filter: str = "day",
+    min_activity_score: float = 50.0,
+    max_workers: int = 1,
+    rate_limiter: RequestRateLimiter | None = None,
+    prefetch: bool = True,
+) -> list[SubredditActivity]:
+    """
+    Measure candidate subreddits and keep the active ones.
+
+    PRAW clients are not thread-safe, so each worker gets a client of its
+    own: with a RedditClientPool up to ``max_workers`` threads (at most one
+    per credential) each prefetch and measure a share of the candidates on
+    their own client. A single praw.Reddit is always measured sequentially.
+    Metadata is prefetched in /api/info batches, and the shared
+    ``rate_limiter`` (rather than a fixed sleep per subreddit) keeps the
+    combined request rate inside the budget. Results keep the candidates'
+    order.
+
+    Args:
+        reddit_client: PRAW Reddit client instance or RedditClientPool
+        candidate_subreddits: List of subreddit names to check
+        time_filter: Time period for activity analysis
+        min_activity_score: Minimum activity score threshold (0-100)
+        max_workers: Concurrent measurements (only with a RedditClientPool)
+        rate_limiter: Optional shared request limiter
+        prefetch: Batch-resolve subreddit metadata before measuring
+
+    Returns:
+        List of SubredditActivity for subreddits meeting the threshold
+    """
+    if isinstance(reddit_client, RedditClientPool):
+        clients = [member.client for member in reddit_client.members][: max(1, max_workers)]
+    else:
+        if max_workers > 1:
+            logger.debug("A single PRAW client is not thread-safe; measuring sequentially")
+        clients = [reddit_client]
+
+    logger.info(
+        f"Filtering {len(candidate_subreddits)} candidate subreddits with "
+        f"min_score={min_activity_score} (workers={len(clients)})"
+    )
+
+    failed_subreddits = []
+
+    def measure_share(client: praw.Reddit, names: list[str]) -> list[SubredditActivity | None]:
+        hydrated = prefetch_subreddits(client, names, rate_limiter) if prefetch else {}
+        measured = []
+        for subreddit_name in names:
+            try:
+                subreddit = hydrated.get(subreddit_name.lower())
+                prefetched = subreddit is not None
+                if not prefetched:
+                    subreddit = client.subreddit(subreddit_name)
+                activity = measure_subreddit_activity(
+                    subreddit, time_filter, rate_limiter, prefetched=prefetched
+                )
+            except Exception as e:
+                logger.warning(f"Error processing subreddit r/{subreddit_name}: {e}")
+                activity = None
+
+            if activity is None:
+                failed_subreddits.append(subreddit_name)
+            measured.append(activity)
+        return measured
+
+    if len(clients) == 1:
+        measured = measure_share(clients[0], candidate_subreddits)
+    else:
+        # Worker i takes every len(clients)-th candidate from offset i
+        shares = [candidate_subreddits[i :: len(clients)] for i in range(len(clients))]
+        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+            results = list(executor.map(measure_share, clients, shares))
+        measured = [None] * len(candidate_subreddits)
+        for i, result in enumerate(results):
+            measured[i :: len(clients)] = result
+
+    active = []
+    for subreddit_name, activity in zip(candidate_subreddits, measured, strict=True):
+        if activity is None:
             continue
+        if activity.activity_score >= min_activity_score:
+            logger.info(
+                f"✅ r/{subreddit_name}: ACTIVE (score: {activity.activity_score:.2f})"
+            )
+            active.append(activity)
+        else:
+            logger.debug(
+                f"❌ r/{subreddit_name}: Inactive (score: {activity.activity_score:.2f} < {min_activity_score})"
+            )
 
     logger.info(
-        f"Found {len(active_subreddits)} active subreddits out of {len(candidate_subreddits)} candidates"
+        f"Found {len(active)} active subreddits out of {len(candidate_subreddits)} candidates"
     )
     if failed_subreddits:
         logger.warning(
             f"Failed to process {len(failed_subreddits)} subreddits: {failed_subreddits}"
         )
 
-    return active_subreddits
+    return active
 
 
 def validate_subreddit_accessible(subreddit: praw.models.Subreddit) -> bool:
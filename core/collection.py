@@ -10,9 +10,12 @@ import logging
 import re
 import time
 import traceback
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from core.fetchers.high_water_marks import HighWaterMarkStore
+from core.storage.buffered_sink import DEFAULT_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL, BufferedSink
+
 logger = logging.getLogger(__name__)
 
 # Strategic subreddit lists for monetizable app research
@@ -51,6 +54,13 @@ TARGET_SUBREDDITS = {
 
 ALL_TARGET_SUBREDDITS = [subreddit for category in TARGET_SUBREDDITS.values() for subreddit in category]
 
+# submissions and comments are partitioned by month on created_utc, so their
+# unique constraints include it; the keys alone are unique through the
+# <table>_keys tables (migration 20251129000000). Upsert with
+# upsert_partitioned().
+SUBMISSION_CONFLICT_KEY = "submission_id,created_utc"
+COMMENT_CONFLICT_KEY = "comment_id,created_utc"
+
 # Problem and solution keyword sets for opportunity identification
 PROBLEM_KEYWORDS = [
     "pain", "problem", "frustrated", "wish", "if only", "hate", "annoying", "difficult",
@@ -95,18 +105,21 @@ def collect_data(
     limit: int = 100,
     sort_types: list[str] | None = None,
     mask_pii: bool = True,
+    high_water_marks: HighWaterMarkStore | None = None,
 ) -> bool:
     """
     Collect Reddit data and store it in Supabase database.
 
     Args:
-        reddit_client: Reddit API client
+        reddit_client: Reddit API client (praw.Reddit or RedditClientPool)
         supabase_client: Supabase database client
         db_config: Database table configuration
         subreddits: List of subreddits to collect from
         limit: Maximum number of posts to collect per subreddit
         sort_types: Sort types to use ("hot", "new", "top", etc.)
         mask_pii: Whether to mask personally identifiable information
+        high_water_marks: Optional store of per-subreddit marks; 'new' listings
+            stop at the newest submission stored by the previous run
 
     Returns:
         bool: True if collection successful, False otherwise
@@ -119,7 +132,8 @@ def collect_data(
 
         # Collect submissions
         submissions_success = collect_submissions(
-            reddit_client, supabase_client, db_config, subreddits, limit, sort_types, mask_pii
+            reddit_client, supabase_client, db_config, subreddits, limit, sort_types, mask_pii,
+            high_water_marks=high_water_marks,
         )
 
         # CRITICAL: Collect comments for all submissions
@@ -143,8 +157,14 @@ def collect_submissions(
     limit: int,
     sort_types: list[str],
     mask_pii: bool,
+    high_water_marks: HighWaterMarkStore | None = None,
 ) -> bool:
-    """Collect submissions from specified subreddits"""
+    """Collect submissions from specified subreddits
+
+    When ``high_water_marks`` is given, 'new' listings stop at the newest
+    submission seen by the previous run and the marks are saved once all
+    subreddits have been stored.
+    """
     try:
         logger.info(f"📝 Collecting submissions from {len(subreddits)} subreddits")
 
@@ -170,6 +190,11 @@ def collect_submissions(
                         else:
                             submissions = subreddit.hot(limit=limit)
 
+                        if high_water_marks is not None:
+                            submissions = high_water_marks.iter_unseen(
+                                submissions, subreddit_name, sort_type
+                            )
+
                         for submission in submissions:
                             try:
                                 # Store submission data
@@ -180,7 +205,7 @@ def collect_submissions(
                                     "subreddit": subreddit_name,
                                     "score": submission.score,
                                     "num_comments": submission.num_comments,
-                                    "created_utc": datetime.fromtimestamp(submission.created_utc).isoformat(),
+                                    "created_utc": reddit_created_utc(submission.created_utc),
                                     "url": submission.url,
                                     "selftext": submission.selftext[:1000] if submission.selftext else "",
                                     "permalink": submission.permalink,
@@ -193,9 +218,10 @@ def collect_submissions(
                                     submission_data = apply_pii_masking(submission_data)
 
                                 # Store in Supabase
-                                result = supabase_client.table(db_config["submission"]).upsert(
-                                    submission_data, on_conflict="submission_id"
-                                ).execute()
+                                result = upsert_partitioned(
+                                    supabase_client, db_config["submission"], [submission_data],
+                                    SUBMISSION_CONFLICT_KEY
+                                )
 
                                 if result.data:
                                     subreddit_submissions += 1
@@ -222,6 +248,9 @@ def collect_submissions(
                 logger.error(f"  ❌ Failed to process r/{subreddit_name}: {e}")
                 continue
 
+        if high_water_marks is not None:
+            high_water_marks.save()
+
         logger.info(f"✅ Submission collection complete: {total_submissions} submissions from {successful_subreddits}/{len(subreddits)} subreddits")
         return True
 
@@ -251,7 +280,7 @@ def collect_comments_for_submissions(
         logger.info(f"⏰ Processing submissions from last {max_age_hours} hours")
 
         # Get recent submissions that need comments
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+        cutoff_time = datetime.now(UTC) - timedelta(hours=max_age_hours)
 
         total_comments_collected = 0
         processed_submissions = 0
@@ -261,9 +290,12 @@ def collect_comments_for_submissions(
                 logger.info(f"  💬 Processing comments for r/{subreddit_name}")
 
                 # Get recent submissions from this subreddit that have comments
-                submissions_query = supabase_client.table(db_config["submission"]).select(
-                    "submission_id,title,num_comments,created_utc"
-                ).eq("subreddit", subreddit_name).gte("created_utc", cutoff_time.isoformat()).gt("num_comments", 0).limit(50)
+                submissions_query = created_utc_window(
+                    supabase_client.table(db_config["submission"]).select(
+                        "submission_id,title,num_comments,created_utc"
+                    ),
+                    cutoff_time,
+                ).eq("subreddit", subreddit_name).gt("num_comments", 0).limit(50)
 
                 submissions_result = submissions_query.execute()
 
@@ -283,8 +315,10 @@ def collect_comments_for_submissions(
                         logger.info(f"      💬 Processing submission {submission_id} (expected {expected_comments} comments)")
 
                         # Check if comments already exist for this submission
-                        existing_comments_query = supabase_client.table(db_config["comment"]).select(
-                            "comment_id"
+                        # Comments are never older than their submission
+                        existing_comments_query = created_utc_window(
+                            supabase_client.table(db_config["comment"]).select("comment_id"),
+                            submission_data["created_utc"],
                         ).eq("submission_id", submission_id).limit(1)
 
                         existing_comments_result = existing_comments_query.execute()
@@ -317,7 +351,7 @@ def collect_comments_for_submissions(
                                     "author": str(comment.author) if comment.author else "[deleted]",
                                     "body": comment.body[:2000],  # Limit comment length
                                     "score": comment.score,
-                                    "created_utc": datetime.fromtimestamp(comment.created_utc).isoformat(),
+                                    "created_utc": reddit_created_utc(comment.created_utc),
                                     "subreddit": subreddit_name,
                                     "parent_id": comment.parent_id,
                                     "depth": getattr(comment, 'depth', 0),
@@ -329,9 +363,9 @@ def collect_comments_for_submissions(
                                     comment_data = apply_pii_masking(comment_data)
 
                                 # Store in Supabase
-                                result = supabase_client.table(db_config["comment"]).upsert(
-                                    comment_data, on_conflict="comment_id"
-                                ).execute()
+                                result = upsert_partitioned(
+                                    supabase_client, db_config["comment"], [comment_data], COMMENT_CONFLICT_KEY
+                                )
 
                                 if result.data:
                                     comment_count += 1
@@ -410,7 +444,7 @@ def collect_standalone_comments(
                                         "author": str(comment.author),
                                         "body": comment.body[:2000],
                                         "score": comment.score,
-                                        "created_utc": datetime.fromtimestamp(comment.created_utc).isoformat(),
+                                        "created_utc": reddit_created_utc(comment.created_utc),
                                         "subreddit": subreddit_name,
                                         "parent_id": comment.parent_id,
                                         "collection_timestamp": datetime.utcnow().isoformat()
@@ -419,9 +453,10 @@ def collect_standalone_comments(
                                     if mask_pii:
                                         comment_data = apply_pii_masking(comment_data)
 
-                                    result = supabase_client.table(db_config["comment"]).upsert(
-                                        comment_data, on_conflict="comment_id"
-                                    ).execute()
+                                    result = upsert_partitioned(
+                                        supabase_client, db_config["comment"], [comment_data],
+                                        COMMENT_CONFLICT_KEY
+                                    )
 
                                     if result.data:
                                         total_comments += 1
@@ -715,7 +750,7 @@ def collect_monetizable_opportunities_data(
     Collects from target subreddits with problem/solution tracking
 
     Args:
-        reddit_client: Reddit API client
+        reddit_client: Reddit API client (praw.Reddit or RedditClientPool)
         supabase_client: Supabase database client
         db_config: Database table configuration
         market_segment: Target market segment (health_fitness, finance_investing, etc.) or 'all'
@@ -786,6 +821,105 @@ def collect_monetizable_opportunities_data(
         return False
 
 
+def reddit_created_utc(timestamp: float) -> str:
+    """
+    Format a Reddit ``created_utc`` Unix timestamp for the created_utc column.
+
+    The value is part of the submissions/comments conflict keys, so it is
+    always rendered in UTC rather than the collector's local time zone.
+
+    Args:
+        timestamp: Seconds since the epoch
+
+    Returns:
+        ISO 8601 string with a +00:00 offset
+    """
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
+
+
+def created_utc_window(query, since: datetime | str, until: datetime | str | None = None):
+    """
+    Restrict a submissions or comments query to a created_utc range.
+
+    Both tables are partitioned by month on created_utc. Bounding the range on
+    both sides lets Postgres skip every other partition, including the default
+    one that an open-ended ``gte`` would still scan.
+
+    Args:
+        query: Supabase query on submissions or comments
+        since: Inclusive lower bound
+        until: Inclusive upper bound (default: a day from now, leaving room for
+            clock skew in stored timestamps)
+
+    Returns:
+        The query with both bounds applied
+    """
+    if until is None:
+        until = datetime.now(UTC) + timedelta(days=1)
+    bounds = [value.isoformat() if isinstance(value, datetime) else value for value in (since, until)]
+    return query.gte("created_utc", bounds[0]).lte("created_utc", bounds[1])
+
+
+def upsert_partitioned(supabase_client, table_name: str, rows: list[dict[str, Any]], on_conflict: str):
+    """
+    Upsert rows into a month-partitioned table on (key, created_utc).
+
+    Rows sharing a key are collapsed to the last one, since Postgres rejects
+    an upsert that touches the same row twice. Rows whose key is already
+    stored take its created_utc from <table>_keys, so a re-collected row with
+    a different created_utc updates the stored row instead of being rejected
+    as a duplicate key.
+
+    Args:
+        supabase_client: Supabase database client
+        table_name: Target table
+        rows: Rows to upsert
+        on_conflict: Key column followed by created_utc, comma-separated
+
+    Returns:
+        The executed upsert response
+    """
+    key_column = on_conflict.split(",")[0].strip()
+    unique_rows = list({
+        row[key_column] if row.get(key_column) is not None else id(row): row for row in rows
+    }.values())
+
+    keys = [row[key_column] for row in unique_rows if row.get(key_column) is not None]
+    if keys:
+        stored = (
+            supabase_client.table(f"{table_name}_keys")
+            .select(f"{key_column},created_utc")
+            .in_(key_column, keys)
+            .execute()
+        )
+        created = {entry[key_column]: entry["created_utc"] for entry in stored.data or []}
+        unique_rows = [
+            {**row, "created_utc": created[row[key_column]]} if row.get(key_column) in created else row
+            for row in unique_rows
+        ]
+
+    return supabase_client.table(table_name).upsert(unique_rows, on_conflict=on_conflict).execute()
+
+
+def upsert_rows_fn(supabase_client, table_name: str, on_conflict: str):
+    """
+    Build a BufferedSink flush function that upserts a batch into a table.
+
+    Args:
+        supabase_client: Supabase database client
+        table_name: Target month-partitioned table
+        on_conflict: Key column followed by created_utc, comma-separated
+
+    Returns:
+        Callable taking a list of rows
+    """
+
+    def upsert(rows: list[dict[str, Any]]) -> None:
+        upsert_partitioned(supabase_client, table_name, rows, on_conflict)
+
+    return upsert
+
+
 def collect_enhanced_submissions(
     reddit_client,
     supabase_client,
@@ -794,108 +928,134 @@ def collect_enhanced_submissions(
     limit: int,
     sort_types: list[str],
     time_filter: str,
-    mask_pii: bool
+    mask_pii: bool,
+    high_water_marks: HighWaterMarkStore | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
 ) -> bool:
     """
     Collect submissions with enhanced metadata for monetizable app research
+
+    Rows are upserted in batches of ``batch_size`` (or every
+    ``flush_interval`` seconds) by a background BufferedSink while crawling
+    continues. When ``high_water_marks`` is given, 'new' listings stop at the
+    newest submission seen by the previous run; the marks are saved only if
+    every batch was stored. Returns False if any batch failed to store.
     """
     try:
         logger.info(f"📝 Collecting enhanced submissions from {len(subreddits)} subreddits")
 
         total_submissions = 0
         successful_subreddits = 0
+        sink = BufferedSink(
+            upsert_rows_fn(
+                supabase_client, db_config.get("submission", "submissions"), SUBMISSION_CONFLICT_KEY
+            ),
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            name="enhanced_submissions",
+        )
 
-        for subreddit_name in subreddits:
-            try:
-                logger.info(f"  📖 Processing r/{subreddit_name}")
-                subreddit = reddit_client.subreddit(subreddit_name)
-                market_segment = identify_market_segment(subreddit_name)
-
-                subreddit_submissions = 0
-
-                for sort_type in sort_types:
-                    try:
-                        if sort_type == "hot":
-                            submissions = subreddit.hot(limit=limit)
-                        elif sort_type == "new":
-                            submissions = subreddit.new(limit=limit)
-                        elif sort_type == "top":
-                            if time_filter == "day":
-                                submissions = subreddit.top("day", limit=limit)
-                            elif time_filter == "week":
-                                submissions = subreddit.top("week", limit=limit)
+        # Closing the sink waits for the pending batches, even if crawling fails
+        with sink:
+            for subreddit_name in subreddits:
+                try:
+                    logger.info(f"  📖 Processing r/{subreddit_name}")
+                    subreddit = reddit_client.subreddit(subreddit_name)
+                    market_segment = identify_market_segment(subreddit_name)
+
+                    subreddit_submissions = 0
+
+                    for sort_type in sort_types:
+                        try:
+                            if sort_type == "hot":
+                                submissions = subreddit.hot(limit=limit)
+                            elif sort_type == "new":
+                                submissions = subreddit.new(limit=limit)
+                            elif sort_type == "top":
+                                if time_filter == "day":
+                                    submissions = subreddit.top("day", limit=limit)
+                                elif time_filter == "week":
+                                    submissions = subreddit.top("week", limit=limit)
+                                else:
+                                    submissions = subreddit.top("month", limit=limit)
+                            elif sort_type == "rising":
+                                submissions = subreddit.rising(limit=limit)
                             else:
-                                submissions = subreddit.top("month", limit=limit)
-                        elif sort_type == "rising":
-                            submissions = subreddit.rising(limit=limit)
-                        else:
-                            submissions = subreddit.hot(limit=limit)
+                                submissions = subreddit.hot(limit=limit)
 
-                        for submission in submissions:
-                            try:
-                                # Enhanced submission data for monetizable app research
-                                submission_data = {
-                                    "submission_id": submission.id,
-                                    "title": submission.title,
-                                    "author": str(submission.author) if submission.author else "[deleted]",
-                                    "subreddit": subreddit_name,
-                                    "score": submission.score,
-                                    "num_comments": submission.num_comments,
-                                    "created_utc": datetime.fromtimestamp(submission.created_utc).isoformat(),
-                                    "url": submission.url,
-                                    "selftext": submission.selftext[:1000] if submission.selftext else "",
-                                    "permalink": submission.permalink,
-                                    "over_18": submission.over_18,
-                                    "collection_timestamp": datetime.utcnow().isoformat(),
-                                    # Enhanced fields for monetizable app research
-                                    "market_segment": market_segment,
-                                    "sort_type": sort_type,
-                                    "time_filter": time_filter,
-                                    "post_engagement_rate": submission.score / max(submission.num_comments, 1),
-                                    "emotional_language_score": analyze_emotional_intensity(submission.title + " " + submission.selftext),
-                                    "sentiment_score": calculate_sentiment_score(submission.title + " " + submission.selftext),
-                                    "problem_indicators": json.dumps(extract_problem_keywords(submission.selftext)),
-                                    "solution_mentions": json.dumps(extract_solution_mentions(submission.selftext)),
-                                    "monetization_signals": json.dumps(detect_payment_mentions(submission.selftext))
-                                }
+                            if high_water_marks is not None:
+                                submissions = high_water_marks.iter_unseen(
+                                    submissions, subreddit_name, sort_type
+                                )
 
-                                # Apply PII masking if enabled
-                                if mask_pii:
-                                    submission_data = apply_pii_masking(submission_data)
+                            for submission in submissions:
+                                try:
+                                    # Enhanced submission data for monetizable app research
+                                    submission_data = {
+                                        "submission_id": submission.id,
+                                        "title": submission.title,
+                                        "author": str(submission.author) if submission.author else "[deleted]",
+                                        "subreddit": subreddit_name,
+                                        "score": submission.score,
+                                        "num_comments": submission.num_comments,
+                                        "created_utc": reddit_created_utc(submission.created_utc),
+                                        "url": submission.url,
+                                        "selftext": submission.selftext[:1000] if submission.selftext else "",
+                                        "permalink": submission.permalink,
+                                        "over_18": submission.over_18,
+                                        "collection_timestamp": datetime.utcnow().isoformat(),
+                                        # Enhanced fields for monetizable app research
+                                        "market_segment": market_segment,
+                                        "sort_type": sort_type,
+                                        "time_filter": time_filter,
+                                        "post_engagement_rate": submission.score / max(submission.num_comments, 1),
+                                        "emotional_language_score": analyze_emotional_intensity(submission.title + " " + submission.selftext),
+                                        "sentiment_score": calculate_sentiment_score(submission.title + " " + submission.selftext),
+                                        "problem_indicators": json.dumps(extract_problem_keywords(submission.selftext)),
+                                        "solution_mentions": json.dumps(extract_solution_mentions(submission.selftext)),
+                                        "monetization_signals": json.dumps(detect_payment_mentions(submission.selftext))
+                                    }
 
-                                # Store in Supabase
-                                result = supabase_client.table(db_config.get("submission", "submissions")).upsert(
-                                    submission_data, on_conflict="submission_id"
-                                ).execute()
+                                    # Apply PII masking if enabled
+                                    if mask_pii:
+                                        submission_data = apply_pii_masking(submission_data)
 
-                                if result.data:
+                                    # Queue for a batched upsert in Supabase
+                                    sink.add(submission_data)
                                     subreddit_submissions += 1
 
-                            except Exception as e:
-                                logger.warning(f"    ⚠️ Failed to store submission {submission.id}: {e}")
-                                continue
+                                except Exception as e:
+                                    logger.warning(f"    ⚠️ Failed to prepare submission {submission.id}: {e}")
+                                    continue
 
-                        # Smart rate limiting
-                        delay = smart_rate_limiting(sort_type, "submission")
-                        time.sleep(delay)
+                            # Smart rate limiting
+                            delay = smart_rate_limiting(sort_type, "submission")
+                            time.sleep(delay)
 
-                    except Exception as e:
-                        logger.warning(f"  ⚠️ Failed to fetch {sort_type} posts from r/{subreddit_name}: {e}")
-                        continue
+                        except Exception as e:
+                            logger.warning(f"  ⚠️ Failed to fetch {sort_type} posts from r/{subreddit_name}: {e}")
+                            continue
 
-                total_submissions += subreddit_submissions
-                successful_subreddits += 1
-                logger.info(f"  ✅ Collected {subreddit_submissions} enhanced submissions from r/{subreddit_name}")
+                    total_submissions += subreddit_submissions
+                    successful_subreddits += 1
+                    logger.info(f"  ✅ Collected {subreddit_submissions} enhanced submissions from r/{subreddit_name}")
 
-                # Rate limiting between subreddits
-                time.sleep(3)
+                    # Rate limiting between subreddits
+                    time.sleep(3)
 
-            except Exception as e:
-                logger.error(f"  ❌ Failed to process r/{subreddit_name}: {e}")
-                continue
+                except Exception as e:
+                    logger.error(f"  ❌ Failed to process r/{subreddit_name}: {e}")
+                    continue
 
-        logger.info(f"✅ Enhanced submission collection complete: {total_submissions} submissions from {successful_subreddits}/{len(subreddits)} subreddits")
-        return True
+        stats = sink.stats
+        if stats.rows_failed:
+            logger.warning(f"  ⚠️ Failed to store {stats.rows_failed} submissions in {stats.batches_failed} batches")
+        elif high_water_marks is not None:
+            high_water_marks.save()
+
+        logger.info(f"✅ Enhanced submission collection complete: {stats.rows_flushed}/{total_submissions} submissions stored from {successful_subreddits}/{len(subreddits)} subreddits")
+        return not stats.rows_failed
 
     except Exception as e:
         logger.error(f"❌ Enhanced submission collection failed: {e}")
@@ -944,9 +1104,15 @@ def collect_enhanced_comments(
                         submission_id = submission_data["submission_id"]
 
                         # Check if comments already exist for this submission
+                        # Comments are never older than their submission
                         existing_comments_query = supabase_client.table(db_config.get("comment", "comments")).select(
                             "comment_id"
-                        ).eq("submission_id", submission_id).limit(1)
+                        ).eq("submission_id", submission_id)
+                        if submission_data.get("created_utc"):
+                            existing_comments_query = created_utc_window(
+                                existing_comments_query, submission_data["created_utc"]
+                            )
+                        existing_comments_query = existing_comments_query.limit(1)
 
                         existing_comments_result = existing_comments_query.execute()
 
@@ -980,7 +1146,7 @@ def collect_enhanced_comments(
                                     "author": str(comment.author) if comment.author else "[deleted]",
                                     "body": comment_body,
                                     "score": comment.score,
-                                    "created_utc": datetime.fromtimestamp(comment.created_utc).isoformat(),
+                                    "created_utc": reddit_created_utc(comment.created_utc),
                                     "subreddit": subreddit_name,
                                     "parent_id": comment.parent_id,
                                     "depth": getattr(comment, 'depth', 0),
@@ -999,9 +1165,10 @@ def collect_enhanced_comments(
                                     comment_data = apply_pii_masking(comment_data)
 
                                 # Store in Supabase
-                                result = supabase_client.table(db_config.get("comment", "comments")).upsert(
-                                    comment_data, on_conflict="comment_id"
-                                ).execute()
+                                result = upsert_partitioned(
+                                    supabase_client, db_config.get("comment", "comments"), [comment_data],
+                                    COMMENT_CONFLICT_KEY
+                                )
 
                                 if result.data:
                                     comment_count += 1
@@ -1207,7 +1374,7 @@ def collect_with_dlt_validation(
     and DLT-enhanced collection with activity validation.
 
     Args:
-        reddit_client: Reddit API client
+        reddit_client: Reddit API client (praw.Reddit or RedditClientPool)
         supabase_client: Supabase database client
         db_config: Database table configuration
         subreddits: List of subreddits to collect from
@@ -1340,7 +1507,7 @@ def get_dlt_collection_stats(
     integration metrics with the existing RedditHarbor system.
 
     Args:
-        reddit_client: Reddit API client
+        reddit_client: Reddit API client (praw.Reddit or RedditClientPool)
         supabase_client: Supabase database client
         db_config: Database table configuration
 
@@ -1413,10 +1580,13 @@ def get_dlt_collection_stats(
         # Activity validation metrics (try to get recent activity data)
         try:
             # Check if we have recent activity data
-            recent_cutoff = datetime.utcnow() - timedelta(days=1)
-            recent_submissions = supabase_client.table(db_config.get("submission", "submissions")).select(
-                "submission_id,created_utc,score,num_comments"
-            ).gte("created_utc", recent_cutoff.isoformat()).execute()
+            recent_cutoff = datetime.now(UTC) - timedelta(days=1)
+            recent_submissions = created_utc_window(
+                supabase_client.table(db_config.get("submission", "submissions")).select(
+                    "submission_id,created_utc,score,num_comments"
+                ),
+                recent_cutoff,
+            ).execute()
 
             if recent_submissions.data:
                 dlt_stats["validation_metrics"]["recent_submissions_24h"] = len(recent_submissions.data)
@@ -1,576 +0,0 @@
-"""
-RedditHarbor Semantic Deduplication Engine
-Phase 1: String-based deduplication (no ML dependencies)
-
-Task 2 Implementation: SimpleDeduplicator class with fingerprint generation.
-This module provides basic deduplication functionality using normalized concept
-fingerprints to identify duplicate business concepts from Reddit data.
-"""
-
-import hashlib
-import logging
-import time
-import uuid
-
-try:
-    from supabase import Client, create_client
-except ImportError:
-    Client = None
-    create_client = None
-
-logger = logging.getLogger(__name__)
-
-
-class SimpleDeduplicator:
-    """
-    Phase 1: String-based deduplication using normalized concept fingerprints.
-    No ML dependencies - fast, simple, effective for ~40-50% duplicates.
-
-    This class provides core functionality for:
-    - Normalizing business concept text
-    - Generating SHA256 fingerprints for deduplication
-    - Integration with Supabase for storage and retrieval
-    """
-
-    def __init__(self, supabase_url: str, supabase_key: str):
-        """
-        Initialize with Supabase client.
-
-        Args:
-            supabase_url: Supabase project URL
-            supabase_key: Supabase service role key
-
-        Raises:
-            ImportError: If supabase package is not installed
-            Exception: If Supabase client creation fails
-        """
-        if create_client is None:
-            raise ImportError(
-                "supabase package is required. Install with: pip install supabase"
-            )
-
-        self.supabase: Client = create_client(supabase_url, supabase_key)
-        logger.info(f"SimpleDeduplicator initialized with Supabase URL: {supabase_url}")
-
-    def normalize_concept(self, concept: str) -> str:
-        """
-        Normalize business concept for fingerprinting.
-
-        This method standardizes text by:
-        - Converting to lowercase
-        - Removing common app-related prefixes
-        - Normalizing whitespace
-        - Stripping leading/trailing spaces
-
-        Args:
-            concept: Raw business concept text
-
-        Returns:
-            Normalized concept string
-        """
-        if not concept:
-            return ""
-
-        # Convert to lowercase and strip whitespace
-        normalized = concept.lower().strip()
-
-        # Remove common variations and prefixes
-        # Order matters: handle specific cases first
-        normalized = normalized.replace("app idea:", "idea:")
-        # Handle "mobile app" -> "app" conversion first, but preserve "app:" prefix
-        if normalized.startswith("mobile app:"):
-            normalized = "app:" + normalized[11:]  # Replace "mobile app:" with "app:"
-        elif normalized.startswith("web app:"):
-            normalized = "app:" + normalized[8:]  # Replace "web app:" with "app:"
-        else:
-            # Handle standalone replacements
-            normalized = normalized.replace("mobile app", "app")
-            normalized = normalized.replace("web app", "app")
-            # Remove standalone "app:" at the beginning
-            if normalized.startswith("app:"):
-                normalized = normalized[4:]  # Remove "app:" prefix
-
-        # Remove extra whitespace (multiple spaces to single space)
-        normalized = " ".join(normalized.split())
-
-        return normalized
-
-    def generate_fingerprint(self, concept: str) -> str:
-        """
-        Generate SHA256 fingerprint from normalized concept.
-
-        Args:
-            concept: Business concept text
-
-        Returns:
-            SHA256 hash as hexadecimal string
-        """
-        normalized = self.normalize_concept(concept)
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
-
-    def validate_and_convert_uuid(self, opportunity_id: str) -> str:
-        """
-        Validate and convert opportunity ID to proper UUID format.
-
-        For testing purposes, this will generate a valid UUID for non-UUID strings.
-        In production, opportunity IDs should already be valid UUIDs.
-
-        Args:
-            opportunity_id: Raw opportunity identifier
-
-        Returns:
-            Valid UUID string
-        """
-        if not opportunity_id:
-            raise ValueError("Opportunity ID cannot be empty")
-
-        try:
-            # Try to parse as UUID (for production UUIDs)
-            parsed_uuid = uuid.UUID(opportunity_id)
-            return str(parsed_uuid)
-        except (ValueError, AttributeError):
-            # For testing - generate deterministic UUID based on string
-            # This ensures the same string always generates the same UUID
-            namespace = uuid.uuid5(uuid.NAMESPACE_URL, "reddit-harbor-test")
-            return str(uuid.uuid5(namespace, opportunity_id))
-
-    def find_existing_concept(self, fingerprint: str) -> dict | None:
-        """
-        Check if business concept already exists in database.
-
-        Args:
-            fingerprint: SHA256 fingerprint to search for
-
-        Returns:
-            Dictionary with concept data if found, None otherwise
-        """
-        try:
-            response = (
-                self.supabase.table("business_concepts")
-                .select("*")
-                .eq("concept_fingerprint", fingerprint)  # Updated field name
-                .execute()
-            )
-
-            if response.data and len(response.data) > 0:
-                fp_prefix = fingerprint[:8]
-                logger.info(f"Found existing concept for fingerprint: {fp_prefix}...")
-                return response.data[0]
-            else:
-                fp_prefix = fingerprint[:8]
-                logger.debug(
-                    f"No existing concept found for fingerprint: {fp_prefix}..."
-                )
-                return None
-
-        except Exception as e:
-            fp_prefix = fingerprint[:8]
-            logger.error(
-                f"Error finding existing concept for fingerprint {fp_prefix}...: {e}"
-            )
-            return None
-
-    def create_business_concept(
-        self, concept_name: str, fingerprint: str, opportunity_id: str
-    ) -> int | None:
-        """
-        Create new business concept in database.
-
-        Args:
-            concept_name: Normalized business concept name
-            fingerprint: SHA256 fingerprint of the concept
-            opportunity_id: ID of the opportunity that created this concept
-
-        Returns:
-            ID of the created concept if successful, None otherwise
-        """
-        try:
-            # First ensure the opportunity exists in opportunities_unified table
-            # This is needed for the foreign key constraint
-            self._ensure_opportunity_exists(opportunity_id)
-
-            concept_data = {
-                "concept_name": concept_name,
-                "concept_fingerprint": fingerprint,  # Updated field name
-                "primary_opportunity_id": opportunity_id,  # Updated field name
-                "submission_count": 1,  # Updated field name
-            }
-
-            response = (
-                self.supabase.table("business_concepts").insert(concept_data).execute()
-            )
-
-            if response.data and len(response.data) > 0:
-                concept_id = response.data[0].get("id")
-                name_preview = concept_name[:50]
-                logger.info(
-                    f"Created new business concept '{name_preview}...' with ID: "
-                    f"{concept_id}"
-                )
-                return concept_id
-            else:
-                name_preview = concept_name[:50]
-                logger.error(f"Failed to create business concept '{name_preview}...'")
-                return None
-
-        except Exception as e:
-            name_preview = concept_name[:50]
-            logger.error(f"Error creating business concept '{name_preview}...': {e}")
-            return None
-
-    def _ensure_opportunity_exists(self, opportunity_id: str) -> bool:
-        """
-        Ensure opportunity exists in opportunities_unified table for foreign key.
-        Creates a minimal opportunity record if it doesn't exist.
-
-        Args:
-            opportunity_id: UUID of the opportunity
-
-        Returns:
-            True if opportunity exists or was created, False otherwise
-        """
-        try:
-            # Check if opportunity already exists
-            response = (
-                self.supabase.table("opportunities_unified")
-                .select("id")
-                .eq("id", opportunity_id)
-                .execute()
-            )
-
-            if response.data and len(response.data) > 0:
-                logger.debug(f"Opportunity {opportunity_id} already exists")
-                return True
-
-            # Create minimal opportunity record for testing
-            minimal_opportunity = {
-                "id": opportunity_id,
-                "title": f"Test Opportunity {opportunity_id[:8]}",
-                "app_concept": "Test concept for deduplication",
-                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-            }
-
-            create_response = (
-                self.supabase.table("opportunities_unified")
-                .insert(minimal_opportunity)
-                .execute()
-            )
-
-            if create_response.data and len(create_response.data) > 0:
-                logger.info(
-                    f"Created test opportunity {opportunity_id} for foreign key"
-                )
-                return True
-            else:
-                logger.error(f"Failed to create test opportunity {opportunity_id}")
-                return False
-
-        except Exception as e:
-            logger.error(f"Error ensuring opportunity exists {opportunity_id}: {e}")
-            return False
-
-    def update_concept_stats(self, concept_id: int) -> None:
-        """
-        Update concept statistics in database.
-
-        Args:
-            concept_id: ID of the concept to update
-        """
-        try:
-            # Call database function to increment opportunity count
-            self.supabase.rpc(
-                "increment_concept_count", {"concept_id": concept_id}
-            ).execute()
-
-            # Note: increment_concept_count doesn't return data, just performs update
-            logger.info(f"Updated stats for concept ID: {concept_id}")
-
-        except Exception as e:
-            logger.error(f"Error updating concept stats for ID {concept_id}: {e}")
-
-    def mark_as_duplicate(
-        self, opportunity_id: str, concept_id: int, primary_opportunity_id: str
-    ) -> bool:
-        """
-        Mark an opportunity as a duplicate.
-
-        Args:
-            opportunity_id: ID of the opportunity to mark as duplicate
-            concept_id: ID of the business concept it belongs to
-            primary_opportunity_id: ID of the primary/original opportunity
-
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            # Ensure the opportunity exists in opportunities_unified table
-            if not self._ensure_opportunity_exists(opportunity_id):
-                logger.error(f"Failed to ensure opportunity exists: {opportunity_id}")
-                return False
-
-            # Use database function for atomic operation
-            response = self.supabase.rpc(
-                "mark_opportunity_duplicate",
-                {
-                    "p_opportunity_id": opportunity_id,
-                    "p_concept_id": concept_id,
-                    "p_primary_opportunity_id": primary_opportunity_id,
-                },
-            ).execute()
-
-            if response.data is True:
-                msg = (
-                    f"Marked opportunity {opportunity_id} as duplicate of "
-                    f"{primary_opportunity_id}"
-                )
-                logger.info(msg)
-                return True
-            else:
-                logger.error(
-                    f"Failed to mark opportunity {opportunity_id} as duplicate"
-                )
-                return False
-
-        except Exception as e:
-            logger.error(
-                f"Error marking opportunity {opportunity_id} as duplicate: {e}"
-            )
-            return False
-
-    def mark_as_unique(self, opportunity_id: str, concept_id: int) -> bool:
-        """
-        Mark an opportunity as unique (original).
-
-        Args:
-            opportunity_id: ID of the opportunity to mark as unique
-            concept_id: ID of the business concept it belongs to
-
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            # Ensure the opportunity exists in opportunities_unified table
-            if not self._ensure_opportunity_exists(opportunity_id):
-                logger.error(f"Failed to ensure opportunity exists: {opportunity_id}")
-                return False
-
-            # Use database function for atomic operation
-            response = self.supabase.rpc(
-                "mark_opportunity_unique",
-                {
-                    "p_opportunity_id": opportunity_id,
-                    "p_concept_id": concept_id,
-                },
-            ).execute()
-
-            if response.data is True:
-                logger.info(f"Marked opportunity {opportunity_id} as unique")
-                return True
-            else:
-                logger.error(f"Failed to mark opportunity {opportunity_id} as unique")
-                return False
-
-        except Exception as e:
-            logger.error(f"Error marking opportunity {opportunity_id} as unique: {e}")
-            return False
-
-    def process_opportunity(self, opportunity: dict) -> dict:
-        """
-        Process single opportunity for deduplication.
-
-        This method implements the complete deduplication workflow:
-        1. Validates required fields (id, app_concept)
-        2. Normalizes the concept and generates fingerprint
-        3. Checks for existing concepts using fingerprint
-        4. If duplicate found: marks as duplicate and updates stats
-        5. If unique: creates new business concept and marks as unique
-        6. Returns comprehensive result with success status
-
-        Args:
-            opportunity: Dictionary containing opportunity data with at least:
-                - id: Unique opportunity identifier
-                - app_concept: Business concept description
-
-        Returns:
-            Dictionary with comprehensive processing result:
-                - success: bool - Overall processing success
-                - is_duplicate: bool - Whether opportunity was identified as duplicate
-                - concept_id: Optional[int] - Business concept ID if successful
-                - opportunity_id: Optional[str] - Opportunity ID from input
-                - fingerprint: Optional[str] - Generated fingerprint
-                - normalized_concept: Optional[str] - Normalized concept text
-                - message: str - Success or error message
-                - processing_time: float - Time taken in seconds
-                - error: Optional[str] - Error details if failed
-        """
-        start_time = time.time()
-
-        # Initialize result structure
-        result = {
-            "success": False,
-            "is_duplicate": False,
-            "concept_id": None,
-            "opportunity_id": None,
-            "fingerprint": None,
-            "normalized_concept": None,
-            "message": "",
-            "processing_time": 0.0,
-            "error": None,
-        }
-
-        try:
-            # Step 1: Validate required fields
-            if not opportunity:
-                result["error"] = "Opportunity dictionary is required"
-                result["message"] = "Validation failed: empty opportunity"
-                return result
-
-            opportunity_id = opportunity.get("id")
-            app_concept = opportunity.get("app_concept")
-
-            if not opportunity_id:
-                result["error"] = "Missing required field: id"
-                result["message"] = "Validation failed: missing opportunity ID"
-                return result
-
-            if not app_concept:
-                result["error"] = "Missing required field: app_concept"
-                result["message"] = "Validation failed: missing app concept"
-                result["opportunity_id"] = opportunity_id
-                return result
-
-            # Convert to valid UUID format
-            try:
-                valid_uuid = self.validate_and_convert_uuid(opportunity_id)
-            except ValueError as e:
-                result["error"] = f"Invalid opportunity ID: {e}"
-                result["message"] = "Validation failed: invalid opportunity ID"
-                result["opportunity_id"] = opportunity_id
-                return result
-
-            # Store opportunity_id for all subsequent operations
-            result["opportunity_id"] = valid_uuid
-
-            # Step 2: Normalize concept and generate fingerprint
-            normalized_concept = self.normalize_concept(app_concept)
-            result["normalized_concept"] = normalized_concept
-
-            if not normalized_concept:
-                result["error"] = "Concept becomes empty after normalization"
-                result["message"] = "Processing failed: empty normalized concept"
-                return result
-
-            fingerprint = self.generate_fingerprint(app_concept)
-            result["fingerprint"] = fingerprint
-
-            # Step 3: Check for existing concept
-            logger.debug(
-                f"Processing opportunity {valid_uuid} with concept: "
-                f"'{normalized_concept[:50]}...', fingerprint: {fingerprint[:8]}..."
-            )
-
-            existing_concept = self.find_existing_concept(fingerprint)
-
-            if existing_concept:
-                # Step 4a: Handle duplicate opportunity
-                logger.info(
-                    f"Found duplicate concept for opportunity {valid_uuid}: "
-                    f"existing concept ID {existing_concept['id']}"
-                )
-
-                # Update concept statistics
-                self.update_concept_stats(existing_concept["id"])
-
-                # Mark opportunity as duplicate
-                concept_id = existing_concept["id"]
-                primary_opportunity_id = existing_concept.get(
-                    "primary_opportunity_id", valid_uuid
-                )
-
-                duplicate_marked = self.mark_as_duplicate(
-                    valid_uuid, concept_id, primary_opportunity_id
-                )
-
-                if not duplicate_marked:
-                    result["error"] = "Failed to mark opportunity as duplicate"
-                    result["message"] = "Processing failed: could not mark as duplicate"
-                    return result
-
-                # Success - duplicate found and processed
-                result["success"] = True
-                result["is_duplicate"] = True
-                result["concept_id"] = concept_id
-                result["message"] = "Processed duplicate opportunity successfully"
-
-                logger.info(
-                    f"Successfully processed duplicate opportunity {valid_uuid} "
-                    f"with concept ID {concept_id}"
-                )
-
-            else:
-                # Step 4b: Handle unique opportunity
-                logger.info(
-                    f"New unique concept for opportunity {valid_uuid}: "
-                    f"'{normalized_concept[:50]}...'"
-                )
-
-                # Create new business concept
-                concept_id = self.create_business_concept(
-                    normalized_concept, fingerprint, valid_uuid
-                )
-
-                if concept_id is None:
-                    result["error"] = "Failed to create business concept"
-                    result["message"] = "Processing failed: could not create concept"
-                    return result
-
-                # Mark opportunity as unique
-                unique_marked = self.mark_as_unique(valid_uuid, concept_id)
-
-                if not unique_marked:
-                    result["error"] = "Failed to mark opportunity as unique"
-                    result["message"] = "Processing failed: could not mark as unique"
-                    return result
-
-                # Success - unique concept created and processed
-                result["success"] = True
-                result["is_duplicate"] = False
-                result["concept_id"] = concept_id
-                result["message"] = "Processed unique opportunity successfully"
-
-                logger.info(
-                    f"Successfully processed unique opportunity {valid_uuid} "
-                    f"with new concept ID {concept_id}"
-                )
-
-        except Exception as e:
-            # Handle unexpected errors
-            error_msg = f"Unexpected error processing opportunity: {e}"
-            logger.error(error_msg)
-            result["error"] = error_msg
-            result["message"] = "Processing failed: unexpected error"
-
-        finally:
-            # Calculate processing time
-            result["processing_time"] = time.time() - start_time
-
-        return result
-
-
-# Future extension methods (to be implemented in later tasks)
-# These are commented out as they're not part of Task 2 requirements
-
-# def find_existing_concept(self, fingerprint: str) -> Optional[dict]:
-#     """Check if business concept already exists in database."""
-#     pass
-
-# def create_business_concept(
-#     self, concept_name: str, fingerprint: str, opportunity_id: str
-# ) -> Optional[int]:
-#     """Create new business concept in database."""
-#     pass
-
-# def process_opportunity(self, opportunity: dict) -> dict:
-#     """Process single opportunity for deduplication."""
-#     pass
@@ -9,11 +9,13 @@ Components:
 - AgnoSkipLogic: Monetization analysis deduplication
 - ProfilerSkipLogic: AI profiler deduplication
 - DeduplicationStatsUpdater: Track cost savings statistics
+- SimpleDeduplicator: Fingerprint and near-duplicate concept matching
 """
 
 from core.deduplication.agno_skip_logic import AgnoSkipLogic
 from core.deduplication.concept_manager import BusinessConceptManager
 from core.deduplication.profiler_skip_logic import ProfilerSkipLogic
+from core.deduplication.simple_deduplicator import SimpleDeduplicator
 from core.deduplication.stats_updater import DeduplicationStatsUpdater
 
 __all__ = [
@@ -21,4 +23,5 @@ __all__ = [
     "AgnoSkipLogic",
     "ProfilerSkipLogic",
     "DeduplicationStatsUpdater",
+    "SimpleDeduplicator",
 ]
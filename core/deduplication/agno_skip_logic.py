@@ -19,6 +19,12 @@ from core.deduplication.concept_manager import BusinessConceptManager
 
 logger = logging.getLogger(__name__)
 
+# View holding the most recent primary (non-copied) row per business concept
+PRIMARY_ANALYSIS_VIEW = "latest_primary_agno_analysis"
+
+# Database function returning the same rows with one index probe per concept
+PRIMARY_ANALYSIS_FUNCTION = "get_latest_primary_agno_analyses"
+
 
 class AgnoSkipLogic:
     """
@@ -249,44 +255,7 @@ class AgnoSkipLogic:
             source_submission_id = primary_analysis.get("submission_id")
 
             # Create analysis data for orchestrator return (without inserting)
-            copied_data = {
-                "willingness_to_pay_score": primary_analysis.get(
-                    "willingness_to_pay_score"
-                ),
-                "customer_segment": primary_analysis.get("customer_segment"),
-                "payment_sentiment": primary_analysis.get("payment_sentiment"),
-                "urgency_level": primary_analysis.get("urgency_level"),
-                "mentioned_price_points": primary_analysis.get(
-                    "mentioned_price_points"
-                ),
-                "existing_payment_behavior": primary_analysis.get(
-                    "existing_payment_behavior"
-                ),
-                "payment_friction_indicators": primary_analysis.get(
-                    "payment_friction_indicators"
-                ),
-                "confidence": primary_analysis.get("confidence"),
-                "llm_monetization_score": primary_analysis.get(
-                    "llm_monetization_score"
-                ),
-                "keyword_monetization_score": primary_analysis.get(
-                    "keyword_monetization_score"
-                ),
-                "price_sensitivity_score": primary_analysis.get(
-                    "price_sensitivity_score"
-                ),
-                "revenue_potential_score": primary_analysis.get(
-                    "revenue_potential_score"
-                ),
-                "reasoning": primary_analysis.get("reasoning"),
-                "subreddit_multiplier": primary_analysis.get("subreddit_multiplier"),
-                "model_used": primary_analysis.get("model_used"),
-                "score_delta": primary_analysis.get("score_delta"),
-                # Tracking metadata
-                "copied_from_primary": True,
-                "primary_opportunity_id": primary_analysis.get("opportunity_id"),
-                "copy_timestamp": datetime.now().isoformat(),
-            }
+            copied_data = self._copied_analysis_data(primary_analysis)
 
             # Store copy in database for audit trail
             try:
@@ -319,6 +288,179 @@ class AgnoSkipLogic:
             logger.error("Invalid combination of arguments for copy_agno_analysis")
             return None
 
+    @staticmethod
+    def _copied_analysis_data(primary: dict[str, Any]) -> dict[str, Any]:
+        """Build the copied analysis fields from a primary llm_monetization_analysis row."""
+        return {
+            "willingness_to_pay_score": primary.get("willingness_to_pay_score"),
+            "customer_segment": primary.get("customer_segment"),
+            "payment_sentiment": primary.get("payment_sentiment"),
+            "urgency_level": primary.get("urgency_level"),
+            "mentioned_price_points": primary.get("mentioned_price_points"),
+            "existing_payment_behavior": primary.get("existing_payment_behavior"),
+            "payment_friction_indicators": primary.get("payment_friction_indicators"),
+            "confidence": primary.get("confidence"),
+            "llm_monetization_score": primary.get("llm_monetization_score"),
+            "keyword_monetization_score": primary.get("keyword_monetization_score"),
+            "price_sensitivity_score": primary.get("price_sensitivity_score"),
+            "revenue_potential_score": primary.get("revenue_potential_score"),
+            "reasoning": primary.get("reasoning"),
+            "subreddit_multiplier": primary.get("subreddit_multiplier"),
+            "model_used": primary.get("model_used"),
+            "score_delta": primary.get("score_delta"),
+            # Tracking metadata
+            "copied_from_primary": True,
+            "primary_opportunity_id": primary.get("opportunity_id"),
+            "copy_timestamp": datetime.now().isoformat(),
+        }
+
+    def fetch_primary_analyses(
+        self,
+        concept_ids: list[Any],
+        supabase=None,
+        primary_ids: dict[Any, Any] | None = None,
+    ) -> dict[Any, dict[str, Any]]:
+        """
+        Fetch the most recent primary Agno analysis for many concepts in one query.
+
+        Calls the get_latest_primary_agno_analyses database function. Without it,
+        reads the latest_primary_agno_analysis view (DISTINCT ON
+        business_concept_id); if the view is missing too, it reads
+        llm_monetization_analysis directly and keeps the latest row per concept
+        in memory.
+
+        Args:
+            concept_ids: Business concept IDs
+            supabase: Supabase client (optional, uses self.client if None)
+            primary_ids: Concept ID -> primary llm_monetization_analysis ID, as kept in
+                submission_concept_status. When every concept has one, the
+                rows are read by ID instead.
+
+        Returns:
+            dict: Concept ID -> primary llm_monetization_analysis row, for concepts that have one
+        """
+        client = supabase if supabase is not None else self.client
+        ids = list(dict.fromkeys(c for c in concept_ids if c is not None))
+        if not ids:
+            return {}
+
+        if primary_ids and all(concept_id in primary_ids for concept_id in ids):
+            try:
+                response = (
+                    client.table("llm_monetization_analysis")
+                    .select("*")
+                    .in_("id", list(dict.fromkeys(primary_ids[c] for c in ids)))
+                    .execute()
+                )
+                return {
+                    row.get("business_concept_id"): row for row in response.data or []
+                }
+            except Exception as e:
+                logger.debug(
+                    f"Reading primary analyses by ID failed ({e}), using {PRIMARY_ANALYSIS_FUNCTION}"
+                )
+
+        try:
+            response = client.rpc(
+                PRIMARY_ANALYSIS_FUNCTION, {"p_concept_ids": ids}
+            ).execute()
+        except Exception as e:
+            logger.debug(f"{PRIMARY_ANALYSIS_FUNCTION} unavailable ({e}), reading the view")
+            try:
+                response = (
+                    client.table(PRIMARY_ANALYSIS_VIEW)
+                    .select("*")
+                    .in_("business_concept_id", ids)
+                    .execute()
+                )
+            except Exception as e:
+                logger.warning(
+                    f"{PRIMARY_ANALYSIS_VIEW} unavailable ({e}), reading llm_monetization_analysis"
+                )
+                response = (
+                    client.table("llm_monetization_analysis")
+                    .select("*")
+                    .in_("business_concept_id", ids)
+                    .eq("copied_from_primary", False)
+                    .execute()
+                )
+
+        latest: dict[Any, dict[str, Any]] = {}
+        for row in response.data or []:
+            concept_id = row.get("business_concept_id")
+            current = latest.get(concept_id)
+            if current is None or (
+                (row.get("analyzed_at") or "") > (current.get("analyzed_at") or "")
+            ):
+                latest[concept_id] = row
+        return latest
+
+    def copy_agno_analyses_batch(
+        self,
+        targets: list[tuple[dict[str, Any], Any]],
+        supabase=None,
+        primary_ids: dict[Any, Any] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Batch version of copy_agno_analysis for the orchestrator interface.
+
+        Fetches the primary Agno analyses for every concept in one query, fans
+        them out to the target submissions in memory, and stores the audit
+        copies with one insert.
+
+        Args:
+            targets: (submission, concept_id) pairs
+            supabase: Supabase client (optional, uses self.client if None)
+            primary_ids: Concept ID -> primary llm_monetization_analysis ID (optional)
+
+        Returns:
+            dict: Submission ID -> copied analysis data, for the targets that
+                could be copied
+        """
+        client = supabase if supabase is not None else self.client
+        primaries = self.fetch_primary_analyses(
+            [concept_id for _, concept_id in targets], client, primary_ids
+        )
+
+        copies: dict[str, dict[str, Any]] = {}
+        records = []
+        for submission, concept_id in targets:
+            target_submission_id = submission.get("submission_id")
+            if not target_submission_id:
+                logger.error("No submission_id found in submission data")
+                continue
+
+            primary = primaries.get(concept_id)
+            if primary is None:
+                logger.warning(f"No primary Agno analysis found for concept {concept_id}")
+                continue
+
+            copied_data = self._copied_analysis_data(primary)
+            copies[target_submission_id] = copied_data
+            records.append({
+                "opportunity_id": f"opp_{target_submission_id}",
+                "submission_id": target_submission_id,
+                "business_concept_id": concept_id,
+                **copied_data,
+            })
+
+        # Store copies in database for audit trail
+        if records:
+            try:
+                client.table("llm_monetization_analysis").insert(records).execute()
+            except Exception as db_error:
+                # Log warning but don't fail the copy operation
+                logger.warning(
+                    f"Failed to store {len(records)} Agno copies in database: {db_error}"
+                )
+
+        self.stats["copied"] += len(copies)
+        logger.info(
+            f"Copied Agno analyses for {len(copies)} of {len(targets)} submissions "
+            f"({len(primaries)} concepts)"
+        )
+        return copies
+
     def _copy_agno_analysis_original(
         self,
         source_submission_id: str,
@@ -0,0 +1,410 @@
+"""Semantic near-duplicate index over business concept text.
+
+SimpleDeduplicator fingerprints a concept with SHA256 over lightly
+normalized text. Only identical wording matches, so "Roommate chore tracker"
+and "Chore tracking app for roommates" become separate business_concepts,
+and each is paid for separately in Agno and profiler analysis.
+
+ConceptSimilarityIndex keeps one vector per concept and finds the most
+similar existing concept with a brute-force NumPy search. Vectors are
+hashed bag-of-words: lowercased tokens with stop words and app boilerplate
+("app", "tool", "platform"...) removed and plurals and -ing forms folded.
+This needs no ML dependency and is fast for tens of thousands of concepts.
+Cosine similarity is compared against a threshold
+(PipelineConfig.deduplication_threshold).
+
+Persistence is incremental. The index lives in a directory holding a
+vectors.npz snapshot and an additions.jsonl log. add() appends one line to
+the log, save() compacts the log into the snapshot, and load() replays the
+log on top of the snapshot.
+
+Usage:
+    from core.deduplication.concept_index import ConceptSimilarityIndex
+
+    index = ConceptSimilarityIndex.load("data/concept_index")
+    match = index.best_match("App to track chores between roommates", threshold=0.8)
+    if match is None:
+        index.add(concept_id, "roommate chore tracker", primary_opportunity_id)
+"""
+
+import json
+import logging
+import re
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default cosine similarity for attaching a concept to an existing one
+# (matches PipelineConfig.deduplication_threshold)
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+# Hashed vector width (float32, so 8 KB per concept)
+DEFAULT_DIMENSIONS = 2048
+
+SNAPSHOT_FILE = "vectors.npz"
+LOG_FILE = "additions.jsonl"
+
+# Function words and boilerplate that say nothing about what a concept does
+STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "any", "app", "application", "apps", "as", "at", "based",
+        "between", "by", "for", "from", "helps", "idea", "in", "into", "is", "it",
+        "mobile", "of", "on", "or", "platform", "service", "software", "that",
+        "the", "their", "them", "to", "tool", "users", "using", "web", "which",
+        "with", "your",
+    }
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _stem(token: str) -> str:
+    """Fold plurals and -ing/-er forms so "chores"/"chore" and "tracking"/"tracker" match."""
+    if len(token) > 4 and token.endswith("ies"):
+        token = token[:-3] + "y"
+    elif len(token) > 3 and token.endswith("es") and token[-3] in "sxz":
+        token = token[:-2]
+    elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        token = token[:-1]
+
+    if len(token) > 5 and token.endswith("ing"):
+        token = token[:-3]
+    elif len(token) > 4 and token.endswith("er"):
+        token = token[:-2]
+
+    # "planner"/"planning" -> "plann" -> "plan"; "invoice"/"invoicing" -> "invoic"
+    if len(token) > 3 and token[-1] == token[-2] and token[-1] not in "aeiouls":
+        token = token[:-1]
+    elif len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def concept_tokens(text: str) -> list[str]:
+    """
+    Tokenize concept text for similarity.
+
+    Args:
+        text: Concept text (raw or normalized)
+
+    Returns:
+        list: Stemmed content tokens
+    """
+    return [
+        _stem(token)
+        for token in _TOKEN_PATTERN.findall((text or "").lower())
+        if token not in STOP_WORDS
+    ]
+
+
+def vectorize_concept(text: str, dimensions: int = DEFAULT_DIMENSIONS) -> np.ndarray:
+    """
+    Hash concept text into an L2-normalized float32 vector.
+
+    CRC32 is used instead of hash() so vectors are identical across
+    processes and persisted snapshots stay valid.
+
+    Args:
+        text: Concept text
+        dimensions: Vector width
+
+    Returns:
+        np.ndarray: Unit vector (all zeros if the text has no content tokens)
+    """
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for token in set(concept_tokens(text)):
+        vector[zlib.crc32(token.encode("utf-8")) % dimensions] += 1.0
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+@dataclass
+class ConceptMatch:
+    """An existing concept similar to a query."""
+
+    concept_id: Any
+    concept_name: str
+    similarity: float
+    primary_opportunity_id: str | None = None
+
+
+class ConceptSimilarityIndex:
+    """
+    In-memory similarity index of business concepts with incremental persistence.
+
+    Attributes:
+        dimensions: Vector width
+        path: Directory the index persists to (None for memory only)
+
+    Examples:
+        >>> index = ConceptSimilarityIndex()
+        >>> index.add(1, "roommate chore tracker", "opp-1")
+        >>> index.best_match("Chore tracking app for roommates").concept_id
+        1
+    """
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS, path: str | Path | None = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            dimensions: Vector width
+            path: Directory to persist additions to (None for memory only)
+        """
+        self.dimensions = dimensions
+        self.path = Path(path) if path is not None else None
+
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._size = 0
+        self._concept_ids: list[Any] = []
+        self._names: list[str] = []
+        self._primary_ids: list[str | None] = []
+        self._rows: dict[Any, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, concept_id: Any) -> bool:
+        return concept_id in self._rows
+
+    def add(
+        self,
+        concept_id: Any,
+        concept_name: str,
+        primary_opportunity_id: str | None = None,
+        persist: bool = True,
+    ) -> None:
+        """
+        Add a concept, or replace the text of one already indexed.
+
+        Args:
+            concept_id: business_concepts.id
+            concept_name: Concept text
+            primary_opportunity_id: Opportunity that created the concept
+            persist: Append the addition to the on-disk log (if path is set)
+        """
+        vector = vectorize_concept(concept_name, self.dimensions)
+
+        with self._lock:
+            row = self._rows.get(concept_id)
+            if row is None:
+                row = self._size
+                self._reserve(row + 1)
+                self._rows[concept_id] = row
+                self._concept_ids.append(concept_id)
+                self._names.append(concept_name)
+                self._primary_ids.append(primary_opportunity_id)
+                self._size += 1
+            else:
+                self._names[row] = concept_name
+                self._primary_ids[row] = primary_opportunity_id
+            self._vectors[row] = vector
+
+            if persist and self.path is not None:
+                self.path.mkdir(parents=True, exist_ok=True)
+                with (self.path / LOG_FILE).open("a", encoding="utf-8") as log:
+                    log.write(
+                        json.dumps(
+                            {
+                                "concept_id": concept_id,
+                                "concept_name": concept_name,
+                                "primary_opportunity_id": primary_opportunity_id,
+                            }
+                        )
+                        + "\n"
+                    )
+
+    def search(
+        self,
+        text: str,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        top_k: int = 5,
+    ) -> list[ConceptMatch]:
+        """
+        Find indexed concepts at least ``threshold`` similar to text.
+
+        Args:
+            text: Query concept text
+            threshold: Minimum cosine similarity
+            top_k: Maximum number of matches
+
+        Returns:
+            list: ConceptMatch objects, most similar first
+        """
+        query = vectorize_concept(text, self.dimensions)
+        if not query.any():
+            return []
+
+        with self._lock:
+            if self._size == 0:
+                return []
+            scores = self._vectors[: self._size] @ query
+            candidates = np.flatnonzero(scores >= threshold)
+            if candidates.size > top_k:
+                candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            return [
+                ConceptMatch(
+                    concept_id=self._concept_ids[row],
+                    concept_name=self._names[row],
+                    similarity=float(scores[row]),
+                    primary_opportunity_id=self._primary_ids[row],
+                )
+                for row in candidates
+            ]
+
+    def best_match(
+        self, text: str, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> ConceptMatch | None:
+        """
+        Most similar indexed concept, if any reaches ``threshold``.
+
+        Args:
+            text: Query concept text
+            threshold: Minimum cosine similarity
+
+        Returns:
+            ConceptMatch or None
+        """
+        matches = self.search(text, threshold, top_k=1)
+        return matches[0] if matches else None
+
+    def save(self, path: str | Path | None = None) -> None:
+        """
+        Write a snapshot and clear the additions log.
+
+        Args:
+            path: Directory to save to (default: self.path)
+
+        Raises:
+            ValueError: If neither path nor self.path is set
+        """
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("No path given for ConceptSimilarityIndex.save()")
+        target.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            metadata = {
+                "dimensions": self.dimensions,
+                "concept_ids": self._concept_ids,
+                "concept_names": self._names,
+                "primary_opportunity_ids": self._primary_ids,
+            }
+            snapshot = target / SNAPSHOT_FILE
+            temporary = target / f"{SNAPSHOT_FILE}.tmp"
+            with temporary.open("wb") as f:
+                np.savez(
+                    f,
+                    vectors=self._vectors[: self._size],
+                    metadata=np.array(json.dumps(metadata)),
+                )
+            temporary.replace(snapshot)
+            (target / LOG_FILE).unlink(missing_ok=True)
+
+        logger.info(f"Saved concept index with {self._size} concepts to {target}")
+
+    @classmethod
+    def load(cls, path: str | Path, dimensions: int = DEFAULT_DIMENSIONS) -> "ConceptSimilarityIndex":
+        """
+        Load an index directory, replaying additions logged since the snapshot.
+
+        A missing directory gives an empty index that persists to it.
+
+        Args:
+            path: Index directory
+            dimensions: Vector width for a new index (a snapshot keeps its own)
+
+        Returns:
+            ConceptSimilarityIndex
+        """
+        path = Path(path)
+        snapshot = path / SNAPSHOT_FILE
+
+        if snapshot.exists():
+            with np.load(snapshot, allow_pickle=False) as data:
+                metadata = json.loads(str(data["metadata"]))
+                vectors = data["vectors"]
+            index = cls(dimensions=metadata["dimensions"], path=path)
+            index._vectors = vectors.astype(np.float32, copy=True)
+            index._size = len(vectors)
+            index._concept_ids = metadata["concept_ids"]
+            index._names = metadata["concept_names"]
+            index._primary_ids = metadata["primary_opportunity_ids"]
+            index._rows = {concept_id: row for row, concept_id in enumerate(index._concept_ids)}
+        else:
+            index = cls(dimensions=dimensions, path=path)
+
+        log = path / LOG_FILE
+        replayed = 0
+        if log.exists():
+            with log.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn last line from an interrupted write
+                        logger.warning(f"Skipping unreadable line in {log}")
+                        continue
+                    index.add(
+                        entry["concept_id"],
+                        entry["concept_name"],
+                        entry.get("primary_opportunity_id"),
+                        persist=False,
+                    )
+                    replayed += 1
+
+        logger.info(
+            f"Loaded concept index from {path}: {len(index)} concepts "
+            f"({replayed} replayed from log)"
+        )
+        return index
+
+    @classmethod
+    def from_concepts(
+        cls,
+        concepts: list[dict[str, Any]],
+        dimensions: int = DEFAULT_DIMENSIONS,
+        path: str | Path | None = None,
+    ) -> "ConceptSimilarityIndex":
+        """
+        Build an index from business_concepts rows.
+
+        Args:
+            concepts: Rows with id, concept_name and primary_opportunity_id
+            dimensions: Vector width
+            path: Directory the index persists to
+
+        Returns:
+            ConceptSimilarityIndex
+        """
+        index = cls(dimensions=dimensions, path=path)
+        for concept in concepts:
+            if concept.get("id") is not None and concept.get("concept_name"):
+                index.add(
+                    concept["id"],
+                    concept["concept_name"],
+                    concept.get("primary_opportunity_id"),
+                    persist=False,
+                )
+        return index
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the vector matrix geometrically. Caller must hold the lock."""
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return
+        grown = np.zeros((max(rows, capacity * 2, 64), self.dimensions), dtype=np.float32)
+        grown[: self._size] = self._vectors[: self._size]
+        self._vectors = grown
@@ -5,17 +5,29 @@ deduplication. Extracted from batch_opportunity_scoring.py to centralize
 concept lookup and analysis status tracking.
 
 Key Features:
-- Get or create business concepts
+- Get or create business concepts (singly or in bulk)
 - Track analysis status (Agno, Profiler)
 - Query concepts by submission ID
 - Update concept metadata
+- Lease concepts so concurrent workers analyze each one once
 """
 
 import logging
+from collections import Counter
+from collections.abc import Iterable
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Analysis type -> business_concepts flag column
+ANALYSIS_STATUS_FIELDS = {
+    "agno": "has_agno_analysis",
+    "profiler": "has_profiler_analysis",
+}
+
+# Seconds an analysis lease lasts if its holder never releases it
+DEFAULT_LEASE_SECONDS = 900
+
 
 class BusinessConceptManager:
     """
@@ -112,6 +124,84 @@ class BusinessConceptManager:
             logger.error(f"Error in get_or_create_concept for {submission_id}: {e}")
             return None
 
+    def get_or_create_concepts(
+        self, concepts: Iterable[tuple[str, str]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get or create business concepts for many submissions at once.
+
+        Inserts the missing concepts with one upsert keyed on
+        primary_submission_id that skips existing rows, then selects the
+        existing ones in a second query. Existing concepts are returned as
+        stored (concept_text is not overwritten), and two workers creating
+        the same concept at the same time both receive the one row the
+        database kept. New concepts get the column defaults (no analysis,
+        submission_count 1).
+
+        Args:
+            concepts: (submission_id, concept_text) pairs. If a submission ID
+                repeats, its last concept text is used.
+
+        Returns:
+            dict: Business concept record keyed by primary_submission_id.
+                Empty if a query failed.
+
+        Examples:
+            >>> rows = manager.get_or_create_concepts([
+            ...     ('sub123', 'Fitness tracker'),
+            ...     ('sub456', 'Meal planner'),
+            ... ])
+            >>> rows['sub123']['primary_submission_id']
+            'sub123'
+        """
+        # ON CONFLICT cannot touch the same row twice in one statement
+        texts = {
+            submission_id: concept_text
+            for submission_id, concept_text in concepts
+            if submission_id
+        }
+        if not texts:
+            return {}
+
+        payload = [
+            {"primary_submission_id": submission_id, "concept_text": concept_text}
+            for submission_id, concept_text in texts.items()
+        ]
+
+        try:
+            response = (
+                self.client.table(self.table)
+                .upsert(
+                    payload,
+                    on_conflict="primary_submission_id",
+                    ignore_duplicates=True,
+                    default_to_null=False,
+                )
+                .execute()
+            )
+            rows = {row["primary_submission_id"]: row for row in response.data or []}
+
+            # Rows that already existed are not returned by the upsert
+            existing = [submission_id for submission_id in texts if submission_id not in rows]
+            if existing:
+                response = (
+                    self.client.table(self.table)
+                    .select("*")
+                    .in_("primary_submission_id", existing)
+                    .execute()
+                )
+                rows.update((row["primary_submission_id"], row) for row in response.data or [])
+        except Exception as e:
+            logger.error(f"Error in get_or_create_concepts for {len(payload)} submissions: {e}")
+            return {}
+
+        missing = len(texts) - len(rows)
+        if missing:
+            logger.warning(f"Found or created no concept for {missing} submissions")
+
+        logger.debug(f"Resolved {len(rows)} business concepts")
+        return rows
+
     def update_analysis_status(
         self, concept_id: int, analysis_type: str, status: bool = True
     ) -> bool:
@@ -139,12 +229,7 @@ class BusinessConceptManager:
             True
         """
         try:
-            field_map = {
-                "agno": "has_agno_analysis",
-                "profiler": "has_profiler_analysis",
-            }
-
-            field = field_map.get(analysis_type)
+            field = ANALYSIS_STATUS_FIELDS.get(analysis_type)
             if not field:
                 raise ValueError(
                     f"Unknown analysis type: {analysis_type}. "
@@ -166,6 +251,53 @@ class BusinessConceptManager:
             )
             return False
 
+    def update_analysis_statuses(
+        self, concept_ids: Iterable[int], analysis_type: str, status: bool = True
+    ) -> bool:
+        """
+        Update the analysis status flag for many concepts in one request.
+
+        Bulk variant of update_analysis_status.
+
+        Args:
+            concept_ids: IDs of the business concepts
+            analysis_type: Type of analysis ('agno' or 'profiler')
+            status: Status value to set (default: True)
+
+        Returns:
+            bool: True if update succeeded (or there was nothing to update),
+                False otherwise
+
+        Raises:
+            ValueError: If analysis_type is not 'agno' or 'profiler'
+
+        Examples:
+            >>> manager.update_analysis_statuses([42, 43], 'agno')
+            True
+        """
+        field = ANALYSIS_STATUS_FIELDS.get(analysis_type)
+        if not field:
+            raise ValueError(
+                f"Unknown analysis type: {analysis_type}. "
+                f"Must be 'agno' or 'profiler'"
+            )
+
+        ids = list(dict.fromkeys(concept_ids))
+        if not ids:
+            return True
+
+        try:
+            self.client.table(self.table).update({field: status}).in_(
+                "id", ids
+            ).execute()
+
+            logger.debug(f"Updated {analysis_type} status to {status} for {len(ids)} concepts")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating analysis status for {len(ids)} concepts: {e}")
+            return False
+
     def get_concept_for_submission(
         self, submission_id: str
     ) -> Optional[dict[str, Any]]:
@@ -280,3 +412,125 @@ class BusinessConceptManager:
                 f"Error incrementing submission count for concept {concept_id}: {e}"
             )
             return False
+
+    def increment_submission_counts(self, concept_ids: Iterable[int]) -> bool:
+        """
+        Increment submission counts for many concepts in one request.
+
+        Bulk variant of increment_submission_count. Uses the
+        increment_concept_counts RPC, which adds to the stored count in the
+        database instead of reading and rewriting it, so concurrent workers
+        do not lose increments.
+
+        Args:
+            concept_ids: IDs of the business concepts. An ID that appears
+                several times is incremented once per appearance.
+
+        Returns:
+            bool: True if increment succeeded (or there was nothing to
+                increment), False otherwise
+
+        Examples:
+            >>> manager.increment_submission_counts([42, 42, 43])
+            True
+        """
+        increments = Counter(int(concept_id) for concept_id in concept_ids)
+        if not increments:
+            return True
+
+        try:
+            self.client.rpc(
+                "increment_concept_counts",
+                {
+                    "p_concept_ids": list(increments),
+                    "p_increments": list(increments.values()),
+                },
+            ).execute()
+
+            logger.debug(f"Incremented submission counts for {len(increments)} concepts")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error incrementing submission counts for {len(increments)} concepts: {e}")
+            return False
+
+    def acquire_analysis_lease(
+        self,
+        concept_id: int,
+        holder: str,
+        ttl_seconds: int = DEFAULT_LEASE_SECONDS,
+        require_agno: bool = True,
+        require_profiler: bool = True,
+    ) -> bool:
+        """
+        Claim the right to run fresh analysis for a concept.
+
+        Calls the acquire_concept_analysis_lease RPC, which succeeds if the
+        concept has no analysis from the required services yet and no other
+        holder has an unexpired lease. If the RPC is unavailable the lease is
+        treated as acquired, so analysis still runs.
+
+        Args:
+            concept_id: ID of the business concept
+            holder: Identifier of the worker taking the lease
+            ttl_seconds: Seconds until the lease expires on its own
+            require_agno: Refuse the lease if the concept has Agno analysis
+            require_profiler: Refuse the lease if the concept has profiler analysis
+
+        Returns:
+            bool: True if this worker may analyze the concept
+
+        Examples:
+            >>> if manager.acquire_analysis_lease(42, 'worker-1'):
+            ...     try:
+            ...         analyze()
+            ...     finally:
+            ...         manager.release_analysis_lease(42, 'worker-1')
+        """
+        try:
+            response = self.client.rpc(
+                "acquire_concept_analysis_lease",
+                {
+                    "p_concept_id": int(concept_id),
+                    "p_holder": holder,
+                    "p_ttl_seconds": int(ttl_seconds),
+                    "p_require_agno": bool(require_agno),
+                    "p_require_profiler": bool(require_profiler),
+                },
+            ).execute()
+
+            acquired = response.data is True
+            logger.debug(
+                f"Analysis lease for concept {concept_id} "
+                f"{'acquired' if acquired else 'held elsewhere'} ({holder})"
+            )
+            return acquired
+
+        except Exception as e:
+            logger.warning(
+                f"Could not acquire analysis lease for concept {concept_id}, "
+                f"analyzing without it: {e}"
+            )
+            return True
+
+    def release_analysis_lease(self, concept_id: int, holder: str) -> bool:
+        """
+        Release an analysis lease taken with acquire_analysis_lease.
+
+        Args:
+            concept_id: ID of the business concept
+            holder: Identifier of the worker that holds the lease
+
+        Returns:
+            bool: True if the lease was released, False otherwise
+        """
+        try:
+            response = self.client.rpc(
+                "release_concept_analysis_lease",
+                {"p_concept_id": int(concept_id), "p_holder": holder},
+            ).execute()
+            return response.data is True
+
+        except Exception as e:
+            logger.warning(f"Could not release analysis lease for concept {concept_id}: {e}")
+            return False
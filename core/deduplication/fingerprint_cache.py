@@ -0,0 +1,285 @@
+"""In-process fingerprint -> business concept cache.
+
+SimpleDeduplicator.find_existing_concept() queries Supabase once per
+opportunity. Most fingerprints in a batch are new, so most of those round
+trips return nothing. FingerprintCache is warmed with every known
+fingerprint in one bulk query and kept current as concepts are created:
+
+- An LRU map holds recently seen concepts, so repeat hits skip the database.
+- A Bloom filter holds every known fingerprint. A negative answer is
+  definite, so a new fingerprint skips the database entirely. A positive
+  answer may be a false positive (at the configured rate), so the database
+  is still asked.
+
+Concepts created by other processes after the cache was warmed are not in
+the filter. SimpleDeduplicator handles that: if creating the concept hits
+the fingerprint unique constraint, it falls back to a database lookup.
+
+Usage:
+    from core.deduplication.fingerprint_cache import FingerprintCache
+
+    cache = FingerprintCache()
+    cache.warm(rows)                 # rows with concept_fingerprint
+    concept = cache.get(fingerprint)
+    if concept is None and cache.might_contain(fingerprint):
+        concept = query_database(fingerprint)
+"""
+
+import hashlib
+import logging
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Concepts kept in the LRU map
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Fingerprints the Bloom filter is sized for (grows on warm() if exceeded)
+DEFAULT_EXPECTED_FINGERPRINTS = 100_000
+
+# Bloom filter false positive rate at the expected size
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings using double hashing of a BLAKE2b digest.
+
+    Attributes:
+        size_bits: Number of bits
+        num_hashes: Bit positions set per key
+        count: Number of keys added
+
+    Examples:
+        >>> bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        >>> bloom.add("abc")
+        >>> "abc" in bloom
+        True
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE):
+        """
+        Size the filter for ``capacity`` keys at ``false_positive_rate``.
+
+        Args:
+            capacity: Expected number of keys (must be positive)
+            false_positive_rate: Target false positive rate, between 0 and 1
+
+        Raises:
+            ValueError: If capacity or false_positive_rate is out of range
+        """
+        if capacity <= 0 or not 0 < false_positive_rate < 1:
+            raise ValueError("capacity must be positive and false_positive_rate in (0, 1)")
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.size_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.size_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = np.zeros((self.size_bits + 7) // 8, dtype=np.uint8)
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> None:
+        """Add a key."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+
+@dataclass
+class CacheStatistics:
+    """Statistics for a fingerprint cache."""
+
+    hits: int = 0
+    misses: int = 0
+    bloom_negatives: int = 0
+    bloom_false_positives: int = 0
+    database_lookups: int = 0
+    evictions: int = 0
+    warmed_fingerprints: int = 0
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get statistics summary."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            # Misses answered without a database round trip
+            "bloom_negatives": self.bloom_negatives,
+            "bloom_false_positives": self.bloom_false_positives,
+            "database_lookups": self.database_lookups,
+            "evictions": self.evictions,
+            "warmed_fingerprints": self.warmed_fingerprints,
+        }
+
+
+class FingerprintCache:
+    """
+    LRU map of fingerprint -> concept backed by a Bloom filter of all fingerprints.
+
+    Until warm() succeeds the cache is cold: might_contain() answers True for
+    everything so callers keep asking the database.
+
+    Attributes:
+        max_entries: Concepts kept in the LRU map
+        stats: CacheStatistics for this cache
+
+    Examples:
+        >>> cache = FingerprintCache(max_entries=1000)
+        >>> cache.warm([{"id": 1, "concept_fingerprint": "ab12..."}])
+        >>> cache.get("ab12...")["id"]
+        1
+        >>> cache.might_contain("ffff...")
+        False
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        expected_fingerprints: int = DEFAULT_EXPECTED_FINGERPRINTS,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ):
+        """
+        Initialize a cold cache.
+
+        Args:
+            max_entries: Concepts kept in the LRU map
+            expected_fingerprints: Fingerprints the Bloom filter is sized for
+            false_positive_rate: Bloom filter false positive rate
+        """
+        self.max_entries = max_entries
+        self.expected_fingerprints = expected_fingerprints
+        self.false_positive_rate = false_positive_rate
+        self.stats = CacheStatistics()
+
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._bloom: BloomFilter | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_warm(self) -> bool:
+        """True once the Bloom filter holds every known fingerprint."""
+        return self._bloom is not None
+
+    def warm(self, concepts: list[dict[str, Any]]) -> None:
+        """
+        Load every known concept (one bulk query's worth of rows).
+
+        The most recent max_entries rows also go into the LRU map. Concepts
+        put() before warming are kept.
+
+        Args:
+            concepts: business_concepts rows with concept_fingerprint
+        """
+        rows = [c for c in concepts if c.get("concept_fingerprint")]
+        bloom = BloomFilter(
+            max(self.expected_fingerprints, 2 * len(rows)), self.false_positive_rate
+        )
+        for row in rows:
+            bloom.add(row["concept_fingerprint"])
+
+        with self._lock:
+            for fingerprint in self._entries:
+                if fingerprint not in bloom:
+                    bloom.add(fingerprint)
+            entries = OrderedDict(
+                (row["concept_fingerprint"], row)
+                for row in (rows[-self.max_entries:] if self.max_entries > 0 else [])
+            )
+            entries.update(self._entries)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._bloom = bloom
+            self._entries = entries
+            self.stats.warmed_fingerprints = len(rows)
+
+        logger.info(
+            f"Warmed fingerprint cache with {len(rows)} concepts "
+            f"(Bloom filter: {bloom.size_bits // 8 // 1024} KB, {bloom.num_hashes} hashes)"
+        )
+
+    def get(self, fingerprint: str) -> dict[str, Any] | None:
+        """
+        Return the cached concept for a fingerprint, marking it recently used.
+
+        Args:
+            fingerprint: Concept fingerprint
+
+        Returns:
+            Concept dict, or None if not in the LRU map
+        """
+        with self._lock:
+            concept = self._entries.get(fingerprint)
+            if concept is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(fingerprint)
+            self.stats.hits += 1
+            return concept
+
+    def might_contain(self, fingerprint: str) -> bool:
+        """
+        Whether the database may hold this fingerprint.
+
+        False is definite and is counted as a Bloom negative. A cold cache
+        always answers True.
+
+        Args:
+            fingerprint: Concept fingerprint
+
+        Returns:
+            bool
+        """
+        with self._lock:
+            if self._bloom is None or fingerprint in self._bloom:
+                self.stats.database_lookups += 1
+                return True
+            self.stats.bloom_negatives += 1
+            return False
+
+    def put(self, fingerprint: str, concept: dict[str, Any]) -> None:
+        """
+        Record a concept found in or written to the database.
+
+        Args:
+            fingerprint: Concept fingerprint
+            concept: Concept dict (at least id and primary_opportunity_id)
+        """
+        with self._lock:
+            if self._bloom is not None and fingerprint not in self._bloom:
+                self._bloom.add(fingerprint)
+                if self._bloom.count > self._bloom.capacity:
+                    logger.warning(
+                        f"Fingerprint Bloom filter holds {self._bloom.count} keys, over its "
+                        f"capacity of {self._bloom.capacity}; re-warm to keep misses cheap"
+                    )
+            if self.max_entries <= 0:
+                return
+            self._entries[fingerprint] = concept
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def record_false_positive(self) -> None:
+        """Count a database lookup that the Bloom filter let through but found nothing."""
+        with self._lock:
+            self.stats.bloom_false_positives += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -20,6 +20,12 @@ from core.deduplication.concept_manager import BusinessConceptManager
 
 logger = logging.getLogger(__name__)
 
+# View holding the most recent primary (non-copied) row per business concept
+PRIMARY_PROFILE_VIEW = "latest_primary_profiler_analysis"
+
+# Database function returning the same rows with one index probe per concept
+PRIMARY_PROFILE_FUNCTION = "get_latest_primary_profiler_analyses"
+
 
 class ProfilerSkipLogic:
     """
@@ -168,25 +174,7 @@ class ProfilerSkipLogic:
             source_submission_id = primary_profile.get("submission_id")
 
             # Create profile data for orchestrator return (without inserting)
-            copied_data = {
-                "app_name": primary_profile.get("app_name"),
-                "core_functions": primary_profile.get("core_functions"),
-                "value_proposition": primary_profile.get("value_proposition"),
-                "problem_description": primary_profile.get("problem_description"),
-                "app_concept": primary_profile.get("app_concept"),
-                "target_user": primary_profile.get("target_user"),
-                "monetization_model": primary_profile.get("monetization_model"),
-                "final_score": primary_profile.get("final_score"),
-                "market_demand": primary_profile.get("market_demand"),
-                "pain_intensity": primary_profile.get("pain_intensity"),
-                "monetization_potential": primary_profile.get("monetization_potential"),
-                "market_gap": primary_profile.get("market_gap"),
-                "technical_feasibility": primary_profile.get("technical_feasibility"),
-                # Tracking metadata
-                "copied_from_primary": True,
-                "primary_opportunity_id": primary_profile.get("opportunity_id"),
-                "copy_timestamp": datetime.now().isoformat(),
-            }
+            copied_data = self._copied_profile_data(primary_profile)
 
             # Store copy in database for audit trail
             try:
@@ -219,6 +207,175 @@ class ProfilerSkipLogic:
             logger.error("Invalid combination of arguments for copy_profiler_analysis")
             return None
 
+    @staticmethod
+    def _copied_profile_data(primary: dict[str, Any]) -> dict[str, Any]:
+        """Build the copied profile fields from a primary workflow_results row."""
+        return {
+            "app_name": primary.get("app_name"),
+            "core_functions": primary.get("core_functions"),
+            "value_proposition": primary.get("value_proposition"),
+            "problem_description": primary.get("problem_description"),
+            "app_concept": primary.get("app_concept"),
+            "target_user": primary.get("target_user"),
+            "monetization_model": primary.get("monetization_model"),
+            "final_score": primary.get("final_score"),
+            "market_demand": primary.get("market_demand"),
+            "pain_intensity": primary.get("pain_intensity"),
+            "monetization_potential": primary.get("monetization_potential"),
+            "market_gap": primary.get("market_gap"),
+            "technical_feasibility": primary.get("technical_feasibility"),
+            # Tracking metadata
+            "copied_from_primary": True,
+            "primary_opportunity_id": primary.get("opportunity_id"),
+            "copy_timestamp": datetime.now().isoformat(),
+        }
+
+    def fetch_primary_profiles(
+        self,
+        concept_ids: list[Any],
+        supabase=None,
+        primary_ids: dict[Any, Any] | None = None,
+    ) -> dict[Any, dict[str, Any]]:
+        """
+        Fetch the most recent primary AI profile for many concepts in one query.
+
+        Calls the get_latest_primary_profiler_analyses database function. Without it,
+        reads the latest_primary_profiler_analysis view (DISTINCT ON
+        business_concept_id); if the view is missing too, it reads
+        workflow_results directly and keeps the latest row per concept in memory.
+
+        Args:
+            concept_ids: Business concept IDs
+            supabase: Supabase client (optional, uses self.client if None)
+            primary_ids: Concept ID -> primary workflow_results ID, as kept in
+                submission_concept_status. When every concept has one, the
+                rows are read by ID instead.
+
+        Returns:
+            dict: Concept ID -> primary workflow_results row, for concepts that have one
+        """
+        client = supabase if supabase is not None else self.client
+        ids = list(dict.fromkeys(c for c in concept_ids if c is not None))
+        if not ids:
+            return {}
+
+        if primary_ids and all(concept_id in primary_ids for concept_id in ids):
+            try:
+                response = (
+                    client.table("workflow_results")
+                    .select("*")
+                    .in_("id", list(dict.fromkeys(primary_ids[c] for c in ids)))
+                    .execute()
+                )
+                return {
+                    row.get("business_concept_id"): row for row in response.data or []
+                }
+            except Exception as e:
+                logger.debug(
+                    f"Reading primary profiles by ID failed ({e}), using {PRIMARY_PROFILE_FUNCTION}"
+                )
+
+        try:
+            response = client.rpc(
+                PRIMARY_PROFILE_FUNCTION, {"p_concept_ids": ids}
+            ).execute()
+        except Exception as e:
+            logger.debug(f"{PRIMARY_PROFILE_FUNCTION} unavailable ({e}), reading the view")
+            try:
+                response = (
+                    client.table(PRIMARY_PROFILE_VIEW)
+                    .select("*")
+                    .in_("business_concept_id", ids)
+                    .execute()
+                )
+            except Exception as e:
+                logger.warning(
+                    f"{PRIMARY_PROFILE_VIEW} unavailable ({e}), reading workflow_results"
+                )
+                response = (
+                    client.table("workflow_results")
+                    .select("*")
+                    .in_("business_concept_id", ids)
+                    .eq("copied_from_primary", False)
+                    .execute()
+                )
+
+        latest: dict[Any, dict[str, Any]] = {}
+        for row in response.data or []:
+            concept_id = row.get("business_concept_id")
+            current = latest.get(concept_id)
+            if current is None or (
+                (row.get("processed_at") or "") > (current.get("processed_at") or "")
+            ):
+                latest[concept_id] = row
+        return latest
+
+    def copy_profiler_analyses_batch(
+        self,
+        targets: list[tuple[dict[str, Any], Any]],
+        supabase=None,
+        primary_ids: dict[Any, Any] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Batch version of copy_profiler_analysis for the orchestrator interface.
+
+        Fetches the primary AI profiles for every concept in one query, fans
+        them out to the target submissions in memory, and stores the audit
+        copies with one insert.
+
+        Args:
+            targets: (submission, concept_id) pairs
+            supabase: Supabase client (optional, uses self.client if None)
+            primary_ids: Concept ID -> primary workflow_results ID (optional)
+
+        Returns:
+            dict: Submission ID -> copied profile data, for the targets that
+                could be copied
+        """
+        client = supabase if supabase is not None else self.client
+        primaries = self.fetch_primary_profiles(
+            [concept_id for _, concept_id in targets], client, primary_ids
+        )
+
+        copies: dict[str, dict[str, Any]] = {}
+        records = []
+        for submission, concept_id in targets:
+            target_submission_id = submission.get("submission_id")
+            if not target_submission_id:
+                logger.error("No submission_id found in submission data")
+                continue
+
+            primary = primaries.get(concept_id)
+            if primary is None:
+                logger.warning(f"No primary AI profile found for concept {concept_id}")
+                continue
+
+            copied_data = self._copied_profile_data(primary)
+            copies[target_submission_id] = copied_data
+            records.append({
+                "opportunity_id": f"opp_{target_submission_id}",
+                "submission_id": target_submission_id,
+                "business_concept_id": concept_id,
+                **copied_data,
+            })
+
+        # Store copies in database for audit trail
+        if records:
+            try:
+                client.table("workflow_results").insert(records).execute()
+            except Exception as db_error:
+                # Log warning but don't fail the copy operation
+                logger.warning(
+                    f"Failed to store {len(records)} profiler copies in database: {db_error}"
+                )
+
+        self.stats["copied"] += len(copies)
+        logger.info(
+            f"Copied AI profiles for {len(copies)} of {len(targets)} submissions "
+            f"({len(primaries)} concepts)"
+        )
+        return copies
+
     def _copy_profiler_analysis_original(
         self,
         source_submission_id: str,
@@ -0,0 +1,1255 @@
+"""
+RedditHarbor Semantic Deduplication Engine
+Phase 1: String-based deduplication (no ML dependencies)
+
+Task 2 Implementation: SimpleDeduplicator class with fingerprint generation.
+This module provides basic deduplication functionality using normalized concept
+fingerprints to identify duplicate business concepts from Reddit data.
+
+With a similarity_threshold, concepts that miss the exact fingerprint are
+matched against a ConceptSimilarityIndex (core/deduplication/concept_index.py),
+so reworded near-duplicates attach to the existing concept instead of creating
+a new one.
+
+With a fingerprint_cache_size, exact fingerprint lookups go through a
+FingerprintCache (core/deduplication/fingerprint_cache.py), warmed from
+business_concepts in one bulk query, so repeat hits and definite misses skip
+the database.
+
+Both are off by default; from_pipeline_config() turns them on as configured.
+"""
+
+import hashlib
+import logging
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from core.deduplication.concept_index import (
+    LOG_FILE,
+    SNAPSHOT_FILE,
+    ConceptSimilarityIndex,
+)
+from core.deduplication.fingerprint_cache import DEFAULT_MAX_ENTRIES, FingerprintCache
+
+try:
+    from supabase import Client, create_client
+except ImportError:
+    Client = None
+    create_client = None
+
+logger = logging.getLogger(__name__)
+
+
+class SimpleDeduplicator:
+    """
+    Phase 1: String-based deduplication using normalized concept fingerprints.
+    No ML dependencies - fast, simple, effective for ~40-50% duplicates.
+
+    This class provides core functionality for:
+    - Normalizing business concept text
+    - Generating SHA256 fingerprints for deduplication
+    - Near-duplicate matching through a concept similarity index
+    - An in-process fingerprint cache in front of business_concepts lookups
+    - Integration with Supabase for storage and retrieval
+    """
+
+    # Rows per request when bootstrapping the similarity index and fingerprint cache
+    CONCEPT_PAGE_SIZE = 1000
+
+    # Fingerprints (or opportunity IDs) per .in_() filter, keeping request URLs short
+    FINGERPRINT_QUERY_CHUNK = 200
+
+    def __init__(
+        self,
+        supabase_url: str,
+        supabase_key: str,
+        similarity_threshold: float | None = None,
+        index_path: str | Path | None = None,
+        fingerprint_cache_size: int | None = None,
+    ):
+        """
+        Initialize with Supabase client.
+
+        Args:
+            supabase_url: Supabase project URL
+            supabase_key: Supabase service role key
+            similarity_threshold: Cosine similarity at which a concept joins an
+                existing one (None, the default, disables near-duplicate matching)
+            index_path: Directory to persist the similarity index in (None keeps
+                it in memory and rebuilds it from business_concepts)
+            fingerprint_cache_size: Concepts kept in the in-process LRU map
+                (None, the default, disables the fingerprint cache)
+
+        Raises:
+            ImportError: If supabase package is not installed
+            Exception: If Supabase client creation fails
+        """
+        if create_client is None:
+            raise ImportError(
+                "supabase package is required. Install with: pip install supabase"
+            )
+
+        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.similarity_threshold = similarity_threshold
+        self.index_path = Path(index_path) if index_path is not None else None
+        self._concept_index: ConceptSimilarityIndex | None = None
+        self._fingerprint_cache = (
+            FingerprintCache(max_entries=fingerprint_cache_size)
+            if fingerprint_cache_size is not None
+            else None
+        )
+        self._cache_warm_attempted = False
+        logger.info(f"SimpleDeduplicator initialized with Supabase URL: {supabase_url}")
+
+    @classmethod
+    def from_pipeline_config(
+        cls,
+        config: Any,
+        supabase_url: str,
+        supabase_key: str,
+        index_path: str | Path | None = None,
+    ) -> "SimpleDeduplicator":
+        """
+        Create a deduplicator that follows a PipelineConfig.
+
+        Uses config.deduplication_threshold as the similarity threshold and
+        enables the fingerprint cache. Both stay disabled when
+        config.enable_deduplication is False.
+
+        Args:
+            config: PipelineConfig
+            supabase_url: Supabase project URL
+            supabase_key: Supabase service role key
+            index_path: Directory to persist the similarity index in
+
+        Returns:
+            SimpleDeduplicator
+        """
+        if not config.enable_deduplication:
+            return cls(supabase_url, supabase_key, index_path=index_path)
+        return cls(
+            supabase_url,
+            supabase_key,
+            similarity_threshold=config.deduplication_threshold,
+            index_path=index_path,
+            fingerprint_cache_size=DEFAULT_MAX_ENTRIES,
+        )
+
+    def normalize_concept(self, concept: str) -> str:
+        """
+        Normalize business concept for fingerprinting.
+
+        This method standardizes text by:
+        - Converting to lowercase
+        - Removing common app-related prefixes
+        - Normalizing whitespace
+        - Stripping leading/trailing spaces
+
+        Args:
+            concept: Raw business concept text
+
+        Returns:
+            Normalized concept string
+        """
+        if not concept:
+            return ""
+
+        # Convert to lowercase and strip whitespace
+        normalized = concept.lower().strip()
+
+        # Remove common variations and prefixes
+        # Order matters: handle specific cases first
+        normalized = normalized.replace("app idea:", "idea:")
+        # Handle "mobile app" -> "app" conversion first, but preserve "app:" prefix
+        if normalized.startswith("mobile app:"):
+            normalized = "app:" + normalized[11:]  # Replace "mobile app:" with "app:"
+        elif normalized.startswith("web app:"):
+            normalized = "app:" + normalized[8:]  # Replace "web app:" with "app:"
+        else:
+            # Handle standalone replacements
+            normalized = normalized.replace("mobile app", "app")
+            normalized = normalized.replace("web app", "app")
+            # Remove standalone "app:" at the beginning
+            if normalized.startswith("app:"):
+                normalized = normalized[4:]  # Remove "app:" prefix
+
+        # Remove extra whitespace (multiple spaces to single space)
+        normalized = " ".join(normalized.split())
+
+        return normalized
+
+    def generate_fingerprint(self, concept: str) -> str:
+        """
+        Generate SHA256 fingerprint from normalized concept.
+
+        Args:
+            concept: Business concept text
+
+        Returns:
+            SHA256 hash as hexadecimal string
+        """
+        normalized = self.normalize_concept(concept)
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get_concept_index(self) -> ConceptSimilarityIndex:
+        """
+        Return the concept similarity index, loading or building it on first use.
+
+        A persisted index (index_path) is loaded as is. Otherwise the index is
+        built from the business_concepts table, and saved if index_path is set.
+
+        Returns:
+            ConceptSimilarityIndex
+        """
+        if self._concept_index is not None:
+            return self._concept_index
+
+        if self._has_persisted_index():
+            self._concept_index = ConceptSimilarityIndex.load(self.index_path)
+            return self._concept_index
+
+        return self._build_concept_index(self._fetch_all_concepts() or [])
+
+    def _build_concept_index(self, concepts: list[dict]) -> ConceptSimilarityIndex:
+        """Build (and persist, if index_path is set) the index from concept rows."""
+        self._concept_index = ConceptSimilarityIndex.from_concepts(
+            concepts, path=self.index_path
+        )
+        if self.index_path is not None:
+            self._concept_index.save()
+        logger.info(f"Built concept similarity index with {len(self._concept_index)} concepts")
+        return self._concept_index
+
+    def _has_persisted_index(self) -> bool:
+        path = self.index_path
+        return path is not None and ((path / SNAPSHOT_FILE).exists() or (path / LOG_FILE).exists())
+
+    def warm_fingerprint_cache(self) -> bool:
+        """
+        Load every known fingerprint into the fingerprint cache.
+
+        Runs automatically before the first lookup. The same bulk query also
+        builds the similarity index when it has not been built or persisted yet.
+
+        Returns:
+            True if the cache was warmed, False if it is disabled or loading failed
+        """
+        self._cache_warm_attempted = True
+        if self._fingerprint_cache is None:
+            return False
+
+        concepts = self._fetch_all_concepts()
+        if concepts is None:
+            # A partial load would turn unseen fingerprints into false misses
+            logger.warning("Fingerprint cache left cold; lookups will query the database")
+            return False
+
+        self._fingerprint_cache.warm(concepts)
+        if (
+            self._concept_index is None
+            and self.similarity_threshold is not None
+            and not self._has_persisted_index()
+        ):
+            self._build_concept_index(concepts)
+        return True
+
+    def get_cache_statistics(self) -> dict[str, Any]:
+        """
+        Get fingerprint cache hit/miss counters.
+
+        Returns:
+            CacheStatistics summary, or an empty dict if the cache is disabled
+        """
+        if self._fingerprint_cache is None:
+            return {}
+        return self._fingerprint_cache.stats.get_summary()
+
+    def _fetch_all_concepts(self) -> list[dict] | None:
+        """
+        Page through business_concepts for the fields the caches need.
+
+        Returns:
+            All concept rows, or None if a page failed to load
+        """
+        concepts: list[dict] = []
+        try:
+            while True:
+                response = (
+                    self.supabase.table("business_concepts")
+                    .select("id, concept_name, concept_fingerprint, primary_opportunity_id")
+                    .order("id")
+                    .range(len(concepts), len(concepts) + self.CONCEPT_PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = response.data or []
+                concepts.extend(page)
+                if len(page) < self.CONCEPT_PAGE_SIZE:
+                    break
+        except Exception as e:
+            logger.error(f"Error loading business concepts: {e}")
+            return None
+        return concepts
+
+    def find_similar_concept(self, normalized_concept: str) -> tuple[dict, float] | None:
+        """
+        Find an existing concept similar enough to count as a duplicate.
+
+        Args:
+            normalized_concept: Normalized business concept text
+
+        Returns:
+            Tuple of (concept dict with id, concept_name, primary_opportunity_id;
+            similarity), or None if matching is disabled or nothing is close enough
+        """
+        if self.similarity_threshold is None:
+            return None
+
+        match = self.get_concept_index().best_match(
+            normalized_concept, self.similarity_threshold
+        )
+        if match is None:
+            return None
+
+        logger.info(
+            f"Found near-duplicate concept {match.concept_id} "
+            f"('{match.concept_name[:50]}', similarity {match.similarity:.2f})"
+        )
+        concept = {
+            "id": match.concept_id,
+            "concept_name": match.concept_name,
+            "primary_opportunity_id": match.primary_opportunity_id,
+        }
+        return concept, match.similarity
+
+    def _index_concept(
+        self, concept_id: Any, concept_name: str, primary_opportunity_id: str | None
+    ) -> None:
+        """Add a concept to the similarity index (best effort)."""
+        if self.similarity_threshold is None:
+            return
+        try:
+            index = self.get_concept_index()
+            if concept_id not in index:
+                index.add(concept_id, concept_name, primary_opportunity_id)
+        except Exception as e:
+            logger.error(f"Error indexing concept {concept_id}: {e}")
+
+    def validate_and_convert_uuid(self, opportunity_id: str) -> str:
+        """
+        Validate and convert opportunity ID to proper UUID format.
+
+        For testing purposes, this will generate a valid UUID for non-UUID strings.
+        In production, opportunity IDs should already be valid UUIDs.
+
+        Args:
+            opportunity_id: Raw opportunity identifier
+
+        Returns:
+            Valid UUID string
+        """
+        if not opportunity_id:
+            raise ValueError("Opportunity ID cannot be empty")
+
+        try:
+            # Try to parse as UUID (for production UUIDs)
+            parsed_uuid = uuid.UUID(opportunity_id)
+            return str(parsed_uuid)
+        except (ValueError, AttributeError):
+            # For testing - generate deterministic UUID based on string
+            # This ensures the same string always generates the same UUID
+            namespace = uuid.uuid5(uuid.NAMESPACE_URL, "reddit-harbor-test")
+            return str(uuid.uuid5(namespace, opportunity_id))
+
+    def find_existing_concept(self, fingerprint: str) -> dict | None:
+        """
+        Check if business concept already exists in database.
+
+        The fingerprint cache answers first: an LRU hit or a Bloom filter
+        negative returns without querying Supabase.
+
+        Args:
+            fingerprint: SHA256 fingerprint to search for
+
+        Returns:
+            Dictionary with concept data if found, None otherwise
+        """
+        cache = self._fingerprint_cache
+        if cache is None:
+            return self._query_existing_concept(fingerprint)
+
+        if not self._cache_warm_attempted:
+            self.warm_fingerprint_cache()
+
+        cached = cache.get(fingerprint)
+        if cached is not None:
+            return cached
+        if not cache.might_contain(fingerprint):
+            logger.debug(f"Fingerprint cache miss (definite): {fingerprint[:8]}...")
+            return None
+
+        concept = self._query_existing_concept(fingerprint)
+        if concept is not None:
+            cache.put(fingerprint, concept)
+        elif cache.is_warm:
+            cache.record_false_positive()
+        return concept
+
+    def _query_existing_concept(self, fingerprint: str) -> dict | None:
+        """Look a fingerprint up in business_concepts."""
+        try:
+            response = (
+                self.supabase.table("business_concepts")
+                .select("*")
+                .eq("concept_fingerprint", fingerprint)  # Updated field name
+                .execute()
+            )
+
+            if response.data and len(response.data) > 0:
+                fp_prefix = fingerprint[:8]
+                logger.info(f"Found existing concept for fingerprint: {fp_prefix}...")
+                return response.data[0]
+            else:
+                fp_prefix = fingerprint[:8]
+                logger.debug(
+                    f"No existing concept found for fingerprint: {fp_prefix}..."
+                )
+                return None
+
+        except Exception as e:
+            fp_prefix = fingerprint[:8]
+            logger.error(
+                f"Error finding existing concept for fingerprint {fp_prefix}...: {e}"
+            )
+            return None
+
+    def create_business_concept(
+        self, concept_name: str, fingerprint: str, opportunity_id: str
+    ) -> int | None:
+        """
+        Create new business concept in database.
+
+        Args:
+            concept_name: Normalized business concept name
+            fingerprint: SHA256 fingerprint of the concept
+            opportunity_id: ID of the opportunity that created this concept
+
+        Returns:
+            ID of the created concept if successful, None otherwise
+        """
+        try:
+            # First ensure the opportunity exists in opportunities_unified table
+            # This is needed for the foreign key constraint
+            self._ensure_opportunity_exists(opportunity_id)
+
+            concept_data = {
+                "concept_name": concept_name,
+                "concept_fingerprint": fingerprint,  # Updated field name
+                "primary_opportunity_id": opportunity_id,  # Updated field name
+                "submission_count": 1,  # Updated field name
+            }
+
+            response = (
+                self.supabase.table("business_concepts").insert(concept_data).execute()
+            )
+
+            if response.data and len(response.data) > 0:
+                concept_id = response.data[0].get("id")
+                name_preview = concept_name[:50]
+                logger.info(
+                    f"Created new business concept '{name_preview}...' with ID: "
+                    f"{concept_id}"
+                )
+                if self._fingerprint_cache is not None:
+                    self._fingerprint_cache.put(fingerprint, response.data[0])
+                return concept_id
+            else:
+                name_preview = concept_name[:50]
+                logger.error(f"Failed to create business concept '{name_preview}...'")
+                return None
+
+        except Exception as e:
+            name_preview = concept_name[:50]
+            logger.error(f"Error creating business concept '{name_preview}...': {e}")
+            return None
+
+    def _ensure_opportunity_exists(self, opportunity_id: str) -> bool:
+        """
+        Ensure opportunity exists in opportunities_unified table for foreign key.
+        Creates a minimal opportunity record if it doesn't exist.
+
+        Args:
+            opportunity_id: UUID of the opportunity
+
+        Returns:
+            True if opportunity exists or was created, False otherwise
+        """
+        try:
+            # Check if opportunity already exists
+            response = (
+                self.supabase.table("opportunities_unified")
+                .select("id")
+                .eq("id", opportunity_id)
+                .execute()
+            )
+
+            if response.data and len(response.data) > 0:
+                logger.debug(f"Opportunity {opportunity_id} already exists")
+                return True
+
+            # Create minimal opportunity record for testing
+            minimal_opportunity = {
+                "id": opportunity_id,
+                "title": f"Test Opportunity {opportunity_id[:8]}",
+                "app_concept": "Test concept for deduplication",
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            }
+
+            create_response = (
+                self.supabase.table("opportunities_unified")
+                .insert(minimal_opportunity)
+                .execute()
+            )
+
+            if create_response.data and len(create_response.data) > 0:
+                logger.info(
+                    f"Created test opportunity {opportunity_id} for foreign key"
+                )
+                return True
+            else:
+                logger.error(f"Failed to create test opportunity {opportunity_id}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error ensuring opportunity exists {opportunity_id}: {e}")
+            return False
+
+    def update_concept_stats(self, concept_id: int) -> None:
+        """
+        Update concept statistics in database.
+
+        Args:
+            concept_id: ID of the concept to update
+        """
+        try:
+            # Call database function to increment opportunity count
+            self.supabase.rpc(
+                "increment_concept_count", {"concept_id": concept_id}
+            ).execute()
+
+            # Note: increment_concept_count doesn't return data, just performs update
+            logger.info(f"Updated stats for concept ID: {concept_id}")
+
+        except Exception as e:
+            logger.error(f"Error updating concept stats for ID {concept_id}: {e}")
+
+    def mark_as_duplicate(
+        self, opportunity_id: str, concept_id: int, primary_opportunity_id: str
+    ) -> bool:
+        """
+        Mark an opportunity as a duplicate.
+
+        Args:
+            opportunity_id: ID of the opportunity to mark as duplicate
+            concept_id: ID of the business concept it belongs to
+            primary_opportunity_id: ID of the primary/original opportunity
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Ensure the opportunity exists in opportunities_unified table
+            if not self._ensure_opportunity_exists(opportunity_id):
+                logger.error(f"Failed to ensure opportunity exists: {opportunity_id}")
+                return False
+
+            # Use database function for atomic operation
+            response = self.supabase.rpc(
+                "mark_opportunity_duplicate",
+                {
+                    "p_opportunity_id": opportunity_id,
+                    "p_concept_id": concept_id,
+                    "p_primary_opportunity_id": primary_opportunity_id,
+                },
+            ).execute()
+
+            if response.data is True:
+                msg = (
+                    f"Marked opportunity {opportunity_id} as duplicate of "
+                    f"{primary_opportunity_id}"
+                )
+                logger.info(msg)
+                return True
+            else:
+                logger.error(
+                    f"Failed to mark opportunity {opportunity_id} as duplicate"
+                )
+                return False
+
+        except Exception as e:
+            logger.error(
+                f"Error marking opportunity {opportunity_id} as duplicate: {e}"
+            )
+            return False
+
+    def mark_as_unique(self, opportunity_id: str, concept_id: int) -> bool:
+        """
+        Mark an opportunity as unique (original).
+
+        Args:
+            opportunity_id: ID of the opportunity to mark as unique
+            concept_id: ID of the business concept it belongs to
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Ensure the opportunity exists in opportunities_unified table
+            if not self._ensure_opportunity_exists(opportunity_id):
+                logger.error(f"Failed to ensure opportunity exists: {opportunity_id}")
+                return False
+
+            # Use database function for atomic operation
+            response = self.supabase.rpc(
+                "mark_opportunity_unique",
+                {
+                    "p_opportunity_id": opportunity_id,
+                    "p_concept_id": concept_id,
+                },
+            ).execute()
+
+            if response.data is True:
+                logger.info(f"Marked opportunity {opportunity_id} as unique")
+                return True
+            else:
+                logger.error(f"Failed to mark opportunity {opportunity_id} as unique")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error marking opportunity {opportunity_id} as unique: {e}")
+            return False
+
+    @staticmethod
+    def _new_result() -> dict:
+        """Return the initial result structure for one opportunity."""
+        return {
+            "success": False,
+            "is_duplicate": False,
+            "concept_id": None,
+            "opportunity_id": None,
+            "fingerprint": None,
+            "normalized_concept": None,
+            "match_type": None,
+            "similarity": None,
+            "message": "",
+            "processing_time": 0.0,
+            "error": None,
+        }
+
+    def _prepare_opportunity(self, opportunity: dict, result: dict) -> bool:
+        """
+        Validate an opportunity and fill in its UUID, normalized concept and fingerprint.
+
+        Args:
+            opportunity: Opportunity dictionary
+            result: Result structure to fill in
+
+        Returns:
+            True if the opportunity is ready for matching, False if result holds an error
+        """
+        # Step 1: Validate required fields
+        if not opportunity:
+            result["error"] = "Opportunity dictionary is required"
+            result["message"] = "Validation failed: empty opportunity"
+            return False
+
+        opportunity_id = opportunity.get("id")
+        app_concept = opportunity.get("app_concept")
+
+        if not opportunity_id:
+            result["error"] = "Missing required field: id"
+            result["message"] = "Validation failed: missing opportunity ID"
+            return False
+
+        if not app_concept:
+            result["error"] = "Missing required field: app_concept"
+            result["message"] = "Validation failed: missing app concept"
+            result["opportunity_id"] = opportunity_id
+            return False
+
+        # Convert to valid UUID format
+        try:
+            valid_uuid = self.validate_and_convert_uuid(opportunity_id)
+        except ValueError as e:
+            result["error"] = f"Invalid opportunity ID: {e}"
+            result["message"] = "Validation failed: invalid opportunity ID"
+            result["opportunity_id"] = opportunity_id
+            return False
+
+        # Store opportunity_id for all subsequent operations
+        result["opportunity_id"] = valid_uuid
+
+        # Step 2: Normalize concept and generate fingerprint
+        normalized_concept = self.normalize_concept(app_concept)
+        result["normalized_concept"] = normalized_concept
+
+        if not normalized_concept:
+            result["error"] = "Concept becomes empty after normalization"
+            result["message"] = "Processing failed: empty normalized concept"
+            return False
+
+        result["fingerprint"] = self.generate_fingerprint(app_concept)
+        return True
+
+    def process_opportunity(self, opportunity: dict) -> dict:
+        """
+        Process single opportunity for deduplication.
+
+        This method implements the complete deduplication workflow:
+        1. Validates required fields (id, app_concept)
+        2. Normalizes the concept and generates fingerprint
+        3. Checks for existing concepts using fingerprint, then for a
+           near-duplicate in the concept similarity index
+        4. If duplicate found: marks as duplicate and updates stats
+        5. If unique: creates new business concept and marks as unique
+        6. Returns comprehensive result with success status
+
+        Args:
+            opportunity: Dictionary containing opportunity data with at least:
+                - id: Unique opportunity identifier
+                - app_concept: Business concept description
+
+        Returns:
+            Dictionary with comprehensive processing result:
+                - success: bool - Overall processing success
+                - is_duplicate: bool - Whether opportunity was identified as duplicate
+                - concept_id: Optional[int] - Business concept ID if successful
+                - opportunity_id: Optional[str] - Opportunity ID from input
+                - fingerprint: Optional[str] - Generated fingerprint
+                - normalized_concept: Optional[str] - Normalized concept text
+                - match_type: Optional[str] - "exact" or "similar" for duplicates
+                - similarity: Optional[float] - Cosine similarity of a "similar" match
+                - message: str - Success or error message
+                - processing_time: float - Time taken in seconds
+                - error: Optional[str] - Error details if failed
+        """
+        start_time = time.time()
+        result = self._new_result()
+
+        try:
+            # Steps 1-2: Validate, normalize and fingerprint
+            if not self._prepare_opportunity(opportunity, result):
+                return result
+
+            valid_uuid = result["opportunity_id"]
+            normalized_concept = result["normalized_concept"]
+            fingerprint = result["fingerprint"]
+
+            # Step 3: Check for existing concept
+            logger.debug(
+                f"Processing opportunity {valid_uuid} with concept: "
+                f"'{normalized_concept[:50]}...', fingerprint: {fingerprint[:8]}..."
+            )
+
+            existing_concept = self.find_existing_concept(fingerprint)
+            if existing_concept:
+                result["match_type"] = "exact"
+                self._index_concept(
+                    existing_concept["id"],
+                    existing_concept.get("concept_name", normalized_concept),
+                    existing_concept.get("primary_opportunity_id"),
+                )
+            else:
+                similar = self.find_similar_concept(normalized_concept)
+                if similar:
+                    existing_concept, result["similarity"] = similar
+                    result["match_type"] = "similar"
+
+            concept_id = None
+            if not existing_concept:
+                # Create new business concept
+                concept_id = self.create_business_concept(
+                    normalized_concept, fingerprint, valid_uuid
+                )
+
+                if concept_id is None and self._fingerprint_cache is not None:
+                    # Another process may have created it after the cache was warmed
+                    existing_concept = self._query_existing_concept(fingerprint)
+                    if existing_concept:
+                        self._fingerprint_cache.put(fingerprint, existing_concept)
+                        result["match_type"] = "exact"
+
+                if concept_id is None and not existing_concept:
+                    result["error"] = "Failed to create business concept"
+                    result["message"] = "Processing failed: could not create concept"
+                    return result
+
+            if existing_concept:
+                # Step 4a: Handle duplicate opportunity
+                logger.info(
+                    f"Found duplicate concept for opportunity {valid_uuid}: "
+                    f"existing concept ID {existing_concept['id']}"
+                )
+
+                # Update concept statistics
+                self.update_concept_stats(existing_concept["id"])
+
+                # Mark opportunity as duplicate
+                concept_id = existing_concept["id"]
+                primary_opportunity_id = existing_concept.get(
+                    "primary_opportunity_id", valid_uuid
+                )
+
+                duplicate_marked = self.mark_as_duplicate(
+                    valid_uuid, concept_id, primary_opportunity_id
+                )
+
+                if not duplicate_marked:
+                    result["error"] = "Failed to mark opportunity as duplicate"
+                    result["message"] = "Processing failed: could not mark as duplicate"
+                    return result
+
+                # Success - duplicate found and processed
+                result["success"] = True
+                result["is_duplicate"] = True
+                result["concept_id"] = concept_id
+                result["message"] = "Processed duplicate opportunity successfully"
+
+                logger.info(
+                    f"Successfully processed duplicate opportunity {valid_uuid} "
+                    f"with concept ID {concept_id}"
+                )
+
+            else:
+                # Step 4b: Handle unique opportunity
+                logger.info(
+                    f"New unique concept for opportunity {valid_uuid}: "
+                    f"'{normalized_concept[:50]}...'"
+                )
+
+                self._index_concept(concept_id, normalized_concept, valid_uuid)
+
+                # Mark opportunity as unique
+                unique_marked = self.mark_as_unique(valid_uuid, concept_id)
+
+                if not unique_marked:
+                    result["error"] = "Failed to mark opportunity as unique"
+                    result["message"] = "Processing failed: could not mark as unique"
+                    return result
+
+                # Success - unique concept created and processed
+                result["success"] = True
+                result["is_duplicate"] = False
+                result["concept_id"] = concept_id
+                result["message"] = "Processed unique opportunity successfully"
+
+                logger.info(
+                    f"Successfully processed unique opportunity {valid_uuid} "
+                    f"with new concept ID {concept_id}"
+                )
+
+        except Exception as e:
+            # Handle unexpected errors
+            error_msg = f"Unexpected error processing opportunity: {e}"
+            logger.error(error_msg)
+            result["error"] = error_msg
+            result["message"] = "Processing failed: unexpected error"
+
+        finally:
+            # Calculate processing time
+            result["processing_time"] = time.time() - start_time
+
+        return result
+
+    # ------------------------------------------------------------------
+    # Batch processing
+    # ------------------------------------------------------------------
+
+    def find_existing_concepts(self, fingerprints: list[str]) -> dict[str, dict]:
+        """
+        Look up many fingerprints at once.
+
+        Fingerprints answered by the fingerprint cache are not queried; the
+        rest are fetched with one query per FINGERPRINT_QUERY_CHUNK fingerprints.
+
+        Args:
+            fingerprints: SHA256 fingerprints to search for
+
+        Returns:
+            Dictionary of fingerprint -> concept data for the fingerprints found
+        """
+        cache = self._fingerprint_cache
+        if cache is not None and not self._cache_warm_attempted:
+            self.warm_fingerprint_cache()
+
+        found: dict[str, dict] = {}
+        to_query: list[str] = []
+        for fingerprint in dict.fromkeys(fingerprints):
+            if cache is not None:
+                cached = cache.get(fingerprint)
+                if cached is not None:
+                    found[fingerprint] = cached
+                    continue
+                if not cache.might_contain(fingerprint):
+                    continue
+            to_query.append(fingerprint)
+
+        for start in range(0, len(to_query), self.FINGERPRINT_QUERY_CHUNK):
+            chunk = to_query[start:start + self.FINGERPRINT_QUERY_CHUNK]
+            try:
+                response = (
+                    self.supabase.table("business_concepts")
+                    .select("*")
+                    .in_("concept_fingerprint", chunk)
+                    .execute()
+                )
+            except Exception as e:
+                logger.error(f"Error finding existing concepts for {len(chunk)} fingerprints: {e}")
+                continue
+            for concept in response.data or []:
+                found[concept["concept_fingerprint"]] = concept
+                if cache is not None:
+                    cache.put(concept["concept_fingerprint"], concept)
+
+        if cache is not None and cache.is_warm:
+            for fingerprint in to_query:
+                if fingerprint not in found:
+                    cache.record_false_positive()
+
+        logger.info(f"Resolved {len(found)} of {len(to_query)} queried fingerprints")
+        return found
+
+    def create_business_concepts(self, concepts: list[dict]) -> dict[str, dict]:
+        """
+        Insert many new business concepts in one request.
+
+        Fingerprints that already exist (for example created by another
+        process meanwhile) are skipped rather than failing the request, and
+        are missing from the result.
+
+        Args:
+            concepts: Dictionaries with concept_name, concept_fingerprint and
+                primary_opportunity_id
+
+        Returns:
+            Dictionary of fingerprint -> created concept row (empty if the insert failed)
+        """
+        if not concepts:
+            return {}
+
+        rows = [{**concept, "submission_count": 1} for concept in concepts]
+        try:
+            response = (
+                self.supabase.table("business_concepts")
+                .upsert(rows, on_conflict="concept_fingerprint", ignore_duplicates=True)
+                .execute()
+            )
+        except Exception as e:
+            logger.error(f"Error creating {len(rows)} business concepts: {e}")
+            return {}
+
+        created = {row["concept_fingerprint"]: row for row in response.data or []}
+        if self._fingerprint_cache is not None:
+            for fingerprint, row in created.items():
+                self._fingerprint_cache.put(fingerprint, row)
+        logger.info(f"Created {len(created)} of {len(rows)} new business concepts")
+        return created
+
+    def _ensure_opportunities_exist(self, opportunity_ids: list[str]) -> set[str]:
+        """
+        Batch version of _ensure_opportunity_exists.
+
+        Args:
+            opportunity_ids: UUIDs of the opportunities
+
+        Returns:
+            Set of opportunity IDs that exist or were created
+        """
+        existing: set[str] = set()
+        ids = list(dict.fromkeys(opportunity_ids))
+        try:
+            for start in range(0, len(ids), self.FINGERPRINT_QUERY_CHUNK):
+                response = (
+                    self.supabase.table("opportunities_unified")
+                    .select("id")
+                    .in_("id", ids[start:start + self.FINGERPRINT_QUERY_CHUNK])
+                    .execute()
+                )
+                existing.update(str(row["id"]) for row in response.data or [])
+
+            missing = [opportunity_id for opportunity_id in ids if opportunity_id not in existing]
+            if missing:
+                now = time.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+                create_response = (
+                    self.supabase.table("opportunities_unified")
+                    .insert([
+                        {
+                            "id": opportunity_id,
+                            "title": f"Test Opportunity {opportunity_id[:8]}",
+                            "app_concept": "Test concept for deduplication",
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for opportunity_id in missing
+                    ])
+                    .execute()
+                )
+                existing.update(str(row["id"]) for row in create_response.data or [])
+                logger.info(f"Created {len(missing)} test opportunities for foreign keys")
+
+        except Exception as e:
+            logger.error(f"Error ensuring {len(ids)} opportunities exist: {e}")
+        return existing
+
+    def update_concept_stats_batch(self, increments: dict[int, int]) -> None:
+        """
+        Batch version of update_concept_stats.
+
+        Args:
+            increments: Dictionary of concept ID -> number of times to increment
+        """
+        if not increments:
+            return
+        try:
+            self.supabase.rpc(
+                "increment_concept_counts",
+                {
+                    "p_concept_ids": list(increments),
+                    "p_increments": list(increments.values()),
+                },
+            ).execute()
+            logger.info(f"Updated stats for {len(increments)} concepts")
+        except Exception as e:
+            logger.error(f"Error updating stats for {len(increments)} concepts: {e}")
+
+    def mark_opportunities_batch(self, marks: list[dict]) -> set[str]:
+        """
+        Batch version of mark_as_duplicate and mark_as_unique.
+
+        Duplicates increment their concept's count, as mark_opportunity_duplicate does.
+
+        Args:
+            marks: Dictionaries with opportunity_id, concept_id, is_duplicate
+                and (for duplicates) primary_opportunity_id
+
+        Returns:
+            Set of opportunity IDs that were marked
+        """
+        if not marks:
+            return set()
+        try:
+            response = self.supabase.rpc(
+                "mark_opportunities_batch", {"p_marks": marks}
+            ).execute()
+        except Exception as e:
+            logger.error(f"Error marking {len(marks)} opportunities: {e}")
+            return set()
+
+        marked = {str(opportunity_id) for opportunity_id in response.data or []}
+        if len(marked) < len({mark["opportunity_id"] for mark in marks}):
+            logger.error(f"Marked only {len(marked)} of {len(marks)} opportunities")
+        return marked
+
+    def process_opportunities(self, opportunities: list[dict]) -> list[dict]:
+        """
+        Process many opportunities with batched database round trips.
+
+        Produces the same results as calling process_opportunity() on each
+        opportunity in order, but with one fingerprint lookup, one concept
+        insert, one stats update and one marking call for the whole list:
+        1. Validates, normalizes and fingerprints every opportunity
+        2. Resolves all fingerprints against business_concepts at once
+        3. Matches in input order; a concept first seen in this batch is
+           matched by later rows (exactly or as a near-duplicate) before
+           it is inserted
+        4. Bulk-inserts the new concepts and bulk-updates concept stats
+           and duplicate/unique markers
+
+        Rows whose new concept was not inserted (for example because another
+        process created the fingerprint meanwhile) fall back to
+        process_opportunity(), along with the rows matched to that concept.
+
+        Args:
+            opportunities: Opportunity dictionaries (see process_opportunity)
+
+        Returns:
+            List of result dictionaries, one per input, in input order
+        """
+        start_time = time.time()
+        results = [self._new_result() for _ in opportunities]
+        ready = [
+            i for i, (opportunity, result) in enumerate(zip(opportunities, results, strict=True))
+            if self._prepare_opportunity(opportunity, result)
+        ]
+        if not ready:
+            return results
+
+        try:
+            existing = self.find_existing_concepts([results[i]["fingerprint"] for i in ready])
+
+            # Step 3: Match in order. Concepts new to this batch are keyed by fingerprint.
+            pending: dict[str, dict] = {}
+            pending_index = (
+                ConceptSimilarityIndex(dimensions=self.get_concept_index().dimensions)
+                if self.similarity_threshold is not None
+                else None
+            )
+            matches: dict[int, tuple[str, Any]] = {}
+            for i in ready:
+                result = results[i]
+                fingerprint = result["fingerprint"]
+                normalized_concept = result["normalized_concept"]
+
+                if fingerprint in existing:
+                    concept = existing[fingerprint]
+                    result["match_type"] = "exact"
+                    self._index_concept(
+                        concept["id"],
+                        concept.get("concept_name", normalized_concept),
+                        concept.get("primary_opportunity_id"),
+                    )
+                    matches[i] = ("existing", concept)
+                    continue
+
+                if fingerprint in pending:
+                    result["match_type"] = "exact"
+                    matches[i] = ("pending", fingerprint)
+                    continue
+
+                similar = self.find_similar_concept(normalized_concept)
+                pending_match = (
+                    pending_index.best_match(normalized_concept, self.similarity_threshold)
+                    if pending_index is not None and len(pending_index)
+                    else None
+                )
+                if pending_match and (similar is None or pending_match.similarity > similar[1]):
+                    result["match_type"] = "similar"
+                    result["similarity"] = pending_match.similarity
+                    matches[i] = ("pending", pending_match.concept_id)
+                elif similar:
+                    concept, result["similarity"] = similar
+                    result["match_type"] = "similar"
+                    matches[i] = ("existing", concept)
+                else:
+                    pending[fingerprint] = {
+                        "concept_name": normalized_concept,
+                        "concept_fingerprint": fingerprint,
+                        "primary_opportunity_id": result["opportunity_id"],
+                    }
+                    if pending_index is not None:
+                        pending_index.add(
+                            fingerprint, normalized_concept, result["opportunity_id"]
+                        )
+                    matches[i] = ("new", fingerprint)
+
+            # Step 4: Bulk-insert new concepts
+            self._ensure_opportunities_exist([results[i]["opportunity_id"] for i in ready])
+            created = self.create_business_concepts(list(pending.values()))
+            for concept in pending.values():
+                row = created.get(concept["concept_fingerprint"])
+                if row is not None:
+                    self._index_concept(
+                        row["id"], concept["concept_name"], concept["primary_opportunity_id"]
+                    )
+
+            fallback = [
+                i for i in ready
+                if matches[i][0] != "existing" and matches[i][1] not in created
+            ]
+            fallback_set = set(fallback)
+            batched = [i for i in ready if i not in fallback_set]
+
+            # Step 5: Bulk-update concept stats and markers
+            increments: dict[int, int] = {}
+            marks: list[dict] = []
+            for i in batched:
+                result = results[i]
+                kind, key = matches[i]
+                if kind == "new":
+                    concept_id = created[key]["id"]
+                    marks.append({
+                        "opportunity_id": result["opportunity_id"],
+                        "concept_id": concept_id,
+                        "is_duplicate": False,
+                    })
+                else:
+                    concept = key if kind == "existing" else created[key]
+                    concept_id = concept["id"]
+                    increments[concept_id] = increments.get(concept_id, 0) + 1
+                    marks.append({
+                        "opportunity_id": result["opportunity_id"],
+                        "concept_id": concept_id,
+                        "is_duplicate": True,
+                        "primary_opportunity_id": concept.get(
+                            "primary_opportunity_id", result["opportunity_id"]
+                        ),
+                    })
+                result["concept_id"] = concept_id
+
+            self.update_concept_stats_batch(increments)
+            marked = self.mark_opportunities_batch(marks)
+
+            for i, mark in zip(batched, marks, strict=True):
+                result = results[i]
+                is_duplicate = mark["is_duplicate"]
+                if mark["opportunity_id"] in marked:
+                    result["success"] = True
+                    result["is_duplicate"] = is_duplicate
+                    result["message"] = (
+                        "Processed duplicate opportunity successfully"
+                        if is_duplicate
+                        else "Processed unique opportunity successfully"
+                    )
+                else:
+                    result["concept_id"] = None
+                    if is_duplicate:
+                        result["error"] = "Failed to mark opportunity as duplicate"
+                        result["message"] = "Processing failed: could not mark as duplicate"
+                    else:
+                        result["error"] = "Failed to mark opportunity as unique"
+                        result["message"] = "Processing failed: could not mark as unique"
+
+            elapsed = (time.time() - start_time) / len(opportunities)
+            for result in results:
+                result["processing_time"] = elapsed
+
+            if fallback:
+                logger.warning(
+                    f"Falling back to per-row processing for {len(fallback)} opportunities"
+                )
+            for i in fallback:
+                results[i] = self.process_opportunity(opportunities[i])
+
+        except Exception as e:
+            error_msg = f"Unexpected error processing opportunities: {e}"
+            logger.error(error_msg)
+            for i in ready:
+                if not results[i]["success"]:
+                    results[i]["error"] = error_msg
+                    results[i]["message"] = "Processing failed: unexpected error"
+
+        logger.info(
+            f"Processed {len(opportunities)} opportunities in "
+            f"{time.time() - start_time:.2f}s"
+        )
+        return results
+
+
+# Future extension methods (to be implemented in later tasks)
+# These are commented out as they're not part of Task 2 requirements
+
+# def find_existing_concept(self, fingerprint: str) -> Optional[dict]:
+#     """Check if business concept already exists in database."""
+#     pass
+
+# def create_business_concept(
+#     self, concept_name: str, fingerprint: str, opportunity_id: str
+# ) -> Optional[int]:
+#     """Create new business concept in database."""
+#     pass
+
+# def process_opportunity(self, opportunity: dict) -> dict:
+#     """Process single opportunity for deduplication."""
+#     pass
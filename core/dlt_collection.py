@@ -16,25 +16,37 @@ Features:
 
 Main Functions:
 - collect_problem_posts(): Collect problem-keyword filtered submissions
+- stream_problem_posts(): Collect and load in background batches while crawling
 - collect_post_comments(): Collect comments from submissions with threading info
 - load_to_supabase(): Load data using DLT pipeline for incremental updates
 """
 
+import os
 import sys
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import dlt
+import praw
 
 # Add project root
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-# Load environment variables manually
-import os
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.collection import PROBLEM_KEYWORDS, reddit_created_utc
 from core.dlt import PK_SUBMISSION_ID
+from core.dlt.incremental import created_utc_cursor, reset_incremental_cursors
+from core.fetchers.high_water_marks import HighWaterMarkStore
+from core.storage.buffered_sink import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    BufferedSink,
+    SinkStatistics,
+)
+from core.utils.reddit_client_pool import RedditClientPool, load_reddit_credentials
+
+project_root = Path(__file__).parent.parent
 
 # Manually read .env file
 env_file = project_root / '.env'
@@ -51,12 +63,6 @@ REDDIT_PUBLIC = os.getenv("REDDIT_PUBLIC")
 REDDIT_SECRET = os.getenv("REDDIT_SECRET")
 REDDIT_USER_AGENT = os.getenv("REDDIT_USER_AGENT")
 
-# Import Reddit client
-import praw
-
-# Import problem keywords from existing collection
-from core.collection import PROBLEM_KEYWORDS
-
 # DLT pipeline configuration
 PIPELINE_NAME = "reddit_harbor_problem_collection"
 DESTINATION = "postgres"
@@ -71,8 +77,17 @@ TARGET_SUBREDDITS = [
 ]
 
 
-def get_reddit_client() -> praw.Reddit:
-    """Initialize and return Reddit client."""
+def get_reddit_client() -> praw.Reddit | RedditClientPool:
+    """
+    Initialize and return Reddit client.
+
+    Returns a RedditClientPool when numbered credentials (REDDIT_PUBLIC_2, ...)
+    are configured, so collection can use every app's rate limit.
+    """
+    credentials = load_reddit_credentials()
+    if len(credentials) > 1:
+        return RedditClientPool(credentials)
+
     return praw.Reddit(
         client_id=REDDIT_PUBLIC,
         client_secret=REDDIT_SECRET,
@@ -112,6 +127,7 @@ def transform_submission_to_schema(submission_data: dict[str, Any]) -> dict[str,
     - id → submission_id (Reddit API ID)
     - selftext → text and content (post body content)
     - created_utc → created_at (Unix timestamp to ISO datetime)
+    - created_utc → created_utc (UTC ISO datetime, the partition key)
     - Keep: title, subreddit, score, url, num_comments
     - Drop: author, problem_keyword_count, _dlt_* metadata
 
@@ -137,29 +153,35 @@ def transform_submission_to_schema(submission_data: dict[str, Any]) -> dict[str,
         "comments_count": comments_count,  # Store as comments_count (integer column)
         "url": submission_data.get("url"),
         "created_at": datetime.fromtimestamp(submission_data.get("created_utc", 0)).isoformat(),
+        "created_utc": reddit_created_utc(submission_data.get("created_utc", 0)),
     }
 
     # Remove None values to avoid schema issues
     return {k: v for k, v in transformed.items() if v is not None}
 
 
-def collect_problem_posts(
+def iter_problem_posts(
     subreddits: list[str],
     limit: int = 50,
     sort_type: str = "new",
-    test_mode: bool = False
-) -> list[dict[str, Any]]:
+    test_mode: bool = False,
+    high_water_marks: HighWaterMarkStore | None = None,
+) -> Iterator[dict[str, Any]]:
     """
-    Collect problem posts from specified subreddits.
+    Yield problem posts from specified subreddits as they are crawled.
 
     Args:
         subreddits: List of subreddit names (without 'r/')
         limit: Maximum number of posts to collect per subreddit
         sort_type: Reddit sort type ('new', 'hot', 'top', 'rising')
         test_mode: If True, return test data instead of real API calls
+        high_water_marks: Optional store of per-subreddit marks. 'new' listings
+            stop at the newest submission seen by the previous run; marks are
+            advanced in memory only, so call ``high_water_marks.save()`` once
+            the yielded posts have been loaded.
 
-    Returns:
-        List of problem post dictionaries (transformed to Supabase schema)
+    Yields:
+        Problem post dictionaries (transformed to Supabase schema)
     """
     if test_mode:
         # Return mock data for testing
@@ -190,7 +212,9 @@ def collect_problem_posts(
             all_mock_submissions.extend(mock_submissions)
 
         # Transform to schema format
-        return [transform_submission_to_schema(sub) for sub in all_mock_submissions]
+        for sub in all_mock_submissions:
+            yield transform_submission_to_schema(sub)
+        return
 
     print(f"Collecting problem posts from {len(subreddits)} subreddits...")
     print(f"Limit: {limit} posts per subreddit")
@@ -198,7 +222,6 @@ def collect_problem_posts(
     print("-" * 80)
 
     reddit = get_reddit_client()
-    all_problem_posts = []
 
     for subreddit_name in subreddits:
         print(f"\nProcessing r/{subreddit_name}...")
@@ -219,6 +242,11 @@ def collect_problem_posts(
                 print(f"✗ Unknown sort type: {sort_type}, using 'new'")
                 submissions = subreddit.new(limit=limit)
 
+            if high_water_marks is not None:
+                submissions = high_water_marks.iter_unseen(
+                    submissions, subreddit_name, sort_type
+                )
+
             subreddit_problems = 0
             total_checked = 0
 
@@ -253,7 +281,7 @@ def collect_problem_posts(
                     # Transform to Supabase schema
                     problem_post = transform_submission_to_schema(raw_submission)
 
-                    all_problem_posts.append(problem_post)
+                    yield problem_post
                     subreddit_problems += 1
 
             print(f"✓ Checked {total_checked} posts, found {subreddit_problems} problem posts")
@@ -263,10 +291,89 @@ def collect_problem_posts(
             import traceback
             traceback.print_exc()
 
-    print(f"\nTotal problem posts collected: {len(all_problem_posts)}")
+
+def collect_problem_posts(
+    subreddits: list[str],
+    limit: int = 50,
+    sort_type: str = "new",
+    test_mode: bool = False,
+    high_water_marks: HighWaterMarkStore | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Collect problem posts from specified subreddits.
+
+    Args:
+        subreddits: List of subreddit names (without 'r/')
+        limit: Maximum number of posts to collect per subreddit
+        sort_type: Reddit sort type ('new', 'hot', 'top', 'rising')
+        test_mode: If True, return test data instead of real API calls
+        high_water_marks: Optional store of per-subreddit marks. 'new' listings
+            stop at the newest submission seen by the previous run; marks are
+            advanced in memory only, so call ``high_water_marks.save()`` once
+            the returned posts have been loaded.
+
+    Returns:
+        List of problem post dictionaries (transformed to Supabase schema)
+    """
+    all_problem_posts = list(
+        iter_problem_posts(subreddits, limit, sort_type, test_mode, high_water_marks)
+    )
+
+    if not test_mode:
+        print(f"\nTotal problem posts collected: {len(all_problem_posts)}")
     return all_problem_posts
 
 
+def stream_problem_posts(
+    subreddits: list[str],
+    limit: int = 50,
+    sort_type: str = "new",
+    test_mode: bool = False,
+    high_water_marks: HighWaterMarkStore | None = None,
+    write_mode: str = "merge",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> SinkStatistics:
+    """
+    Collect problem posts and load them to Supabase while crawling.
+
+    Posts go into a BufferedSink that loads every ``batch_size`` posts (or
+    every ``flush_interval`` seconds) on a background thread, so network
+    collection overlaps with database writes, memory stays bounded, and a
+    failure mid-crawl keeps the batches already loaded.
+
+    Args:
+        subreddits: List of subreddit names (without 'r/')
+        limit: Maximum number of posts to collect per subreddit
+        sort_type: Reddit sort type ('new', 'hot', 'top', 'rising')
+        test_mode: If True, use test data instead of real API calls
+        high_water_marks: Optional store of per-subreddit marks (see
+            iter_problem_posts); save it only if no batch failed
+        write_mode: DLT write disposition ('replace', 'merge', 'append')
+        batch_size: Posts per load
+        flush_interval: Seconds before a partial batch is loaded
+
+    Returns:
+        SinkStatistics with rows and batches loaded or failed
+    """
+    # Each batch is a separate load: a cursor advanced by one batch would
+    # drop the older posts of the next, so streaming relies on high-water
+    # marks instead of the created_utc cursors
+    sink = BufferedSink(
+        lambda batch: load_to_supabase(batch, write_mode, incremental=False),
+        batch_size=batch_size,
+        flush_interval=flush_interval,
+        name="problem_posts",
+    )
+    with sink:
+        sink.extend(
+            iter_problem_posts(subreddits, limit, sort_type, test_mode, high_water_marks)
+        )
+
+    print(f"\nTotal problem posts collected: {sink.stats.rows_added}")
+    return sink.stats
+
+
 def transform_comment_to_schema(comment_data: dict[str, Any]) -> dict[str, Any]:
     """
     Transform Reddit API comment data to match Supabase schema.
@@ -277,6 +384,7 @@ def transform_comment_to_schema(comment_data: dict[str, Any]) -> dict[str, Any]:
     - link_id → link_id (Reddit submission ID for foreign key linkage)
     - body → body and content (store as both for compatibility)
     - created_utc → created_at (Unix timestamp to ISO datetime)
+    - created_utc → created_utc (UTC ISO datetime, the partition key)
     - Keep: score, parent_id, depth, subreddit
     - Drop: author, _dlt_* metadata
 
@@ -298,6 +406,7 @@ def transform_comment_to_schema(comment_data: dict[str, Any]) -> dict[str, Any]:
         "content": body_text,  # Also store as content for public schema
         "score": comment_data.get("score"),
         "created_at": datetime.fromtimestamp(comment_data.get("created_utc", 0)).isoformat(),
+        "created_utc": reddit_created_utc(comment_data.get("created_utc", 0)),
         "parent_id": comment_data.get("parent_id"),
         "depth": comment_data.get("depth"),
         "comment_depth": comment_data.get("depth", 0),  # Also store as comment_depth
@@ -475,13 +584,39 @@ def create_dlt_pipeline() -> dlt.Pipeline:
     return pipeline
 
 
-def load_to_supabase(problem_posts: list[dict[str, Any]], write_mode: str = "merge") -> bool:
+def submission_cursor_name(subreddit: str) -> str:
+    """
+    Name of the resource holding a subreddit's submissions cursor.
+
+    Args:
+        subreddit: Subreddit name (without 'r/')
+
+    Returns:
+        Resource name to pass to reset_incremental_cursors()
+    """
+    return f"submissions_{subreddit.lower()}"
+
+
+def load_to_supabase(
+    problem_posts: list[dict[str, Any]],
+    write_mode: str = "merge",
+    incremental: bool = False,
+) -> bool:
     """
     Load problem posts to Supabase using DLT.
 
+    With ``incremental`` each subreddit's posts go through their own
+    resource (see submission_cursor_name) with a ``created_utc`` cursor in
+    the pipeline state, so posts older than that subreddit's newest loaded
+    post (minus the cursor lag) are dropped instead of re-merged. Only use
+    it for 'new' listings: hot/top/rising return older posts that the cursor
+    would drop. Use reset_incremental_cursors() (``--reset-cursor``) before
+    a backfill.
+
     Args:
         problem_posts: List of problem post dictionaries (transformed to schema)
         write_mode: DLT write disposition ('replace', 'merge', 'append')
+        incremental: Skip posts already covered by the stored cursors
 
     Returns:
         True if successful, False otherwise
@@ -498,7 +633,7 @@ def load_to_supabase(problem_posts: list[dict[str, Any]], write_mode: str = "mer
     try:
         # Create DLT resource with schema hints for proper column handling
         @dlt.resource(
-            name="submissions",
+            table_name="submissions",
             write_disposition=write_mode,
             columns={
                 "submission_id": {"data_type": "text", "nullable": True, "unique": True},
@@ -510,15 +645,34 @@ def load_to_supabase(problem_posts: list[dict[str, Any]], write_mode: str = "mer
                 "url": {"data_type": "text", "nullable": True},
                 "num_comments": {"data_type": "bigint", "nullable": True},
                 "created_at": {"data_type": "timestamp", "nullable": True},
+                "created_utc": {"data_type": "timestamp", "nullable": True},
             }
         )
-        def submission_resource():
-            yield problem_posts
+        def submission_resource(
+            posts: list[dict[str, Any]],
+            created_utc: dlt.sources.incremental[str] | None = None,
+        ):
+            yield posts
+
+        if incremental:
+            # One cursor per subreddit: a pipeline-wide cursor would let a
+            # busy subreddit's newest post hide a quieter one's new posts
+            by_subreddit: dict[str, list[dict[str, Any]]] = {}
+            for post in problem_posts:
+                by_subreddit.setdefault(post.get("subreddit") or "", []).append(post)
+            resources = [
+                submission_resource.with_name(submission_cursor_name(subreddit))(
+                    posts, created_utc=created_utc_cursor()
+                )
+                for subreddit, posts in by_subreddit.items()
+            ]
+        else:
+            resources = [submission_resource.with_name("submissions")(problem_posts)]
 
         # Run DLT pipeline with merge disposition for incremental loading
         # Use submission_id for deduplication (unique constraint)
         load_info = pipeline.run(
-            submission_resource(),
+            resources,
             primary_key=PK_SUBMISSION_ID if write_mode == "merge" else None
         )
 
@@ -567,6 +721,39 @@ def main():
         action="store_true",
         help="Use test data instead of real API calls"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Stop 'new' listings at the newest post seen by the previous run "
+             "and skip posts behind each subreddit's created_utc cursor"
+    )
+    parser.add_argument(
+        "--reset-marks",
+        action="store_true",
+        help="Forget stored high-water marks for the selected subreddits first"
+    )
+    parser.add_argument(
+        "--reset-cursor",
+        action="store_true",
+        help="Forget the selected subreddits' created_utc cursors first (backfill)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Load posts in batches while crawling instead of after collection"
+    )
+    parser.add_argument(
+        "--flush-rows",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Posts per load in --stream mode"
+    )
+    parser.add_argument(
+        "--flush-seconds",
+        type=float,
+        default=DEFAULT_FLUSH_INTERVAL,
+        help="Seconds before a partial batch is loaded in --stream mode"
+    )
 
     args = parser.parse_args()
 
@@ -574,13 +761,57 @@ def main():
     print("DLT Problem-First Collection")
     print("=" * 80)
 
+    high_water_marks = None
+    if args.incremental and not args.test:
+        high_water_marks = HighWaterMarkStore()
+        if args.reset_marks:
+            for subreddit_name in args.subreddits:
+                high_water_marks.reset(subreddit_name, args.sort)
+
+    if args.reset_cursor and not args.test:
+        reset_incremental_cursors(
+            create_dlt_pipeline(),
+            [submission_cursor_name(subreddit) for subreddit in args.subreddits],
+        )
+
+    if args.stream:
+        start_time = time.time()
+        stats = stream_problem_posts(
+            subreddits=args.subreddits,
+            limit=args.limit,
+            sort_type=args.sort,
+            test_mode=args.test,
+            high_water_marks=high_water_marks,
+            batch_size=args.flush_rows,
+            flush_interval=args.flush_seconds,
+        )
+        total_time = time.time() - start_time
+
+        if not stats.rows_added:
+            print("\n✗ No problem posts collected")
+            return 1
+
+        print(f"\n✓ Streamed {stats.rows_flushed}/{stats.rows_added} posts "
+              f"in {stats.batches_flushed} batches ({total_time:.2f}s total, "
+              f"{stats.flush_seconds:.2f}s loading in background)")
+
+        if stats.rows_failed:
+            print(f"✗ {stats.batches_failed} batches ({stats.rows_failed} posts) failed to load")
+            return 1
+
+        # Only advance the marks once every post is safely stored
+        if high_water_marks is not None:
+            high_water_marks.save()
+        return 0
+
     # Collect problem posts
     start_time = time.time()
     problem_posts = collect_problem_posts(
         subreddits=args.subreddits,
         limit=args.limit,
         sort_type=args.sort,
-        test_mode=args.test
+        test_mode=args.test,
+        high_water_marks=high_water_marks,
     )
     collection_time = time.time() - start_time
 
@@ -593,9 +824,16 @@ def main():
 
     # Load to Supabase
     start_load = time.time()
-    success = load_to_supabase(problem_posts)
+    # The cursors assume newest-first listings; other sorts load everything
+    success = load_to_supabase(
+        problem_posts, incremental=args.incremental and args.sort == "new"
+    )
     load_time = time.time() - start_load
 
+    # Only advance the marks once the posts are safely stored
+    if success and high_water_marks is not None:
+        high_water_marks.save()
+
     # If Supabase is not running, show verification steps
     if not success:
         print("\n" + "=" * 80)
@@ -39,7 +39,7 @@ Usage:
 """
 
 import logging
-import time
+import threading
 from collections.abc import Generator
 from typing import Any
 
@@ -48,17 +48,18 @@ import pendulum
 import praw
 
 # Import activity validation functions
-from core.activity_validation import (
-    calculate_activity_score,
-    calculate_trending_score,
-    collect_activity_metrics,
-    get_active_subreddits,
-)
+from core.activity_validation import SubredditActivity, snapshot_active_subreddits
 from core.dlt import PK_DISPLAY_NAME, PK_ID
+from core.dlt.incremental import created_utc_cursor, reset_incremental_cursors
+from core.utils.rate_limiter import REDDIT_REQUESTS_PER_MINUTE, RequestRateLimiter
+from core.utils.reddit_client_pool import RedditClientPool
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Requests made to fetch one submission's comment tree
+REQUESTS_PER_SUBMISSION_COMMENTS = 1
+
 
 def quick_opportunity_score(submission_title: str, subreddit: str, submission_score: int) -> float:
     """
@@ -157,26 +158,111 @@ def filter_high_potential_submissions(data_stream, min_score: float = 30.0):
     logger.info(f"Database reduction: {((total_count - filtered_count) / total_count * 100):.1f}% less storage")
 
 
+class ActivitySnapshot:
+    """
+    Activity measurements for a source's subreddits, computed once and shared.
+
+    All resources of ``reddit_activity_aware`` read the same snapshot, so the
+    candidate subreddits are validated and measured a single time per
+    extraction instead of once per resource. The snapshot is computed lazily
+    by whichever resource asks first (creating a source makes no API calls);
+    the other resources block on the lock until it is ready.
+
+    Attributes:
+        reddit_client: PRAW Reddit client instance or RedditClientPool
+        subreddits: Candidate subreddit names
+        time_filter: Time period for activity analysis
+        min_activity_score: Minimum activity score threshold
+        max_workers: Concurrent subreddit measurements (RedditClientPool only)
+        rate_limiter: Request budget shared by every resource of the source
+        collection_timestamp: When the snapshot was taken (None until computed)
+    """
+
+    def __init__(
+        self,
+        reddit_client: praw.Reddit | RedditClientPool,
+        subreddits: list[str],
+        time_filter: str = "day",
+        min_activity_score: float = 50.0,
+        max_workers: int = 1,
+        rate_limiter: RequestRateLimiter | None = None,
+    ):
+        self.reddit_client = reddit_client
+        self.subreddits = subreddits
+        self.time_filter = time_filter
+        self.min_activity_score = min_activity_score
+        self.max_workers = max_workers
+        if rate_limiter is None:
+            # A pool enforces per-credential budgets itself; cap the source at
+            # their sum instead of a single client's budget
+            budget = (
+                reddit_client.requests_per_minute
+                if isinstance(reddit_client, RedditClientPool)
+                else REDDIT_REQUESTS_PER_MINUTE
+            )
+            rate_limiter = RequestRateLimiter(budget)
+        self.rate_limiter = rate_limiter
+        self.collection_timestamp: pendulum.DateTime | None = None
+        self._active: list[SubredditActivity] | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> list[SubredditActivity]:
+        """
+        Return the active subreddits, computing the snapshot on first use.
+
+        Returns:
+            List of SubredditActivity meeting min_activity_score
+        """
+        with self._lock:
+            if self._active is None:
+                self.collection_timestamp = pendulum.now()
+                self._active = snapshot_active_subreddits(
+                    self.reddit_client,
+                    self.subreddits,
+                    self.time_filter,
+                    self.min_activity_score,
+                    max_workers=self.max_workers,
+                    rate_limiter=self.rate_limiter,
+                )
+            return self._active
+
+
 @dlt.source(
     name="reddit_activity_aware",
     max_table_nesting=0,
 )
 def reddit_activity_aware(
-    reddit_client: praw.Reddit,
+    reddit_client: praw.Reddit | RedditClientPool,
     subreddits: list[str],
     time_filter: str = "day",
     min_activity_score: float = 50.0,
     min_opportunity_score: float = 30.0,
+    max_workers: int = 1,
+    rate_limiter: RequestRateLimiter | None = None,
 ) -> Any:
     """
     Main DLT source for Reddit data collection with activity validation and pre-filtering.
 
+    The three resources share one ActivitySnapshot. PRAW clients are not
+    thread-safe, so a single praw.Reddit is used from one thread at a time:
+    resources are extracted in turn and subreddits are measured and
+    collected sequentially. With a RedditClientPool the resources are
+    parallelized, subreddits are measured on up to ``max_workers`` threads,
+    and per-subreddit comment collection is deferred to dlt's extract thread
+    pool (``[extract] workers``), each task on its own pool client. All of it
+    draws from one ``rate_limiter`` budget instead of sleeping per subreddit.
+
     Args:
-        reddit_client: PRAW Reddit client instance
+        reddit_client: PRAW Reddit client instance or RedditClientPool
         subreddits: List of subreddit names to collect from
         time_filter: Time period for activity analysis (hour, day, week, month, year, all)
         min_activity_score: Minimum activity score threshold (0-100)
         min_opportunity_score: Minimum quick opportunity score for pre-filtering (0-100)
+        max_workers: Concurrent subreddit activity measurements (RedditClientPool
+            only; PRAW clients are not thread-safe)
+        rate_limiter: Shared request budget (default: one Reddit client's
+            budget, or the combined budget when reddit_client is a
+            RedditClientPool)
 
     Returns:
         DLT source with configured resources and pre-filtering applied
@@ -187,11 +273,21 @@ def reddit_activity_aware(
         f"min_opportunity_score={min_opportunity_score}"
     )
 
-    return [
-        active_subreddits(reddit_client, subreddits, time_filter, min_activity_score),
-        validated_comments(reddit_client, subreddits, time_filter, min_activity_score, min_opportunity_score),
-        activity_trends(reddit_client, subreddits, time_filter, min_activity_score),
+    snapshot = ActivitySnapshot(
+        reddit_client, subreddits, time_filter, min_activity_score, max_workers, rate_limiter
+    )
+
+    resources = [
+        active_subreddits(reddit_client, subreddits, time_filter, min_activity_score, snapshot=snapshot),
+        validated_comments(
+            reddit_client, subreddits, time_filter, min_activity_score, min_opportunity_score,
+            snapshot=snapshot,
+        ),
+        activity_trends(reddit_client, subreddits, time_filter, min_activity_score, snapshot=snapshot),
     ]
+    if isinstance(reddit_client, RedditClientPool):
+        resources = [resource.parallelize() for resource in resources]
+    return resources
 
 
 @dlt.resource(
@@ -224,6 +320,7 @@ def active_subreddits(
     subreddits: list[str],
     time_filter: str = "day",
     min_activity_score: float = 50.0,
+    snapshot: ActivitySnapshot | None = None,
 ) -> Generator[dict[str, Any], None, None]:
     """
     DLT resource for collecting active subreddits with validation.
@@ -233,6 +330,7 @@ def active_subreddits(
         subreddits: List of subreddit names to validate and collect
         time_filter: Time period for activity analysis
         min_activity_score: Minimum activity score threshold
+        snapshot: Shared activity snapshot (created from the other args if omitted)
 
     Yields:
         Dict containing subreddit data with activity metrics
@@ -241,37 +339,32 @@ def active_subreddits(
         f"Starting active_subreddits resource collection for {len(subreddits)} subreddits"
     )
 
-    # Get active subreddits using activity validation
-    active_subs = get_active_subreddits(
+    snapshot = snapshot or ActivitySnapshot(
         reddit_client, subreddits, time_filter, min_activity_score
     )
+    active_subs = snapshot.get()
+    collection_timestamp = snapshot.collection_timestamp
 
-    collection_timestamp = pendulum.now()
-
-    for subreddit in active_subs:
+    for activity in active_subs:
+        subreddit = activity.subreddit
+        metrics = activity.metrics
         try:
-            # Collect detailed activity metrics
-            metrics = collect_activity_metrics(subreddit, time_filter)
-
-            # Calculate trending score
-            trending_score = calculate_trending_score(metrics)
-
             # Extract subreddit metadata safely
             subscribers = getattr(subreddit, "subscribers", None) or 0
             public_description = getattr(subreddit, "public_description", "") or ""
-            is_restricted = getattr(subreddit, "over18", False) or getattr(
-                subreddit, "restricted", False
-            )
+            # Only read fields /api/info returns: a missing attribute on a
+            # PRAW Subreddit triggers a full /about fetch
             is_nsfw = getattr(subreddit, "over18", False)
             subreddit_type = getattr(subreddit, "subreddit_type", "public")
+            is_restricted = is_nsfw or subreddit_type in ("restricted", "private")
 
             # Yield subreddit data with activity metrics
             yield {
                 "display_name": subreddit.display_name,
                 "subscribers": subscribers,
                 "public_description": public_description,
-                "activity_score": calculate_activity_score(subreddit, time_filter),
-                "trending_score": trending_score,
+                "activity_score": activity.activity_score,
+                "trending_score": activity.trending_score,
                 "comments_24h": metrics.comments_24h,
                 "posts_24h": metrics.posts_24h,
                 "avg_engagement_rate": metrics.avg_engagement_rate,
@@ -287,9 +380,6 @@ def active_subreddits(
                 "subreddit_type": subreddit_type,
             }
 
-            # Rate limiting between subreddit processing
-            time.sleep(1)
-
         except Exception as e:
             logger.warning(f"Error processing subreddit {subreddit.display_name}: {e}")
             continue
@@ -324,7 +414,7 @@ def active_subreddits(
     },
 )
 def validated_comments(
-    reddit_client: praw.Reddit,
+    reddit_client: praw.Reddit | RedditClientPool,
     subreddits: list[str],
     time_filter: str = "day",
     min_activity_score: float = 50.0,
@@ -333,12 +423,27 @@ def validated_comments(
     created_after: pendulum.DateTime | None = None,
     min_comment_length: int = 10,
     min_score: int = 1,
-) -> Generator[dict[str, Any], None, None]:
+    created_utc: dlt.sources.incremental[str] = created_utc_cursor(),
+    snapshot: ActivitySnapshot | None = None,
+) -> Generator[Any, None, None]:
     """
     DLT resource for collecting validated comments with activity awareness and pre-filtering.
 
+    With a RedditClientPool each active subreddit is collected by a deferred
+    task on a pool client, so dlt runs subreddits concurrently on its extract
+    thread pool; a task holds its client exclusively while it runs. A single
+    praw.Reddit is not thread-safe, so subreddits are then collected one
+    after another on the calling thread. Submissions whose
+    quick opportunity score is below the threshold are skipped before their
+    comment trees are fetched.
+
+    The ``created_utc`` cursor is kept in the pipeline state: comments older
+    than the previous run's newest comment (minus the cursor lag) are
+    dropped before they are built, so extraction and merge volume scale
+    with new comments only. Use reset_incremental_cursors() to backfill.
+
     Args:
-        reddit_client: PRAW Reddit client instance
+        reddit_client: PRAW Reddit client instance or RedditClientPool
         subreddits: List of subreddit names to collect from
         time_filter: Time period for activity analysis
         min_activity_score: Minimum activity score threshold
@@ -347,32 +452,41 @@ def validated_comments(
         created_after: Optional incremental loading cursor
         min_comment_length: Minimum comment length filter
         min_score: Minimum comment score filter
+        created_utc: Incremental cursor on comment creation time
+        snapshot: Shared activity snapshot (created from the other args if omitted)
 
     Yields:
-        Dict containing comment data with validation metadata and quick opportunity score
+        Per-subreddit batches (deferred with a RedditClientPool) of comment
+        dicts with validation metadata and quick opportunity score
     """
     logger.info(
         f"Starting validated_comments resource collection for {len(subreddits)} subreddits"
     )
 
-    # Get active subreddits first
-    active_subs = get_active_subreddits(
+    snapshot = snapshot or ActivitySnapshot(
         reddit_client, subreddits, time_filter, min_activity_score
     )
+    active_subs = snapshot.get()
+    collection_timestamp = snapshot.collection_timestamp
+    rate_limiter = snapshot.rate_limiter
+    comment_cutoff = (
+        pendulum.parse(created_utc.start_value).timestamp()
+        if created_utc.start_value
+        else None
+    )
+
+    def collect_subreddit_comments(
+        activity: SubredditActivity, subreddit: praw.models.Subreddit
+    ) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
 
-    collection_timestamp = pendulum.now()
+        logger.info(
+            f"Collecting comments from r/{subreddit.display_name} "
+            f"(activity_score: {activity.activity_score:.2f})"
+        )
 
-    for subreddit in active_subs:
         try:
-            # Calculate subreddit activity metrics
-            activity_score = calculate_activity_score(subreddit, time_filter)
-            metrics = collect_activity_metrics(subreddit, time_filter)
-            trending_score = calculate_trending_score(metrics)
-
-            logger.info(
-                f"Collecting comments from r/{subreddit.display_name} "
-                f"(activity_score: {activity_score:.2f})"
-            )
+            rate_limiter.acquire()
 
             # Get top posts within time filter
             for submission in subreddit.top(time_filter=time_filter, limit=20):
@@ -385,7 +499,18 @@ def validated_comments(
                         if submission_time <= created_after:
                             continue
 
+                    # The quick score depends only on the submission, so
+                    # filter before paying for its comment tree
+                    quick_score = quick_opportunity_score(
+                        submission.title,
+                        subreddit.display_name,
+                        submission.score
+                    )
+                    if quick_score < min_opportunity_score:
+                        continue
+
                     # Collect comments from this submission
+                    rate_limiter.acquire(REQUESTS_PER_SUBMISSION_COMMENTS)
                     submission.comments.replace_more(limit=0)
                     comment_count = 0
 
@@ -393,6 +518,10 @@ def validated_comments(
                         if comment_count >= comments_per_post:
                             break
 
+                        # Already loaded by a previous run
+                        if comment_cutoff is not None and comment.created_utc < comment_cutoff:
+                            continue
+
                         # Apply quality filters
                         if (
                             hasattr(comment, "body")
@@ -400,43 +529,34 @@ def validated_comments(
                             and len(comment.body) >= min_comment_length
                             and comment.score >= min_score
                         ):
-                            # Calculate quick opportunity score for pre-filtering
-                            quick_score = quick_opportunity_score(
-                                submission.title,
-                                subreddit.display_name,
-                                submission.score
-                            )
-
-                            # Only yield if opportunity score meets threshold
-                            if quick_score >= min_opportunity_score:
-                                yield {
-                                    "id": comment.id,
-                                    "subreddit": subreddit.display_name,
-                                    "author": (
-                                        str(comment.author)
-                                        if comment.author
-                                        else "[deleted]"
-                                    ),
-                                    "body": comment.body,
-                                    "score": comment.score,
-                                    "created_utc": pendulum.from_timestamp(
-                                        comment.created_utc
-                                    ).to_iso8601_string(),
-                                    "permalink": getattr(comment, "permalink", ""),
-                                    "subreddit_activity_score": activity_score,
-                                    "subreddit_trending_score": trending_score,
-                                    "body_length": len(comment.body) if comment.body else 0,
-                                    "is_edited": getattr(comment, "edited", False),
-                                    "stickied": getattr(comment, "stickied", False),
-                                    "parent_id": getattr(comment, "parent_id", ""),
-                                    "submission_id": submission.id,
-                                    "submission_title": submission.title,
-                                    "submission_score": submission.score,
-                                    "quick_opportunity_score": quick_score,
-                                    "time_filter": time_filter,
-                                    "collection_timestamp": collection_timestamp.to_iso8601_string(),
-                                }
-                                comment_count += 1
+                            rows.append({
+                                "id": comment.id,
+                                "subreddit": subreddit.display_name,
+                                "author": (
+                                    str(comment.author)
+                                    if comment.author
+                                    else "[deleted]"
+                                ),
+                                "body": comment.body,
+                                "score": comment.score,
+                                "created_utc": pendulum.from_timestamp(
+                                    comment.created_utc
+                                ).to_iso8601_string(),
+                                "permalink": getattr(comment, "permalink", ""),
+                                "subreddit_activity_score": activity.activity_score,
+                                "subreddit_trending_score": activity.trending_score,
+                                "body_length": len(comment.body) if comment.body else 0,
+                                "is_edited": getattr(comment, "edited", False),
+                                "stickied": getattr(comment, "stickied", False),
+                                "parent_id": getattr(comment, "parent_id", ""),
+                                "submission_id": submission.id,
+                                "submission_title": submission.title,
+                                "submission_score": submission.score,
+                                "quick_opportunity_score": quick_score,
+                                "time_filter": time_filter,
+                                "collection_timestamp": collection_timestamp.to_iso8601_string(),
+                            })
+                            comment_count += 1
 
                 except Exception as e:
                     logger.warning(
@@ -444,14 +564,34 @@ def validated_comments(
                     )
                     continue
 
-            # Rate limiting between subreddit processing
-            time.sleep(2)
-
         except Exception as e:
             logger.warning(f"Error processing subreddit {subreddit.display_name}: {e}")
-            continue
 
-    logger.info("Completed validated_comments resource collection")
+        return rows
+
+    if not isinstance(reddit_client, RedditClientPool):
+        for activity in active_subs:
+            yield collect_subreddit_comments(activity, activity.subreddit)
+        logger.info("Completed validated_comments collection for all active subreddits")
+        return
+
+    # More tasks than credentials can run at once: a task waits for its
+    # client rather than sharing it
+    client_locks = {
+        id(member.client): threading.Lock() for member in reddit_client.members
+    }
+
+    @dlt.defer
+    def collect_on_pool_client(activity: SubredditActivity) -> list[dict[str, Any]]:
+        client = reddit_client.acquire().client
+        with client_locks[id(client)]:
+            subreddit = client.subreddit(activity.subreddit.display_name)
+            return collect_subreddit_comments(activity, subreddit)
+
+    for activity in active_subs:
+        yield collect_on_pool_client(activity)
+
+    logger.info("Scheduled validated_comments collection for all active subreddits")
 
 
 @dlt.resource(
@@ -480,6 +620,7 @@ def activity_trends(
     subreddits: list[str],
     time_filter: str = "day",
     min_activity_score: float = 50.0,
+    snapshot: ActivitySnapshot | None = None,
 ) -> Generator[dict[str, Any], None, None]:
     """
     DLT resource for tracking subreddit activity trends over time.
@@ -489,6 +630,7 @@ def activity_trends(
         subreddits: List of subreddit names to track trends for
         time_filter: Time period for activity analysis
         min_activity_score: Minimum activity score threshold
+        snapshot: Shared activity snapshot (created from the other args if omitted)
 
     Yields:
         Dict containing activity trend data
@@ -497,21 +639,17 @@ def activity_trends(
         f"Starting activity_trends resource collection for {len(subreddits)} subreddits"
     )
 
-    # Get active subreddits
-    active_subs = get_active_subreddits(
+    snapshot = snapshot or ActivitySnapshot(
         reddit_client, subreddits, time_filter, min_activity_score
     )
-
-    collection_timestamp = pendulum.now()
+    active_subs = snapshot.get()
+    collection_timestamp = snapshot.collection_timestamp
     analysis_date = collection_timestamp.date()
 
-    for subreddit in active_subs:
+    for activity in active_subs:
+        subreddit = activity.subreddit
+        metrics = activity.metrics
         try:
-            # Collect comprehensive activity metrics
-            metrics = collect_activity_metrics(subreddit, time_filter)
-            activity_score = calculate_activity_score(subreddit, time_filter)
-            trending_score = calculate_trending_score(metrics)
-
             # Determine trend direction
             if metrics.trending_velocity > 50:
                 trend_direction = "rising"
@@ -536,8 +674,8 @@ def activity_trends(
             yield {
                 "subreddit_name": subreddit.display_name,
                 "time_filter": time_filter,
-                "activity_score": activity_score,
-                "trending_score": trending_score,
+                "activity_score": activity.activity_score,
+                "trending_score": activity.trending_score,
                 "comments_24h": metrics.comments_24h,
                 "posts_24h": metrics.posts_24h,
                 "avg_engagement_rate": metrics.avg_engagement_rate,
@@ -550,9 +688,6 @@ def activity_trends(
                 "analysis_date": analysis_date.isoformat(),
             }
 
-            # Rate limiting between subreddit processing
-            time.sleep(1)
-
         except Exception as e:
             logger.warning(f"Error processing trends for {subreddit.display_name}: {e}")
             continue
@@ -597,6 +732,7 @@ def run_reddit_collection(
     time_filter: str = "day",
     min_activity_score: float = 50.0,
     pipeline_name: str = "reddit_activity_pipeline",
+    reset_cursors: bool = False,
     **pipeline_kwargs,
 ) -> dict[str, Any]:
     """
@@ -608,6 +744,7 @@ def run_reddit_collection(
         time_filter: Time period for activity analysis
         min_activity_score: Minimum activity score threshold
         pipeline_name: Name of the DLT pipeline
+        reset_cursors: Forget the incremental cursors first (backfill)
         pipeline_kwargs: Additional pipeline arguments
 
     Returns:
@@ -618,6 +755,9 @@ def run_reddit_collection(
     # Create pipeline
     pipeline = create_reddit_pipeline(pipeline_name=pipeline_name, **pipeline_kwargs)
 
+    if reset_cursors:
+        reset_incremental_cursors(pipeline, ["validated_comments"])
+
     # Create data source
     data = reddit_activity_aware(
         reddit_client=reddit_client,
@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Offline Bulk Ingest from Local Reddit Dump Files
+
+Backfills months of history from locally stored Pushshift-style dumps
+(``RS_*.zst`` submissions, ``RC_*.zst`` comments) instead of fetching it
+through PRAW at 100 requests/min.
+
+Dumps are zstd-compressed NDJSON (one JSON object per line). Files are
+decompressed as a stream and processed line by line, so memory stays bounded
+by the load batch size regardless of dump size. Rows are filtered by the
+``TARGET_SUBREDDITS`` lists and keyword sets in ``core/collection.py``, mapped
+through ``transform_submission_to_schema``/``transform_comment_to_schema`` from
+``core/dlt_collection.py``, and loaded in large batches through ``DLTLoader``.
+Comments are kept only for submissions ingested in the same run, so the
+comments table gets no rows for posts that were filtered out.
+
+Main Functions:
+- iter_dump_records(): Stream JSON rows from a .zst (or plain) NDJSON dump
+- ingest_submissions(): Filter, transform and load a submissions dump
+- ingest_comments(): Filter, transform and load a comments dump
+
+Usage:
+    python -m core.dump_ingest --submissions RS_2024-01.zst --segment technology_saas
+    python -m core.dump_ingest --comments RC_2024-01.zst --keywords problem workaround
+"""
+
+import io
+import json
+import logging
+import re
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from core.collection import (
+    ALL_TARGET_SUBREDDITS,
+    MONETIZATION_KEYWORDS,
+    PAYMENT_WILLINGNESS_SIGNALS,
+    PROBLEM_KEYWORDS,
+    SOLUTION_MENTION_KEYWORDS,
+    TARGET_SUBREDDITS,
+    WORKAROUND_KEYWORDS,
+)
+from core.dlt import PK_COMMENT_ID, PK_SUBMISSION_ID
+from core.dlt_collection import (
+    transform_comment_to_schema,
+    transform_submission_to_schema,
+)
+from core.storage.dlt_loader import DLTLoader
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Pushshift dumps are compressed with a long window; the decompressor must allow it
+ZSTD_MAX_WINDOW_SIZE = 2**31
+
+# Rows per DLTLoader.load() call
+DEFAULT_BATCH_SIZE = 5000
+
+# Seconds between progress log lines
+DEFAULT_PROGRESS_INTERVAL = 10.0
+
+# Keyword sets selectable by name
+KEYWORD_SETS: dict[str, list[str]] = {
+    "problem": PROBLEM_KEYWORDS,
+    "monetization": MONETIZATION_KEYWORDS,
+    "payment": PAYMENT_WILLINGNESS_SIGNALS,
+    "workaround": WORKAROUND_KEYWORDS,
+    "solution": SOLUTION_MENTION_KEYWORDS,
+}
+
+DELETED_MARKERS = ("[deleted]", "[removed]")
+
+
+@dataclass
+class IngestProgress:
+    """Progress counters for a dump ingest, reported in rows per second."""
+
+    label: str
+    interval: float = DEFAULT_PROGRESS_INTERVAL
+    rows_read: int = 0
+    rows_matched: int = 0
+    rows_loaded: int = 0
+    rows_malformed: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    _last_report: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return max(time.monotonic() - self.started_at, 1e-9)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed
+
+    def maybe_report(self) -> None:
+        """Log progress if the reporting interval has elapsed."""
+        now = time.monotonic()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self) -> None:
+        """Log current progress."""
+        logger.info(
+            f"[{self.label}] read {self.rows_read:,} rows "
+            f"({self.rows_per_second:,.0f} rows/s), matched {self.rows_matched:,}, "
+            f"loaded {self.rows_loaded:,} in {self.batches} batches"
+        )
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get progress summary."""
+        return {
+            "rows_read": self.rows_read,
+            "rows_matched": self.rows_matched,
+            "rows_loaded": self.rows_loaded,
+            "rows_malformed": self.rows_malformed,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def resolve_subreddits(segments: Iterable[str] | None = None) -> set[str]:
+    """
+    Resolve market segments to a lowercased subreddit allow-list.
+
+    Args:
+        segments: Keys of TARGET_SUBREDDITS, or None/'all' for every segment
+
+    Returns:
+        Set of lowercased subreddit names
+
+    Raises:
+        ValueError: If a segment name is unknown
+    """
+    if not segments or "all" in segments:
+        return {name.lower() for name in ALL_TARGET_SUBREDDITS}
+
+    subreddits: set[str] = set()
+    for segment in segments:
+        if segment not in TARGET_SUBREDDITS:
+            raise ValueError(
+                f"Unknown segment '{segment}'. Choose from: {', '.join(TARGET_SUBREDDITS)}"
+            )
+        subreddits.update(name.lower() for name in TARGET_SUBREDDITS[segment])
+    return subreddits
+
+
+def compile_keyword_pattern(keyword_sets: Iterable[str] | None) -> re.Pattern[str] | None:
+    """
+    Compile selected keyword sets into one case-insensitive substring pattern.
+
+    A single alternation is much cheaper per row than scanning each keyword
+    with ``in`` and keeps the same substring-match semantics.
+
+    Args:
+        keyword_sets: Names from KEYWORD_SETS, or None/empty to disable filtering
+
+    Returns:
+        Compiled pattern, or None when keyword filtering is disabled
+
+    Raises:
+        ValueError: If a keyword set name is unknown
+    """
+    if not keyword_sets:
+        return None
+
+    keywords: set[str] = set()
+    for name in keyword_sets:
+        if name not in KEYWORD_SETS:
+            raise ValueError(
+                f"Unknown keyword set '{name}'. Choose from: {', '.join(KEYWORD_SETS)}"
+            )
+        keywords.update(keyword.lower() for keyword in KEYWORD_SETS[name])
+
+    # Longest first so overlapping keywords do not shadow each other
+    alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(alternation, re.IGNORECASE)
+
+
+def iter_dump_records(path: str | Path, progress: IngestProgress | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Stream JSON rows from an NDJSON dump.
+
+    ``.zst`` files are decompressed as a stream; other files are read as
+    plain NDJSON. Malformed lines are counted and skipped.
+
+    Args:
+        path: Dump file path
+        progress: Optional progress tracker (rows_read / rows_malformed)
+
+    Yields:
+        Parsed JSON objects, one per line
+
+    Raises:
+        ImportError: If a .zst file is given and zstandard is not installed
+    """
+    path = Path(path)
+
+    with open(path, "rb") as raw:
+        if path.suffix == ".zst":
+            if not ZSTD_AVAILABLE:
+                raise ImportError(
+                    "zstandard is required for .zst dumps. Install with: uv sync --extra dumps"
+                )
+            decompressor = zstandard.ZstdDecompressor(max_window_size=ZSTD_MAX_WINDOW_SIZE)
+            stream = decompressor.stream_reader(raw)
+        else:
+            stream = raw
+
+        text = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+        for line in text:
+            if progress is not None:
+                progress.rows_read += 1
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if progress is not None:
+                    progress.rows_malformed += 1
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+def _created_utc(record: dict[str, Any]) -> int | None:
+    """Dumps store created_utc as int, float or string depending on the year."""
+    try:
+        return int(float(record.get("created_utc")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _in_window(created_utc: int, since: int | None, until: int | None) -> bool:
+    if since is not None and created_utc < since:
+        return False
+    if until is not None and created_utc >= until:
+        return False
+    return True
+
+
+def dump_submission_to_schema(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Map a dump submission row to the submissions schema.
+
+    Args:
+        record: Raw submission object from an RS_* dump
+
+    Returns:
+        Row produced by transform_submission_to_schema
+    """
+    return transform_submission_to_schema({
+        "id": record.get("id"),
+        "title": record.get("title"),
+        "selftext": record.get("selftext") or "",
+        "subreddit": record.get("subreddit"),
+        "score": record.get("score", 0),
+        "url": record.get("url"),
+        "num_comments": record.get("num_comments", 0),
+        "created_utc": _created_utc(record) or 0,
+    })
+
+
+def dump_comment_to_schema(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Map a dump comment row to the comments schema.
+
+    Dumps carry ``link_id`` as a fullname ('t3_abc123') and no thread depth;
+    depth is only known (0) for top-level comments.
+
+    Args:
+        record: Raw comment object from an RC_* dump
+
+    Returns:
+        Row produced by transform_comment_to_schema
+    """
+    link_id = (record.get("link_id") or "").removeprefix("t3_") or None
+    parent_id = record.get("parent_id")
+
+    return transform_comment_to_schema({
+        "comment_id": record.get("id"),
+        "submission_id": link_id,
+        "link_id": link_id,
+        "body": record.get("body") or "",
+        "score": record.get("score"),
+        "created_utc": _created_utc(record) or 0,
+        "parent_id": parent_id,
+        "depth": 0 if parent_id and parent_id.startswith("t3_") else None,
+        "subreddit": record.get("subreddit"),
+    })
+
+
+def _ingest(
+    path: str | Path,
+    label: str,
+    text_of: Callable[[dict[str, Any]], str | None],
+    to_schema: Callable[[dict[str, Any]], dict[str, Any]],
+    table_name: str,
+    primary_key: str,
+    subreddits: set[str],
+    keyword_pattern: re.Pattern[str] | None,
+    since: int | None,
+    until: int | None,
+    loader: DLTLoader | None,
+    batch_size: int,
+    progress_interval: float,
+    keep: Callable[[dict[str, Any]], bool] | None = None,
+    matched_ids: set[str] | None = None,
+) -> dict[str, Any]:
+    """Shared filter → transform → batch-load loop for both dump types."""
+    progress = IngestProgress(label=label, interval=progress_interval)
+    batch: list[dict[str, Any]] = []
+
+    def flush() -> None:
+        if not batch:
+            return
+        progress.batches += 1
+        if loader is None:
+            progress.rows_loaded += len(batch)
+        elif loader.load(
+            data=list(batch),
+            table_name=table_name,
+            write_disposition="merge",
+            primary_key=primary_key,
+            pipeline_name=f"dump_ingest_{table_name}",
+        ):
+            progress.rows_loaded += len(batch)
+        else:
+            progress.failed_batches += 1
+        batch.clear()
+
+    logger.info(f"[{label}] ingesting {path} into '{table_name}'")
+
+    for record in iter_dump_records(path, progress):
+        progress.maybe_report()
+
+        if (record.get("subreddit") or "").lower() not in subreddits:
+            continue
+
+        created_utc = _created_utc(record)
+        if created_utc is None or not _in_window(created_utc, since, until):
+            continue
+
+        text = text_of(record)
+        if text is None:
+            continue
+        if keyword_pattern is not None and not keyword_pattern.search(text):
+            continue
+        if keep is not None and not keep(record):
+            continue
+
+        progress.rows_matched += 1
+        if matched_ids is not None and record.get("id"):
+            matched_ids.add(record["id"])
+        batch.append(to_schema(record))
+        if len(batch) >= batch_size:
+            flush()
+
+    flush()
+    progress.report()
+    return progress.get_summary()
+
+
+def _submission_text(record: dict[str, Any]) -> str | None:
+    return f"{record.get('title') or ''} {record.get('selftext') or ''}"
+
+
+def _comment_text(record: dict[str, Any]) -> str | None:
+    body = record.get("body") or ""
+    if not body or body in DELETED_MARKERS or record.get("author") in DELETED_MARKERS:
+        return None
+    return body
+
+
+def ingest_submissions(
+    path: str | Path,
+    segments: Iterable[str] | None = None,
+    keyword_sets: Iterable[str] | None = ("problem",),
+    since: int | None = None,
+    until: int | None = None,
+    loader: DLTLoader | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+    kept_ids: set[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Ingest a submissions dump into the submissions table.
+
+    Args:
+        path: RS_* dump file (.zst or plain NDJSON)
+        segments: TARGET_SUBREDDITS keys to keep (default: all segments)
+        keyword_sets: KEYWORD_SETS names matched against title + selftext;
+            None or empty keeps every post in the target subreddits
+        since: Keep rows with created_utc >= since (Unix seconds)
+        until: Keep rows with created_utc < until (Unix seconds)
+        loader: DLTLoader to load batches with; None counts matches only (dry run)
+        batch_size: Rows per load call
+        progress_interval: Seconds between progress log lines
+        kept_ids: Set the IDs of matched submissions are added to, to pass
+            on to ingest_comments()
+
+    Returns:
+        dict: rows_read, rows_matched, rows_loaded, rows_malformed, batches,
+            failed_batches, elapsed_seconds, rows_per_second
+    """
+    return _ingest(
+        path, "submissions", _submission_text, dump_submission_to_schema,
+        "submissions", PK_SUBMISSION_ID, resolve_subreddits(segments),
+        compile_keyword_pattern(keyword_sets), since, until, loader,
+        batch_size, progress_interval, matched_ids=kept_ids,
+    )
+
+
+def ingest_comments(
+    path: str | Path,
+    segments: Iterable[str] | None = None,
+    keyword_sets: Iterable[str] | None = None,
+    since: int | None = None,
+    until: int | None = None,
+    loader: DLTLoader | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+    submission_ids: set[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Ingest a comments dump into the comments table.
+
+    Deleted/removed comments are skipped, as in live collection.
+
+    Args:
+        path: RC_* dump file (.zst or plain NDJSON)
+        segments: TARGET_SUBREDDITS keys to keep (default: all segments)
+        keyword_sets: KEYWORD_SETS names matched against the body;
+            None or empty keeps every comment in the target subreddits
+        since: Keep rows with created_utc >= since (Unix seconds)
+        until: Keep rows with created_utc < until (Unix seconds)
+        loader: DLTLoader to load batches with; None counts matches only (dry run)
+        batch_size: Rows per load call
+        progress_interval: Seconds between progress log lines
+        submission_ids: Keep only comments on these submissions (the kept_ids
+            of ingest_submissions()); None keeps comments on any submission,
+            including ones that were never ingested
+
+    Returns:
+        dict: Same summary as ingest_submissions()
+    """
+    keep = None
+    if submission_ids is not None:
+        def keep(record: dict[str, Any]) -> bool:
+            return (record.get("link_id") or "").removeprefix("t3_") in submission_ids
+
+    return _ingest(
+        path, "comments", _comment_text, dump_comment_to_schema,
+        "comments", PK_COMMENT_ID, resolve_subreddits(segments),
+        compile_keyword_pattern(keyword_sets), since, until, loader,
+        batch_size, progress_interval, keep=keep,
+    )
+
+
+def main() -> int:
+    """Command-line entry point."""
+    import argparse
+    from datetime import UTC, datetime
+
+    def to_epoch(value: str) -> int:
+        return int(datetime.fromisoformat(value).replace(tzinfo=UTC).timestamp())
+
+    parser = argparse.ArgumentParser(description="Bulk ingest Reddit dump files via DLT")
+    parser.add_argument("--submissions", nargs="*", default=[], help="RS_* dump files")
+    parser.add_argument("--comments", nargs="*", default=[], help="RC_* dump files")
+    parser.add_argument(
+        "--segment", nargs="+", default=["all"],
+        help=f"Market segments to keep ({', '.join(TARGET_SUBREDDITS)} or all)",
+    )
+    parser.add_argument(
+        "--keywords", nargs="*", default=["problem"],
+        help=f"Keyword sets for submissions ({', '.join(KEYWORD_SETS)}); empty disables",
+    )
+    parser.add_argument(
+        "--comment-keywords", nargs="*", default=[],
+        help="Keyword sets for comments; empty (default) keeps all target comments",
+    )
+    parser.add_argument("--since", type=to_epoch, help="Start date (ISO, inclusive)")
+    parser.add_argument("--until", type=to_epoch, help="End date (ISO, exclusive)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--connection-string", help="Postgres DSN for DLTLoader")
+    parser.add_argument("--dry-run", action="store_true", help="Count matches without loading")
+    args = parser.parse_args()
+
+    if not args.submissions and not args.comments:
+        parser.error("provide --submissions and/or --comments dump files")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    loader = None if args.dry_run else DLTLoader(connection_string=args.connection_string)
+    failed = 0
+
+    # Comments follow the submissions ingested in this run; without any, they
+    # are kept for whatever is already in the submissions table
+    submission_ids: set[str] | None = set() if args.submissions else None
+    if submission_ids is None:
+        logger.warning(
+            "No --submissions given: comments are loaded for every submission in the "
+            "target subreddits, including ones not in the submissions table"
+        )
+
+    for path in args.submissions:
+        summary = ingest_submissions(
+            path, args.segment, args.keywords, args.since, args.until, loader, args.batch_size,
+            kept_ids=submission_ids,
+        )
+        print(f"✓ {path}: {summary}")
+        failed += summary["failed_batches"]
+
+    for path in args.comments:
+        summary = ingest_comments(
+            path, args.segment, args.comment_keywords, args.since, args.until, loader,
+            args.batch_size, submission_ids=submission_ids,
+        )
+        print(f"✓ {path}: {summary}")
+        failed += summary["failed_batches"]
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
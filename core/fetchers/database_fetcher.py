@@ -6,6 +6,7 @@ scripts/core/batch_opportunity_scoring.py to enable code reuse across pipeline
 components.
 """
 
+from datetime import UTC, datetime, timedelta
 from typing import Any, Iterator
 
 from core.fetchers.base_fetcher import BaseFetcher
@@ -26,6 +27,7 @@ class DatabaseFetcher(BaseFetcher):
             - batch_size: Number of records per batch (default: 1000)
             - deduplicate: Enable content-based deduplication (default: True)
             - table_name: Database table name (default: "app_opportunities")
+            - max_age_hours: Only fetch rows created in this many hours (default: None)
         stats: Fetching statistics (fetched, filtered, errors)
 
     Examples:
@@ -89,12 +91,37 @@ class DatabaseFetcher(BaseFetcher):
                 - batch_size: Records per batch (default: 1000)
                 - deduplicate: Enable deduplication (default: True)
                 - table_name: Table to query (default: "app_opportunities")
+                - max_age_hours: Only fetch rows whose created_utc is within this
+                  many hours (default: None, no window)
         """
         super().__init__(config)
         self.client = client
         self.batch_size = self.config.get("batch_size", 1000)
         self.deduplicate = self.config.get("deduplicate", True)
         self.table_name = self.config.get("table_name", "app_opportunities")
+        self.max_age_hours = self.config.get("max_age_hours")
+
+    def _select(self) -> Any:
+        """
+        Build the base submissions query, limited to the recent window if set.
+
+        The window is closed on both sides: submissions is partitioned by month
+        on created_utc, and an upper bound lets Postgres skip the default
+        partition as well as the older months.
+
+        Returns:
+            Supabase query builder
+        """
+        query = self.client.table(self.table_name).select(
+            "submission_id, title, content, subreddit, reddit_score, "
+            "num_comments, trust_score, trust_level, created_utc, author, selftext"
+        )
+        if self.max_age_hours:
+            now = datetime.now(UTC)
+            query = query.gte(
+                "created_utc", (now - timedelta(hours=self.max_age_hours)).isoformat()
+            ).lte("created_utc", (now + timedelta(days=1)).isoformat())
+        return query
 
     def fetch(self, limit: int | None = None, **kwargs) -> Iterator[dict[str, Any]]:
         """
@@ -148,14 +175,7 @@ class DatabaseFetcher(BaseFetcher):
             Exception: If query fails
         """
         try:
-            query = (
-                self.client.table(self.table_name)
-                .select(
-                    "submission_id, title, content, subreddit, reddit_score, "
-                    "num_comments, trust_score, trust_level, created_utc, author, selftext"
-                )
-                .limit(limit)
-            )
+            query = self._select().limit(limit)
 
             response = query.execute()
 
@@ -194,14 +214,7 @@ class DatabaseFetcher(BaseFetcher):
 
             while True:
                 # Build query with pagination
-                query = (
-                    self.client.table(self.table_name)
-                    .select(
-                        "submission_id, title, content, subreddit, reddit_score, "
-                        "num_comments, trust_score, trust_level, created_utc, author, selftext"
-                    )
-                    .range(offset, offset + self.batch_size - 1)
-                )
+                query = self._select().range(offset, offset + self.batch_size - 1)
 
                 response = query.execute()
 
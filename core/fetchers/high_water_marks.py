@@ -0,0 +1,216 @@
+"""Per-subreddit high-water marks for incremental listing crawls.
+
+Listing crawls (``subreddit.new()``) always return the newest posts first, so
+once a run has stored everything up to a given post there is no reason to page
+past it again. This module persists the newest submission fullname and
+``created_utc`` seen per ``(subreddit, sort_type)`` and wraps PRAW listings so
+iteration stops as soon as an already-seen item appears. PRAW fetches listings
+lazily one page at a time, so stopping early also stops the underlying API
+requests: steady-state collection costs only as many pages as there are new
+posts.
+
+Only chronological listings are incremental. ``hot``, ``top`` and ``rising``
+are ranking listings where an old post can sit above a new one, so they are
+passed through unchanged.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default location of the persisted marks (kept out of the package tree)
+DEFAULT_STATE_PATH = Path(__file__).parent.parent.parent / ".state" / "high_water_marks.json"
+
+# Sort types whose listings are ordered newest-first
+INCREMENTAL_SORT_TYPES = frozenset({"new"})
+
+
+@dataclass
+class HighWaterMark:
+    """
+    Newest submission seen for one subreddit listing.
+
+    Attributes:
+        fullname: Reddit fullname of the newest submission (e.g. 't3_abc123')
+        created_utc: Unix timestamp of that submission
+        updated_at: ISO timestamp of when the mark was last advanced
+    """
+
+    fullname: str
+    created_utc: float
+    updated_at: str
+
+
+class HighWaterMarkStore:
+    """
+    JSON-file backed store of listing high-water marks.
+
+    Marks are keyed by lowercased subreddit name and sort type. Marks are only
+    advanced in memory once a wrapped listing has been fully consumed; call
+    ``save()`` after the collected rows have been stored so a failed run never
+    skips posts it did not persist.
+
+    Attributes:
+        path: Location of the JSON state file
+        stats: Counters for listing items yielded and crawls stopped early
+
+    Examples:
+        >>> marks = HighWaterMarkStore()
+        >>> listing = reddit.subreddit("SaaS").new(limit=100)
+        >>> for submission in marks.iter_unseen(listing, "SaaS", "new"):
+        ...     store(submission)
+        >>> marks.save()
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Initialize the store and load any previously saved marks.
+
+        Args:
+            path: JSON state file location (default: DEFAULT_STATE_PATH)
+        """
+        self.path = Path(path) if path else DEFAULT_STATE_PATH
+        self._marks: dict[str, HighWaterMark] = {}
+        self.stats = {"yielded": 0, "stopped_early": 0}
+        self._load()
+
+    @staticmethod
+    def _key(subreddit: str, sort_type: str) -> str:
+        return f"{subreddit.lower()}:{sort_type}"
+
+    def _load(self) -> None:
+        """Load marks from disk, starting empty if the file is missing or invalid."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+            self._marks = {key: HighWaterMark(**value) for key, value in raw.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable high-water mark file {self.path}: {e}")
+            self._marks = {}
+
+    def save(self) -> None:
+        """Persist marks atomically (write to a temp file, then rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({key: asdict(mark) for key, mark in self._marks.items()}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, subreddit: str, sort_type: str) -> HighWaterMark | None:
+        """
+        Return the mark for a subreddit listing.
+
+        Args:
+            subreddit: Subreddit name (without 'r/')
+            sort_type: Listing sort type
+
+        Returns:
+            HighWaterMark or None if the listing has never been crawled
+        """
+        return self._marks.get(self._key(subreddit, sort_type))
+
+    def update(self, subreddit: str, sort_type: str, fullname: str, created_utc: float) -> bool:
+        """
+        Advance the mark for a subreddit listing.
+
+        The mark never moves backwards: an older submission is ignored.
+
+        Args:
+            subreddit: Subreddit name (without 'r/')
+            sort_type: Listing sort type
+            fullname: Reddit fullname of the newest submission seen
+            created_utc: Unix timestamp of that submission
+
+        Returns:
+            bool: True if the mark was advanced
+        """
+        current = self.get(subreddit, sort_type)
+        if current is not None and created_utc <= current.created_utc:
+            return False
+
+        self._marks[self._key(subreddit, sort_type)] = HighWaterMark(
+            fullname=fullname,
+            created_utc=float(created_utc),
+            updated_at=datetime.now(UTC).isoformat(),
+        )
+        return True
+
+    def reset(self, subreddit: str | None = None, sort_type: str | None = None) -> None:
+        """
+        Drop marks so the next crawl fetches the full listing again.
+
+        Args:
+            subreddit: Only reset this subreddit (default: all subreddits)
+            sort_type: Only reset this sort type (default: all sort types)
+        """
+        for key in list(self._marks):
+            key_subreddit, key_sort = key.rsplit(":", 1)
+            if subreddit is not None and key_subreddit != subreddit.lower():
+                continue
+            if sort_type is not None and key_sort != sort_type:
+                continue
+            del self._marks[key]
+
+    def is_incremental(self, sort_type: str) -> bool:
+        """Return True if listings of this sort type can stop at the mark."""
+        return sort_type in INCREMENTAL_SORT_TYPES
+
+    def iter_unseen(
+        self, listing: Iterable[Any], subreddit: str, sort_type: str
+    ) -> Iterator[Any]:
+        """
+        Yield listing items newer than the stored mark.
+
+        For chronological listings, iteration stops at the first item that
+        matches the mark's fullname or is not newer than its timestamp, which
+        also stops PRAW from requesting further pages. Once the listing is
+        exhausted (or stopped at the mark) the mark advances to the newest
+        item yielded. Ranking listings are passed through unchanged.
+
+        Args:
+            listing: PRAW ListingGenerator (or any iterable of submissions)
+            subreddit: Subreddit name (without 'r/')
+            sort_type: Listing sort type
+
+        Yields:
+            Submissions not seen by a previous crawl
+        """
+        if not self.is_incremental(sort_type):
+            yield from listing
+            return
+
+        mark = self.get(subreddit, sort_type)
+        newest: tuple[str, float] | None = None
+
+        for item in listing:
+            fullname = f"t3_{item.id}"
+            created_utc = float(item.created_utc)
+
+            if mark is not None and (
+                fullname == mark.fullname or created_utc <= mark.created_utc
+            ):
+                self.stats["stopped_early"] += 1
+                logger.info(
+                    f"r/{subreddit} ({sort_type}): reached high-water mark {mark.fullname}, "
+                    "stopping listing crawl"
+                )
+                break
+
+            if newest is None or created_utc > newest[1]:
+                newest = (fullname, created_utc)
+
+            self.stats["yielded"] += 1
+            yield item
+
+        if newest is not None:
+            self.update(subreddit, sort_type, *newest)
@@ -12,7 +12,9 @@ from typing import Any, Iterator
 import praw
 
 from core.fetchers.base_fetcher import BaseFetcher
+from core.fetchers.high_water_marks import HighWaterMarkStore
 from core.quality_filters.thresholds import PROBLEM_KEYWORDS
+from core.utils.reddit_client_pool import RedditClientPool, load_reddit_credentials
 
 
 class RedditAPIFetcher(BaseFetcher):
@@ -24,11 +26,12 @@ class RedditAPIFetcher(BaseFetcher):
     unified pipeline architecture.
 
     Attributes:
-        client: Initialized PRAW Reddit client
+        client: Initialized PRAW Reddit client or RedditClientPool
         config: Configuration dictionary with optional settings:
             - sort_type: Sort method for fetching ('new', 'hot', 'top', 'rising')
             - filter_keywords: Enable problem keyword filtering (default: True)
             - min_keywords: Minimum problem keywords required (default: 1)
+            - high_water_marks: HighWaterMarkStore for incremental 'new' crawls
         stats: Fetching statistics (fetched, filtered, errors)
 
     Examples:
@@ -41,32 +44,44 @@ class RedditAPIFetcher(BaseFetcher):
         >>> print(f"Fetched {stats['fetched']}, Filtered {stats['filtered']}")
     """
 
-    def __init__(self, client: praw.Reddit | None = None, config: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        client: praw.Reddit | RedditClientPool | None = None,
+        config: dict[str, Any] | None = None,
+    ):
         """
         Initialize Reddit API fetcher.
 
         Args:
-            client: Initialized PRAW Reddit client. If None, creates client from env vars.
+            client: Initialized PRAW Reddit client or RedditClientPool. If None,
+                creates a client (or a pool, when several credentials are set)
+                from env vars.
             config: Optional configuration dictionary with settings:
                 - sort_type: Sort method ('new', 'hot', 'top', 'rising') (default: 'new')
                 - filter_keywords: Enable keyword filtering (default: True)
                 - min_keywords: Minimum problem keywords (default: 1)
+                - high_water_marks: HighWaterMarkStore; when set, 'new' listings
+                  stop at the newest submission seen by the previous run. Marks
+                  advance in memory only: the caller saves the store once the
+                  fetched submissions are stored
         """
         super().__init__(config)
         self.client = client or self._create_client()
         self.sort_type = self.config.get("sort_type", "new")
         self.filter_keywords = self.config.get("filter_keywords", True)
         self.min_keywords = self.config.get("min_keywords", 1)
+        self.high_water_marks: HighWaterMarkStore | None = self.config.get("high_water_marks")
 
-    def _create_client(self) -> praw.Reddit:
+    def _create_client(self) -> praw.Reddit | RedditClientPool:
         """
         Create PRAW Reddit client from environment variables.
 
         Reads REDDIT_PUBLIC, REDDIT_SECRET, and REDDIT_USER_AGENT from .env file
-        or environment variables.
+        or environment variables. If numbered credentials (REDDIT_PUBLIC_2, ...)
+        are also set, returns a RedditClientPool spanning all of them.
 
         Returns:
-            praw.Reddit: Initialized Reddit client
+            praw.Reddit | RedditClientPool: Initialized Reddit client
 
         Raises:
             ValueError: If required credentials are missing
@@ -94,6 +109,10 @@ class RedditAPIFetcher(BaseFetcher):
                 "and REDDIT_USER_AGENT environment variables."
             )
 
+        credentials = load_reddit_credentials()
+        if len(credentials) > 1:
+            return RedditClientPool(credentials)
+
         return praw.Reddit(
             client_id=reddit_public,
             client_secret=reddit_secret,
@@ -175,6 +194,12 @@ class RedditAPIFetcher(BaseFetcher):
                 # Default to 'new' if unknown sort type
                 submissions = subreddit.new(limit=limit)
 
+            # Stop at the previous run's newest submission when tracking marks
+            if self.high_water_marks is not None:
+                submissions = self.high_water_marks.iter_unseen(
+                    submissions, subreddit_name, self.sort_type
+                )
+
             for submission in submissions:
                 # Apply problem keyword filtering if enabled
                 if self.filter_keywords:
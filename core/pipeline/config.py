@@ -41,9 +41,24 @@ class PipelineConfig:
     batch_size: int = 10
     max_workers: int = 4
 
+    # Write-behind storage: store results on a background thread while enriching
+    storage_write_behind: bool = False
+    storage_batch_size: int = 50
+    storage_flush_interval: float = 5.0
+    storage_max_pending_batches: int = 4
+    # "merge" writes whole rows; "patch" (HybridStore only) updates just the
+    # columns owned by the enabled services, skipping the trust prefetch
+    storage_write_mode: str = "merge"
+    # DLTLoader connection string; "duckdb:///<path>" (LocalSupabaseClient.dsn)
+    # keeps a run on an embedded database. None uses the default Postgres.
+    storage_dsn: str | None = None
+
     # Deduplication settings
     enable_deduplication: bool = True
+    # Concept similarity for near-duplicate matching (SimpleDeduplicator.from_pipeline_config)
     deduplication_threshold: float = 0.8
+    # Seconds a worker holds a concept's analysis lease before others may take over
+    concept_lease_seconds: int = 900
 
     # Quality thresholds
     ai_profile_threshold: float = 40.0
@@ -55,6 +70,8 @@ class PipelineConfig:
     min_score: int = 10
     min_comments: int = 5
     min_text_length: int = 100
+    # Trained RelevanceGate (.npz) applied after the quality filter; None disables
+    relevance_gate_path: str | None = None
 
     # Data return settings
     return_data: bool = True
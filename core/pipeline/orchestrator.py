@@ -10,6 +10,7 @@ Key Features:
 - Configurable service enablement (enable/disable any service)
 - Comprehensive error handling and statistics tracking
 - Storage using Phase 7 services (OpportunityStore, HybridStore)
+- Optional write-behind storage that overlaps with enrichment
 
 Architecture:
     Config -> Fetcher -> Enrichment Services -> Storage
@@ -29,13 +30,18 @@ Example:
 """
 
 import logging
+import os
+import socket
+import uuid
+from datetime import datetime
 from typing import Any
 
 from core.enrichment.base_service import BaseEnrichmentService
 from core.fetchers.base_fetcher import BaseFetcher
 from core.pipeline.config import DataSource, PipelineConfig
 from core.pipeline.factory import ServiceFactory
-from core.storage import HybridStore, OpportunityStore, ProfileStore
+from core.quality_filters.relevance_gate import RelevanceGate, apply_relevance_gate
+from core.storage import BufferedSink, DLTLoader, HybridStore, OpportunityStore, ProfileStore
 
 logger = logging.getLogger(__name__)
 
@@ -86,8 +92,21 @@ class OpportunityPipeline:
             "stored": 0,
             "errors": 0,
             "skipped": 0,
+            "deferred": 0,  # Concept analyzed by another worker (lease held)
         }
+        # Identifies this process in business_concepts analysis leases
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._held_leases: list[Any] = []
+        self._deferred: list[dict[str, Any]] = []
+        self._storage_sink: BufferedSink | None = None
+        self._storage_store: Any = None
+        self._stored_results: list[dict[str, Any]] = []
         self.services: dict[str, BaseEnrichmentService] = {}
+        self.relevance_gate = (
+            RelevanceGate.load(config.relevance_gate_path)
+            if config.relevance_gate_path
+            else None
+        )
         self._initialize_services()
 
     def _initialize_services(self) -> None:
@@ -117,12 +136,15 @@ class OpportunityPipeline:
                 - stats (dict): Processing statistics
                 - summary (dict): Human-readable summary
                 - opportunities (list): Enriched submissions (if requested)
+                - deferred (list): Submissions whose concept another worker
+                  is analyzing; run them again later to copy its analysis
 
         Examples:
             >>> pipeline = OpportunityPipeline(config)
             >>> result = pipeline.run(min_score=50)
             >>> print(result['summary']['success_rate'])
         """
+        self._deferred = []
         try:
             logger.info(
                 f"[OK] Starting pipeline with {self.config.data_source.value} source"
@@ -149,6 +171,14 @@ class OpportunityPipeline:
                     f"{filtered_count} filtered"
                 )
 
+            # 2b. Learned relevance gate (skip LLM calls likely to score low)
+            if self.relevance_gate is not None and submissions:
+                submissions, gated = apply_relevance_gate(submissions, self.relevance_gate)
+                self.stats["filtered"] += len(gated)
+                logger.info(
+                    f"[OK] Relevance gate: {len(submissions)} passed, {len(gated)} gated"
+                )
+
             # 3. AI enrichment with deduplication
             enriched = []
 
@@ -160,27 +190,38 @@ class OpportunityPipeline:
                     f"[OK] Deduplication check: {len(concept_metadata)} concepts found"
                 )
 
+            # DEDUPLICATION: Batch-copy existing analyses (1 query per service)
+            copied_analyses = self._batch_copy_existing_analyses(
+                submissions, concept_metadata
+            )
+
+            # DEDUPLICATION: Analyze each new concept once, fan out to siblings
+            concept_groups = self._group_by_concept(submissions, concept_metadata)
+            sibling_ids = {
+                sibling.get("submission_id")
+                for siblings in concept_groups.values()
+                for sibling in siblings
+            }
+
+            # Write-behind: results are stored in batches while enrichment continues
+            if self.config.storage_write_behind and not self.config.dry_run:
+                self._storage_sink = self._open_storage_sink()
+
             for sub in submissions:
+                emitted = len(enriched)
                 try:
                     sub_id = sub.get("submission_id")
+                    if sub_id in sibling_ids:
+                        continue  # Enriched together with its representative
                     metadata = concept_metadata.get(sub_id, {})
 
                     # DEDUPLICATION: Check if we can copy existing analysis
-                    should_copy = False
-                    if metadata:
-                        # Check if either Agno or Profiler has existing analysis
-                        has_agno = metadata.get("has_agno", False)
-                        has_profiler = metadata.get("has_profiler", False)
-
-                        # Copy if ANY required service has existing analysis
-                        should_copy = (
-                            self.config.enable_monetization and has_agno
-                        ) or (self.config.enable_profiler and has_profiler)
+                    should_copy = self._should_copy_enrichment(metadata)
 
                     if should_copy:
                         # COPY: Reuse existing analysis ($0 cost)
                         result = self._copy_existing_enrichment(
-                            sub, metadata["concept_id"]
+                            sub, metadata["concept_id"], copied_analyses
                         )
                         if result:
                             enriched.append(result)
@@ -195,42 +236,41 @@ class OpportunityPipeline:
                                 f"[WARN] Copy failed for {sub_id}, "
                                 "running fresh analysis"
                             )
-                            result, service_errors = (
-                                self._enrich_submission_with_error_tracking(sub)
-                            )
-                            if result:
-                                enriched.append(result)
-                                self.stats["analyzed"] += 1
-                            else:
-                                self.stats["skipped"] += 1
-                            self.stats["errors"] += service_errors
+                            self._analyze_fresh(sub, enriched)
                     else:
-                        # ANALYZE: Run fresh AI analysis ($0.075 cost)
-                        result, service_errors = (
-                            self._enrich_submission_with_error_tracking(sub)
+                        # ANALYZE: Run fresh AI analysis ($0.075 cost), once per concept
+                        self._analyze_concept_group(
+                            sub,
+                            metadata.get("concept_id"),
+                            concept_groups.get(sub_id, []),
+                            enriched,
                         )
-                        if result:
-                            enriched.append(result)
-                            self.stats["analyzed"] += 1
-                        else:
-                            self.stats["skipped"] += 1
-
-                        # Add service errors to pipeline error count
-                        self.stats["errors"] += service_errors
 
                 except Exception as e:
                     sub_id = sub.get("submission_id", "unknown")
                     logger.error(f"[ERROR] Enrichment error for {sub_id}: {e}")
                     self.stats["errors"] += 1
 
+                if self._storage_sink is not None:
+                    # Blocks while storage_max_pending_batches batches wait for the writer
+                    self._storage_sink.extend(enriched[emitted:])
+
             logger.info(
                 f"[OK] Enriched {len(enriched)} submissions "
                 f"(analyzed: {self.stats['analyzed']}, copied: {self.stats['copied']})"
             )
 
             # 4. Storage
-            if enriched and not self.config.dry_run:
+            stored_all = not enriched and not self.config.dry_run
+            if self._storage_sink is not None:
+                stored = self._close_storage_sink()
+                self.stats["stored"] = len(stored)
+                logger.info(f"[OK] Stored {len(stored)} of {len(enriched)} results")
+                self._update_concept_metadata(stored)
+                stored_all = len(stored) == len(enriched)
+            elif enriched and not self.config.dry_run:
                 success = self._store_results(enriched)
+                stored_all = success
                 if success:
                     self.stats["stored"] = len(enriched)
                     logger.info(f"[OK] Stored {len(enriched)} results")
@@ -241,6 +281,12 @@ class OpportunityPipeline:
                 logger.info("[OK] Dry run mode - skipping storage")
                 self.stats["stored"] = 0
 
+            # Advance high-water marks only once every result is stored, so a
+            # failed run re-fetches the same submissions
+            high_water_marks = (self.config.source_config or {}).get("high_water_marks")
+            if high_water_marks is not None and stored_all:
+                high_water_marks.save()
+
             # 5. Generate summary
             summary = self._generate_summary()
 
@@ -252,6 +298,8 @@ class OpportunityPipeline:
                 "stats": self.stats,
                 "summary": summary,
                 "opportunities": enriched if self.config.return_data else [],
+                # Left for a later run: another worker holds their concept's lease
+                "deferred": self._deferred,
             }
 
         except Exception as e:
@@ -263,6 +311,13 @@ class OpportunityPipeline:
                 "summary": self._generate_summary(),
             }
 
+        finally:
+            # Don't lose buffered results if the run failed mid-way
+            if self._storage_sink is not None:
+                self._close_storage_sink()
+            # Concepts are flagged as analyzed by now (or the run failed)
+            self._release_concept_leases()
+
     def _create_fetcher(self) -> BaseFetcher:
         """
         Create appropriate fetcher based on config.
@@ -337,14 +392,17 @@ class OpportunityPipeline:
         """
         Batch-fetch concept metadata for all submissions.
 
-        Reduces N*3 queries to 2 batch queries total, improving performance
-        by ~75x for deduplication checks.
+        Reduces N*3 queries to one get_concept_metadata RPC call (a primary-key
+        read of submission_concept_status), or to 2 batch queries when the
+        function is not deployed.
 
         Args:
             submissions: List of submission dictionaries
 
         Returns:
-            dict: submission_id → {concept_id, has_agno, has_profiler}
+            dict: submission_id → {concept_id, has_agno, has_profiler}, plus
+                primary_agno_analysis_id / primary_profiler_analysis_id when
+                read through get_concept_metadata
         """
         if not self.config.supabase_client:
             logger.warning("No Supabase client - skipping concept metadata fetch")
@@ -357,6 +415,10 @@ class OpportunityPipeline:
         if not submission_ids:
             return {}
 
+        metadata = self._fetch_concept_metadata_rpc(submission_ids)
+        if metadata is not None:
+            return metadata
+
         try:
             # Batch Query 1: Get all concept_ids at once
             concepts_response = (
@@ -412,6 +474,44 @@ class OpportunityPipeline:
             logger.error(f"[ERROR] Failed to batch-fetch concept metadata: {e}")
             return {}
 
+    def _fetch_concept_metadata_rpc(
+        self, submission_ids: list[str]
+    ) -> dict[str, dict[str, Any]] | None:
+        """
+        Fetch concept metadata with the get_concept_metadata database function.
+
+        Args:
+            submission_ids: Submission IDs to look up
+
+        Returns:
+            dict: submission_id → {concept_id, has_agno, has_profiler,
+                primary_agno_analysis_id, primary_profiler_analysis_id}, or None
+                if the function is unavailable
+        """
+        try:
+            response = self.config.supabase_client.rpc(
+                "get_concept_metadata", {"p_submission_ids": submission_ids}
+            ).execute()
+        except Exception as e:
+            logger.debug(f"get_concept_metadata unavailable, using table queries: {e}")
+            return None
+
+        metadata = {
+            row["submission_id"]: {
+                "concept_id": row["concept_id"],
+                "has_agno": row.get("has_agno_analysis", False),
+                "has_profiler": row.get("has_profiler_analysis", False),
+                "primary_agno_analysis_id": row.get("primary_agno_analysis_id"),
+                "primary_profiler_analysis_id": row.get("primary_profiler_analysis_id"),
+            }
+            for row in response.data or []
+        }
+        logger.info(
+            f"[OK] Batch-fetched metadata for {len(metadata)} submissions "
+            f"(1 query vs {len(submission_ids) * 3} queries)"
+        )
+        return metadata
+
     def _enrich_submission(self, submission: dict[str, Any]) -> dict[str, Any] | None:
         """
         Apply all enabled enrichment services.
@@ -505,8 +605,283 @@ class OpportunityPipeline:
 
         return result, service_errors
 
+    def _should_copy_enrichment(self, metadata: dict[str, Any]) -> bool:
+        """
+        Whether a submission's concept already has analysis worth copying.
+
+        Args:
+            metadata: Entry from _batch_fetch_concept_metadata (empty if none)
+
+        Returns:
+            True if ANY required service has existing analysis
+        """
+        if not metadata:
+            return False
+        return bool(
+            (self.config.enable_monetization and metadata.get("has_agno", False))
+            or (self.config.enable_profiler and metadata.get("has_profiler", False))
+        )
+
+    def _analyze_fresh(
+        self, submission: dict[str, Any], enriched: list[dict[str, Any]]
+    ) -> dict[str, Any] | None:
+        """
+        Run fresh AI analysis on one submission and record the outcome.
+
+        Args:
+            submission: Submission to enrich
+            enriched: List the result is appended to
+
+        Returns:
+            Enriched submission, or None if enrichment failed
+        """
+        result, service_errors = self._enrich_submission_with_error_tracking(submission)
+        if result:
+            enriched.append(result)
+            self.stats["analyzed"] += 1
+        else:
+            self.stats["skipped"] += 1
+
+        # Add service errors to pipeline error count
+        self.stats["errors"] += service_errors
+        return result
+
+    def _group_by_concept(
+        self,
+        submissions: list[dict[str, Any]],
+        concept_metadata: dict[str, dict[str, Any]],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Group submissions that share a concept with no analysis yet.
+
+        The first submission of each concept is its representative; only it
+        is analyzed, and the result is copied to the others.
+
+        Args:
+            submissions: Submissions to enrich
+            concept_metadata: Output of _batch_fetch_concept_metadata
+
+        Returns:
+            dict: Representative submission_id -> sibling submissions (only
+                concepts with more than one submission)
+        """
+        representatives: dict[Any, str] = {}
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for sub in submissions:
+            sub_id = sub.get("submission_id")
+            metadata = concept_metadata.get(sub_id, {})
+            concept_id = metadata.get("concept_id")
+            if not concept_id or self._should_copy_enrichment(metadata):
+                continue
+            if concept_id in representatives:
+                groups.setdefault(representatives[concept_id], []).append(sub)
+            else:
+                representatives[concept_id] = sub_id
+
+        if groups:
+            logger.info(
+                f"[OK] Single-flight: {sum(len(g) for g in groups.values())} submissions "
+                f"will reuse analysis of {len(groups)} representatives"
+            )
+        return groups
+
+    def _analyze_concept_group(
+        self,
+        representative: dict[str, Any],
+        concept_id: Any,
+        siblings: list[dict[str, Any]],
+        enriched: list[dict[str, Any]],
+    ) -> None:
+        """
+        Analyze a representative submission and fan its result out to siblings.
+
+        When the submission has a concept, an analysis lease on the concept is
+        taken first, so concurrent workers never pay for the same concept at
+        the same time. After a successful analysis the lease is held until the
+        run has stored results and flagged the concept as analyzed. If another
+        worker holds the lease, the whole group is deferred: run() returns it
+        under "deferred" so a later run or re-queue copies the analysis.
+
+        Args:
+            representative: Submission to analyze
+            concept_id: Its business concept ID (None if it has none)
+            siblings: Other submissions of the same concept in this batch
+            enriched: List results are appended to
+        """
+        concept_manager = None
+        if concept_id and self.config.supabase_client:
+            from core.deduplication import BusinessConceptManager
+
+            concept_manager = BusinessConceptManager(self.config.supabase_client)
+            # Only analysis from enabled services blocks the lease, matching
+            # _should_copy_enrichment
+            if not concept_manager.acquire_analysis_lease(
+                concept_id,
+                self.worker_id,
+                self.config.concept_lease_seconds,
+                require_agno=self.config.enable_monetization,
+                require_profiler=self.config.enable_profiler,
+            ):
+                self.stats["deferred"] += 1 + len(siblings)
+                self._deferred.extend([representative, *siblings])
+                logger.info(
+                    f"[OK] Concept {concept_id} is being analyzed elsewhere - "
+                    f"deferred {1 + len(siblings)} submissions"
+                )
+                return
+
+            self._held_leases.append(concept_id)
+
+        result = self._analyze_fresh(representative, enriched)
+        if not result and concept_manager is not None:
+            # Let another worker try
+            concept_manager.release_analysis_lease(concept_id, self.worker_id)
+            self._held_leases.remove(concept_id)
+
+        for sibling in siblings:
+            if result:
+                enriched.append(self._fan_out_enrichment(representative, result, sibling))
+                self.stats["copied"] += 1
+            else:
+                # Representative failed - analyze siblings individually
+                self._analyze_fresh(sibling, enriched)
+
+    def _release_concept_leases(self) -> None:
+        """Release the analysis leases taken during this run."""
+        if not self._held_leases:
+            return
+        from core.deduplication import BusinessConceptManager
+
+        concept_manager = BusinessConceptManager(self.config.supabase_client)
+        for concept_id in self._held_leases:
+            concept_manager.release_analysis_lease(concept_id, self.worker_id)
+        logger.debug(f"Released {len(self._held_leases)} concept analysis leases")
+        self._held_leases = []
+
+    @staticmethod
+    def _fan_out_enrichment(
+        representative: dict[str, Any],
+        result: dict[str, Any],
+        sibling: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Copy a representative's enrichment onto a sibling submission.
+
+        IDs the services derive from the analyzed submission (submission_id,
+        opportunity_id as set by ProfilerService) are rewritten for the sibling.
+
+        Args:
+            representative: Submission that was analyzed
+            result: Its enriched result
+            sibling: Submission of the same concept
+
+        Returns:
+            Sibling submission with the representative's enrichment fields
+        """
+        enrichment = {
+            key: value
+            for key, value in result.items()
+            if key not in representative or representative[key] != value
+        }
+        sibling_id = sibling.get("submission_id", sibling.get("id", "unknown"))
+        for key, value in (("submission_id", sibling_id), ("opportunity_id", f"opp_{sibling_id}")):
+            if key in enrichment:
+                enrichment[key] = value
+
+        representative_id = representative.get("submission_id", representative.get("id", "unknown"))
+        return {
+            **sibling,
+            **enrichment,
+            # Tracking metadata, as for analyses copied from the database
+            "copied_from_primary": True,
+            "primary_opportunity_id": f"opp_{representative_id}",
+            "copy_timestamp": datetime.now().isoformat(),
+        }
+
+    def _batch_copy_existing_analyses(
+        self,
+        submissions: list[dict[str, Any]],
+        concept_metadata: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, dict[str, Any]]] | None:
+        """
+        Copy existing Agno/Profiler analyses for every deduplicated submission at once.
+
+        Fetches the latest primary analysis for all concept IDs in the batch with
+        one query per service and fans it out to the target submissions in memory.
+        When the metadata carries primary analysis IDs, those rows are read by ID.
+
+        Args:
+            submissions: Submissions to enrich
+            concept_metadata: Output of _batch_fetch_concept_metadata
+
+        Returns:
+            Service name ("monetization", "profiler") -> submission ID -> copied
+            data, or None if nothing was batch-copied
+        """
+        copy_services = []
+        if self.config.enable_monetization and "monetization" in self.services:
+            copy_services.append("monetization")
+        if self.config.enable_profiler and "profiler" in self.services:
+            copy_services.append("profiler")
+        if not concept_metadata or not copy_services:
+            return None
+
+        targets = []
+        primary_ids: dict[str, dict[Any, Any]] = {"agno": {}, "profiler": {}}
+        for sub in submissions:
+            metadata = concept_metadata.get(sub.get("submission_id"), {})
+            if self._should_copy_enrichment(metadata):
+                concept_id = metadata["concept_id"]
+                targets.append((sub, concept_id))
+                for service in primary_ids:
+                    analysis_id = metadata.get(f"primary_{service}_analysis_id")
+                    if analysis_id:
+                        primary_ids[service][concept_id] = analysis_id
+        if not targets:
+            return None
+
+        copied: dict[str, dict[str, dict[str, Any]]] = {}
+        # Agno first, as in _copy_existing_enrichment
+        if "monetization" in copy_services:
+            try:
+                from core.deduplication import AgnoSkipLogic
+
+                copied["monetization"] = AgnoSkipLogic(
+                    self.config.supabase_client
+                ).copy_agno_analyses_batch(
+                    targets,
+                    supabase=self.config.supabase_client,
+                    primary_ids=primary_ids["agno"],
+                )
+            except Exception as e:
+                logger.error(f"[ERROR] Batch Agno copy failed: {e}")
+
+        if "profiler" in copy_services:
+            try:
+                from core.deduplication import ProfilerSkipLogic
+
+                copied["profiler"] = ProfilerSkipLogic(
+                    self.config.supabase_client
+                ).copy_profiler_analyses_batch(
+                    targets,
+                    supabase=self.config.supabase_client,
+                    primary_ids=primary_ids["profiler"],
+                )
+            except Exception as e:
+                logger.error(f"[ERROR] Batch profiler copy failed: {e}")
+
+        if copied:
+            logger.info(
+                "[OK] Batch-copied analyses: "
+                + ", ".join(f"{name} {len(data)}" for name, data in copied.items())
+            )
+        return copied or None
+
     def _copy_existing_enrichment(
-        self, submission: dict[str, Any], concept_id: str
+        self,
+        submission: dict[str, Any],
+        concept_id: str,
+        copied_analyses: dict[str, dict[str, dict[str, Any]]] | None = None,
     ) -> dict[str, Any] | None:
         """
         Copy existing enrichment with evidence flow preservation.
@@ -517,27 +892,34 @@ class OpportunityPipeline:
         Args:
             submission: Submission data
             concept_id: Business concept ID with existing analysis
+            copied_analyses: Output of _batch_copy_existing_analyses; services
+                present there are not copied again per submission
 
         Returns:
             Enriched submission with copied data, or None if copy fails
         """
         result = {**submission}  # Start with original
         copy_success = False
+        copied_analyses = copied_analyses or {}
+        sub_id = submission.get("submission_id")
 
         # STEP 1: Copy Agno analysis FIRST (generates evidence)
         agno_evidence = None
         if self.config.enable_monetization and "monetization" in self.services:
             try:
-                from core.deduplication import AgnoSkipLogic
+                if "monetization" in copied_analyses:
+                    agno_data = copied_analyses["monetization"].get(sub_id)
+                else:
+                    from core.deduplication import AgnoSkipLogic
 
-                skip_logic = AgnoSkipLogic(self.config.supabase_client)
+                    skip_logic = AgnoSkipLogic(self.config.supabase_client)
 
-                # Copy Agno analysis using unified API signature
-                agno_data = skip_logic.copy_agno_analysis(
-                    submission=submission,
-                    concept_id=concept_id,
-                    supabase=self.config.supabase_client,
-                )
+                    # Copy Agno analysis using unified API signature
+                    agno_data = skip_logic.copy_agno_analysis(
+                        submission=submission,
+                        concept_id=concept_id,
+                        supabase=self.config.supabase_client,
+                    )
 
                 if agno_data:
                     result.update(agno_data)
@@ -577,16 +959,19 @@ class OpportunityPipeline:
         # STEP 2: Copy Profiler analysis SECOND (uses evidence if available)
         if self.config.enable_profiler and "profiler" in self.services:
             try:
-                from core.deduplication import ProfilerSkipLogic
+                if "profiler" in copied_analyses:
+                    profiler_data = copied_analyses["profiler"].get(sub_id)
+                else:
+                    from core.deduplication import ProfilerSkipLogic
 
-                skip_logic = ProfilerSkipLogic(self.config.supabase_client)
+                    skip_logic = ProfilerSkipLogic(self.config.supabase_client)
 
-                # Copy profiler analysis using monolith API signature
-                profiler_data = skip_logic.copy_profiler_analysis(
-                    submission=submission,
-                    concept_id=concept_id,
-                    supabase=self.config.supabase_client,
-                )
+                    # Copy profiler analysis using monolith API signature
+                    profiler_data = skip_logic.copy_profiler_analysis(
+                        submission=submission,
+                        concept_id=concept_id,
+                        supabase=self.config.supabase_client,
+                    )
 
                 if profiler_data:
                     result.update(profiler_data)
@@ -772,33 +1157,9 @@ class OpportunityPipeline:
             bool: True if storage succeeded, False otherwise
         """
         try:
-            # Determine storage strategy based on enabled services
-            has_opportunity = self.config.enable_opportunity_scoring
-            has_profile = self.config.enable_profiler or self.config.enable_trust
-
-            if has_opportunity and has_profile:
-                # Use HybridStore for both opportunity and profile data
-                # PHASE 2: Pass supabase_client for trust data preservation
-                store = HybridStore(supabase_client=self.config.supabase_client)
-                logger.info("Using HybridStore for combined data")
-            elif has_opportunity:
-                # Use OpportunityStore for opportunity data only
-                store = OpportunityStore()
-                logger.info("Using OpportunityStore for opportunity data")
-            else:
-                # Use ProfileStore for profile data only
-                store = ProfileStore()
-                logger.info("Using ProfileStore for profile data")
-
+            store = self._create_store()
             success = store.store(results)
-
-            # Log storage statistics
-            storage_stats = store.get_statistics()
-            logger.info(
-                f"[OK] Storage stats - Loaded: {storage_stats['loaded']}, "
-                f"Failed: {storage_stats['failed']}, "
-                f"Skipped: {storage_stats.get('skipped', 0)}"
-            )
+            self._log_storage_statistics(store)
             return success
 
         except Exception as e:
@@ -806,6 +1167,113 @@ class OpportunityPipeline:
             logger.error(f"[ERROR] Storage error: {e}", exc_info=True)
             return False
 
+    def _create_store(self) -> Any:
+        """
+        Create the storage service matching the enabled enrichment types.
+
+        Returns:
+            HybridStore, OpportunityStore, or ProfileStore instance
+        """
+        has_opportunity = self.config.enable_opportunity_scoring
+        has_profile = self.config.enable_profiler or self.config.enable_trust
+        # None lets each store build its default (Postgres) loader
+        loader = (
+            DLTLoader(connection_string=self.config.storage_dsn)
+            if self.config.storage_dsn
+            else None
+        )
+
+        if has_opportunity and has_profile:
+            # Use HybridStore for both opportunity and profile data
+            # PHASE 2: Pass supabase_client for trust data preservation
+            logger.info("Using HybridStore for combined data")
+            patch_services = None
+            if self.config.storage_write_mode == "patch":
+                enabled = {
+                    "profiler": self.config.enable_profiler,
+                    "opportunity": self.config.enable_opportunity_scoring,
+                    "monetization": self.config.enable_monetization,
+                    "trust": self.config.enable_trust,
+                    "market_validation": self.config.enable_market_validation,
+                }
+                patch_services = [service for service, on in enabled.items() if on]
+            return HybridStore(
+                loader=loader,
+                supabase_client=self.config.supabase_client,
+                patch_services=patch_services,
+            )
+        elif has_opportunity:
+            # Use OpportunityStore for opportunity data only
+            logger.info("Using OpportunityStore for opportunity data")
+            return OpportunityStore(loader=loader, supabase_client=self.config.supabase_client)
+        else:
+            # Use ProfileStore for profile data only
+            logger.info("Using ProfileStore for profile data")
+            return ProfileStore(loader=loader)
+
+    def _log_storage_statistics(self, store: Any) -> None:
+        """Log a storage service's loaded/failed/skipped counts."""
+        storage_stats = store.get_statistics()
+        logger.info(
+            f"[OK] Storage stats - Loaded: {storage_stats['loaded']}, "
+            f"Failed: {storage_stats['failed']}, "
+            f"Skipped: {storage_stats.get('skipped', 0)}"
+        )
+
+    def _open_storage_sink(self) -> BufferedSink:
+        """
+        Start a write-behind sink that stores results on a background thread.
+
+        Batches of storage_batch_size results (or whatever arrived within
+        storage_flush_interval seconds) are passed to one storage service
+        instance. Results from batches that stored successfully are kept for
+        concept metadata updates.
+
+        Returns:
+            BufferedSink writing to the configured storage service
+        """
+        store = self._storage_store = self._create_store()
+        self._stored_results = []
+
+        def write(batch: list[dict[str, Any]]) -> bool:
+            success = store.store(batch)
+            if success:
+                self._stored_results.extend(batch)
+            return success
+
+        return BufferedSink(
+            write,
+            batch_size=self.config.storage_batch_size,
+            flush_interval=self.config.storage_flush_interval,
+            max_pending_batches=self.config.storage_max_pending_batches,
+            name="pipeline_storage",
+        )
+
+    def _close_storage_sink(self) -> list[dict[str, Any]]:
+        """
+        Flush and stop the write-behind sink.
+
+        Returns:
+            list: Results from batches that were stored successfully
+        """
+        sink, self._storage_sink = self._storage_sink, None
+        if sink is None:
+            return []
+
+        sink_stats = sink.close()
+        if sink_stats.batches_failed:
+            logger.error(
+                f"[ERROR] Write-behind storage failed for {sink_stats.rows_failed} results "
+                f"in {sink_stats.batches_failed} batches"
+            )
+        logger.info(
+            f"[OK] Write-behind storage: {sink_stats.batches_flushed} batches, "
+            f"{sink_stats.flush_seconds:.2f}s writing, "
+            f"{sink_stats.blocked_seconds:.2f}s waiting on the writer"
+        )
+        self._log_storage_statistics(self._storage_store)
+        return self._stored_results
+
     def _generate_summary(self) -> dict[str, Any]:
         """
         Generate pipeline summary statistics.
@@ -838,6 +1306,7 @@ class OpportunityPipeline:
             "total_processed": total_processed,  # NEW: Total (analyzed + copied)
             "total_stored": total_stored,
             "total_skipped": self.stats["skipped"],
+            "total_deferred": self.stats.get("deferred", 0),
             "total_errors": total_errors,
             "success_rate": round(success_rate, 2),
             "dedup_rate": round(dedup_rate, 2),  # NEW: Deduplication percentage
@@ -889,6 +1358,7 @@ class OpportunityPipeline:
             "stored": 0,
             "errors": 0,
             "skipped": 0,
+            "deferred": 0,
         }
 
         for service in self.services.values():
@@ -7,7 +7,9 @@ to enable code reuse and consistent filtering across the pipeline.
 
 from typing import Any
 
+from .batch_scorer import evaluate_submissions_batch
 from .quality_scorer import calculate_pre_ai_quality_score
+from .relevance_gate import RelevanceGate, apply_relevance_gate
 from .thresholds import (
     DEFAULT_QUALITY_THRESHOLD,
     MIN_COMMENT_COUNT,
@@ -106,17 +108,22 @@ def filter_submissions_batch(
     submissions: list[dict[str, Any]],
     quality_threshold: float = DEFAULT_QUALITY_THRESHOLD,
     enable_filtering: bool = True,
+    relevance_gate: RelevanceGate | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Filter a batch of submissions for AI analysis.
 
-    Applies should_analyze_with_ai() to a list of submissions and separates
-    them into passed and filtered lists, adding quality metadata to each.
+    Applies the should_analyze_with_ai() criteria to a list of submissions
+    (scored column-wise by evaluate_submissions_batch()) and separates them
+    into passed and filtered lists, adding quality metadata to each. With a
+    relevance_gate, posts that pass the heuristic are then checked by the
+    learned gate (see relevance_gate.py).
 
     Args:
         submissions: List of Reddit post dictionaries
         quality_threshold: Minimum quality score required
         enable_filtering: If False, all submissions pass
+        relevance_gate: Optional trained RelevanceGate applied after the heuristic
 
     Returns:
         tuple: (passed_submissions, filtered_submissions)
@@ -136,11 +143,13 @@ def filter_submissions_batch(
     passed = []
     filtered = []
 
-    for submission in submissions:
-        should_analyze, score, reason = should_analyze_with_ai(
-            submission, quality_threshold, enable_filtering
-        )
+    decisions, scores, reasons = evaluate_submissions_batch(
+        submissions, quality_threshold, enable_filtering
+    )
 
+    for submission, should_analyze, score, reason in zip(
+        submissions, decisions.tolist(), scores, reasons, strict=True
+    ):
         # Add quality metadata to submission
         submission_with_meta = {
             **submission,
@@ -153,6 +162,10 @@ def filter_submissions_batch(
         else:
             filtered.append(submission_with_meta)
 
+    if relevance_gate is not None and enable_filtering and passed:
+        passed, gated = apply_relevance_gate(passed, relevance_gate)
+        filtered.extend(gated)
+
     return passed, filtered
 
 
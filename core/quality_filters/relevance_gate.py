@@ -0,0 +1,565 @@
+"""Learned pre-AI relevance gate.
+
+should_analyze_with_ai() is a hand-tuned keyword and engagement heuristic.
+Many posts that pass it still come back from the LLM profiler with a low
+final_score, so the call was wasted. Profiler and Agno outcomes are already
+stored in app_opportunities / llm_monetization_analysis. This module trains
+a CPU-cheap classifier on those outcomes. It predicts whether a post will
+score at or above a threshold, and the pipeline drops posts that are
+unlikely to.
+
+The model is logistic regression over hashed word unigrams and bigrams,
+the subreddit, and a few engagement features. It is implemented in NumPy
+(no scikit-learn dependency) and trains in seconds on tens of thousands of
+exported rows. The decision threshold is set on a held-out validation split
+so that a target share of the posts that did score well still pass the gate
+(recall), and is then evaluated on a separate held-out test split. Keeping
+recall high is what makes dropping the rest cheap.
+
+Usage:
+    from core.quality_filters.relevance_gate import RelevanceGate
+
+    gate = RelevanceGate.train(posts, labels)          # offline
+    gate.save("models/relevance_gate.npz")
+
+    gate = RelevanceGate.load("models/relevance_gate.npz")
+    passed, filtered = filter_submissions_batch(posts, relevance_gate=gate)
+
+See scripts/analysis/train_relevance_gate.py for training from exported rows.
+"""
+
+import json
+import logging
+import math
+import re
+import zlib
+from dataclasses import dataclass
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .thresholds import PROBLEM_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+# Hashed n-gram feature space (weights are float64, so 2 MB at 2**18)
+DEFAULT_N_FEATURES = 2**18
+
+# A post is relevant if its enrichment scored at least this much
+# (matches PipelineConfig.ai_profile_threshold)
+DEFAULT_SCORE_THRESHOLD = 40.0
+
+# Share of relevant held-out posts the gate must let through
+DEFAULT_TARGET_RECALL = 0.95
+
+# Number of dense engagement features appended after the hashed features
+N_DENSE_FEATURES = 4
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+def _post_text(post: dict[str, Any]) -> str:
+    """Title and body of a post, as scored by the pre-AI filters."""
+    body = post.get("text") or post.get("content") or post.get("selftext") or ""
+    return f"{post.get('title') or ''} {body}"
+
+
+def _number(value: Any) -> float:
+    """Coerce an exported numeric field (possibly None or a string) to float."""
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def extract_features(
+    post: dict[str, Any], n_features: int = DEFAULT_N_FEATURES
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert one post to sparse feature indices and values.
+
+    Hashed features are word unigrams, word bigrams and the subreddit, each
+    counted once and scaled to unit L2 norm. Hashing uses CRC32, which is
+    stable across processes (unlike hash()), so a saved model scores the
+    same way everywhere. Dense features follow at indices n_features and up.
+
+    Args:
+        post: Reddit post dictionary
+        n_features: Size of the hashed feature space
+
+    Returns:
+        tuple: (indices, values) as int64 and float64 arrays
+    """
+    text = _post_text(post).lower()
+    tokens = _TOKEN_PATTERN.findall(text)
+    grams = set(tokens)
+    grams.update(f"{a} {b}" for a, b in pairwise(tokens))
+    subreddit = post.get("subreddit")
+    if subreddit:
+        grams.add(f"r/{str(subreddit).lower()}")
+
+    hashed = {zlib.crc32(gram.encode("utf-8")) % n_features for gram in grams}
+    indices = np.fromiter(sorted(hashed), dtype=np.int64, count=len(hashed))
+    values = np.full(len(hashed), 1.0 / math.sqrt(len(hashed)) if hashed else 0.0)
+
+    upvotes = _number(post.get("upvotes") or post.get("score") or post.get("reddit_score"))
+    comments = _number(post.get("comments_count") or post.get("num_comments"))
+    keyword_count = sum(kw in text for kw in PROBLEM_KEYWORDS)
+    dense = np.array(
+        [
+            math.log1p(upvotes) / 5,
+            math.log1p(comments) / 5,
+            math.log1p(len(text)) / 8,
+            min(keyword_count, 5) / 5,
+        ]
+    )
+
+    return (
+        np.concatenate([indices, np.arange(n_features, n_features + N_DENSE_FEATURES)]),
+        np.concatenate([values, dense]),
+    )
+
+
+def featurize_batch(
+    posts: list[dict[str, Any]], n_features: int = DEFAULT_N_FEATURES
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Featurize posts into flat coordinate arrays.
+
+    Args:
+        posts: Reddit post dictionaries
+        n_features: Size of the hashed feature space
+
+    Returns:
+        tuple: (rows, indices, values), one entry per non-zero feature
+    """
+    rows, indices, values = [], [], []
+    for row, post in enumerate(posts):
+        post_indices, post_values = extract_features(post, n_features)
+        rows.append(np.full(len(post_indices), row, dtype=np.int64))
+        indices.append(post_indices)
+        values.append(post_values)
+
+    if not posts:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0)
+
+    return np.concatenate(rows), np.concatenate(indices), np.concatenate(values)
+
+
+def labels_from_scores(
+    rows: list[dict[str, Any]],
+    score_column: str = "final_score",
+    score_threshold: float = DEFAULT_SCORE_THRESHOLD,
+) -> np.ndarray:
+    """
+    Label exported enrichment rows as relevant (score >= threshold).
+
+    Args:
+        rows: Exported rows with a score column
+        score_column: Column holding the enrichment outcome
+        score_threshold: Minimum score counted as relevant
+
+    Returns:
+        np.ndarray: Boolean labels, one per row
+    """
+    return np.array([_number(row.get(score_column)) >= score_threshold for row in rows], dtype=bool)
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -35, 35)))
+
+
+def roc_auc(labels: np.ndarray, probabilities: np.ndarray) -> float:
+    """
+    Area under the ROC curve (Mann-Whitney U, ties counted as half).
+
+    Args:
+        labels: Boolean labels
+        probabilities: Predicted probabilities
+
+    Returns:
+        float: AUC, or 0.5 if only one class is present
+    """
+    positives = int(labels.sum())
+    negatives = len(labels) - positives
+    if positives == 0 or negatives == 0:
+        return 0.5
+
+    order = np.argsort(probabilities, kind="mergesort")
+    sorted_probs = probabilities[order]
+    ranks = np.empty(len(labels))
+    # Average ranks across ties
+    _, first, counts = np.unique(sorted_probs, return_index=True, return_counts=True)
+    ranks[order] = np.repeat(first + (counts + 1) / 2, counts)
+    return float((ranks[labels].sum() - positives * (positives + 1) / 2) / (positives * negatives))
+
+
+def choose_decision_threshold(
+    labels: np.ndarray, probabilities: np.ndarray, target_recall: float = DEFAULT_TARGET_RECALL
+) -> float:
+    """
+    Highest probability cut-off that keeps recall at or above target_recall.
+
+    Args:
+        labels: Boolean labels of held-out posts
+        probabilities: Predicted probabilities for the same posts
+        target_recall: Share of relevant posts that must pass
+
+    Returns:
+        float: Decision threshold (0.0 if there are no relevant posts)
+    """
+    positive_probs = np.sort(probabilities[labels])
+    if positive_probs.size == 0:
+        return 0.0
+    # Posts at or above the cut-off pass, so allow this many positives below it
+    allowed_misses = math.floor(positive_probs.size * (1 - target_recall) + 1e-9)
+    return float(positive_probs[allowed_misses])
+
+
+@dataclass
+class GateEvaluation:
+    """Held-out quality of a relevance gate."""
+
+    posts: int = 0
+    relevant: int = 0
+    passed: int = 0
+    relevant_passed: int = 0
+    auc: float = 0.5
+    decision_threshold: float = 0.0
+
+    @property
+    def recall(self) -> float:
+        return self.relevant_passed / self.relevant if self.relevant else 1.0
+
+    @property
+    def precision(self) -> float:
+        return self.relevant_passed / self.passed if self.passed else 0.0
+
+    @property
+    def skip_rate(self) -> float:
+        return 1 - self.passed / self.posts if self.posts else 0.0
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get evaluation summary."""
+        return {
+            "posts": self.posts,
+            "relevant": self.relevant,
+            "passed": self.passed,
+            "auc": round(self.auc, 4),
+            "decision_threshold": round(self.decision_threshold, 4),
+            "recall": round(self.recall, 4),
+            "precision": round(self.precision, 4),
+            # Share of LLM calls the gate avoids
+            "skip_rate": round(self.skip_rate, 4),
+            # Calls on posts that would have scored low, without / with the gate
+            "wasted_calls_before": self.posts - self.relevant,
+            "wasted_calls_after": self.passed - self.relevant_passed,
+        }
+
+
+class RelevanceGate:
+    """
+    Hashed n-gram logistic regression that predicts enrichment relevance.
+
+    Attributes:
+        weights: Weight vector (n_features hashed + N_DENSE_FEATURES dense)
+        bias: Intercept
+        n_features: Size of the hashed feature space
+        decision_threshold: Probability at or above which a post passes
+        metadata: Training details (label definition, evaluation summary)
+
+    Examples:
+        >>> gate = RelevanceGate.train(posts, labels, target_recall=0.95)
+        >>> gate.predict_proba(new_posts)
+        array([0.91, 0.07, ...])
+        >>> gate.should_analyze(new_posts)
+        array([ True, False, ...])
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: float = 0.0,
+        n_features: int = DEFAULT_N_FEATURES,
+        decision_threshold: float = 0.5,
+        metadata: dict[str, Any] | None = None,
+    ):
+        """
+        Initialize a gate from trained parameters.
+
+        Args:
+            weights: Weight vector of length n_features + N_DENSE_FEATURES
+            bias: Intercept
+            n_features: Size of the hashed feature space
+            decision_threshold: Probability at or above which a post passes
+            metadata: Training details to persist with the model
+
+        Raises:
+            ValueError: If the weight vector does not match n_features
+        """
+        if len(weights) != n_features + N_DENSE_FEATURES:
+            raise ValueError(
+                f"Expected {n_features + N_DENSE_FEATURES} weights, got {len(weights)}"
+            )
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.n_features = n_features
+        self.decision_threshold = decision_threshold
+        self.metadata = metadata or {}
+
+    @classmethod
+    def train(
+        cls,
+        posts: list[dict[str, Any]],
+        labels: np.ndarray,
+        n_features: int = DEFAULT_N_FEATURES,
+        target_recall: float = DEFAULT_TARGET_RECALL,
+        validation_fraction: float = 0.2,
+        test_fraction: float = 0.2,
+        epochs: int = 300,
+        learning_rate: float = 0.1,
+        l2: float = 1e-4,
+        seed: int = 42,
+    ) -> "RelevanceGate":
+        """
+        Train a gate and calibrate its decision threshold.
+
+        The model is fit with full-batch Adam on a class-balanced log loss.
+        A held-out validation split sets the decision threshold for
+        target_recall. A separate held-out test split, not used for fitting
+        or calibration, provides the evaluation stored in
+        metadata["evaluation"].
+
+        Args:
+            posts: Post dictionaries (title, text/content, score, num_comments, subreddit)
+            labels: Boolean labels, True if enrichment scored at or above threshold
+            n_features: Size of the hashed feature space
+            target_recall: Share of relevant held-out posts that must pass
+            validation_fraction: Share of rows held out for calibration
+            test_fraction: Share of rows held out for evaluation
+            epochs: Full-batch optimization steps
+            learning_rate: Adam step size
+            l2: L2 penalty on the weights
+            seed: Shuffle seed for the train/validation/test split
+
+        Returns:
+            RelevanceGate
+
+        Raises:
+            ValueError: If posts and labels differ in length, a class is missing,
+                or the validation or test split has no relevant posts
+        """
+        labels = np.asarray(labels, dtype=bool)
+        if len(posts) != len(labels):
+            raise ValueError(f"Got {len(posts)} posts but {len(labels)} labels")
+        if labels.all() or not labels.any():
+            raise ValueError("Training needs both relevant and non-relevant posts")
+
+        order = np.random.default_rng(seed).permutation(len(posts))
+        n_validation = int(len(posts) * validation_fraction)
+        n_test = int(len(posts) * test_fraction)
+        validation_idx = order[:n_validation]
+        test_idx = order[n_validation:n_validation + n_test]
+        train_idx = order[n_validation + n_test:]
+        # Calibrating or evaluating on training rows would overstate recall
+        for split, split_idx in (("validation", validation_idx), ("test", test_idx)):
+            if not labels[split_idx].any():
+                raise ValueError(
+                    f"The {split} split has no relevant posts; export more labeled rows "
+                    f"or raise {split}_fraction"
+                )
+
+        train_posts = [posts[i] for i in train_idx]
+        weights, bias = _fit_logistic_regression(
+            featurize_batch(train_posts, n_features),
+            labels[train_idx],
+            n_features + N_DENSE_FEATURES,
+            epochs=epochs,
+            learning_rate=learning_rate,
+            l2=l2,
+        )
+        gate = cls(weights, bias, n_features=n_features)
+
+        probabilities = gate.predict_proba([posts[i] for i in validation_idx])
+        gate.decision_threshold = choose_decision_threshold(
+            labels[validation_idx], probabilities, target_recall
+        )
+
+        evaluation = gate.evaluate([posts[i] for i in test_idx], labels[test_idx])
+        gate.metadata = {
+            "train_rows": len(train_idx),
+            "validation_rows": n_validation,
+            "test_rows": n_test,
+            "target_recall": target_recall,
+            "evaluation": evaluation.get_summary(),
+        }
+        logger.info(f"Trained relevance gate: {evaluation.get_summary()}")
+        return gate
+
+    def predict_proba(self, posts: list[dict[str, Any]]) -> np.ndarray:
+        """
+        Predict the probability that each post's enrichment scores well.
+
+        Args:
+            posts: Post dictionaries
+
+        Returns:
+            np.ndarray: Probabilities, one per post
+        """
+        rows, indices, values = featurize_batch(posts, self.n_features)
+        logits = np.bincount(rows, weights=self.weights[indices] * values, minlength=len(posts))
+        return _sigmoid(logits + self.bias)
+
+    def should_analyze(self, posts: list[dict[str, Any]]) -> np.ndarray:
+        """
+        Decide which posts are worth an LLM call.
+
+        Args:
+            posts: Post dictionaries
+
+        Returns:
+            np.ndarray: Boolean array, True for posts that pass the gate
+        """
+        return self.predict_proba(posts) >= self.decision_threshold
+
+    def evaluate(self, posts: list[dict[str, Any]], labels: np.ndarray) -> GateEvaluation:
+        """
+        Evaluate the gate on labeled posts.
+
+        Args:
+            posts: Post dictionaries
+            labels: Boolean labels
+
+        Returns:
+            GateEvaluation
+        """
+        labels = np.asarray(labels, dtype=bool)
+        probabilities = self.predict_proba(posts)
+        passed = probabilities >= self.decision_threshold
+        return GateEvaluation(
+            posts=len(posts),
+            relevant=int(labels.sum()),
+            passed=int(passed.sum()),
+            relevant_passed=int((passed & labels).sum()),
+            auc=roc_auc(labels, probabilities),
+            decision_threshold=self.decision_threshold,
+        )
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save the gate as a compressed .npz file.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        config = {
+            "bias": self.bias,
+            "n_features": self.n_features,
+            "decision_threshold": self.decision_threshold,
+            "metadata": self.metadata,
+        }
+        with path.open("wb") as f:
+            np.savez_compressed(f, weights=self.weights, config=np.array(json.dumps(config)))
+        logger.info(f"Saved relevance gate to {path}")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RelevanceGate":
+        """
+        Load a gate saved with save().
+
+        Args:
+            path: .npz file written by save()
+
+        Returns:
+            RelevanceGate
+        """
+        with np.load(path, allow_pickle=False) as data:
+            config = json.loads(str(data["config"]))
+            weights = data["weights"]
+        return cls(
+            weights,
+            bias=config["bias"],
+            n_features=config["n_features"],
+            decision_threshold=config["decision_threshold"],
+            metadata=config.get("metadata"),
+        )
+
+
+def _fit_logistic_regression(
+    features: tuple[np.ndarray, np.ndarray, np.ndarray],
+    labels: np.ndarray,
+    dimension: int,
+    epochs: int,
+    learning_rate: float,
+    l2: float,
+) -> tuple[np.ndarray, float]:
+    """Full-batch Adam on class-balanced log loss over coordinate features."""
+    rows, indices, values = features
+    n_rows = len(labels)
+    y = labels.astype(np.float64)
+
+    # Balance classes so a rare "relevant" class is not ignored
+    positive_share = y.mean()
+    sample_weight = np.where(labels, 0.5 / positive_share, 0.5 / (1 - positive_share)) / n_rows
+
+    params = np.zeros(dimension + 1)  # last entry is the bias
+    first_moment = np.zeros_like(params)
+    second_moment = np.zeros_like(params)
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+
+    for step in range(1, epochs + 1):
+        logits = np.bincount(rows, weights=params[indices] * values, minlength=n_rows) + params[-1]
+        error = (_sigmoid(logits) - y) * sample_weight
+
+        gradient = np.empty_like(params)
+        gradient[:-1] = np.bincount(indices, weights=values * error[rows], minlength=dimension)
+        gradient[:-1] += l2 * params[:-1]
+        gradient[-1] = error.sum()
+
+        first_moment = beta1 * first_moment + (1 - beta1) * gradient
+        second_moment = beta2 * second_moment + (1 - beta2) * gradient**2
+        corrected_first = first_moment / (1 - beta1**step)
+        corrected_second = second_moment / (1 - beta2**step)
+        params -= learning_rate * corrected_first / (np.sqrt(corrected_second) + eps)
+
+    return params[:-1], float(params[-1])
+
+
+def apply_relevance_gate(
+    submissions: list[dict[str, Any]], gate: RelevanceGate
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Split submissions by the gate's prediction (quality_filters stage).
+
+    Every submission gets a relevance_probability; filtered ones also get a
+    filter_reason that get_filter_stats() groups under "Predicted low relevance".
+
+    Args:
+        submissions: Post dictionaries (usually those passing the heuristic filter)
+        gate: Trained RelevanceGate
+
+    Returns:
+        tuple: (passed_submissions, filtered_submissions)
+    """
+    passed = []
+    filtered = []
+
+    probabilities = gate.predict_proba(submissions).tolist()
+    for submission, probability in zip(submissions, probabilities, strict=True):
+        submission_with_meta = {**submission, "relevance_probability": round(probability, 4)}
+
+        if probability >= gate.decision_threshold:
+            passed.append(submission_with_meta)
+        else:
+            submission_with_meta["filter_reason"] = (
+                f"Predicted low relevance ({probability:.2f} < "
+                f"{gate.decision_threshold:.2f} threshold)"
+            )
+            filtered.append(submission_with_meta)
+
+    return passed, filtered
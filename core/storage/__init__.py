@@ -8,6 +8,8 @@ Components:
 - OpportunityStore: Storage for opportunity analysis results
 - ProfileStore: Storage for AI profiles
 - HybridStore: Storage for hybrid submissions (trust pipeline)
+- BufferedSink: Background batch writer for streaming collectors
+- LocalSupabaseClient: Embedded DuckDB stand-in for the Supabase client
 
 Usage:
     from core.storage import DLTLoader
@@ -17,15 +19,21 @@ Usage:
     loader.load(data, "app_opportunities", primary_key=PK_SUBMISSION_ID)
 """
 
+from .buffered_sink import BufferedSink, SinkStatistics
 from .dlt_loader import DLTLoader, LoadStatistics
 from .opportunity_store import OpportunityStore
 from .profile_store import ProfileStore
 from .hybrid_store import HybridStore
+from .local_client import LocalAPIError, LocalSupabaseClient
 
 __all__ = [
+    "BufferedSink",
+    "SinkStatistics",
     "DLTLoader",
     "LoadStatistics",
     "OpportunityStore",
     "ProfileStore",
     "HybridStore",
+    "LocalAPIError",
+    "LocalSupabaseClient",
 ]
@@ -0,0 +1,275 @@
+"""Bounded, background-flushed row buffer for streaming collectors.
+
+Collectors used to accumulate every row of a crawl in a list and load it at
+the end. That keeps the whole crawl in RAM, loses everything if the run dies
+before the load, and serializes network collection with database writes.
+
+BufferedSink takes rows as they are produced. It hands a batch to a
+background writer thread every ``batch_size`` rows, or after
+``flush_interval`` seconds for a partially filled buffer. At most
+``max_pending_batches`` batches wait for the writer. When the writer falls
+behind, ``add()`` blocks, which bounds memory and slows the collector to the
+database's pace.
+
+Usage:
+    from core.storage.buffered_sink import BufferedSink
+
+    with BufferedSink(lambda rows: loader.load(rows, "submissions"), batch_size=500) as sink:
+        for row in crawl():
+            sink.add(row)
+    print(sink.stats.get_summary())
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rows per flushed batch
+DEFAULT_BATCH_SIZE = 500
+
+# Seconds a partially filled buffer may wait before it is flushed
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# Batches allowed to wait for the writer before add() blocks
+DEFAULT_MAX_PENDING_BATCHES = 4
+
+_STOP = object()
+
+
+@dataclass
+class SinkStatistics:
+    """Statistics for a buffered sink."""
+
+    rows_added: int = 0
+    rows_flushed: int = 0
+    rows_failed: int = 0
+    batches_flushed: int = 0
+    batches_failed: int = 0
+    flush_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get statistics summary."""
+        return {
+            "rows_added": self.rows_added,
+            "rows_flushed": self.rows_flushed,
+            "rows_failed": self.rows_failed,
+            "batches_flushed": self.batches_flushed,
+            "batches_failed": self.batches_failed,
+            "flush_seconds": round(self.flush_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "error_count": len(self.errors),
+        }
+
+
+class BufferedSink:
+    """
+    Buffer rows and write them in batches on a background thread.
+
+    ``flush_fn`` receives each batch as a new list. It reports failure by
+    returning False or raising; any other return value counts as success.
+    A failed batch is counted and logged, and it does not stop the sink.
+
+    Attributes:
+        flush_fn: Callable that writes one batch
+        batch_size: Rows per batch
+        flush_interval: Maximum seconds a partial batch waits
+        name: Label used in log messages and the thread name
+        stats: SinkStatistics for this sink
+
+    Examples:
+        >>> sink = BufferedSink(write_rows, batch_size=100, flush_interval=2.0)
+        >>> sink.extend(rows)
+        >>> sink.flush()      # barrier: everything added so far is written
+        >>> sink.close()
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[list[dict[str, Any]]], Any],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending_batches: int = DEFAULT_MAX_PENDING_BATCHES,
+        name: str = "sink",
+    ):
+        """
+        Initialize the sink and start its writer thread.
+
+        Args:
+            flush_fn: Callable that writes one batch of rows
+            batch_size: Rows per batch (must be positive)
+            flush_interval: Seconds before a partial batch is flushed
+            max_pending_batches: Batches queued for the writer before add() blocks
+            name: Label used in log messages
+
+        Raises:
+            ValueError: If batch_size or max_pending_batches is not positive
+        """
+        if batch_size <= 0 or max_pending_batches <= 0:
+            raise ValueError("batch_size and max_pending_batches must be positive")
+
+        self.flush_fn = flush_fn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.name = name
+        self.stats = SinkStatistics()
+
+        self._buffer: list[dict[str, Any]] = []
+        self._buffer_started: float | None = None
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending_batches)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"buffered-{name}", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "BufferedSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def add(self, row: dict[str, Any]) -> None:
+        """
+        Add one row, handing a full batch to the writer.
+
+        Blocks while ``max_pending_batches`` batches are waiting.
+
+        Args:
+            row: Row to write
+
+        Raises:
+            RuntimeError: If the sink is closed
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"BufferedSink '{self.name}' is closed")
+            if not self._buffer:
+                self._buffer_started = time.monotonic()
+            self._buffer.append(row)
+            self.stats.rows_added += 1
+            batch = self._take_buffer() if len(self._buffer) >= self.batch_size else None
+
+        if batch:
+            self._enqueue(batch)
+
+    def extend(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Add several rows (see add())."""
+        for row in rows:
+            self.add(row)
+
+    def flush(self) -> None:
+        """
+        Barrier: write the buffered rows and wait for all pending batches.
+        """
+        with self._lock:
+            batch = self._take_buffer()
+        if batch:
+            self._enqueue(batch)
+        self._queue.join()
+
+    def close(self) -> SinkStatistics:
+        """
+        Flush remaining rows and stop the writer thread.
+
+        Safe to call more than once.
+
+        Returns:
+            SinkStatistics for the sink's lifetime
+        """
+        with self._lock:
+            if self._closed:
+                return self.stats
+            self._closed = True
+            batch = self._take_buffer()
+
+        if batch:
+            self._enqueue(batch)
+        self._queue.put(_STOP)
+        self._thread.join()
+
+        logger.info(f"BufferedSink '{self.name}' closed: {self.stats.get_summary()}")
+        return self.stats
+
+    @property
+    def buffered_rows(self) -> int:
+        """Number of rows not yet handed to the writer."""
+        with self._lock:
+            return len(self._buffer)
+
+    def _take_buffer(self) -> list[dict[str, Any]]:
+        """Swap out the buffer. Caller must hold the lock."""
+        batch, self._buffer = self._buffer, []
+        self._buffer_started = None
+        return batch
+
+    def _enqueue(self, batch: list[dict[str, Any]]) -> None:
+        start = time.monotonic()
+        self._queue.put(batch)
+        self.stats.blocked_seconds += time.monotonic() - start
+
+    def _seconds_until_due(self) -> float:
+        with self._lock:
+            if self._buffer_started is None:
+                return self.flush_interval
+            elapsed = time.monotonic() - self._buffer_started
+        return max(self.flush_interval - elapsed, 0.0)
+
+    def _flush_if_due(self) -> None:
+        """Queue a partial batch that has waited flush_interval seconds."""
+        with self._lock:
+            if (
+                self._buffer_started is None
+                or time.monotonic() - self._buffer_started < self.flush_interval
+            ):
+                return
+            batch = self._take_buffer()
+            try:
+                # Never block here: this thread is the queue's only consumer
+                self._queue.put_nowait(batch)
+            except queue.Full:
+                # Writer is busy; keep the rows and retry on the next tick
+                self._buffer = batch + self._buffer
+                self._buffer_started = time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=max(self._seconds_until_due(), 0.01))
+            except queue.Empty:
+                self._flush_if_due()
+                continue
+
+            try:
+                if item is _STOP:
+                    return
+                self._write(item)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        start = time.monotonic()
+        try:
+            ok = self.flush_fn(batch) is not False
+            error = None if ok else "flush_fn returned False"
+        except Exception as e:
+            ok = False
+            error = str(e)
+            logger.error(f"BufferedSink '{self.name}' failed to write {len(batch)} rows: {e}")
+        self.stats.flush_seconds += time.monotonic() - start
+
+        if ok:
+            self.stats.rows_flushed += len(batch)
+            self.stats.batches_flushed += 1
+        else:
+            self.stats.rows_failed += len(batch)
+            self.stats.batches_failed += 1
+            self.stats.errors.append(error)
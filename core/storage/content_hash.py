@@ -0,0 +1,158 @@
+"""Per-row content hashes for skipping unchanged rows on merge loads.
+
+Pipeline re-runs produce mostly the same rows. A dlt merge rewrites every
+row it is given, so unchanged rows still cost Postgres writes, WAL, and
+index churn. Stores stamp each row with a hash of its content, fetch the
+hashes already stored for the batch in one query, and load only the rows
+whose hash differs.
+
+Usage:
+    from core.storage.content_hash import add_content_hashes, drop_unchanged_rows
+
+    rows = add_content_hashes(rows)
+    changed, unchanged = drop_unchanged_rows(rows, client, "app_opportunities")
+    loader.load(changed, "app_opportunities", primary_key="submission_id")
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Column that stores each row's content hash
+CONTENT_HASH_COLUMN = "content_hash"
+
+# Fields left out of the hash because they change on every run
+VOLATILE_FIELDS = frozenset({"analyzed_at", "copy_timestamp", CONTENT_HASH_COLUMN})
+
+# IDs per existing-hash query, keeping the PostgREST URL short
+HASH_QUERY_CHUNK = 200
+
+
+def compute_content_hash(
+    record: dict[str, Any], exclude: frozenset[str] = VOLATILE_FIELDS
+) -> str:
+    """
+    Hash a row's content independently of key order.
+
+    Args:
+        record: Row to hash
+        exclude: Field names left out of the hash
+
+    Returns:
+        str: 32-character hex digest
+
+    Examples:
+        >>> compute_content_hash({"a": 1, "b": [2]}) == compute_content_hash({"b": [2], "a": 1})
+        True
+    """
+    content = {
+        key: value
+        for key, value in record.items()
+        if key not in exclude and not key.startswith("_dlt")
+    }
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def add_content_hashes(
+    records: list[dict[str, Any]], exclude: frozenset[str] = VOLATILE_FIELDS
+) -> list[dict[str, Any]]:
+    """
+    Set CONTENT_HASH_COLUMN on each record (in place).
+
+    Args:
+        records: Rows about to be loaded
+        exclude: Field names left out of the hash
+
+    Returns:
+        list: The same records, for chaining
+    """
+    for record in records:
+        record[CONTENT_HASH_COLUMN] = compute_content_hash(record, exclude)
+    return records
+
+
+def fetch_existing_hashes(
+    client: Any, table: str, ids: list[str], primary_key: str = "submission_id"
+) -> dict[str, str]:
+    """
+    Fetch the stored content hashes for a batch of primary keys.
+
+    Args:
+        client: Supabase client
+        table: Table to query
+        ids: Primary key values to look up
+        primary_key: Primary key column
+
+    Returns:
+        dict: Mapping of primary key -> stored hash. Rows without a hash are
+            omitted. Empty on any error, so every row is loaded.
+    """
+    existing: dict[str, str] = {}
+    unique_ids = list(dict.fromkeys(i for i in ids if i))
+
+    try:
+        for start in range(0, len(unique_ids), HASH_QUERY_CHUNK):
+            chunk = unique_ids[start : start + HASH_QUERY_CHUNK]
+            response = (
+                client.table(table)
+                .select(f"{primary_key}, {CONTENT_HASH_COLUMN}")
+                .in_(primary_key, chunk)
+                .execute()
+            )
+            for row in response.data or []:
+                if row.get(CONTENT_HASH_COLUMN):
+                    existing[row[primary_key]] = row[CONTENT_HASH_COLUMN]
+    except Exception as e:
+        logger.warning(f"Could not fetch content hashes from {table}, loading all rows: {e}")
+        return {}
+
+    return existing
+
+
+def drop_unchanged_rows(
+    records: list[dict[str, Any]],
+    client: Any,
+    table: str,
+    primary_key: str = "submission_id",
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Drop rows whose content hash matches the one already stored.
+
+    Records must already carry CONTENT_HASH_COLUMN (see add_content_hashes).
+    Without a client every row is kept.
+
+    Args:
+        records: Hashed rows about to be loaded
+        client: Supabase client, or None
+        table: Destination table
+        primary_key: Primary key column
+
+    Returns:
+        tuple: (rows to load, number of unchanged rows dropped)
+
+    Examples:
+        >>> changed, unchanged = drop_unchanged_rows(rows, client, "submissions")
+        >>> print(f"{unchanged} rows already up to date")
+    """
+    if not client or not records:
+        return records, 0
+
+    existing = fetch_existing_hashes(
+        client, table, [record.get(primary_key) for record in records], primary_key
+    )
+    if not existing:
+        return records, 0
+
+    changed = [
+        record
+        for record in records
+        if existing.get(record.get(primary_key)) != record.get(CONTENT_HASH_COLUMN)
+    ]
+    unchanged = len(records) - len(changed)
+    if unchanged:
+        logger.info(f"Skipping {unchanged}/{len(records)} unchanged rows in {table}")
+    return changed, unchanged
@@ -1,10 +1,13 @@
 """Hybrid storage service for combined enrichment pipelines."""
 
+import json
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from core.dlt import PK_SUBMISSION_ID
 
+from .content_hash import CONTENT_HASH_COLUMN, add_content_hashes, drop_unchanged_rows
 from .dlt_loader import DLTLoader, LoadStatistics
 
 logger = logging.getLogger(__name__)
@@ -51,8 +54,42 @@ APP_OPPORTUNITIES_COLUMNS = {
     "title": {"data_type": "text"},
     "subreddit": {"data_type": "text"},
     "reddit_score": {"data_type": "bigint"},
+    # Change detection (core.storage.content_hash)
+    "content_hash": {"data_type": "text"},
 }
 
+# Columns each enrichment service owns, per table. In patch mode a store
+# writes only the columns of the services that ran.
+OPPORTUNITY_COLUMN_OWNERS = {
+    "opportunity": (
+        "problem_description",
+        "app_concept",
+        "core_functions",
+        "value_proposition",
+        "target_user",
+        "monetization_model",
+        "opportunity_score",
+        "final_score",
+        "status",
+        "dimension_scores",
+        "priority",
+        "confidence",
+        "evidence_based",
+    ),
+    "profiler": ("ai_profile", "app_name", "app_category", "profession", "core_problems"),
+    "trust": ("trust_score", "trust_badge", "activity_score", "trust_level", "trust_badges"),
+    "monetization": ("monetization_score",),
+    "market_validation": ("market_validation_score",),
+}
+PROFILE_COLUMN_OWNERS = {
+    "opportunity": ("opportunity_score",),
+    "trust": ("trust_score", "trust_level"),
+    "market_validation": ("market_validation_score",),
+}
+
+# Written with every opportunity patch
+PATCH_METADATA_COLUMNS = ("analyzed_at", "enrichment_version", "pipeline_source")
+
 
 class HybridStore:
     """Storage service for hybrid submissions with combined enrichment data.
@@ -67,6 +104,8 @@ class HybridStore:
         opportunity_table: str = "app_opportunities",
         profile_table: str = "submissions",
         supabase_client: Any = None,
+        skip_unchanged: bool = True,
+        patch_services: Iterable[str] | None = None,
     ):
         """Initialize HybridStore.
 
@@ -75,6 +114,14 @@ class HybridStore:
             opportunity_table: Table for opportunity data (default: "app_opportunities")
             profile_table: Table for enriched profiles (default: "submissions")
             supabase_client: Supabase client for trust data fetching (optional)
+            skip_unchanged: Stamp rows with a content hash and, when a
+                Supabase client is set, skip rows whose stored hash matches
+            patch_services: Enrichment services (e.g. ["profiler", "trust"])
+                whose columns store() should patch in place instead of
+                merging whole rows (see patch()). Requires supabase_client.
+
+        Raises:
+            ValueError: If patch_services names an unknown service
         """
         self.loader = loader or DLTLoader()
         self.opportunity_table = opportunity_table
@@ -82,6 +129,10 @@ class HybridStore:
         self.primary_key = PK_SUBMISSION_ID
         self.stats = LoadStatistics()
         self.supabase_client = supabase_client
+        self.skip_unchanged = skip_unchanged
+        self.patch_services = (
+            self._validate_services(patch_services) if patch_services is not None else None
+        )
         logger.info(
             f"HybridStore initialized (opp={opportunity_table}, profile={profile_table})"
         )
@@ -166,59 +217,42 @@ class HybridStore:
             # Return empty dict on error - trust preservation is best-effort
             return {}
 
-    def store(self, hybrid_submissions: list[dict[str, Any]]) -> bool:
-        """Store hybrid submissions to both opportunity and profile tables.
-
-        Splits hybrid data into opportunity and profile components and stores
-        to respective tables with merge disposition.
+    def _drop_unchanged(
+        self, rows: list[dict[str, Any]], table: str
+    ) -> list[dict[str, Any]]:
+        """
+        Hash rows and drop those already stored with the same content.
 
         Args:
-            hybrid_submissions: List of hybrid submission dictionaries with fields:
-                Opportunity fields:
-                - submission_id (required)
-                - problem_description (optional)
-                - app_concept (optional)
-                - core_functions (optional)
-                - opportunity_score (optional)
-
-                Profile fields:
-                - title (optional)
-                - selftext (optional)
-                - author (optional)
-                - subreddit (optional)
-                - trust_score (optional)
-                - market_validation (optional)
+            rows: Rows about to be merged into table
+            table: Destination table
 
         Returns:
-            True if both storage operations successful, False otherwise
+            list: Rows that are new or changed
+        """
+        add_content_hashes(rows)
+        changed, unchanged = drop_unchanged_rows(
+            rows, self.supabase_client, table, self.primary_key
+        )
+        self.stats.unchanged += unchanged
+        return changed
 
-        Example:
-            >>> store = HybridStore()
-            >>> submissions = [{
-            ...     "submission_id": "abc123",
-            ...     "problem_description": "Teams waste time...",
-            ...     "app_concept": "PM platform",
-            ...     "opportunity_score": 75.0,
-            ...     "title": "Need feedback on my idea",
-            ...     "trust_score": 85.5,
-            ...     "author": "user123"
-            ... }]
-            >>> store.store(submissions)
-            True
+    def _split_submissions(
+        self,
+        hybrid_submissions: list[dict[str, Any]],
+        existing_trust: dict[str, dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
         """
-        if not hybrid_submissions:
-            logger.warning("No hybrid submissions to store")
-            return False
+        Split hybrid submissions into app_opportunities and submissions rows.
 
-        # PHASE 2: Pre-fetch existing trust data to prevent data loss
-        submission_ids = [
-            sub.get("submission_id") or sub.get("reddit_id")
-            for sub in hybrid_submissions
-            if sub.get("submission_id") or sub.get("reddit_id")
-        ]
-        existing_trust = self._fetch_existing_trust_data(submission_ids)
+        Args:
+            hybrid_submissions: Enriched submissions
+            existing_trust: Stored trust fields per submission_id, used where
+                a submission has none of its own
 
-        # Split into opportunity and profile data
+        Returns:
+            tuple: (opportunity rows, profile rows)
+        """
         opportunities = []
         profiles = []
 
@@ -319,6 +353,71 @@ class HybridStore:
             }
             profiles.append(profile_data)
 
+        return opportunities, profiles
+
+    def store(self, hybrid_submissions: list[dict[str, Any]]) -> bool:
+        """Store hybrid submissions to both opportunity and profile tables.
+
+        Splits hybrid data into opportunity and profile components and stores
+        to respective tables with merge disposition.
+
+        Args:
+            hybrid_submissions: List of hybrid submission dictionaries with fields:
+                Opportunity fields:
+                - submission_id (required)
+                - problem_description (optional)
+                - app_concept (optional)
+                - core_functions (optional)
+                - opportunity_score (optional)
+
+                Profile fields:
+                - title (optional)
+                - selftext (optional)
+                - author (optional)
+                - subreddit (optional)
+                - trust_score (optional)
+                - market_validation (optional)
+
+        Returns:
+            True if both storage operations successful, False otherwise
+
+        Example:
+            >>> store = HybridStore()
+            >>> submissions = [{
+            ...     "submission_id": "abc123",
+            ...     "problem_description": "Teams waste time...",
+            ...     "app_concept": "PM platform",
+            ...     "opportunity_score": 75.0,
+            ...     "title": "Need feedback on my idea",
+            ...     "trust_score": 85.5,
+            ...     "author": "user123"
+            ... }]
+            >>> store.store(submissions)
+            True
+        """
+        if not hybrid_submissions:
+            logger.warning("No hybrid submissions to store")
+            return False
+
+        if self.patch_services is not None and self.supabase_client:
+            return self.patch(hybrid_submissions, self.patch_services)
+
+        # PHASE 2: Pre-fetch existing trust data to prevent data loss
+        submission_ids = [
+            sub.get("submission_id") or sub.get("reddit_id")
+            for sub in hybrid_submissions
+            if sub.get("submission_id") or sub.get("reddit_id")
+        ]
+        existing_trust = self._fetch_existing_trust_data(submission_ids)
+
+        # Split into opportunity and profile data
+        opportunities, profiles = self._split_submissions(hybrid_submissions, existing_trust)
+
+        # Merge only rows whose content changed since the last load
+        if self.skip_unchanged:
+            opportunities = self._drop_unchanged(opportunities, self.opportunity_table)
+            profiles = self._drop_unchanged(profiles, self.profile_table)
+
         logger.info(
             f"Storing hybrid data: {len(opportunities)} opportunities, {len(profiles)} profiles"
         )
@@ -369,6 +468,151 @@ class HybridStore:
 
         return success
 
+    @staticmethod
+    def _validate_services(services: Iterable[str]) -> list[str]:
+        """Return services as a list, rejecting names that own no columns."""
+        services = list(services)
+        unknown = set(services) - set(OPPORTUNITY_COLUMN_OWNERS)
+        if unknown:
+            raise ValueError(
+                f"Unknown enrichment services: {sorted(unknown)}. "
+                f"Must be among {sorted(OPPORTUNITY_COLUMN_OWNERS)}"
+            )
+        return services
+
+    def patch(self, hybrid_submissions: list[dict[str, Any]], services: Iterable[str]) -> bool:
+        """Write only the columns the given services own.
+
+        Each table gets one bulk UPDATE ... FROM through the patch_rows RPC,
+        touching only the owned columns. A NULL value never overwrites a
+        stored one, so trust fields survive without the prefetch that
+        store() needs. Rows that do not exist yet are inserted with a
+        normal merge load. If the RPC is unavailable, falls back to store().
+
+        Args:
+            hybrid_submissions: Enriched submissions (same shape as store())
+            services: Services whose output these submissions carry
+                ("opportunity", "profiler", "trust", "monetization",
+                "market_validation")
+
+        Returns:
+            True if every write succeeded, False otherwise
+
+        Raises:
+            ValueError: If services names an unknown service
+
+        Example:
+            >>> store = HybridStore(supabase_client=client)
+            >>> store.patch([{"submission_id": "abc123", "trust_score": 85.5,
+            ...               "problem_description": "..."}], ["trust"])
+            True
+        """
+        services = self._validate_services(services)
+        if not hybrid_submissions:
+            logger.warning("No hybrid submissions to patch")
+            return False
+
+        opportunities, profiles = self._split_submissions(hybrid_submissions, {})
+        opportunity_columns = [
+            column for service in services for column in OPPORTUNITY_COLUMN_OWNERS[service]
+        ] + list(PATCH_METADATA_COLUMNS)
+        profile_columns = [
+            column
+            for service in services
+            for column in PROFILE_COLUMN_OWNERS.get(service, ())
+        ]
+
+        try:
+            new_opportunities = self._patch_rows(
+                self.opportunity_table, opportunities, opportunity_columns
+            )
+            new_profiles = self._patch_rows(self.profile_table, profiles, profile_columns)
+        except Exception as e:
+            logger.warning(f"Patch update unavailable, merging full rows instead: {e}")
+            patch_services, self.patch_services = self.patch_services, None
+            try:
+                return self.store(hybrid_submissions)
+            finally:
+                self.patch_services = patch_services
+
+        logger.info(
+            f"Patched {len(opportunities) - len(new_opportunities)} opportunities and "
+            f"{len(profiles) - len(new_profiles)} profiles ({', '.join(services)}); "
+            f"inserting {len(new_opportunities)} new opportunities, "
+            f"{len(new_profiles)} new profiles"
+        )
+
+        # Rows that don't exist yet have no stored trust data to preserve
+        success = True
+        for rows, table, columns in (
+            (new_opportunities, self.opportunity_table, APP_OPPORTUNITIES_COLUMNS),
+            (new_profiles, self.profile_table, None),
+        ):
+            if not rows:
+                continue
+            if self.skip_unchanged:
+                add_content_hashes(rows)
+            if not self.loader.load(
+                data=rows,
+                table_name=table,
+                write_disposition="merge",
+                primary_key=self.primary_key,
+                columns=columns,
+            ):
+                logger.error(f"Failed to insert new rows into {table}")
+                self.stats.errors.append(f"Insert into {table} failed")
+                success = False
+
+        self.stats.total_attempted += len(hybrid_submissions)
+        if success:
+            self.stats.loaded += len(hybrid_submissions)
+        else:
+            self.stats.failed += len(hybrid_submissions)
+        return success
+
+    def _patch_rows(
+        self, table: str, rows: list[dict[str, Any]], columns: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Update the given columns of existing rows with one patch_rows RPC call.
+
+        Args:
+            table: Table to update
+            rows: Full rows; only primary key and columns are sent
+            columns: Columns to write
+
+        Returns:
+            list: Rows that were not updated because they do not exist yet
+
+        Raises:
+            Exception: If the RPC call fails
+        """
+        if not rows or not columns:
+            return []
+
+        # Last row wins for a repeated key, as with a merge load
+        payload = {
+            row[self.primary_key]: {
+                self.primary_key: row[self.primary_key],
+                **{column: row.get(column) for column in columns},
+            }
+            for row in rows
+        }
+        response = self.supabase_client.rpc(
+            "patch_rows",
+            {
+                "p_table": table,
+                "p_key": self.primary_key,
+                "p_columns": list(dict.fromkeys(columns)),
+                "p_rows": json.loads(json.dumps(list(payload.values()), default=str)),
+                # The stored hash no longer describes the row
+                "p_reset_columns": [CONTENT_HASH_COLUMN] if self.skip_unchanged else [],
+            },
+        ).execute()
+
+        updated = set(response.data or [])
+        return [row for row in rows if row[self.primary_key] not in updated]
+
     def store_batch(
         self, hybrid_submissions: list[dict[str, Any]], batch_size: int = 100
     ) -> dict[str, Any]:
@@ -0,0 +1,840 @@
+"""Embedded local backend implementing the Supabase client subset the pipeline uses.
+
+Stores, fetchers, skip logic and the trust repository all talk to
+``supabase_client.table(...).select/eq/in_/range/upsert/insert/update/execute``.
+LocalSupabaseClient answers those calls from an embedded DuckDB file instead
+of PostgREST, so dev runs, large local runs and load tests need no live
+Supabase. The schema is built from supabase/migrations: tables, columns,
+unique indexes and views are translated to DuckDB, and Postgres-only
+statements (functions, triggers, policies, data fixes) are skipped. Tables
+that only dlt creates (e.g. app_opportunities) appear on the first load.
+
+DLTLoader writes into the same file through its DSN, so a whole pipeline run
+stays local.
+
+Supported query builder subset:
+    select(*columns, count=None), insert(rows), upsert(rows, on_conflict,
+    ignore_duplicates, default_to_null), update(values), delete(),
+    eq/neq/gt/gte/lt/lte/like/ilike/is_/in_/contains/match/filter/or_,
+    order, limit, range, single, maybe_single, execute, rpc
+
+Usage:
+    from core.storage import DLTLoader, HybridStore
+    from core.storage.local_client import LocalSupabaseClient
+
+    client = LocalSupabaseClient("data/local.duckdb")
+    loader = DLTLoader(connection_string=client.dsn)
+    store = HybridStore(loader=loader, supabase_client=client)
+
+    rows = client.table("submissions").select("submission_id, title").limit(10).execute().data
+"""
+
+import json
+import logging
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+try:
+    import duckdb
+
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    duckdb = None
+    DUCKDB_AVAILABLE = False
+
+from .dlt_loader import DUCKDB_DSN_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# Repository migrations applied to a new local database
+DEFAULT_MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "supabase" / "migrations"
+
+# Tables the stores and collectors load through dlt. DuckDB cannot add the
+# NOT NULL columns dlt needs (merge keys, _dlt_id) to an existing table, so
+# these are left for dlt to create on the first load.
+DLT_MANAGED_TABLES = frozenset({"submissions", "comments"})
+
+# Migration statements worth translating; everything else is Postgres-only
+_TRANSLATED_PREFIXES = (
+    "CREATE TABLE",
+    "ALTER TABLE",
+    "CREATE UNIQUE INDEX",
+    "CREATE VIEW",
+    "CREATE OR REPLACE VIEW",
+)
+
+# PostgREST filter operators -> SQL comparison
+_OPERATORS = {
+    "eq": "=",
+    "neq": "<>",
+    "gt": ">",
+    "gte": ">=",
+    "lt": "<",
+    "lte": "<=",
+    "like": "LIKE",
+    "ilike": "ILIKE",
+}
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class LocalAPIError(Exception):
+    """Error raised where PostgREST would return an error response."""
+
+    def __init__(self, message: str, code: str | None = None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+@dataclass
+class LocalResponse:
+    """Response with the attributes callers read from supabase-py responses."""
+
+    data: Any
+    count: int | None = None
+
+
+def _quote(identifier: str) -> str:
+    """Quote a column or table name, rejecting anything but plain identifiers."""
+    identifier = identifier.strip()
+    if not _IDENTIFIER.match(identifier):
+        raise LocalAPIError(f"Unsupported identifier: {identifier!r}", code="PGRST100")
+    return f'"{identifier}"'
+
+
+def _split_top_level(text: str, separator: str = ",") -> list[str]:
+    """Split text on separator outside parentheses, braces and quotes."""
+    parts, depth, quote, current = [], 0, None, []
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "({[":
+            depth += 1
+        elif char in ")}]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if "".join(current).strip():
+        parts.append("".join(current).strip())
+    return parts
+
+
+def _split_sql_statements(sql: str) -> list[str]:
+    """Split a migration file into statements, honoring comments, quotes and $$ bodies."""
+    statements, current = [], []
+    i, length = 0, len(sql)
+    while i < length:
+        char = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = length if end == -1 else end
+            continue
+        if char == "'":
+            end = i + 1
+            while end < length:
+                if sql[end] == "'" and not sql.startswith("''", end):
+                    break
+                end += 2 if sql.startswith("''", end) else 1
+            current.append(sql[i : end + 1])
+            i = end + 1
+            continue
+        if char == "$":
+            tag = re.match(r"\$[A-Za-z_]*\$", sql[i:])
+            if tag:
+                end = sql.find(tag.group(), i + len(tag.group()))
+                end = length if end == -1 else end + len(tag.group())
+                current.append(sql[i:end])
+                i = end
+                continue
+        if char == ";":
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statement = "".join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def _strip_check_constraints(definition: str) -> str:
+    """Remove CHECK (...) clauses, whose parentheses may nest."""
+    while True:
+        match = re.search(r"\s+CHECK\s*\(", definition, re.IGNORECASE)
+        if not match:
+            return definition
+        depth, end = 1, match.end()
+        while end < len(definition) and depth:
+            depth += {"(": 1, ")": -1}.get(definition[end], 0)
+            end += 1
+        definition = definition[: match.start()] + definition[end:]
+
+
+def _translate_statement(
+    statement: str, skip_tables: frozenset[str] = DLT_MANAGED_TABLES
+) -> list[str]:
+    """
+    Translate one Postgres migration statement to DuckDB.
+
+    Args:
+        statement: Statement without trailing semicolon
+        skip_tables: Tables whose CREATE/ALTER TABLE statements are skipped
+
+    Returns:
+        list: DuckDB statements to run (empty if the statement is skipped)
+    """
+    normalized = " ".join(statement.split())
+    upper = normalized.upper()
+    if not upper.startswith(_TRANSLATED_PREFIXES):
+        return []
+    target = re.match(
+        r"(?:CREATE|ALTER) TABLE (?:IF NOT EXISTS |IF EXISTS )?(?:ONLY )?(?:public\.)?(\w+)",
+        normalized,
+        re.IGNORECASE,
+    )
+    if target and target.group(1).lower() in skip_tables:
+        return []
+
+    translated = normalized
+    translated = re.sub(r"\bJSONB\b", "JSON", translated, flags=re.IGNORECASE)
+    translated = re.sub(r"\bVECTOR\(\d+\)", "FLOAT[]", translated, flags=re.IGNORECASE)
+    translated = re.sub(
+        r"\s+REFERENCES\s+\w+(\s*\([^)]*\))?(\s+ON\s+(DELETE|UPDATE)\s+"
+        r"(CASCADE|SET NULL|SET DEFAULT|RESTRICT|NO ACTION))*",
+        "",
+        translated,
+        flags=re.IGNORECASE,
+    )
+    translated = re.sub(r"\)\s*STORED\b", ") VIRTUAL", translated, flags=re.IGNORECASE)
+    translated = re.sub(
+        r"\s+(NOT\s+)?DEFERRABLE(\s+INITIALLY\s+(DEFERRED|IMMEDIATE))?",
+        "",
+        translated,
+        flags=re.IGNORECASE,
+    )
+
+    if upper.startswith("CREATE TABLE"):
+        table = re.match(
+            r"CREATE TABLE (?:IF NOT EXISTS )?(?:public\.)?(\w+)", translated, re.IGNORECASE
+        ).group(1)
+        sequences = []
+
+        def identity(match: re.Match) -> str:
+            column, column_type = match.group(1), match.group(2).upper()
+            sequence = f"{table}_{column}_seq"
+            sequences.append(f"CREATE SEQUENCE IF NOT EXISTS {sequence}")
+            column_type = {"BIGSERIAL": "BIGINT", "SERIAL": "INTEGER"}.get(column_type, column_type)
+            return f"{column} {column_type}{match.group(3) or ''} DEFAULT nextval('{sequence}')"
+
+        # DuckDB has no SERIAL or identity columns: use a sequence default
+        translated = re.sub(
+            r"(\w+) (BIGSERIAL|SERIAL)( PRIMARY KEY)?\b", identity, translated, flags=re.IGNORECASE
+        )
+        translated = re.sub(
+            r"(\w+) (BIGINT|INTEGER|INT)( PRIMARY KEY)? GENERATED (?:ALWAYS|BY DEFAULT) AS IDENTITY",
+            identity,
+            translated,
+            flags=re.IGNORECASE,
+        )
+        return sequences + [translated]
+
+    if upper.startswith("ALTER TABLE"):
+        match = re.match(
+            r"(ALTER TABLE (?:IF EXISTS )?(?:ONLY )?(?:public\.)?\w+) (.*)$",
+            translated,
+            re.IGNORECASE,
+        )
+        if not match:
+            return []
+        # DuckDB takes one action per ALTER TABLE, and no constraints on added columns
+        actions = []
+        for action in _split_top_level(match.group(2)):
+            if action.upper().startswith("ADD COLUMN"):
+                action = _strip_check_constraints(action)
+                action = re.sub(r"\s+(PRIMARY KEY|UNIQUE)\b", "", action, flags=re.IGNORECASE)
+            actions.append(f"{match.group(1)} {action}")
+        return actions
+
+    return [translated]
+
+
+def apply_migrations(
+    connection: Any,
+    migrations_dir: Path | str = DEFAULT_MIGRATIONS_DIR,
+    skip_tables: frozenset[str] = DLT_MANAGED_TABLES,
+) -> tuple[int, int]:
+    """
+    Apply the translatable parts of the Supabase migrations to a DuckDB database.
+
+    Migrations run in filename order. Statements DuckDB rejects (e.g. an
+    ALTER TABLE on a table only dlt creates) are logged at debug level and
+    skipped, so the result is the subset of the schema DuckDB can express.
+
+    Args:
+        connection: DuckDB connection (current schema is used)
+        migrations_dir: Directory of *.sql migration files
+        skip_tables: Tables left for dlt to create (see DLT_MANAGED_TABLES)
+
+    Returns:
+        tuple: (statements applied, statements skipped)
+    """
+    applied = skipped = 0
+    for path in sorted(Path(migrations_dir).glob("*.sql")):
+        for statement in _split_sql_statements(path.read_text()):
+            for translated in _translate_statement(statement, skip_tables):
+                try:
+                    connection.execute(translated)
+                    applied += 1
+                except Exception as e:
+                    skipped += 1
+                    logger.debug(f"Skipped statement from {path.name}: {e}")
+    logger.info(f"Applied {applied} migration statements locally ({skipped} skipped)")
+    return applied, skipped
+
+
+def _to_python(value: Any, type_name: str) -> Any:
+    """Convert a DuckDB value to what PostgREST would return as JSON."""
+    if value is None:
+        return None
+    if type_name == "JSON" and isinstance(value, str):
+        return json.loads(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _to_param(value: Any, type_name: str | None) -> Any:
+    """Convert a request value to a DuckDB parameter for a column type."""
+    if value is None:
+        return None
+    if isinstance(value, dict) or (
+        isinstance(value, list) and not (type_name or "").endswith("[]")
+    ):
+        return json.dumps(value, default=str)
+    return value
+
+
+class LocalQuery:
+    """
+    Query builder for one table, mirroring supabase-py's request builders.
+
+    Methods return the builder so calls chain as with supabase-py; execute()
+    runs the statement and returns a LocalResponse.
+    """
+
+    def __init__(self, client: "LocalSupabaseClient", table: str):
+        self._client = client
+        self._table = table
+        self._operation = "select"
+        self._columns = "*"
+        self._count: str | None = None
+        self._payload: Any = None
+        self._on_conflict: list[str] = []
+        self._ignore_duplicates = False
+        self._filters: list[tuple[str, list[Any]]] = []
+        self._order: list[str] = []
+        self._limit: int | None = None
+        self._offset: int | None = None
+        self._single: str | None = None
+
+    # Operations
+
+    def select(self, *columns: str, count: str | None = None) -> "LocalQuery":
+        """Select columns ("*" or a comma-separated list)."""
+        joined = ",".join(columns) if columns else "*"
+        if "(" in joined:
+            raise LocalAPIError("Embedded resources are not supported locally", code="PGRST100")
+        self._operation = "select"
+        self._columns = joined
+        self._count = count
+        return self
+
+    def insert(self, rows: dict[str, Any] | list[dict[str, Any]], **kwargs) -> "LocalQuery":
+        """Insert one row or a list of rows."""
+        self._operation = "insert"
+        self._payload = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(
+        self,
+        rows: dict[str, Any] | list[dict[str, Any]],
+        on_conflict: str = "",
+        ignore_duplicates: bool = False,
+        default_to_null: bool = True,
+        **kwargs,
+    ) -> "LocalQuery":
+        """Insert rows, updating the given columns of rows whose key exists."""
+        self._operation = "upsert"
+        self._payload = rows if isinstance(rows, list) else [rows]
+        self._on_conflict = [c.strip() for c in on_conflict.split(",") if c.strip()]
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, values: dict[str, Any], **kwargs) -> "LocalQuery":
+        """Update the matching rows."""
+        self._operation = "update"
+        self._payload = values
+        return self
+
+    def delete(self, **kwargs) -> "LocalQuery":
+        """Delete the matching rows."""
+        self._operation = "delete"
+        return self
+
+    # Filters
+
+    def _compare(self, column: str, operator: str, value: Any) -> "LocalQuery":
+        self._filters.append((f"{_quote(column)} {_OPERATORS[operator]} ?", [value]))
+        return self
+
+    def eq(self, column: str, value: Any) -> "LocalQuery":
+        return self._compare(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "LocalQuery":
+        return self._compare(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "LocalQuery":
+        return self._compare(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "LocalQuery":
+        return self._compare(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "LocalQuery":
+        return self._compare(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "LocalQuery":
+        return self._compare(column, "lte", value)
+
+    def like(self, column: str, pattern: str) -> "LocalQuery":
+        return self._compare(column, "like", pattern.replace("*", "%"))
+
+    def ilike(self, column: str, pattern: str) -> "LocalQuery":
+        return self._compare(column, "ilike", pattern.replace("*", "%"))
+
+    def is_(self, column: str, value: Any) -> "LocalQuery":
+        keyword = {None: "NULL", "null": "NULL", True: "TRUE", "true": "TRUE",
+                   False: "FALSE", "false": "FALSE"}[value]
+        self._filters.append((f"{_quote(column)} IS {keyword}", []))
+        return self
+
+    def in_(self, column: str, values: list[Any]) -> "LocalQuery":
+        values = list(values)
+        if not values:
+            self._filters.append(("FALSE", []))
+        else:
+            placeholders = ", ".join("?" for _ in values)
+            self._filters.append((f"{_quote(column)} IN ({placeholders})", values))
+        return self
+
+    def contains(self, column: str, values: list[Any]) -> "LocalQuery":
+        self._filters.append((f"list_has_all({_quote(column)}, ?)", [list(values)]))
+        return self
+
+    def match(self, query: dict[str, Any]) -> "LocalQuery":
+        for column, value in query.items():
+            self.eq(column, value)
+        return self
+
+    def filter(self, column: str, operator: str, value: Any) -> "LocalQuery":
+        sql, params = self._parse_condition(f"{column}.{operator}.{value}")
+        self._filters.append((sql, params))
+        return self
+
+    def or_(self, filters: str) -> "LocalQuery":
+        """Match any of PostgREST-style conditions, e.g. "a.eq.1,tags.cs.{x}"."""
+        conditions = [self._parse_condition(part) for part in _split_top_level(filters)]
+        sql = " OR ".join(f"({condition})" for condition, _ in conditions)
+        params = [param for _, condition_params in conditions for param in condition_params]
+        self._filters.append((f"({sql})", params))
+        return self
+
+    @staticmethod
+    def _parse_condition(condition: str) -> tuple[str, list[Any]]:
+        """Translate one "column.operator.value" condition to SQL."""
+        column, operator, value = condition.split(".", 2)
+        if operator in _OPERATORS:
+            return f"{_quote(column)} {_OPERATORS[operator]} ?", [value]
+        if operator == "is":
+            return f"{_quote(column)} IS {value.upper()}", []
+        if operator == "in":
+            values = _split_top_level(value.strip("()"))
+            return f"{_quote(column)} IN ({', '.join('?' for _ in values)})", values
+        if operator == "cs":
+            values = _split_top_level(value.strip("{}"))
+            return f"list_has_all({_quote(column)}, ?)", [values]
+        raise LocalAPIError(f"Unsupported filter operator: {operator}", code="PGRST100")
+
+    # Modifiers
+
+    def order(self, column: str, desc: bool = False, nullsfirst: bool | None = None) -> "LocalQuery":
+        clause = f"{_quote(column)} {'DESC' if desc else 'ASC'}"
+        if nullsfirst is not None:
+            clause += " NULLS FIRST" if nullsfirst else " NULLS LAST"
+        self._order.append(clause)
+        return self
+
+    def limit(self, size: int) -> "LocalQuery":
+        self._limit = size
+        return self
+
+    def range(self, start: int, end: int) -> "LocalQuery":
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def single(self) -> "LocalQuery":
+        self._single = "single"
+        return self
+
+    def maybe_single(self) -> "LocalQuery":
+        self._single = "maybe"
+        return self
+
+    # Execution
+
+    def _where(self) -> tuple[str, list[Any]]:
+        if not self._filters:
+            return "", []
+        sql = " WHERE " + " AND ".join(condition for condition, _ in self._filters)
+        return sql, [param for _, params in self._filters for param in params]
+
+    def _returning(self) -> str:
+        if self._columns.strip() == "*":
+            return "*"
+        return ", ".join(_quote(column) for column in self._columns.split(","))
+
+    def execute(self) -> LocalResponse:
+        """Run the request and return its rows."""
+        handler = {
+            "select": self._execute_select,
+            "insert": self._execute_insert,
+            "upsert": self._execute_upsert,
+            "update": self._execute_update,
+            "delete": self._execute_delete,
+        }[self._operation]
+        try:
+            response = handler()
+        except LocalAPIError:
+            raise
+        except Exception as e:
+            raise LocalAPIError(str(e)) from e
+
+        if self._single is not None:
+            rows = response.data
+            if len(rows) > 1 or (self._single == "single" and not rows):
+                raise LocalAPIError(
+                    f"JSON object requested, {len(rows)} rows returned", code="PGRST116"
+                )
+            response.data = rows[0] if rows else None
+        return response
+
+    def _execute_select(self) -> LocalResponse:
+        where, params = self._where()
+        sql = f"SELECT {self._returning()} FROM {_quote(self._table)}{where}"
+        if self._order:
+            sql += " ORDER BY " + ", ".join(self._order)
+        if self._limit is not None:
+            sql += f" LIMIT {int(self._limit)}"
+        if self._offset:
+            sql += f" OFFSET {int(self._offset)}"
+        rows = self._client._fetch(sql, params)
+
+        count = None
+        if self._count:
+            count = self._client._fetch(
+                f"SELECT COUNT(*) AS count FROM {_quote(self._table)}{where}", params
+            )[0]["count"]
+        return LocalResponse(data=rows, count=count)
+
+    def _insert_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not rows:
+            return []
+        types = self._client._column_types(self._table)
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        unknown = [column for column in columns if column not in types]
+        if unknown:
+            raise LocalAPIError(
+                f"Could not find columns {unknown} of '{self._table}'", code="PGRST204"
+            )
+        placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+        params = [
+            _to_param(row.get(column), types[column]) for row in rows for column in columns
+        ]
+        sql = (
+            f"INSERT INTO {_quote(self._table)} ({', '.join(_quote(c) for c in columns)}) "
+            f"VALUES {', '.join(placeholders for _ in rows)} RETURNING {self._returning()}"
+        )
+        return self._client._fetch(sql, params)
+
+    def _execute_insert(self) -> LocalResponse:
+        return LocalResponse(data=self._insert_rows(self._payload))
+
+    def _execute_upsert(self) -> LocalResponse:
+        keys = self._on_conflict or self._client._primary_key(self._table)
+        if not keys:
+            raise LocalAPIError(
+                f"upsert on '{self._table}' needs on_conflict (table has no primary key)",
+                code="42P10",
+            )
+
+        # Last row wins for a repeated key, as with a single-statement upsert
+        rows = list({tuple(row.get(key) for key in keys): row for row in self._payload}.values())
+        key_sql = " AND ".join(f"{_quote(key)} = ?" for key in keys)
+        existing = set()
+        for row in rows:
+            found = self._client._fetch(
+                f"SELECT 1 AS hit FROM {_quote(self._table)} WHERE {key_sql}",
+                [row.get(key) for key in keys],
+            )
+            if found:
+                existing.add(tuple(row.get(key) for key in keys))
+
+        types = self._client._column_types(self._table)
+        result = []
+        for row in rows:
+            key_values = tuple(row.get(key) for key in keys)
+            if key_values not in existing:
+                continue
+            if self._ignore_duplicates:
+                continue
+            values = {column: value for column, value in row.items() if column not in keys}
+            if not values:
+                continue
+            set_sql = ", ".join(f"{_quote(column)} = ?" for column in values)
+            result.extend(
+                self._client._fetch(
+                    f"UPDATE {_quote(self._table)} SET {set_sql} WHERE {key_sql} "
+                    f"RETURNING {self._returning()}",
+                    [_to_param(value, types.get(column)) for column, value in values.items()]
+                    + list(key_values),
+                )
+            )
+        new_rows = [row for row in rows if tuple(row.get(key) for key in keys) not in existing]
+        result.extend(self._insert_rows(new_rows))
+        return LocalResponse(data=result)
+
+    def _execute_update(self) -> LocalResponse:
+        if not self._payload:
+            return LocalResponse(data=[])
+        types = self._client._column_types(self._table)
+        where, params = self._where()
+        set_sql = ", ".join(f"{_quote(column)} = ?" for column in self._payload)
+        values = [_to_param(value, types.get(column)) for column, value in self._payload.items()]
+        sql = f"UPDATE {_quote(self._table)} SET {set_sql}{where} RETURNING {self._returning()}"
+        return LocalResponse(data=self._client._fetch(sql, values + params))
+
+    def _execute_delete(self) -> LocalResponse:
+        where, params = self._where()
+        sql = f"DELETE FROM {_quote(self._table)}{where} RETURNING {self._returning()}"
+        return LocalResponse(data=self._client._fetch(sql, params))
+
+
+class LocalRPC:
+    """Pending RPC call; execute() runs the registered function."""
+
+    def __init__(self, client: "LocalSupabaseClient", name: str, params: dict[str, Any]):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> LocalResponse:
+        function = self._client.functions.get(self._name)
+        if function is None:
+            raise LocalAPIError(
+                f"Could not find the function {self._name} locally", code="PGRST202"
+            )
+        return LocalResponse(data=function(self._client, **self._params))
+
+
+def _increment_concept_counts(
+    client: "LocalSupabaseClient", p_concept_ids: list[int], p_increments: list[int]
+) -> None:
+    for concept_id, increment in zip(p_concept_ids, p_increments):
+        client._fetch(
+            "UPDATE business_concepts SET submission_count = COALESCE(submission_count, 0) + ?, "
+            "last_updated_at = NOW() WHERE id = ? RETURNING id",
+            [increment, concept_id],
+        )
+
+
+def _acquire_concept_analysis_lease(
+    client: "LocalSupabaseClient",
+    p_concept_id: int,
+    p_holder: str,
+    p_ttl_seconds: int = 900,
+    p_require_agno: bool = True,
+    p_require_profiler: bool = True,
+) -> bool:
+    if p_concept_id is None or p_holder is None:
+        return False
+    rows = client._fetch(
+        "UPDATE business_concepts SET analysis_lease_holder = ?, "
+        "analysis_lease_expires_at = NOW() + to_seconds(?) "
+        "WHERE id = ? AND NOT (? AND COALESCE(has_agno_analysis, FALSE)) "
+        "AND NOT (? AND COALESCE(has_profiler_analysis, FALSE)) "
+        "AND (analysis_lease_holder IS NULL OR analysis_lease_holder = ? "
+        "OR analysis_lease_expires_at < NOW()) RETURNING id",
+        [p_holder, p_ttl_seconds, p_concept_id, p_require_agno, p_require_profiler, p_holder],
+    )
+    return bool(rows)
+
+
+def _release_concept_analysis_lease(
+    client: "LocalSupabaseClient", p_concept_id: int, p_holder: str
+) -> bool:
+    rows = client._fetch(
+        "UPDATE business_concepts SET analysis_lease_holder = NULL, "
+        "analysis_lease_expires_at = NULL WHERE id = ? AND analysis_lease_holder = ? "
+        "RETURNING id",
+        [p_concept_id, p_holder],
+    )
+    return bool(rows)
+
+
+# Local versions of the migration RPCs the pipeline calls. RPCs without one
+# (e.g. patch_rows) fail as an unknown function, and callers fall back.
+DEFAULT_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "increment_concept_counts": _increment_concept_counts,
+    "acquire_concept_analysis_lease": _acquire_concept_analysis_lease,
+    "release_concept_analysis_lease": _release_concept_analysis_lease,
+}
+
+
+class LocalSupabaseClient:
+    """
+    Supabase client stand-in backed by an embedded DuckDB database.
+
+    Attributes:
+        database: Path of the DuckDB file (":memory:" for a throwaway database)
+        schema: Schema holding the tables (the dlt dataset name)
+        functions: RPC name -> Python function(client, **params)
+
+    Examples:
+        >>> client = LocalSupabaseClient("data/local.duckdb")
+        >>> client.table("business_concepts").insert({"concept_name": "Chore tracker",
+        ...     "concept_fingerprint": "abc"}).execute().data[0]["id"]
+        1
+        >>> DLTLoader(connection_string=client.dsn)  # loads into the same file
+    """
+
+    def __init__(
+        self,
+        database: str | Path = ":memory:",
+        schema: str = "public",
+        migrations_dir: Path | str | None = DEFAULT_MIGRATIONS_DIR,
+    ):
+        """
+        Open (or create) the local database and apply the migrations.
+
+        Args:
+            database: DuckDB file path, or ":memory:"
+            schema: Schema for the tables; matches DLTLoader's dataset_name
+            migrations_dir: Migrations to apply, or None to skip
+
+        Raises:
+            ImportError: If duckdb is not installed
+        """
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("duckdb is required for LocalSupabaseClient: pip install redditharbor[local]")
+
+        self.database = str(database)
+        self.schema = schema
+        self.functions: dict[str, Callable[..., Any]] = dict(DEFAULT_FUNCTIONS)
+        self._connection = duckdb.connect(self.database)
+        self._connection.execute(f"CREATE SCHEMA IF NOT EXISTS {_quote(schema)}")
+        self._connection.execute(f"SET schema = '{schema}'")
+        self._lock = threading.Lock()
+
+        if migrations_dir is not None:
+            apply_migrations(self._connection, migrations_dir)
+
+    @property
+    def dsn(self) -> str:
+        """
+        DSN that points DLTLoader at this database.
+
+        Raises:
+            ValueError: For an in-memory database, which other connections can't open
+        """
+        if self.database == ":memory:":
+            raise ValueError("An in-memory database has no DSN; pass a file path")
+        return f"{DUCKDB_DSN_PREFIX}{self.database}"
+
+    def table(self, table_name: str) -> LocalQuery:
+        """Start a query on a table."""
+        return LocalQuery(self, table_name)
+
+    from_ = table
+
+    def rpc(self, name: str, params: dict[str, Any] | None = None) -> LocalRPC:
+        """Call a registered function (see register_function)."""
+        return LocalRPC(self, name, params or {})
+
+    def register_function(self, name: str, function: Callable[..., Any]) -> None:
+        """
+        Make an RPC available locally.
+
+        Args:
+            name: RPC name
+            function: Called as function(client, **params); its return value
+                becomes the response data
+        """
+        self.functions[name] = function
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def _fetch(self, sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+        """Run one statement and return its rows as PostgREST-style dicts."""
+        with self._lock:
+            cursor = self._connection.execute(sql, params or [])
+            if cursor.description is None:
+                return []
+            names = [column[0] for column in cursor.description]
+            types = [str(column[1]) for column in cursor.description]
+            return [
+                {name: _to_python(value, type_name) for name, type_name, value in zip(names, types, row)}
+                for row in cursor.fetchall()
+            ]
+
+    def _column_types(self, table: str) -> dict[str, str]:
+        """Column name -> DuckDB type for a table; raises if it does not exist."""
+        rows = self._fetch(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = ? AND table_name = ?",
+            [self.schema, table],
+        )
+        if not rows:
+            raise LocalAPIError(f"relation \"{self.schema}.{table}\" does not exist", code="42P01")
+        return {row["column_name"]: row["data_type"] for row in rows}
+
+    def _primary_key(self, table: str) -> list[str]:
+        """Primary key columns of a table (empty for dlt-created tables)."""
+        rows = self._fetch(
+            "SELECT constraint_column_names FROM duckdb_constraints() "
+            "WHERE schema_name = ? AND table_name = ? AND constraint_type = 'PRIMARY KEY'",
+            [self.schema, table],
+        )
+        return list(rows[0]["constraint_column_names"]) if rows else []
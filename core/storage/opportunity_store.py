@@ -5,6 +5,7 @@ from typing import Any
 
 from core.dlt import PK_SUBMISSION_ID
 
+from .content_hash import add_content_hashes, drop_unchanged_rows
 from .dlt_loader import DLTLoader, LoadStatistics
 
 # JSONB column type hints for proper PostgreSQL storage
@@ -53,6 +54,8 @@ APP_OPPORTUNITIES_COLUMNS = {
     "title": {"data_type": "text"},
     "subreddit": {"data_type": "text"},
     "reddit_score": {"data_type": "bigint"},
+    # Change detection (core.storage.content_hash)
+    "content_hash": {"data_type": "text"},
 }
 
 logger = logging.getLogger(__name__)
@@ -69,15 +72,23 @@ class OpportunityStore:
         self,
         loader: DLTLoader | None = None,
         table_name: str = "app_opportunities",
+        supabase_client: Any = None,
+        skip_unchanged: bool = True,
     ):
         """Initialize OpportunityStore.
 
         Args:
             loader: DLTLoader instance (creates new one if not provided)
             table_name: Target table name (default: "app_opportunities")
+            supabase_client: Supabase client used to look up stored content
+                hashes (optional; without it every row is loaded)
+            skip_unchanged: Stamp rows with a content hash and skip rows
+                whose stored hash matches
         """
         self.loader = loader or DLTLoader()
         self.table_name = table_name
+        self.supabase_client = supabase_client
+        self.skip_unchanged = skip_unchanged
         self.primary_key = PK_SUBMISSION_ID
         self.stats = LoadStatistics()
         logger.info(
@@ -151,12 +162,24 @@ class OpportunityStore:
                 # mapped_opp.pop('reddit_id', None)
             mapped_opportunities.append(mapped_opp)
 
-        success = self.loader.load(
-            data=mapped_opportunities,
-            table_name=self.table_name,
-            write_disposition="merge",
-            primary_key=self.primary_key,
-            columns=APP_OPPORTUNITIES_COLUMNS,  # CRITICAL: JSONB type hints for proper storage
+        # Merge only rows whose content changed since the last load
+        if self.skip_unchanged:
+            add_content_hashes(mapped_opportunities)
+            mapped_opportunities, unchanged = drop_unchanged_rows(
+                mapped_opportunities, self.supabase_client, self.table_name, self.primary_key
+            )
+            self.stats.unchanged += unchanged
+
+        success = (
+            self.loader.load(
+                data=mapped_opportunities,
+                table_name=self.table_name,
+                write_disposition="merge",
+                primary_key=self.primary_key,
+                columns=APP_OPPORTUNITIES_COLUMNS,  # CRITICAL: JSONB type hints for proper storage
+            )
+            if mapped_opportunities
+            else True  # Everything is already up to date
         )
 
         # Update statistics
@@ -236,6 +259,7 @@ class OpportunityStore:
             primary_key=self.primary_key,
             batch_size=batch_size,
             write_disposition="merge",
+            columns=APP_OPPORTUNITIES_COLUMNS,
         )
 
         # Update statistics
@@ -0,0 +1,101 @@
+"""
+Thread-safe request rate limiting for the Reddit API.
+
+Reddit grants each OAuth client a fixed number of requests per minute. When
+collection work runs concurrently, every worker sharing a client must draw
+from the same budget; a fixed ``time.sleep`` per subreddit either wastes the
+budget (sequential) or overruns it (concurrent). ``RequestRateLimiter`` is a
+sliding-window limiter that any number of threads can share.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Requests per minute granted to one Reddit OAuth client
+REDDIT_REQUESTS_PER_MINUTE = 100
+
+
+class RequestRateLimiter:
+    """
+    Sliding-window rate limiter shared between threads.
+
+    Attributes:
+        max_requests_per_minute: Request budget per 60 second window
+        window_seconds: Length of the sliding window
+
+    Examples:
+        >>> limiter = RequestRateLimiter(max_requests_per_minute=100)
+        >>> limiter.acquire()          # one request
+        >>> limiter.acquire(cost=4)    # a unit of work that makes ~4 requests
+        >>> limiter.get_remaining_requests()
+        95
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: int = REDDIT_REQUESTS_PER_MINUTE,
+        window_seconds: float = 60.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_requests_per_minute: Request budget per window (must be positive)
+            window_seconds: Window length in seconds (default: 60)
+
+        Raises:
+            ValueError: If the budget is not positive
+        """
+        if max_requests_per_minute <= 0:
+            raise ValueError("max_requests_per_minute must be positive")
+
+        self.max_requests_per_minute = max_requests_per_minute
+        self.window_seconds = window_seconds
+        self._request_times: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        while self._request_times and now - self._request_times[0] >= self.window_seconds:
+            self._request_times.popleft()
+
+    def acquire(self, cost: int = 1) -> float:
+        """
+        Block until ``cost`` requests fit in the window, then record them.
+
+        A cost larger than the whole budget is clamped to the budget so a
+        single oversized unit of work cannot deadlock.
+
+        Args:
+            cost: Number of requests the caller is about to make
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        cost = max(1, min(cost, self.max_requests_per_minute))
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._expire(now)
+                free = self.max_requests_per_minute - len(self._request_times)
+                if free >= cost:
+                    self._request_times.extend([now] * cost)
+                    return waited
+                # Wait until enough of the oldest requests leave the window
+                release_at = self._request_times[cost - free - 1] + self.window_seconds
+                wait_time = max(release_at - now, 0.01)
+
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+            time.sleep(wait_time)
+            waited += wait_time
+
+    def get_remaining_requests(self) -> int:
+        """Get number of requests remaining in the current window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return self.max_requests_per_minute - len(self._request_times)
@@ -0,0 +1,281 @@
+"""
+Pool of Reddit API clients spread across several OAuth app credentials.
+
+One Reddit app is limited to REDDIT_REQUESTS_PER_MINUTE requests, so
+collection throughput is capped no matter how many workers run. The pool
+holds one PRAW client per configured credential. Each client has its own
+RequestRateLimiter wired into PRAW's requestor, so every HTTP request counts
+against its credential's budget. Each new lookup (``subreddit()``,
+``submission()``, ``info()``...) goes to the credential with the most
+remaining budget. Objects returned by a lookup stay bound to that
+credential's client, so a subreddit's listings are fetched with the same
+credential that resolved it.
+
+Credentials are read from the environment:
+
+    REDDIT_PUBLIC / REDDIT_SECRET / REDDIT_USER_AGENT        (credential 1)
+    REDDIT_PUBLIC_2 / REDDIT_SECRET_2 / REDDIT_USER_AGENT_2  (credential 2)
+    ...
+
+Numbering stops at the first missing pair. REDDIT_USER_AGENT_<n> defaults to
+REDDIT_USER_AGENT.
+
+The pool exposes the lookup methods the collectors use, so it can be passed
+anywhere a ``praw.Reddit`` client is expected (``collect_data``,
+``RedditAPIFetcher``, ``reddit_activity_aware``).
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import praw
+import prawcore
+
+from core.utils.rate_limiter import REDDIT_REQUESTS_PER_MINUTE, RequestRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Highest credential index probed in the environment
+MAX_CREDENTIALS = 32
+
+
+@dataclass(frozen=True)
+class RedditCredential:
+    """
+    One Reddit OAuth app credential.
+
+    Attributes:
+        client_id: Reddit app client ID
+        client_secret: Reddit app client secret
+        user_agent: User agent sent with this credential's requests
+    """
+
+    client_id: str
+    client_secret: str
+    user_agent: str
+
+
+class RateLimitedRequestor(prawcore.Requestor):
+    """prawcore requestor that charges every HTTP request to a rate limiter."""
+
+    def __init__(self, *args: Any, rate_limiter: RequestRateLimiter, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        self.rate_limiter.acquire()
+        return super().request(*args, **kwargs)
+
+
+@dataclass
+class PooledClient:
+    """
+    A credential together with its client and request budget.
+
+    Attributes:
+        credential: The OAuth credential
+        client: PRAW client authenticated with the credential
+        rate_limiter: The credential's request budget
+        assignments: Number of lookups routed to this credential
+    """
+
+    credential: RedditCredential
+    client: Any
+    rate_limiter: RequestRateLimiter
+    assignments: int = 0
+
+
+def load_reddit_credentials(environ: Mapping[str, str] | None = None) -> list[RedditCredential]:
+    """
+    Read numbered Reddit credentials from the environment.
+
+    Args:
+        environ: Environment mapping (default: os.environ)
+
+    Returns:
+        List of RedditCredential (empty if REDDIT_PUBLIC is not set)
+    """
+    environ = os.environ if environ is None else environ
+    default_user_agent = environ.get("REDDIT_USER_AGENT", "")
+    credentials = []
+
+    for index in range(1, MAX_CREDENTIALS + 1):
+        suffix = "" if index == 1 else f"_{index}"
+        client_id = environ.get(f"REDDIT_PUBLIC{suffix}")
+        client_secret = environ.get(f"REDDIT_SECRET{suffix}")
+        if not client_id or not client_secret:
+            break
+        credentials.append(
+            RedditCredential(
+                client_id=client_id,
+                client_secret=client_secret,
+                user_agent=environ.get(f"REDDIT_USER_AGENT{suffix}", default_user_agent),
+            )
+        )
+
+    return credentials
+
+
+def create_rate_limited_client(
+    credential: RedditCredential, rate_limiter: RequestRateLimiter
+) -> praw.Reddit:
+    """
+    Create a PRAW client whose HTTP requests are charged to ``rate_limiter``.
+
+    Args:
+        credential: OAuth credential to authenticate with
+        rate_limiter: The credential's request budget
+
+    Returns:
+        praw.Reddit: Read-only Reddit client
+    """
+    return praw.Reddit(
+        client_id=credential.client_id,
+        client_secret=credential.client_secret,
+        user_agent=credential.user_agent,
+        requestor_class=RateLimitedRequestor,
+        requestor_kwargs={"rate_limiter": rate_limiter},
+    )
+
+
+class RedditClientPool:
+    """
+    Route Reddit API lookups across several credentials by remaining budget.
+
+    Attributes:
+        members: One PooledClient per credential
+        requests_per_minute: Combined request budget of all credentials
+
+    Examples:
+        >>> pool = RedditClientPool.from_env()
+        >>> subreddit = pool.subreddit("SaaS")  # bound to the least-used credential
+        >>> for submission in subreddit.new(limit=100):
+        ...     process(submission)
+        >>> pool.get_statistics()
+    """
+
+    def __init__(
+        self,
+        credentials: list[RedditCredential],
+        requests_per_minute: int = REDDIT_REQUESTS_PER_MINUTE,
+        client_factory: Callable[[RedditCredential, RequestRateLimiter], Any] | None = None,
+    ):
+        """
+        Initialize the pool with one client per credential.
+
+        Args:
+            credentials: OAuth credentials (at least one)
+            requests_per_minute: Request budget of each credential
+            client_factory: Builds a client for a credential and its limiter
+                (default: create_rate_limited_client)
+
+        Raises:
+            ValueError: If no credentials are given
+        """
+        if not credentials:
+            raise ValueError(
+                "RedditClientPool needs at least one credential. Set REDDIT_PUBLIC, "
+                "REDDIT_SECRET and REDDIT_USER_AGENT (and REDDIT_PUBLIC_2, ... for more)."
+            )
+
+        client_factory = client_factory or create_rate_limited_client
+        self.members: list[PooledClient] = []
+        for credential in credentials:
+            rate_limiter = RequestRateLimiter(requests_per_minute)
+            self.members.append(
+                PooledClient(
+                    credential=credential,
+                    client=client_factory(credential, rate_limiter),
+                    rate_limiter=rate_limiter,
+                )
+            )
+        self.requests_per_minute = requests_per_minute * len(self.members)
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"Reddit client pool ready with {len(self.members)} credential(s), "
+            f"{self.requests_per_minute} requests/minute combined"
+        )
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        requests_per_minute: int = REDDIT_REQUESTS_PER_MINUTE,
+    ) -> "RedditClientPool":
+        """
+        Create a pool from the numbered REDDIT_PUBLIC/REDDIT_SECRET variables.
+
+        Args:
+            environ: Environment mapping (default: os.environ)
+            requests_per_minute: Request budget of each credential
+
+        Returns:
+            RedditClientPool
+
+        Raises:
+            ValueError: If no credentials are configured
+        """
+        return cls(load_reddit_credentials(environ), requests_per_minute)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def acquire(self) -> PooledClient:
+        """
+        Pick the credential with the most remaining budget.
+
+        Ties go to the credential with the fewest assignments so far, which
+        spreads work round-robin while every budget is untouched.
+
+        Returns:
+            PooledClient the next lookup should use
+        """
+        with self._lock:
+            member = max(
+                self.members,
+                key=lambda m: (m.rate_limiter.get_remaining_requests(), -m.assignments),
+            )
+            member.assignments += 1
+            return member
+
+    def client(self) -> Any:
+        """Return the PRAW client with the most remaining budget."""
+        return self.acquire().client
+
+    def subreddit(self, display_name: str) -> Any:
+        """Return a lazy Subreddit bound to the least-used credential."""
+        return self.client().subreddit(display_name)
+
+    # id shadows the builtin to keep the keyword of praw.Reddit.submission()
+    def submission(self, id: str | None = None, url: str | None = None) -> Any:  # noqa: A002
+        """Return a lazy Submission bound to the least-used credential."""
+        return self.client().submission(id=id, url=url)
+
+    def redditor(self, name: str | None = None, fullname: str | None = None) -> Any:
+        """Return a lazy Redditor bound to the least-used credential."""
+        return self.client().redditor(name=name, fullname=fullname)
+
+    def info(self, **kwargs: Any) -> Any:
+        """Run an /api/info lookup on the least-used credential."""
+        return self.client().info(**kwargs)
+
+    def get_statistics(self) -> list[dict[str, Any]]:
+        """
+        Report per-credential usage.
+
+        Returns:
+            List of dicts with client_id, assignments and remaining_requests
+        """
+        return [
+            {
+                "client_id": member.credential.client_id,
+                "assignments": member.assignments,
+                "remaining_requests": member.rate_limiter.get_remaining_requests(),
+            }
+            for member in self.members
+        ]
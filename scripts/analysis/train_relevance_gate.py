@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Train and evaluate the learned pre-AI relevance gate from exported rows.
+
+Each row is one post that has already been through enrichment, with its
+outcome score. Export them from Supabase (any of CSV, JSON, JSONL or
+Parquet), for example:
+
+    COPY (
+        SELECT s.title, s.content, s.score, s.num_comments, ao.subreddit, ao.final_score
+        FROM app_opportunities ao
+        JOIN submissions s ON s.reddit_id = ao.submission_id
+        WHERE ao.final_score IS NOT NULL
+    ) TO '/tmp/enriched_posts.csv' WITH CSV HEADER;
+
+Use --score-column llm_monetization_score with rows joined from
+llm_monetization_analysis to gate the monetization analysis instead.
+
+Usage:
+    python scripts/analysis/train_relevance_gate.py train enriched_posts.csv \\
+        --output models/relevance_gate.npz
+    python scripts/analysis/train_relevance_gate.py evaluate holdout.csv \\
+        --model models/relevance_gate.npz
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.quality_filters.relevance_gate import (
+    DEFAULT_SCORE_THRESHOLD,
+    DEFAULT_TARGET_RECALL,
+    RelevanceGate,
+    labels_from_scores,
+)
+
+
+def load_rows(path: Path) -> list[dict]:
+    """Read exported rows into a list of dicts."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        frame = pd.read_csv(path)
+    elif suffix == ".jsonl":
+        frame = pd.read_json(path, lines=True)
+    elif suffix == ".json":
+        frame = pd.read_json(path)
+    elif suffix == ".parquet":
+        frame = pd.read_parquet(path)
+    else:
+        raise ValueError(f"Unsupported export format: {path.suffix}")
+
+    # NaN -> None so missing text and scores behave like missing dict keys
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def print_summary(summary: dict) -> None:
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+
+
+def train(args: argparse.Namespace) -> int:
+    rows = load_rows(args.input)
+    labels = labels_from_scores(rows, args.score_column, args.score_threshold)
+    print(f"Loaded {len(rows)} rows, {int(labels.sum())} scored >= {args.score_threshold} "
+          f"on {args.score_column}")
+
+    start = time.perf_counter()
+    gate = RelevanceGate.train(
+        rows,
+        labels,
+        target_recall=args.target_recall,
+        validation_fraction=args.validation_fraction,
+        test_fraction=args.test_fraction,
+        epochs=args.epochs,
+    )
+    print(f"Trained in {time.perf_counter() - start:.1f}s")
+
+    gate.metadata.update({
+        "score_column": args.score_column,
+        "score_threshold": args.score_threshold,
+        "source": str(args.input),
+    })
+    gate.save(args.output)
+
+    print("\nHeld-out test evaluation:")
+    print_summary(gate.metadata["evaluation"])
+    print(f"\nSaved gate to {args.output}")
+    return 0
+
+
+def evaluate(args: argparse.Namespace) -> int:
+    gate = RelevanceGate.load(args.model)
+    score_column = args.score_column or gate.metadata.get("score_column", "final_score")
+    score_threshold = args.score_threshold or gate.metadata.get(
+        "score_threshold", DEFAULT_SCORE_THRESHOLD
+    )
+
+    rows = load_rows(args.input)
+    labels = labels_from_scores(rows, score_column, score_threshold)
+
+    start = time.perf_counter()
+    evaluation = gate.evaluate(rows, labels)
+    elapsed = time.perf_counter() - start
+
+    print(f"Evaluated {len(rows)} rows ({score_column} >= {score_threshold}) "
+          f"in {elapsed:.2f}s ({len(rows) / max(elapsed, 1e-9):,.0f} posts/s)")
+    print_summary(evaluation.get_summary())
+    if args.json:
+        print(json.dumps(evaluation.get_summary()))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Train or evaluate the pre-AI relevance gate")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = subparsers.add_parser("train", help="Train a gate from exported rows")
+    train_parser.add_argument("input", type=Path, help="Exported rows (csv, json, jsonl, parquet)")
+    train_parser.add_argument("--output", type=Path, default=Path("models/relevance_gate.npz"))
+    train_parser.add_argument("--score-column", default="final_score")
+    train_parser.add_argument("--score-threshold", type=float, default=DEFAULT_SCORE_THRESHOLD)
+    train_parser.add_argument("--target-recall", type=float, default=DEFAULT_TARGET_RECALL)
+    train_parser.add_argument("--validation-fraction", type=float, default=0.2)
+    train_parser.add_argument("--test-fraction", type=float, default=0.2)
+    train_parser.add_argument("--epochs", type=int, default=300)
+    train_parser.set_defaults(func=train)
+
+    eval_parser = subparsers.add_parser("evaluate", help="Evaluate a saved gate on exported rows")
+    eval_parser.add_argument("input", type=Path, help="Exported rows (csv, json, jsonl, parquet)")
+    eval_parser.add_argument("--model", type=Path, required=True)
+    eval_parser.add_argument("--score-column", help="Default: the column the gate was trained on")
+    eval_parser.add_argument("--score-threshold", type=float)
+    eval_parser.add_argument("--json", action="store_true", help="Also print the summary as JSON")
+    eval_parser.set_defaults(func=evaluate)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,7 @@ Usage:
 
 Options:
     --output-file FILE     JSON file to save results (default: migration_results.json)
-    --batch-size N         Number of records to process in each batch (default: 100)
+    --batch-size N         Number of records to deduplicate in each batch (default: 100)
     --dry-run             Show what would be processed without actually processing
     --verbose             Enable verbose logging
 """
@@ -27,13 +27,13 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from core.deduplication import SimpleDeduplicator
+
+# MigrationScript raises ImportError when supabase is missing
 try:
-    from core.deduplication import SimpleDeduplicator
     from supabase import create_client
-except ImportError as e:
-    print(f"Error: Required dependency not found: {e}")
-    print("Please install required packages: pip install supabase")
-    sys.exit(1)
+except ImportError:
+    create_client = None
 
 # Import configuration
 try:
@@ -49,7 +49,7 @@ class MigrationScript:
 
     This class handles the complete migration workflow:
     1. Fetch opportunities without business_concept_id
-    2. Process each through the deduplication pipeline
+    2. Process them in batches through the deduplication pipeline
     3. Track progress and statistics
     4. Save comprehensive results to JSON file
     """
@@ -128,7 +128,7 @@ class MigrationScript:
 
         Args:
             opportunities: List of opportunity dictionaries
-            batch_size: Number of records to process before showing progress
+            batch_size: Number of records to deduplicate per batch
 
         Returns:
             List of processing results for each opportunity
@@ -138,10 +138,27 @@ class MigrationScript:
 
         print(f"Starting processing of {total_opportunities} opportunities...")
 
-        for i, opportunity in enumerate(opportunities):
+        for start in range(0, total_opportunities, batch_size):
+            batch = opportunities[start:start + batch_size]
             try:
-                # Process individual opportunity
-                result = self.deduplicator.process_opportunity(opportunity)
+                # Process the batch with bulk lookups, inserts and updates
+                batch_results = self.deduplicator.process_opportunities(batch)
+            except Exception as e:
+                # Handle unexpected errors for the whole batch
+                self.logger.error(
+                    f"Unexpected error processing batch starting at {start}: {e}"
+                )
+                batch_results = [
+                    {
+                        "success": False,
+                        "opportunity_id": opportunity.get("id"),
+                        "error": f"Unexpected error: {e}",
+                        "message": "Processing failed: unexpected error",
+                    }
+                    for opportunity in batch
+                ]
+
+            for result in batch_results:
                 results.append(result)
 
                 # Update statistics
@@ -155,25 +172,8 @@ class MigrationScript:
                 else:
                     self.statistics["errors"] += 1
 
-                # Show progress every batch_size records
-                if (i + 1) % batch_size == 0:
-                    self._print_progress(i + 1, total_opportunities)
-
-            except Exception as e:
-                # Handle unexpected errors for individual opportunities
-                error_result = {
-                    "success": False,
-                    "opportunity_id": opportunity.get("id"),
-                    "error": f"Unexpected error: {e}",
-                    "message": "Processing failed: unexpected error",
-                }
-                results.append(error_result)
-                self.statistics["total_processed"] += 1
-                self.statistics["errors"] += 1
-                self.logger.error(
-                    f"Unexpected error processing opportunity "
-                    f"{opportunity.get('id')}: {e}"
-                )
+            # Show progress after every batch
+            self._print_progress(start + len(batch), total_opportunities)
 
         # Final progress update
         print(f"\nProcessing complete! Total processed: {total_opportunities}")
@@ -254,7 +254,7 @@ Examples:
         "--batch-size",
         type=int,
         default=100,
-        help="Number of records to process before showing progress (default: 100)",
+        help="Number of records to deduplicate in each batch (default: 100)",
     )
 
     parser.add_argument(
@@ -294,7 +294,7 @@ def main() -> None:
     try:
         # Initialize migration script
         print("Initializing migration script...")
-        migration_script = MigrationScript(supabase_url, supabase_key)
+        migration_script = MigrationScript(supabase_url=supabase_url, supabase_key=supabase_key)
 
         # Fetch opportunities without business_concept_id
         print("Fetching opportunities without business_concept_id...")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark the reddit_activity_aware DLT source.
+
+Runs the source against a simulated Reddit client (fixed latency per API
+call, no network) and extracts it with a local DLT pipeline, once
+sequentially and once with parallel activity measurement and extraction.
+
+Usage:
+    python scripts/testing/benchmark_activity_source.py
+    python scripts/testing/benchmark_activity_source.py --subreddits 50 --latency 0.05
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import dlt
+
+from core.dlt_reddit_source import reddit_activity_aware
+from core.utils.rate_limiter import RequestRateLimiter
+
+
+class SimulatedSubreddit:
+    """Subreddit whose listing calls sleep for a fixed latency.
+
+    Like a lazy PRAW Subreddit, the first metadata read costs one /about
+    call unless the object came hydrated from /api/info.
+    """
+
+    METADATA = {
+        "subscribers": 500_000,
+        "subreddit_type": "public",
+        "over18": False,
+    }
+
+    def __init__(self, name: str, latency: float, counter: "SimulatedReddit",
+                 hydrated: bool = False):
+        self.display_name = name
+        self.public_description = f"r/{name}"
+        self._latency = latency
+        self._counter = counter
+        if hydrated:
+            self.__dict__.update(self.METADATA)
+
+    def __getattr__(self, name: str):
+        if name not in self.METADATA:
+            raise AttributeError(name)
+        self._call()
+        self.__dict__.update(self.METADATA)
+        return self.METADATA[name]
+
+    def _call(self) -> None:
+        self._counter.record_call()
+        time.sleep(self._latency)
+
+    def comments(self, limit: int = 100):
+        self._call()
+        now = time.time()
+        return [SimpleNamespace(created_utc=now - 60 * i) for i in range(min(limit, 100))]
+
+    def top(self, time_filter: str = "day", limit: int = 25):
+        self._call()
+        now = time.time()
+        return [self._submission(i, now) for i in range(min(limit, 20))]
+
+    def _submission(self, index: int, now: float) -> SimpleNamespace:
+        comment = SimpleNamespace(
+            id=f"{self.display_name}_c{index}",
+            body="I struggle with this every week, is there a tool for it?",
+            score=5,
+            created_utc=now - 120,
+            author="user",
+            permalink="",
+            edited=False,
+            stickied=False,
+            parent_id=f"t3_{self.display_name}_{index}",
+        )
+        forest = SimpleNamespace(
+            replace_more=lambda limit=0: self._call(),
+            list=lambda: [comment],
+        )
+        return SimpleNamespace(
+            id=f"{self.display_name}_{index}",
+            title="Struggling with invoicing, anyone know a tool? Looking for advice" if index % 4 == 0 else "Weekly thread",
+            score=120 if index % 4 == 0 else 3,
+            num_comments=40,
+            upvote_ratio=0.95,
+            created_utc=now - 3600,
+            comments=forest,
+        )
+
+
+class SimulatedReddit:
+    """Reddit client stand-in that counts API calls."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def subreddit(self, name: str) -> SimulatedSubreddit:
+        return SimulatedSubreddit(name, self.latency, self)
+
+    def info(self, subreddits: list[str]):
+        for start in range(0, len(subreddits), 100):
+            self.record_call()
+            time.sleep(self.latency)
+            for name in subreddits[start:start + 100]:
+                yield SimulatedSubreddit(name, self.latency, self, hydrated=True)
+
+
+def run_extract(subreddits: list[str], latency: float, max_workers: int, extract_workers: int,
+                requests_per_minute: int, prefetch: bool = True) -> dict:
+    """Extract the source once and return timing and row counts."""
+    os.environ["EXTRACT__WORKERS"] = str(extract_workers)
+    client = SimulatedReddit(latency)
+
+    with tempfile.TemporaryDirectory() as pipelines_dir:
+        pipeline = dlt.pipeline(
+            pipeline_name=f"benchmark_activity_{max_workers}",
+            pipelines_dir=pipelines_dir,
+        )
+        source = reddit_activity_aware(
+            client,
+            subreddits,
+            min_activity_score=0.0,
+            min_opportunity_score=30.0,
+            max_workers=max_workers,
+            rate_limiter=RequestRateLimiter(requests_per_minute),
+        )
+
+        start = time.perf_counter()
+        if prefetch:
+            info = pipeline.extract(source)
+        else:
+            with patch("core.activity_validation.prefetch_subreddits", return_value={}):
+                info = pipeline.extract(source)
+        elapsed = time.perf_counter() - start
+
+    rows = {}
+    for metrics in info.metrics.values():
+        for table, table_metrics in metrics[0]["table_metrics"].items():
+            if not table.startswith("_dlt"):
+                rows[table] = rows.get(table, 0) + table_metrics.items_count
+
+    return {"elapsed": elapsed, "api_calls": client.calls, "rows": rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the reddit_activity_aware DLT source")
+    parser.add_argument("--subreddits", type=int, default=50, help="Number of simulated subreddits")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per simulated API call")
+    parser.add_argument("--max-workers", type=int, default=8, help="Parallel activity measurements")
+    parser.add_argument("--extract-workers", type=int, default=8, help="DLT extract thread pool size")
+    parser.add_argument(
+        "--no-prefetch", action="store_true", help="Skip the /api/info metadata prefetch"
+    )
+    parser.add_argument(
+        "--requests-per-minute", type=int, default=100_000,
+        help="Rate limiter budget (high by default so latency, not the budget, is measured)",
+    )
+    args = parser.parse_args()
+
+    subreddits = [f"sub{i:03d}" for i in range(args.subreddits)]
+
+    print("=" * 70)
+    print(f"reddit_activity_aware benchmark: {args.subreddits} subreddits, "
+          f"{args.latency * 1000:.0f} ms/call")
+    print("=" * 70)
+
+    results = {}
+    for label, max_workers, extract_workers in (
+        ("sequential", 1, 1),
+        ("parallel", args.max_workers, args.extract_workers),
+    ):
+        result = run_extract(
+            subreddits, args.latency, max_workers, extract_workers, args.requests_per_minute,
+            prefetch=not args.no_prefetch,
+        )
+        results[label] = result
+        print(f"\n{label}: {result['elapsed']:.2f}s, {result['api_calls']} API calls")
+        for table, count in sorted(result["rows"].items()):
+            print(f"  {table}: {count} rows")
+
+    speedup = results["sequential"]["elapsed"] / max(results["parallel"]["elapsed"], 1e-9)
+    print(f"\nSpeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
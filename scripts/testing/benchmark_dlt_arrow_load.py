@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark DLTLoader's row-by-row path against its Arrow (columnar) path.
+
+Generates synthetic app_opportunities rows and loads them with the
+APP_OPPORTUNITIES_COLUMNS hints into a local DuckDB file, once as a list of
+dicts and once with columnar=True, then reports rows per second for each.
+No Postgres instance is needed.
+
+Usage:
+    python scripts/testing/benchmark_dlt_arrow_load.py
+    python scripts/testing/benchmark_dlt_arrow_load.py --rows 10000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.dlt import PK_SUBMISSION_ID
+from core.storage.dlt_loader import DUCKDB_DSN_PREFIX, DLTLoader
+from core.storage.opportunity_store import APP_OPPORTUNITIES_COLUMNS
+
+
+def make_opportunities(count: int) -> list[dict]:
+    """Build synthetic opportunities with the field mix the pipeline stores."""
+    return [
+        {
+            "submission_id": f"bench_{i:07d}",
+            "title": f"Looking for a tool to manage chores #{i}",
+            "subreddit": "productivity",
+            "reddit_score": i % 500,
+            "problem_description": "Families lose track of who does which chore",
+            "app_concept": "Shared chore tracker with reminders",
+            "core_functions": "Chore rotation, reminders, progress tracking",
+            "value_proposition": "Fewer arguments about chores",
+            "target_user": "Busy families",
+            "monetization_model": "Subscription",
+            "opportunity_score": 50 + i % 50,
+            "final_score": 40.0 + (i % 600) / 10,
+            "status": "scored",
+            "ai_profile": {"app_name": "ChoreMate", "features": ["rotation", "reminders"]},
+            "app_name": "ChoreMate",
+            "app_category": "Productivity",
+            "core_problems": ["forgotten chores", "unfair split"],
+            "dimension_scores": {"market_demand": 7.5, "pain_intensity": 6.0},
+            "confidence": 0.8,
+            "evidence_based": i % 2 == 0,
+            "trust_badges": ["active_community"],
+            "analyzed_at": "2025-11-20T12:00:00+00:00",
+            "enrichment_version": "v3.0.0",
+        }
+        for i in range(count)
+    ]
+
+
+def run_load(rows: list[dict], columnar: bool, workdir: str) -> float:
+    """Load rows once through DLTLoader and return elapsed seconds."""
+    label = "arrow" if columnar else "dicts"
+    loader = DLTLoader(
+        connection_string=f"{DUCKDB_DSN_PREFIX}{Path(workdir) / f'{label}.duckdb'}",
+        pipelines_dir=workdir,
+    )
+    pipeline_name = f"benchmark_{label}"
+
+    start = time.perf_counter()
+    success = loader.load(
+        data=rows,
+        table_name="app_opportunities",
+        write_disposition="merge",
+        primary_key=PK_SUBMISSION_ID,
+        pipeline_name=pipeline_name,
+        columns=APP_OPPORTUNITIES_COLUMNS,
+        columnar=columnar,
+    )
+    elapsed = time.perf_counter() - start
+
+    if not success:
+        raise RuntimeError(f"{label} load failed: {loader.get_statistics()}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DLTLoader dict vs Arrow loads")
+    parser.add_argument("--rows", type=int, default=50_000, help="Number of synthetic rows")
+    args = parser.parse_args()
+
+    rows = make_opportunities(args.rows)
+
+    print("=" * 70)
+    print(f"DLTLoader benchmark: {args.rows} app_opportunities rows -> DuckDB")
+    print("=" * 70)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, columnar in (("dicts", False), ("arrow", True)):
+            elapsed = run_load(rows, columnar, workdir)
+            results[label] = elapsed
+            print(f"\n{label}: {elapsed:.2f}s, {args.rows / elapsed:,.0f} rows/s")
+
+    speedup = results["dicts"] / max(results["arrow"], 1e-9)
+    print(f"\nSpeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
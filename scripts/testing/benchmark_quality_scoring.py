@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark pre-AI quality filtering throughput.
+
+Filters a synthetic batch of posts twice: once post by post with
+should_analyze_with_ai() (the previous filter_submissions_batch loop) and
+once with the columnar evaluate_submissions_batch(). Both runs use the same
+frozen clock, and the script checks that they agree on every decision,
+score and reason.
+
+Usage:
+    python scripts/testing/benchmark_quality_scoring.py
+    python scripts/testing/benchmark_quality_scoring.py --posts 250000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.quality_filters.batch_scorer import evaluate_submissions_batch
+from core.quality_filters.pre_filter import should_analyze_with_ai
+from core.quality_filters.thresholds import PROBLEM_KEYWORDS
+
+FILLER_WORDS = (
+    "the our team uses a spreadsheet for invoicing every week and it takes hours "
+    "is there any tool that handles this better than what we have now"
+).split()
+
+
+def generate_posts(count: int, now: float, seed: int = 42) -> list[dict]:
+    """Build posts shaped like collected Reddit submissions."""
+    rng = random.Random(seed)
+    vocabulary = FILLER_WORDS * 4 + PROBLEM_KEYWORDS
+    posts = []
+
+    for i in range(count):
+        created_utc = now - rng.uniform(0, 30 * 24 * 3600)
+        posts.append({
+            "id": f"p{i}",
+            "title": " ".join(rng.choices(vocabulary, k=rng.randint(5, 15))).capitalize(),
+            "text": " ".join(rng.choices(vocabulary, k=rng.randint(20, 120))),
+            "upvotes": rng.choice([0, 2, 5, 10, 40, 150, 900]),
+            "num_comments": rng.choice([0, 1, 3, 12, 60]),
+            # Collected rows carry either Unix times or ISO strings
+            "created_utc": (
+                created_utc if i % 2 else time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(created_utc))
+            ),
+        })
+
+    return posts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pre-AI quality filtering throughput")
+    parser.add_argument("--posts", type=int, default=100_000, help="Number of synthetic posts")
+    parser.add_argument("--threshold", type=float, default=15.0, help="Quality score threshold")
+    args = parser.parse_args()
+
+    now = time.time()
+    posts = generate_posts(args.posts, now)
+
+    print("=" * 70)
+    print(f"Pre-AI quality filter benchmark: {args.posts:,} posts")
+    print("=" * 70)
+
+    with patch("core.quality_filters.quality_scorer.time.time", return_value=now):
+        start = time.perf_counter()
+        scalar = [should_analyze_with_ai(post, args.threshold) for post in posts]
+        scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decisions, scores, reasons = evaluate_submissions_batch(posts, args.threshold, now=now)
+    batch_elapsed = time.perf_counter() - start
+
+    batch = list(zip(decisions.tolist(), scores, reasons))
+    mismatches = sum(a != b for a, b in zip(scalar, batch))
+
+    print(f"\nscalar: {scalar_elapsed:.2f}s ({args.posts / scalar_elapsed:,.0f} posts/s)")
+    print(f"batch:  {batch_elapsed:.2f}s ({args.posts / batch_elapsed:,.0f} posts/s)")
+    print(f"\nSpeedup: {scalar_elapsed / max(batch_elapsed, 1e-9):.1f}x")
+    print(f"Passed: {int(decisions.sum()):,} / {args.posts:,}")
+    print(f"Mismatches: {mismatches}")
+
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
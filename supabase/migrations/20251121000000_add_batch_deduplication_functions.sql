@@ -0,0 +1,94 @@
+-- Add Batch Deduplication Functions
+-- Purpose: Let SimpleDeduplicator.process_opportunities() mark opportunities and
+--          update concept stats for a whole batch in one round trip each
+-- Risk: LOW (new functions only) | Duration: ~5 seconds
+--
+-- The per-row equivalents are mark_opportunity_duplicate, mark_opportunity_unique
+-- and increment_concept_count from 20251119005848_add_deduplication_schema.sql.
+
+-- ==============================================================================
+-- STEP 1: Increment submission counts for many concepts
+-- ==============================================================================
+
+CREATE OR REPLACE FUNCTION increment_concept_counts(
+  p_concept_ids BIGINT[],
+  p_increments INTEGER[]
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE business_concepts bc
+  SET submission_count = bc.submission_count + d.increment,
+      last_updated_at = NOW()
+  FROM (
+    SELECT concept_id, SUM(increment)::INTEGER AS increment
+    FROM unnest(p_concept_ids, p_increments) AS u(concept_id, increment)
+    GROUP BY concept_id
+  ) d
+  WHERE bc.id = d.concept_id;
+END;
+$$;
+
+-- ==============================================================================
+-- STEP 2: Mark many opportunities as duplicate or unique
+-- ==============================================================================
+-- p_marks is a JSON array of
+--   {"opportunity_id", "concept_id", "is_duplicate", "primary_opportunity_id"}
+-- Returns the IDs of the opportunities that were updated. As in
+-- mark_opportunity_duplicate, each duplicate increments its concept's count.
+
+CREATE OR REPLACE FUNCTION mark_opportunities_batch(p_marks JSONB)
+RETURNS SETOF UUID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  RETURN QUERY
+  WITH marks AS (
+    SELECT DISTINCT ON ((m->>'opportunity_id')::UUID)
+      (m->>'opportunity_id')::UUID AS opportunity_id,
+      (m->>'concept_id')::BIGINT AS concept_id,
+      COALESCE((m->>'is_duplicate')::BOOLEAN, FALSE) AS is_duplicate,
+      NULLIF(m->>'primary_opportunity_id', '')::UUID AS primary_opportunity_id,
+      o.ordinality
+    FROM jsonb_array_elements(p_marks) WITH ORDINALITY AS o(m, ordinality)
+    WHERE m->>'opportunity_id' IS NOT NULL
+      AND m->>'concept_id' IS NOT NULL
+    -- The last mark for an opportunity wins, as with per-row calls
+    ORDER BY (m->>'opportunity_id')::UUID, o.ordinality DESC
+  ),
+  updated AS (
+    UPDATE opportunities_unified ou
+    SET
+      business_concept_id = marks.concept_id,
+      is_duplicate = marks.is_duplicate,
+      duplicate_of_id = CASE
+        WHEN marks.is_duplicate
+          THEN COALESCE(marks.primary_opportunity_id, bc.primary_opportunity_id)
+        ELSE NULL
+      END,
+      updated_at = NOW()
+    FROM marks
+    LEFT JOIN business_concepts bc ON bc.id = marks.concept_id
+    WHERE ou.id = marks.opportunity_id
+    RETURNING ou.id, marks.concept_id, marks.is_duplicate
+  ),
+  counted AS (
+    UPDATE business_concepts bc
+    SET submission_count = bc.submission_count + c.increment,
+        last_updated_at = NOW()
+    FROM (
+      SELECT concept_id, COUNT(*)::INTEGER AS increment
+      FROM updated
+      WHERE is_duplicate
+      GROUP BY concept_id
+    ) c
+    WHERE bc.id = c.concept_id
+    RETURNING bc.id
+  )
+  SELECT updated.id FROM updated;
+END;
+$$;
+
+COMMENT ON FUNCTION increment_concept_counts(BIGINT[], INTEGER[]) IS 'Batch version of increment_concept_count';
+COMMENT ON FUNCTION mark_opportunities_batch(JSONB) IS 'Batch version of mark_opportunity_duplicate / mark_opportunity_unique';
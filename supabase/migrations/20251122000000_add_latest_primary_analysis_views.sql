@@ -0,0 +1,45 @@
+-- Add Latest Primary Analysis Views
+-- Purpose: One-query lookup of the analysis to copy for every concept in a batch
+-- Risk: LOW (views only) | Duration: ~5 seconds
+--
+-- AgnoSkipLogic.copy_agno_analyses_batch() and
+-- ProfilerSkipLogic.copy_profiler_analyses_batch() read these views with
+-- business_concept_id IN (...) instead of querying each concept separately and
+-- picking the newest row in Python.
+
+-- ==============================================================================
+-- STEP 1: Most recent primary Agno analysis per concept
+-- ==============================================================================
+
+CREATE OR REPLACE VIEW latest_primary_agno_analysis AS
+SELECT DISTINCT ON (business_concept_id) *
+FROM llm_monetization_analysis
+WHERE business_concept_id IS NOT NULL
+  AND copied_from_primary = FALSE
+ORDER BY business_concept_id, analyzed_at DESC NULLS LAST;
+
+-- ==============================================================================
+-- STEP 2: Most recent primary AI profile per concept
+-- ==============================================================================
+
+CREATE OR REPLACE VIEW latest_primary_profiler_analysis AS
+SELECT DISTINCT ON (business_concept_id) *
+FROM workflow_results
+WHERE business_concept_id IS NOT NULL
+  AND copied_from_primary = FALSE
+ORDER BY business_concept_id, processed_at DESC NULLS LAST;
+
+-- ==============================================================================
+-- STEP 3: Indexes so DISTINCT ON reads the newest row per concept directly
+-- ==============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_llm_monetization_primary_latest
+ON llm_monetization_analysis (business_concept_id, analyzed_at DESC NULLS LAST)
+WHERE copied_from_primary = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_workflow_results_primary_latest
+ON workflow_results (business_concept_id, processed_at DESC NULLS LAST)
+WHERE copied_from_primary = FALSE;
+
+COMMENT ON VIEW latest_primary_agno_analysis IS 'Most recent non-copied llm_monetization_analysis row per business concept';
+COMMENT ON VIEW latest_primary_profiler_analysis IS 'Most recent non-copied workflow_results row per business concept';
@@ -0,0 +1,80 @@
+-- Add Concept Analysis Lease
+-- Purpose: Stop concurrent pipeline workers from paying for fresh analysis of
+--          the same business concept at the same time
+-- Risk: LOW (nullable columns + new functions) | Duration: ~5 seconds
+--
+-- OpportunityPipeline takes a lease (BusinessConceptManager.acquire_analysis_lease)
+-- before analyzing a concept's representative submission, and releases it once
+-- the run has stored results and set has_agno_analysis / has_profiler_analysis.
+-- A lease that is never released expires after p_ttl_seconds.
+
+-- ==============================================================================
+-- STEP 1: Lease columns
+-- ==============================================================================
+
+ALTER TABLE business_concepts
+ADD COLUMN IF NOT EXISTS analysis_lease_holder TEXT,
+ADD COLUMN IF NOT EXISTS analysis_lease_expires_at TIMESTAMPTZ;
+
+-- ==============================================================================
+-- STEP 2: Acquire / release
+-- ==============================================================================
+-- The conditional UPDATE is atomic, so at most one holder wins. A concept that
+-- already has analysis from a service the caller runs cannot be leased: its
+-- submissions should copy instead. p_require_agno / p_require_profiler match
+-- the caller's enabled services, so analysis from a disabled service (e.g.
+-- has_agno_analysis on a profiler-only run) does not block the lease.
+
+CREATE OR REPLACE FUNCTION acquire_concept_analysis_lease(
+  p_concept_id BIGINT,
+  p_holder TEXT,
+  p_ttl_seconds INTEGER DEFAULT 900,
+  p_require_agno BOOLEAN DEFAULT TRUE,
+  p_require_profiler BOOLEAN DEFAULT TRUE
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF p_concept_id IS NULL OR p_holder IS NULL THEN
+    RETURN FALSE;
+  END IF;
+
+  UPDATE business_concepts
+  SET
+    analysis_lease_holder = p_holder,
+    analysis_lease_expires_at = NOW() + make_interval(secs => p_ttl_seconds)
+  WHERE id = p_concept_id
+    AND NOT (p_require_agno AND COALESCE(has_agno_analysis, FALSE))
+    AND NOT (p_require_profiler AND COALESCE(has_profiler_analysis, FALSE))
+    AND (
+      analysis_lease_holder IS NULL
+      OR analysis_lease_holder = p_holder
+      OR analysis_lease_expires_at < NOW()
+    );
+
+  RETURN FOUND;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION release_concept_analysis_lease(
+  p_concept_id BIGINT,
+  p_holder TEXT
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE business_concepts
+  SET
+    analysis_lease_holder = NULL,
+    analysis_lease_expires_at = NULL
+  WHERE id = p_concept_id
+    AND analysis_lease_holder = p_holder;
+
+  RETURN FOUND;
+END;
+$$;
+
+COMMENT ON COLUMN business_concepts.analysis_lease_holder IS 'Worker currently running fresh analysis for this concept';
+COMMENT ON COLUMN business_concepts.analysis_lease_expires_at IS 'When analysis_lease_holder''s lease lapses';
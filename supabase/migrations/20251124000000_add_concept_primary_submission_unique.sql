@@ -0,0 +1,26 @@
+-- Add Unique Primary Submission To Business Concepts
+-- Purpose: Give BusinessConceptManager.get_or_create_concepts() a conflict
+--          target so concurrent workers resolve to one concept per submission
+-- Risk: LOW (new columns + unique index) | Duration: ~5 seconds
+--
+-- get_or_create_concepts() upserts with on_conflict=primary_submission_id,
+-- which requires a unique index on that column. If older select-then-insert
+-- runs left duplicate rows behind, the index build fails and lists them; merge
+-- those concepts before re-running this migration.
+
+-- ==============================================================================
+-- STEP 1: Columns used by BusinessConceptManager
+-- ==============================================================================
+
+ALTER TABLE business_concepts
+ADD COLUMN IF NOT EXISTS primary_submission_id TEXT,
+ADD COLUMN IF NOT EXISTS concept_text TEXT;
+
+-- ==============================================================================
+-- STEP 2: One concept per primary submission
+-- ==============================================================================
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_business_concepts_primary_submission_id
+ON business_concepts (primary_submission_id);
+
+COMMENT ON COLUMN business_concepts.primary_submission_id IS 'Submission that first introduced this concept (upsert key)';
@@ -0,0 +1,21 @@
+-- Add Content Hash Columns
+-- Purpose: Let the storage services skip merge loads for rows that did not change
+-- Risk: LOW (nullable columns) | Duration: ~5 seconds
+--
+-- HybridStore and OpportunityStore stamp each row with content_hash
+-- (core/storage/content_hash.py), read the stored hashes for a batch with
+-- submission_id IN (...), and merge only rows whose hash differs. Both
+-- lookups use the existing submission_id primary key / unique index.
+
+-- ==============================================================================
+-- STEP 1: Hash columns
+-- ==============================================================================
+
+ALTER TABLE app_opportunities
+ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+ALTER TABLE submissions
+ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN app_opportunities.content_hash IS 'Hash of the row content at last load; unchanged rows are not re-merged';
+COMMENT ON COLUMN submissions.content_hash IS 'Hash of the row content at last load; unchanged rows are not re-merged';
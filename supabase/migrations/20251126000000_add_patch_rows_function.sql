@@ -0,0 +1,71 @@
+-- Add patch_rows Function
+-- Purpose: Let enrichment write-back update only the columns a service owns,
+--          in one bulk UPDATE per table, instead of merging whole rows
+-- Risk: LOW (new function only) | Duration: ~1 second
+--
+-- HybridStore.patch() sends each batch as JSONB rows holding the key plus the
+-- owned columns. Rows are matched on p_key; a NULL in the batch never
+-- overwrites a stored value, so columns written by other services (e.g. trust
+-- scores) survive without a read-before-write. Returns the keys that were
+-- updated; callers insert the remaining rows with a normal merge load.
+
+-- ==============================================================================
+-- STEP 1: patch_rows
+-- ==============================================================================
+-- Only whitelisted tables can be patched, and column names are taken from
+-- information_schema, so unknown names in p_columns are ignored.
+
+CREATE OR REPLACE FUNCTION patch_rows(
+  p_table TEXT,
+  p_key TEXT,
+  p_columns TEXT[],
+  p_rows JSONB,
+  p_reset_columns TEXT[] DEFAULT '{}'
+)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_set TEXT;
+  v_reset TEXT;
+BEGIN
+  IF p_table NOT IN ('app_opportunities', 'submissions') THEN
+    RAISE EXCEPTION 'patch_rows: table % cannot be patched', p_table;
+  END IF;
+
+  SELECT string_agg(format('%I = COALESCE(v.%I, t.%I)', c.column_name, c.column_name, c.column_name), ', ')
+  INTO v_set
+  FROM information_schema.columns c
+  WHERE c.table_schema = 'public'
+    AND c.table_name = p_table
+    AND c.column_name = ANY(p_columns)
+    AND c.column_name <> p_key;
+
+  IF v_set IS NULL THEN
+    RETURN;
+  END IF;
+
+  SELECT string_agg(format('%I = NULL', c.column_name), ', ')
+  INTO v_reset
+  FROM information_schema.columns c
+  WHERE c.table_schema = 'public'
+    AND c.table_name = p_table
+    AND c.column_name = ANY(p_reset_columns)
+    AND c.column_name <> p_key
+    AND NOT c.column_name = ANY(p_columns);
+
+  IF v_reset IS NOT NULL THEN
+    v_set := v_set || ', ' || v_reset;
+  END IF;
+
+  RETURN QUERY EXECUTE format(
+    'UPDATE public.%I AS t SET %s '
+    'FROM jsonb_populate_recordset(NULL::public.%I, $1) AS v '
+    'WHERE t.%I = v.%I '
+    'RETURNING t.%I::TEXT',
+    p_table, v_set, p_table, p_key, p_key, p_key
+  ) USING p_rows;
+END;
+$$;
+
+COMMENT ON FUNCTION patch_rows(TEXT, TEXT, TEXT[], JSONB, TEXT[]) IS 'Bulk-update selected columns of app_opportunities/submissions rows; NULLs keep stored values';
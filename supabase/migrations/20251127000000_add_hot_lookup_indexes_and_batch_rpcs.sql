@@ -0,0 +1,155 @@
+-- Add Hot Lookup Indexes And Batch Lookup Functions
+-- Purpose: Back every per-batch deduplication/enrichment lookup with an index,
+--          and return concept metadata and latest primary analyses for an
+--          array of IDs in one call
+-- Risk: LOW (index swaps + new functions) | Duration: ~1-5 minutes on large tables
+--
+-- Hot lookups and their indexes after this migration:
+--   business_concepts.primary_submission_id   idx_business_concepts_primary_submission_id
+--                                             (unique, 20251124; unchanged)
+--   opportunities_unified.submission_id       idx_opportunities_unified_submission_concept
+--                                             (covers business_concept_id)
+--   llm_monetization_analysis latest primary  idx_llm_monetization_primary_latest
+--                                             (partial, 20251122; unchanged)
+--   workflow_results latest primary           idx_workflow_results_primary_latest
+--                                             (partial, 20251122; unchanged)
+--   llm_monetization_analysis
+--     (business_concept_id, copied_from_primary, analyzed_at)
+--                                             idx_llm_analysis_concept_primary_analyzed
+--   app_opportunities.submission_id           idx_app_opportunities_submission_hash
+--                                             (covers content_hash)
+--   comments.link_id                          idx_comments_link_id
+--
+-- The covering indexes replace single-column indexes on the same leading
+-- column, so each table keeps the same number of indexes to maintain.
+-- scripts/database/check_hot_query_plans.py seeds ~1M rows in a scratch
+-- schema, applies this file and checks with EXPLAIN that each lookup uses
+-- its index.
+
+-- ==============================================================================
+-- STEP 1: opportunities_unified submission -> concept
+-- ==============================================================================
+-- OpportunityPipeline._batch_fetch_concept_metadata() only needs
+-- business_concept_id, so the lookup becomes an index-only scan.
+
+CREATE INDEX IF NOT EXISTS idx_opportunities_unified_submission_concept
+ON opportunities_unified (submission_id) INCLUDE (business_concept_id)
+WHERE submission_id IS NOT NULL;
+
+DROP INDEX IF EXISTS idx_opportunities_unified_submission_id;
+
+-- ==============================================================================
+-- STEP 2: llm_monetization_analysis per concept
+-- ==============================================================================
+-- Serves concept lookups that read copies as well as primaries, and the
+-- ON DELETE SET NULL check from business_concepts. The single-column index
+-- is a prefix of this one.
+
+CREATE INDEX IF NOT EXISTS idx_llm_analysis_concept_primary_analyzed
+ON llm_monetization_analysis (business_concept_id, copied_from_primary, analyzed_at DESC NULLS LAST);
+
+DROP INDEX IF EXISTS idx_llm_analysis_business_concept;
+
+-- ==============================================================================
+-- STEP 3: app_opportunities content hashes
+-- ==============================================================================
+-- fetch_existing_hashes() reads (submission_id, content_hash) for a batch.
+-- The unique_submission_id constraint still enforces uniqueness.
+
+CREATE INDEX IF NOT EXISTS idx_app_opportunities_submission_hash
+ON app_opportunities (submission_id) INCLUDE (content_hash);
+
+DROP INDEX IF EXISTS idx_app_opportunities_submission;
+
+-- ==============================================================================
+-- STEP 4: comments by Reddit submission ID
+-- ==============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_comments_link_id
+ON comments (link_id)
+WHERE link_id IS NOT NULL;
+
+-- ==============================================================================
+-- STEP 5: Concept metadata for many submissions
+-- ==============================================================================
+-- Replaces the opportunities_unified -> business_concepts query pair. IDs that
+-- are not UUIDs cannot match opportunities_unified.submission_id and are
+-- skipped instead of failing the whole call. LANGUAGE sql + STABLE lets the
+-- planner inline these functions, so EXPLAIN shows the index scans.
+
+CREATE OR REPLACE FUNCTION get_concept_metadata(p_submission_ids TEXT[])
+RETURNS TABLE (
+  submission_id TEXT,
+  concept_id BIGINT,
+  has_agno_analysis BOOLEAN,
+  has_profiler_analysis BOOLEAN
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    ids.submission_id,
+    ou.business_concept_id,
+    COALESCE(bc.has_agno_analysis, FALSE),
+    COALESCE(bc.has_profiler_analysis, FALSE)
+  FROM (
+    SELECT DISTINCT
+      u.id AS submission_id,
+      CASE
+        WHEN u.id ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+          THEN u.id::UUID
+      END AS submission_uuid
+    FROM unnest(p_submission_ids) AS u(id)
+  ) ids
+  JOIN opportunities_unified ou ON ou.submission_id = ids.submission_uuid
+  LEFT JOIN business_concepts bc ON bc.id = ou.business_concept_id
+  WHERE ou.business_concept_id IS NOT NULL;
+$$;
+
+-- ==============================================================================
+-- STEP 6: Latest primary analyses for many concepts
+-- ==============================================================================
+-- One LIMIT 1 probe of the partial "primary latest" index per concept, instead
+-- of reading every primary row of the concept as the DISTINCT ON views do.
+
+CREATE OR REPLACE FUNCTION get_latest_primary_agno_analyses(p_concept_ids BIGINT[])
+RETURNS SETOF llm_monetization_analysis
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT latest.*
+  FROM (SELECT DISTINCT unnest(p_concept_ids) AS concept_id) ids
+  CROSS JOIN LATERAL (
+    SELECT lma.*
+    FROM llm_monetization_analysis lma
+    WHERE lma.business_concept_id = ids.concept_id
+      AND lma.copied_from_primary = FALSE
+    ORDER BY lma.analyzed_at DESC NULLS LAST
+    LIMIT 1
+  ) latest;
+$$;
+
+CREATE OR REPLACE FUNCTION get_latest_primary_profiler_analyses(p_concept_ids BIGINT[])
+RETURNS SETOF workflow_results
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT latest.*
+  FROM (SELECT DISTINCT unnest(p_concept_ids) AS concept_id) ids
+  CROSS JOIN LATERAL (
+    SELECT wr.*
+    FROM workflow_results wr
+    WHERE wr.business_concept_id = ids.concept_id
+      AND wr.copied_from_primary = FALSE
+    ORDER BY wr.processed_at DESC NULLS LAST
+    LIMIT 1
+  ) latest;
+$$;
+
+COMMENT ON INDEX idx_opportunities_unified_submission_concept IS 'Index-only submission -> concept lookup for dedup prefetch';
+COMMENT ON INDEX idx_llm_analysis_concept_primary_analyzed IS 'Per-concept analysis lookups, newest first within primaries/copies';
+COMMENT ON INDEX idx_app_opportunities_submission_hash IS 'Index-only content hash lookup for skipping unchanged rows';
+COMMENT ON INDEX idx_comments_link_id IS 'Comments of a Reddit submission by its ID';
+COMMENT ON FUNCTION get_concept_metadata(TEXT[]) IS 'Concept ID and analysis flags for each submission that has a concept';
+COMMENT ON FUNCTION get_latest_primary_agno_analyses(BIGINT[]) IS 'Most recent non-copied llm_monetization_analysis row for each concept';
+COMMENT ON FUNCTION get_latest_primary_profiler_analyses(BIGINT[]) IS 'Most recent non-copied workflow_results row for each concept';
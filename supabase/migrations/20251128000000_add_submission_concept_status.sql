@@ -0,0 +1,296 @@
+-- Add Submission Concept Status
+-- Purpose: Answer the dedup prefetch (submission -> concept, analysis flags and
+--          primary analysis IDs) with one primary-key read
+-- Risk: LOW (new table + triggers, backfilled once) | Duration: ~1-2 minutes on large tables
+--
+-- OpportunityPipeline._batch_fetch_concept_metadata() needed
+-- opportunities_unified -> business_concepts lookups, and the batch copy paths
+-- then searched llm_monetization_analysis / workflow_results for the primary
+-- rows. submission_concept_status keeps all of that per submission_id.
+--
+-- A materialized view would be recomputed in full on every REFRESH. Instead the
+-- table is kept current by row triggers that refresh only the submissions or
+-- concepts a write touched:
+--   opportunities_unified      submission linked to / moved between concepts
+--   business_concepts          has_agno_analysis / has_profiler_analysis changed
+--   llm_monetization_analysis  primary (non-copied) Agno analysis written
+--   workflow_results           primary (non-copied) AI profile written
+--
+-- get_concept_metadata() (20251127) is redefined to read the table through
+-- submission_concept_status_pkey and to return the primary analysis IDs.
+
+-- ==============================================================================
+-- STEP 1: Summary table
+-- ==============================================================================
+
+CREATE TABLE IF NOT EXISTS submission_concept_status (
+  submission_id TEXT PRIMARY KEY,
+  concept_id BIGINT NOT NULL,
+  has_agno_analysis BOOLEAN NOT NULL DEFAULT FALSE,
+  has_profiler_analysis BOOLEAN NOT NULL DEFAULT FALSE,
+  primary_agno_analysis_id UUID,
+  primary_profiler_analysis_id UUID,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_submission_concept_status_concept
+ON submission_concept_status (concept_id);
+
+-- ==============================================================================
+-- STEP 2: Per-concept status
+-- ==============================================================================
+-- Flags plus the latest primary analysis of each concept, one probe of the
+-- "primary latest" partial indexes (20251122) per concept and service.
+
+CREATE OR REPLACE FUNCTION concept_analysis_status(p_concept_ids BIGINT[])
+RETURNS TABLE (
+  concept_id BIGINT,
+  has_agno_analysis BOOLEAN,
+  has_profiler_analysis BOOLEAN,
+  primary_agno_analysis_id UUID,
+  primary_profiler_analysis_id UUID
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    bc.id,
+    COALESCE(bc.has_agno_analysis, FALSE),
+    COALESCE(bc.has_profiler_analysis, FALSE),
+    agno.id,
+    profile.id
+  FROM business_concepts bc
+  LEFT JOIN LATERAL (
+    SELECT lma.id
+    FROM llm_monetization_analysis lma
+    WHERE lma.business_concept_id = bc.id
+      AND lma.copied_from_primary = FALSE
+    ORDER BY lma.analyzed_at DESC NULLS LAST
+    LIMIT 1
+  ) agno ON TRUE
+  LEFT JOIN LATERAL (
+    SELECT wr.id
+    FROM workflow_results wr
+    WHERE wr.business_concept_id = bc.id
+      AND wr.copied_from_primary = FALSE
+    ORDER BY wr.processed_at DESC NULLS LAST
+    LIMIT 1
+  ) profile ON TRUE
+  WHERE bc.id = ANY(p_concept_ids);
+$$;
+
+-- ==============================================================================
+-- STEP 3: Refresh functions
+-- ==============================================================================
+-- refresh_submission_concept_status(NULL) rebuilds every row.
+
+CREATE OR REPLACE FUNCTION refresh_submission_concept_status(p_submission_ids UUID[])
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF p_submission_ids IS NULL THEN
+    DELETE FROM submission_concept_status;
+  ELSE
+    DELETE FROM submission_concept_status
+    WHERE submission_id = ANY(p_submission_ids::TEXT[]);
+  END IF;
+
+  INSERT INTO submission_concept_status (
+    submission_id,
+    concept_id,
+    has_agno_analysis,
+    has_profiler_analysis,
+    primary_agno_analysis_id,
+    primary_profiler_analysis_id
+  )
+  SELECT
+    linked.submission_id::TEXT,
+    linked.business_concept_id,
+    COALESCE(status.has_agno_analysis, FALSE),
+    COALESCE(status.has_profiler_analysis, FALSE),
+    status.primary_agno_analysis_id,
+    status.primary_profiler_analysis_id
+  FROM (
+    -- The most recently updated opportunity wins if a submission has several
+    SELECT DISTINCT ON (ou.submission_id) ou.submission_id, ou.business_concept_id
+    FROM opportunities_unified ou
+    WHERE ou.submission_id IS NOT NULL
+      AND ou.business_concept_id IS NOT NULL
+      AND (p_submission_ids IS NULL OR ou.submission_id = ANY(p_submission_ids))
+    ORDER BY ou.submission_id, ou.updated_at DESC NULLS LAST
+  ) linked
+  LEFT JOIN concept_analysis_status(
+    ARRAY(
+      SELECT DISTINCT ou.business_concept_id
+      FROM opportunities_unified ou
+      WHERE ou.business_concept_id IS NOT NULL
+        AND (p_submission_ids IS NULL OR ou.submission_id = ANY(p_submission_ids))
+    )
+  ) status ON status.concept_id = linked.business_concept_id;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION refresh_concept_status(p_concept_ids BIGINT[])
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE submission_concept_status s
+  SET
+    has_agno_analysis = status.has_agno_analysis,
+    has_profiler_analysis = status.has_profiler_analysis,
+    primary_agno_analysis_id = status.primary_agno_analysis_id,
+    primary_profiler_analysis_id = status.primary_profiler_analysis_id,
+    updated_at = NOW()
+  FROM concept_analysis_status(p_concept_ids) status
+  WHERE s.concept_id = status.concept_id
+    AND (
+      s.has_agno_analysis IS DISTINCT FROM status.has_agno_analysis
+      OR s.has_profiler_analysis IS DISTINCT FROM status.has_profiler_analysis
+      OR s.primary_agno_analysis_id IS DISTINCT FROM status.primary_agno_analysis_id
+      OR s.primary_profiler_analysis_id IS DISTINCT FROM status.primary_profiler_analysis_id
+    );
+END;
+$$;
+
+-- ==============================================================================
+-- STEP 4: Triggers
+-- ==============================================================================
+-- OLD and NEW are only read in the branches where they are assigned.
+
+CREATE OR REPLACE FUNCTION sync_concept_status_from_opportunity()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_submission_ids UUID[] := '{}';
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    v_submission_ids := v_submission_ids || OLD.submission_id;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    v_submission_ids := v_submission_ids || NEW.submission_id;
+  END IF;
+
+  v_submission_ids := array_remove(v_submission_ids, NULL);
+  IF cardinality(v_submission_ids) > 0 THEN
+    PERFORM refresh_submission_concept_status(v_submission_ids);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION sync_concept_status_from_concept()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  PERFORM refresh_concept_status(ARRAY[NEW.id]);
+  RETURN NULL;
+END;
+$$;
+
+-- Shared by llm_monetization_analysis and workflow_results. Copies never
+-- change a concept's primary analysis, so they are ignored.
+CREATE OR REPLACE FUNCTION sync_concept_status_from_analysis()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_concept_ids BIGINT[] := '{}';
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    IF OLD.copied_from_primary IS NOT TRUE THEN
+      v_concept_ids := v_concept_ids || OLD.business_concept_id;
+    END IF;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    IF NEW.copied_from_primary IS NOT TRUE THEN
+      v_concept_ids := v_concept_ids || NEW.business_concept_id;
+    END IF;
+  END IF;
+
+  v_concept_ids := array_remove(v_concept_ids, NULL);
+  IF cardinality(v_concept_ids) > 0 THEN
+    PERFORM refresh_concept_status(v_concept_ids);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS sync_concept_status ON opportunities_unified;
+CREATE TRIGGER sync_concept_status
+    AFTER INSERT OR DELETE OR UPDATE OF submission_id, business_concept_id
+    ON opportunities_unified
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_concept_status_from_opportunity();
+
+DROP TRIGGER IF EXISTS sync_concept_status ON business_concepts;
+CREATE TRIGGER sync_concept_status
+    AFTER UPDATE OF has_agno_analysis, has_profiler_analysis
+    ON business_concepts
+    FOR EACH ROW
+    WHEN (
+      OLD.has_agno_analysis IS DISTINCT FROM NEW.has_agno_analysis
+      OR OLD.has_profiler_analysis IS DISTINCT FROM NEW.has_profiler_analysis
+    )
+    EXECUTE FUNCTION sync_concept_status_from_concept();
+
+DROP TRIGGER IF EXISTS sync_concept_status ON llm_monetization_analysis;
+CREATE TRIGGER sync_concept_status
+    AFTER INSERT OR DELETE OR UPDATE OF business_concept_id, copied_from_primary, analyzed_at
+    ON llm_monetization_analysis
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_concept_status_from_analysis();
+
+DROP TRIGGER IF EXISTS sync_concept_status ON workflow_results;
+CREATE TRIGGER sync_concept_status
+    AFTER INSERT OR DELETE OR UPDATE OF business_concept_id, copied_from_primary, processed_at
+    ON workflow_results
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_concept_status_from_analysis();
+
+-- ==============================================================================
+-- STEP 5: Backfill
+-- ==============================================================================
+
+SELECT refresh_submission_concept_status(NULL);
+
+-- ==============================================================================
+-- STEP 6: get_concept_metadata reads the summary table
+-- ==============================================================================
+-- The result gains the primary analysis columns, so the function is dropped
+-- and recreated rather than replaced.
+
+DROP FUNCTION IF EXISTS get_concept_metadata(TEXT[]);
+
+CREATE FUNCTION get_concept_metadata(p_submission_ids TEXT[])
+RETURNS TABLE (
+  submission_id TEXT,
+  concept_id BIGINT,
+  has_agno_analysis BOOLEAN,
+  has_profiler_analysis BOOLEAN,
+  primary_agno_analysis_id UUID,
+  primary_profiler_analysis_id UUID
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    s.submission_id,
+    s.concept_id,
+    s.has_agno_analysis,
+    s.has_profiler_analysis,
+    s.primary_agno_analysis_id,
+    s.primary_profiler_analysis_id
+  FROM submission_concept_status s
+  WHERE s.submission_id = ANY(p_submission_ids);
+$$;
+
+COMMENT ON TABLE submission_concept_status IS 'Per-submission concept, analysis flags and primary analysis IDs, maintained by triggers';
+COMMENT ON COLUMN submission_concept_status.primary_agno_analysis_id IS 'Latest non-copied llm_monetization_analysis row of the concept';
+COMMENT ON COLUMN submission_concept_status.primary_profiler_analysis_id IS 'Latest non-copied workflow_results row of the concept';
+COMMENT ON FUNCTION refresh_submission_concept_status(UUID[]) IS 'Rebuild submission_concept_status rows for the given submissions (NULL = all)';
+COMMENT ON FUNCTION refresh_concept_status(BIGINT[]) IS 'Refresh flags and primary analysis IDs of submission_concept_status rows for the given concepts';
+COMMENT ON FUNCTION get_concept_metadata(TEXT[]) IS 'Concept ID, analysis flags and primary analysis IDs for each submission that has a concept';
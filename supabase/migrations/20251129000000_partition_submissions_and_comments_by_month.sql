@@ -0,0 +1,822 @@
+-- Partition Submissions And Comments By Month
+-- Purpose: Range-partition submissions and comments by month on created_utc so
+--          recent-window reads scan one or two partitions, and old months can
+--          be detached for archival
+-- Risk: MEDIUM (rewrites both tables, replaces foreign keys into them with triggers) | Duration: ~1-10 minutes on large tables
+--
+-- Both tables only grow, while the collectors and dashboards read a recent
+-- window (collect_comments_for_submissions: created_utc >= cutoff). After
+-- this migration each table is a parent partitioned by RANGE (created_utc)
+-- with:
+--   <table>_yYYYYmMM   one partition per UTC month, created ahead of time by
+--                      ensure_monthly_partitions() (pg_cron, daily)
+--   <table>_default    rows with a NULL created_utc or a month that has no
+--                      partition yet; create_monthly_partition() moves them
+--                      out when their month is created
+--
+-- Postgres requires unique constraints on a partitioned table to include the
+-- partition key, so:
+--   submissions  UNIQUE (id, created_utc), UNIQUE (submission_id, created_utc)
+--   comments     UNIQUE (id, created_utc), UNIQUE (comment_id, created_utc)
+-- core/collection.py upserts on the composite keys (SUBMISSION_CONFLICT_KEY,
+-- COMMENT_CONFLICT_KEY).
+--
+-- Foreign keys that referenced submissions(id) or comments(id) (e.g.
+-- comments.submission_id, opportunities_unified.submission_id ON DELETE
+-- CASCADE) cannot reference a partitioned table without created_utc in the
+-- referencing row. Each one is replaced by two triggers named after it:
+--   on the referencing table   check_partitioned_reference() rejects values
+--                              missing from the referenced table
+--   on the referenced table    apply_partitioned_reference_action() runs the
+--                              ON DELETE / ON UPDATE action (CASCADE, SET
+--                              NULL, SET DEFAULT, or NO ACTION / RESTRICT)
+-- Each trigger's comment holds the original constraint definition. What is
+-- lost: the checks run per row as the statement's AFTER triggers rather than
+-- as deferrable constraints, existing rows are not re-validated, and the
+-- planner no longer sees the constraints (e.g. for join removal).
+--
+-- Existing created_utc values are normalized to UTC first. Collectors before
+-- reddit_created_utc() (and the dlt created_at column used to backfill
+-- created_utc) wrote naive local time of the collector host. Tables with
+-- rows require that zone to be declared before running the migration:
+--   SET app.collector_timezone = 'Europe/Berlin';  -- or 'UTC' if the hosts ran in UTC
+-- Values stored as text with an explicit offset, and Unix timestamps, are
+-- already unambiguous and are not shifted.
+--
+-- Postgres also cannot enforce a key alone across partitions, so each key
+-- gets a plain table with it as primary key, maintained by the
+-- maintain_partition_keys() trigger:
+--   submissions_keys (submission_id PRIMARY KEY, created_utc)
+--   comments_keys    (comment_id PRIMARY KEY, created_utc)
+-- Inserting a key that another month already holds fails with a unique
+-- violation. The collectors look up the stored created_utc of each key and
+-- upsert with it (core.collection.upsert_partitioned), so a post re-collected
+-- with a different created_utc updates its row. Ids default to
+-- gen_random_uuid() and are only checked together with created_utc. Rows of
+-- the old tables that share a key are collapsed to the last-written one.
+--
+-- Cleanup: the original tables are kept as <table>_unpartitioned for
+-- rollback and double the storage of both tables until dropped. Once the row
+-- counts match the NOTICEs of this migration and the collectors have run:
+--   DROP TABLE submissions_unpartitioned, comments_unpartitioned;
+-- Rollback instead: drop the partitioned tables and the *_keys tables, and
+-- rename the *_unpartitioned tables (and their *_old indexes) back.
+--
+-- Archival: detach_partitions_older_than('comments', 12) detaches every month
+-- older than 12 months and returns the detached table names. A detached
+-- partition is an ordinary table: dump and drop it, or ATTACH it again.
+
+SET LOCAL timezone = 'UTC';
+
+-- ==============================================================================
+-- STEP 1: Partition management functions
+-- ==============================================================================
+-- Month bounds are UTC midnights, independent of the session time zone.
+
+CREATE OR REPLACE FUNCTION monthly_partition_name(p_parent TEXT, p_month DATE)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT format('%s_y%sm%s', p_parent, to_char(p_month, 'YYYY'), to_char(p_month, 'MM'));
+$$;
+
+CREATE OR REPLACE FUNCTION create_monthly_partition(p_parent TEXT, p_month DATE)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_month DATE := make_date(
+    EXTRACT(YEAR FROM p_month)::INTEGER, EXTRACT(MONTH FROM p_month)::INTEGER, 1
+  );
+  v_start TIMESTAMPTZ := v_month::TIMESTAMP AT TIME ZONE 'UTC';
+  v_end TIMESTAMPTZ := (v_month + INTERVAL '1 month')::TIMESTAMP AT TIME ZONE 'UTC';
+  v_name TEXT := monthly_partition_name(p_parent, v_month);
+  v_default TEXT := p_parent || '_default';
+BEGIN
+  IF to_regclass(v_name) IS NOT NULL THEN
+    RETURN v_name;
+  END IF;
+
+  -- ATTACH fails while the default partition holds rows of the new month,
+  -- so those rows are moved into the new table first. The rows only change
+  -- partition: the key and reference triggers must not see the DELETE.
+  EXECUTE format(
+    'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE)',
+    v_name, p_parent
+  );
+  IF to_regclass(v_default) IS NOT NULL THEN
+    EXECUTE format('ALTER TABLE %I DISABLE TRIGGER USER', v_default);
+    EXECUTE format(
+      'WITH moved AS ('
+      '  DELETE FROM %I WHERE created_utc >= %L AND created_utc < %L RETURNING *'
+      ') INSERT INTO %I SELECT * FROM moved',
+      v_default, v_start, v_end, v_name
+    );
+    EXECUTE format('ALTER TABLE %I ENABLE TRIGGER USER', v_default);
+  END IF;
+  EXECUTE format(
+    'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+    p_parent, v_name, v_start, v_end
+  );
+  RETURN v_name;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(p_parent TEXT, p_months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_current DATE := date_trunc('month', NOW() AT TIME ZONE 'UTC')::DATE;
+  v_month DATE;
+  v_created INTEGER := 0;
+BEGIN
+  FOR i IN 0..p_months_ahead LOOP
+    v_month := (v_current + make_interval(months => i))::DATE;
+    IF to_regclass(monthly_partition_name(p_parent, v_month)) IS NULL THEN
+      PERFORM create_monthly_partition(p_parent, v_month);
+      v_created := v_created + 1;
+    END IF;
+  END LOOP;
+  RETURN v_created;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION detach_monthly_partition(p_parent TEXT, p_month DATE)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_name TEXT := monthly_partition_name(p_parent, p_month);
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_inherits
+    WHERE inhparent = to_regclass(p_parent) AND inhrelid = to_regclass(v_name)
+  ) THEN
+    RETURN NULL;
+  END IF;
+  EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', p_parent, v_name);
+  RETURN v_name;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION detach_partitions_older_than(p_parent TEXT, p_keep_months INTEGER)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_cutoff DATE;
+  v_partition RECORD;
+BEGIN
+  -- Recent-window reads span the current and the previous month
+  IF p_keep_months < 2 THEN
+    RAISE EXCEPTION 'p_keep_months must be at least 2, got %', p_keep_months;
+  END IF;
+  v_cutoff := (
+    date_trunc('month', NOW() AT TIME ZONE 'UTC') - make_interval(months => p_keep_months - 1)
+  )::DATE;
+
+  FOR v_partition IN
+    SELECT
+      c.relname,
+      make_date(
+        substring(c.relname FROM '_y(\d{4})m\d{2}$')::INTEGER,
+        substring(c.relname FROM '_y\d{4}m(\d{2})$')::INTEGER,
+        1
+      ) AS month
+    FROM pg_inherits inh
+    JOIN pg_class c ON c.oid = inh.inhrelid
+    WHERE inh.inhparent = to_regclass(p_parent)
+      AND c.relname ~ ('^' || p_parent || '_y\d{4}m\d{2}$')
+    ORDER BY 2
+  LOOP
+    IF v_partition.month < v_cutoff THEN
+      EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', p_parent, v_partition.relname);
+      RETURN NEXT v_partition.relname;
+    END IF;
+  END LOOP;
+END;
+$$;
+
+-- ==============================================================================
+-- STEP 2: Triggers for the constraints a partitioned table cannot declare
+-- ==============================================================================
+-- TG_ARGV of both functions: referenced table, referenced column, referencing
+-- table, referencing column, referenced column type, ON DELETE action, ON
+-- UPDATE action (pg_constraint.confdeltype / confupdtype codes). Tables are
+-- schema-qualified, and the functions run as their owner like the foreign key
+-- checks they replace.
+
+CREATE OR REPLACE FUNCTION check_partitioned_reference()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = pg_catalog, public
+AS $$
+DECLARE
+  v_value TEXT := to_jsonb(NEW) ->> TG_ARGV[3];
+  v_found BOOLEAN;
+BEGIN
+  IF v_value IS NULL THEN
+    RETURN NULL;
+  END IF;
+  IF TG_OP = 'UPDATE' AND v_value IS NOT DISTINCT FROM to_jsonb(OLD) ->> TG_ARGV[3] THEN
+    RETURN NULL;
+  END IF;
+
+  -- Lock the referenced row against deletion, as a foreign key check does
+  EXECUTE format(
+    'SELECT TRUE FROM %s WHERE %I = $1::%s LIMIT 1 FOR KEY SHARE',
+    TG_ARGV[0], TG_ARGV[1], TG_ARGV[4]
+  ) INTO v_found USING v_value;
+
+  IF v_found IS NULL THEN
+    RAISE EXCEPTION 'insert or update on table % violates reference "%"', TG_ARGV[2], TG_NAME
+      USING ERRCODE = 'foreign_key_violation',
+            DETAIL = format('Key (%s)=(%s) is not present in table %s.', TG_ARGV[3], v_value, TG_ARGV[0]);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION apply_partitioned_reference_action()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = pg_catalog, public
+AS $$
+DECLARE
+  v_old TEXT := to_jsonb(OLD) ->> TG_ARGV[1];
+  v_new TEXT;
+  v_action TEXT := CASE TG_OP WHEN 'DELETE' THEN TG_ARGV[5] ELSE TG_ARGV[6] END;
+  v_found BOOLEAN;
+BEGIN
+  IF v_old IS NULL THEN
+    RETURN NULL;
+  END IF;
+  IF TG_OP = 'UPDATE' THEN
+    v_new := to_jsonb(NEW) ->> TG_ARGV[1];
+    IF v_new IS NOT DISTINCT FROM v_old THEN
+      RETURN NULL;
+    END IF;
+  END IF;
+
+  -- A row moving to another month partition is deleted and re-inserted, and
+  -- the key may exist in another month: act only once it is gone entirely
+  EXECUTE format(
+    'SELECT TRUE FROM %s WHERE %I = $1::%s LIMIT 1', TG_ARGV[0], TG_ARGV[1], TG_ARGV[4]
+  ) INTO v_found USING v_old;
+  IF v_found THEN
+    RETURN NULL;
+  END IF;
+
+  IF v_action = 'c' AND TG_OP = 'DELETE' THEN
+    EXECUTE format('DELETE FROM %s WHERE %I = $1::%s', TG_ARGV[2], TG_ARGV[3], TG_ARGV[4])
+      USING v_old;
+  ELSIF v_action = 'c' THEN
+    EXECUTE format(
+      'UPDATE %s SET %I = $2::%s WHERE %I = $1::%s',
+      TG_ARGV[2], TG_ARGV[3], TG_ARGV[4], TG_ARGV[3], TG_ARGV[4]
+    ) USING v_old, v_new;
+  ELSIF v_action IN ('n', 'd') THEN
+    EXECUTE format(
+      'UPDATE %s SET %I = %s WHERE %I = $1::%s',
+      TG_ARGV[2], TG_ARGV[3], CASE v_action WHEN 'n' THEN 'NULL' ELSE 'DEFAULT' END,
+      TG_ARGV[3], TG_ARGV[4]
+    ) USING v_old;
+  ELSE
+    -- NO ACTION / RESTRICT
+    EXECUTE format(
+      'SELECT TRUE FROM %s WHERE %I = $1::%s LIMIT 1', TG_ARGV[2], TG_ARGV[3], TG_ARGV[4]
+    ) INTO v_found USING v_old;
+    IF v_found THEN
+      RAISE EXCEPTION 'update or delete on table % violates reference "%" on table %',
+        TG_ARGV[0], TG_NAME, TG_ARGV[2]
+        USING ERRCODE = 'foreign_key_violation',
+              DETAIL = format('Key (%s)=(%s) is still referenced from table %s.', TG_ARGV[1], v_old, TG_ARGV[2]);
+    END IF;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+-- Global key uniqueness. TG_ARGV: key table, partitioned table, key column,
+-- key column type (tables schema-qualified). The key table holds the
+-- created_utc of every key, so a second row with the same key in any month
+-- is rejected; collectors read it to upsert onto the stored row.
+
+CREATE OR REPLACE FUNCTION maintain_partition_keys()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = pg_catalog, public
+AS $$
+DECLARE
+  v_old TEXT;
+  v_new TEXT;
+  v_stored TIMESTAMPTZ;
+  v_found BOOLEAN;
+BEGIN
+  IF TG_OP <> 'INSERT' THEN
+    v_old := to_jsonb(OLD) ->> TG_ARGV[2];
+  END IF;
+  IF TG_OP <> 'DELETE' THEN
+    v_new := to_jsonb(NEW) ->> TG_ARGV[2];
+  END IF;
+  IF TG_OP = 'UPDATE' AND v_new IS NOT DISTINCT FROM v_old
+     AND NEW.created_utc IS NOT DISTINCT FROM OLD.created_utc THEN
+    RETURN NULL;
+  END IF;
+
+  -- Release the old key once no row holds it. A row moving to another month
+  -- partition is deleted and re-inserted, so the insert below may already
+  -- have run for it.
+  IF v_old IS NOT NULL AND v_old IS DISTINCT FROM v_new THEN
+    EXECUTE format(
+      'DELETE FROM %s WHERE %I = $1::%s AND NOT EXISTS (SELECT 1 FROM %s WHERE %I = $1::%s)',
+      TG_ARGV[0], TG_ARGV[2], TG_ARGV[3], TG_ARGV[1], TG_ARGV[2], TG_ARGV[3]
+    ) USING v_old;
+  END IF;
+
+  IF v_new IS NULL THEN
+    RETURN NULL;
+  END IF;
+
+  EXECUTE format(
+    'SELECT created_utc, TRUE FROM %s WHERE %I = $1::%s FOR UPDATE',
+    TG_ARGV[0], TG_ARGV[2], TG_ARGV[3]
+  ) INTO v_stored, v_found USING v_new;
+
+  IF v_found IS NULL THEN
+    -- A concurrent insert of the same key fails on the primary key here
+    EXECUTE format(
+      'INSERT INTO %s (%I, created_utc) VALUES ($1::%s, $2)', TG_ARGV[0], TG_ARGV[2], TG_ARGV[3]
+    ) USING v_new, NEW.created_utc;
+  ELSIF v_stored IS DISTINCT FROM NEW.created_utc THEN
+    EXECUTE format(
+      'SELECT TRUE FROM %s WHERE %I = $1::%s AND created_utc IS NOT DISTINCT FROM $2 LIMIT 1',
+      TG_ARGV[1], TG_ARGV[2], TG_ARGV[3]
+    ) INTO v_found USING v_new, v_stored;
+    IF v_found THEN
+      RAISE EXCEPTION 'duplicate key value violates unique key table %', TG_ARGV[0]
+        USING ERRCODE = 'unique_violation',
+              DETAIL = format('Key (%s)=(%s) already exists in %s with created_utc %s.',
+                              TG_ARGV[2], v_new, TG_ARGV[1], v_stored);
+    END IF;
+    -- The row holding the key moved to another created_utc
+    EXECUTE format(
+      'UPDATE %s SET created_utc = $2 WHERE %I = $1::%s', TG_ARGV[0], TG_ARGV[2], TG_ARGV[3]
+    ) USING v_new, NEW.created_utc;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+-- ==============================================================================
+-- STEP 3: Conversion (session-local helper)
+-- ==============================================================================
+-- Indexes, triggers, outbound foreign keys, RLS policies, grants, the table
+-- comment and dependent views are read from the catalog before the swap. The
+-- captured definitions name the table as <table>, so after the old table is
+-- renamed they apply to the new partitioned parent as-is.
+
+CREATE FUNCTION pg_temp.partition_by_created_utc(p_table TEXT, p_key TEXT)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_old TEXT := p_table || '_unpartitioned';
+  v_keys TEXT := p_table || '_keys';
+  v_qualified TEXT;
+  v_key_type TEXT;
+  v_zone TEXT := NULLIF(current_setting('app.collector_timezone', true), '');
+  v_has_rows BOOLEAN;
+  v_type TEXT;
+  v_created_at_type TEXT;
+  v_column TEXT;
+  v_target_column TEXT;
+  v_target_type TEXT;
+  v_args TEXT;
+  v_trigger TEXT;
+  v_replay TEXT[] := '{}';
+  v_statement TEXT;
+  v_rec RECORD;
+  v_columns TEXT;
+  v_copied BIGINT;
+  v_total BIGINT;
+BEGIN
+  IF to_regclass(p_table) IS NULL THEN
+    RAISE NOTICE '% does not exist, skipping', p_table;
+    RETURN;
+  END IF;
+  IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(p_table)) THEN
+    RAISE NOTICE '% is already partitioned, skipping', p_table;
+    RETURN;
+  END IF;
+
+  SELECT format('%I.%I', n.nspname, c.relname) INTO v_qualified
+  FROM pg_class c
+  JOIN pg_namespace n ON n.oid = c.relnamespace
+  WHERE c.oid = to_regclass(p_table);
+
+  -- Stored values are local time of the collector host, which only the
+  -- operator knows (see the header)
+  EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I)', p_table) INTO v_has_rows;
+  IF v_has_rows AND v_zone IS NULL THEN
+    RAISE EXCEPTION '% has rows with local-time creation timestamps; set app.collector_timezone to the collectors'' time zone and rerun', p_table
+      USING HINT = 'SET app.collector_timezone = ''UTC''; -- if the collectors ran in UTC';
+  END IF;
+  v_zone := COALESCE(v_zone, 'UTC');
+  PERFORM NOW() AT TIME ZONE v_zone;  -- rejects an unknown zone before any rewrite
+
+  -- created_utc as TIMESTAMPTZ in UTC. The dlt path only wrote created_at
+  -- (the Reddit creation time), the collectors wrote created_utc.
+  SELECT format_type(a.atttypid, a.atttypmod) INTO v_type
+  FROM pg_attribute a
+  WHERE a.attrelid = to_regclass(p_table) AND a.attname = 'created_utc' AND NOT a.attisdropped;
+
+  EXECUTE format('ALTER TABLE %I DISABLE TRIGGER USER', p_table);
+
+  IF v_type IS NULL THEN
+    EXECUTE format('ALTER TABLE %I ADD COLUMN created_utc TIMESTAMPTZ', p_table);
+  ELSIF v_type IN ('bigint', 'integer', 'numeric', 'double precision', 'real') THEN
+    EXECUTE format(
+      'ALTER TABLE %I ALTER COLUMN created_utc TYPE TIMESTAMPTZ USING to_timestamp(created_utc)',
+      p_table
+    );
+  ELSIF v_type = 'timestamp with time zone' THEN
+    -- Naive strings were read as UTC on insert: reinterpret the wall clock
+    IF v_zone <> 'UTC' THEN
+      EXECUTE format(
+        'UPDATE %I SET created_utc = (created_utc AT TIME ZONE ''UTC'') AT TIME ZONE %L '
+        'WHERE created_utc IS NOT NULL',
+        p_table, v_zone
+      );
+    END IF;
+  ELSIF v_type = 'timestamp without time zone' THEN
+    EXECUTE format(
+      'ALTER TABLE %I ALTER COLUMN created_utc TYPE TIMESTAMPTZ USING created_utc AT TIME ZONE %L',
+      p_table, v_zone
+    );
+  ELSE
+    EXECUTE format(
+      'ALTER TABLE %I ALTER COLUMN created_utc TYPE TIMESTAMPTZ USING CASE '
+      'WHEN created_utc::TEXT ~ ''\d{2}:\d{2}(:\d{2}(\.\d+)?)?\s*(Z|[+-]\d{2}(:?\d{2})?)$'' '
+      'THEN created_utc::TEXT::TIMESTAMPTZ '
+      'ELSE created_utc::TEXT::TIMESTAMP AT TIME ZONE %L END',
+      p_table, v_zone
+    );
+  END IF;
+
+  SELECT format_type(a.atttypid, a.atttypmod) INTO v_created_at_type
+  FROM pg_attribute a
+  WHERE a.attrelid = to_regclass(p_table) AND a.attname = 'created_at' AND NOT a.attisdropped;
+
+  IF v_created_at_type IS NOT NULL THEN
+    EXECUTE format(
+      'UPDATE %I SET created_utc = %s WHERE created_utc IS NULL AND created_at IS NOT NULL',
+      p_table,
+      CASE v_created_at_type
+        WHEN 'timestamp with time zone' THEN format('(created_at AT TIME ZONE ''UTC'') AT TIME ZONE %L', v_zone)
+        ELSE format('created_at::TEXT::TIMESTAMP AT TIME ZONE %L', v_zone)
+      END
+    );
+  END IF;
+
+  EXECUTE format('ALTER TABLE %I ENABLE TRIGGER USER', p_table);
+
+  SELECT format_type(a.atttypid, a.atttypmod) INTO v_key_type
+  FROM pg_attribute a
+  WHERE a.attrelid = to_regclass(p_table) AND a.attname = p_key AND NOT a.attisdropped;
+
+  -- Foreign keys into the table need a unique constraint on id alone. Each
+  -- is replaced by triggers (STEP 2) that keep its check and actions; the
+  -- triggers on this table are carried over to the new parent below.
+  FOR v_rec IN
+    SELECT
+      c.conname,
+      format('%I.%I', n.nspname, s.relname) AS source,
+      s.relname AS source_name,
+      pg_get_constraintdef(c.oid) AS definition,
+      c.conrelid, c.conkey, c.confkey, c.confdeltype, c.confupdtype
+    FROM pg_constraint c
+    JOIN pg_class s ON s.oid = c.conrelid
+    JOIN pg_namespace n ON n.oid = s.relnamespace
+    WHERE c.contype = 'f' AND c.confrelid = to_regclass(p_table)
+  LOOP
+    IF cardinality(v_rec.conkey) <> 1 THEN
+      RAISE EXCEPTION 'Cannot replace multi-column foreign key % on % (%) with triggers; drop or rewrite it first',
+        v_rec.conname, v_rec.source, v_rec.definition;
+    END IF;
+
+    SELECT attname INTO v_column
+    FROM pg_attribute WHERE attrelid = v_rec.conrelid AND attnum = v_rec.conkey[1];
+    SELECT attname, format_type(atttypid, atttypmod) INTO v_target_column, v_target_type
+    FROM pg_attribute WHERE attrelid = to_regclass(p_table) AND attnum = v_rec.confkey[1];
+
+    v_args := format(
+      '%L, %L, %L, %L, %L, %L, %L',
+      v_qualified, v_target_column, v_rec.source, v_column, v_target_type,
+      v_rec.confdeltype, v_rec.confupdtype
+    );
+
+    RAISE NOTICE 'Replacing foreign key % on % (%) with triggers', v_rec.conname, v_rec.source, v_rec.definition;
+    EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', v_rec.source, v_rec.conname);
+
+    EXECUTE format(
+      'CREATE TRIGGER %I AFTER INSERT OR UPDATE OF %I ON %s '
+      'FOR EACH ROW EXECUTE FUNCTION check_partitioned_reference(%s)',
+      v_rec.conname, v_column, v_rec.source, v_args
+    );
+    EXECUTE format(
+      'COMMENT ON TRIGGER %I ON %s IS %L',
+      v_rec.conname, v_rec.source, format('Replaces foreign key %s', v_rec.definition)
+    );
+
+    v_trigger := left(format('%s_%s', v_rec.source_name, v_rec.conname), 63);
+    EXECUTE format(
+      'CREATE TRIGGER %I AFTER DELETE OR UPDATE OF %I ON %s '
+      'FOR EACH ROW EXECUTE FUNCTION apply_partitioned_reference_action(%s)',
+      v_trigger, v_target_column, v_qualified, v_args
+    );
+    EXECUTE format(
+      'COMMENT ON TRIGGER %I ON %s IS %L',
+      v_trigger, v_qualified,
+      format('Replaces foreign key %s on %s', v_rec.definition, v_rec.source)
+    );
+  END LOOP;
+
+  -- Capture what the new parent needs
+  FOR v_rec IN
+    SELECT c.relname, pg_get_indexdef(i.indexrelid) AS definition, i.indisunique
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE i.indrelid = to_regclass(p_table)
+  LOOP
+    IF v_rec.indisunique THEN
+      RAISE NOTICE 'Not recreating unique index % (%): replaced by (..., created_utc) constraints and %',
+        v_rec.relname, v_rec.definition, v_keys;
+    ELSE
+      v_replay := v_replay || v_rec.definition;
+    END IF;
+  END LOOP;
+
+  FOR v_rec IN
+    SELECT conname, pg_get_constraintdef(oid) AS definition
+    FROM pg_constraint
+    WHERE contype = 'f' AND conrelid = to_regclass(p_table)
+  LOOP
+    v_replay := v_replay || format('ALTER TABLE %I ADD CONSTRAINT %I %s', p_table, v_rec.conname, v_rec.definition);
+  END LOOP;
+
+  FOR v_rec IN
+    SELECT tgname, pg_get_triggerdef(oid) AS definition, obj_description(oid, 'pg_trigger') AS description
+    FROM pg_trigger
+    WHERE tgrelid = to_regclass(p_table) AND NOT tgisinternal
+  LOOP
+    v_replay := v_replay || v_rec.definition;
+    IF v_rec.description IS NOT NULL THEN
+      v_replay := v_replay || format(
+        'COMMENT ON TRIGGER %I ON %s IS %L', v_rec.tgname, v_qualified, v_rec.description
+      );
+    END IF;
+  END LOOP;
+
+  IF (SELECT relrowsecurity FROM pg_class WHERE oid = to_regclass(p_table)) THEN
+    v_replay := v_replay || format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', p_table);
+  END IF;
+
+  FOR v_rec IN
+    SELECT * FROM pg_policies WHERE schemaname = current_schema() AND tablename = p_table
+  LOOP
+    v_replay := v_replay || format(
+      'CREATE POLICY %I ON %I AS %s FOR %s TO %s%s%s',
+      v_rec.policyname,
+      p_table,
+      v_rec.permissive,
+      v_rec.cmd,
+      array_to_string(
+        ARRAY(
+          SELECT CASE WHEN r = 'public' THEN 'PUBLIC' ELSE quote_ident(r) END
+          FROM unnest(v_rec.roles) AS r
+        ),
+        ', '
+      ),
+      COALESCE(' USING (' || v_rec.qual || ')', ''),
+      COALESCE(' WITH CHECK (' || v_rec.with_check || ')', '')
+    );
+  END LOOP;
+
+  FOR v_rec IN
+    SELECT grantee, privilege_type
+    FROM information_schema.role_table_grants
+    WHERE table_schema = current_schema() AND table_name = p_table
+  LOOP
+    v_replay := v_replay || format(
+      'GRANT %s ON %I TO %s',
+      v_rec.privilege_type,
+      p_table,
+      CASE WHEN v_rec.grantee = 'PUBLIC' THEN 'PUBLIC' ELSE quote_ident(v_rec.grantee) END
+    );
+    -- Readers of the table look up stored keys before upserting
+    IF v_key_type IS NOT NULL AND v_rec.privilege_type = 'SELECT' THEN
+      v_replay := v_replay || format(
+        'GRANT SELECT ON %I TO %s',
+        v_keys,
+        CASE WHEN v_rec.grantee = 'PUBLIC' THEN 'PUBLIC' ELSE quote_ident(v_rec.grantee) END
+      );
+    END IF;
+  END LOOP;
+
+  IF obj_description(to_regclass(p_table), 'pg_class') IS NOT NULL THEN
+    v_replay := v_replay || format(
+      'COMMENT ON TABLE %I IS %L', p_table, obj_description(to_regclass(p_table), 'pg_class')
+    );
+  END IF;
+
+  -- Views keep pointing at the renamed table unless redefined
+  FOR v_rec IN
+    SELECT DISTINCT v.oid::regclass::TEXT AS name, v.relkind, pg_get_viewdef(v.oid) AS definition
+    FROM pg_depend d
+    JOIN pg_rewrite r ON r.oid = d.objid
+    JOIN pg_class v ON v.oid = r.ev_class
+    WHERE d.classid = 'pg_rewrite'::regclass
+      AND d.refobjid = to_regclass(p_table)
+      AND v.oid <> to_regclass(p_table)
+  LOOP
+    IF v_rec.relkind = 'v' THEN
+      v_replay := v_replay || format(
+        'CREATE OR REPLACE VIEW %s AS %s', v_rec.name, regexp_replace(v_rec.definition, ';\s*$', '')
+      );
+    ELSE
+      RAISE NOTICE 'Materialized view % still reads %; recreate it', v_rec.name, v_old;
+    END IF;
+  END LOOP;
+
+  -- Swap in the partitioned parent
+  EXECUTE format('ALTER TABLE %I RENAME TO %I', p_table, v_old);
+  FOR v_rec IN
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE i.indrelid = to_regclass(v_old)
+  LOOP
+    EXECUTE format('ALTER INDEX %I RENAME TO %I', v_rec.relname, left(v_rec.relname, 59) || '_old');
+  END LOOP;
+
+  EXECUTE format(
+    'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED '
+    'INCLUDING STORAGE INCLUDING COMMENTS) PARTITION BY RANGE (created_utc)',
+    p_table, v_old
+  );
+  EXECUTE format(
+    'ALTER TABLE %I ADD CONSTRAINT %I UNIQUE (id, created_utc)', p_table, p_table || '_id_created_utc_key'
+  );
+  IF v_key_type IS NOT NULL THEN
+    EXECUTE format(
+      'ALTER TABLE %I ADD CONSTRAINT %I UNIQUE (%I, created_utc)',
+      p_table, format('%s_%s_created_utc_key', p_table, p_key), p_key
+    );
+    EXECUTE format(
+      'CREATE TABLE %I (%I %s PRIMARY KEY, created_utc TIMESTAMPTZ)', v_keys, p_key, v_key_type
+    );
+    EXECUTE format(
+      'COMMENT ON TABLE %I IS %L',
+      v_keys,
+      format('created_utc of every %s.%s, keeping the key unique across month partitions', p_table, p_key)
+    );
+  END IF;
+
+  -- Partitions for every month that has rows, the previous month and the
+  -- months ahead
+  EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', p_table || '_default', p_table);
+  FOR v_rec IN EXECUTE format(
+    'SELECT DISTINCT date_trunc(''month'', created_utc AT TIME ZONE ''UTC'')::DATE AS month '
+    'FROM %I WHERE created_utc IS NOT NULL',
+    v_old
+  )
+  LOOP
+    PERFORM create_monthly_partition(p_table, v_rec.month);
+  END LOOP;
+  PERFORM create_monthly_partition(p_table, (NOW() AT TIME ZONE 'UTC' - INTERVAL '1 month')::DATE);
+  PERFORM ensure_monthly_partitions(p_table);
+
+  -- Copy before the triggers exist so they do not fire. Of the rows sharing
+  -- a key (in any month) or an (id, created_utc), only the last-written one
+  -- is copied.
+  SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO v_columns
+  FROM pg_attribute
+  WHERE attrelid = to_regclass(p_table) AND attnum > 0 AND NOT attisdropped AND attgenerated = '';
+
+  IF v_key_type IS NULL THEN
+    EXECUTE format(
+      'INSERT INTO %I (%s) SELECT %s FROM %I ORDER BY ctid DESC ON CONFLICT DO NOTHING',
+      p_table, v_columns, v_columns, v_old
+    );
+    GET DIAGNOSTICS v_copied = ROW_COUNT;
+  ELSE
+    EXECUTE format(
+      'INSERT INTO %I (%s) SELECT %s FROM ('
+      '  SELECT DISTINCT ON (%I) * FROM %I WHERE %I IS NOT NULL ORDER BY %I, ctid DESC'
+      ') latest ON CONFLICT DO NOTHING',
+      p_table, v_columns, v_columns, p_key, v_old, p_key, p_key
+    );
+    GET DIAGNOSTICS v_copied = ROW_COUNT;
+    EXECUTE format(
+      'INSERT INTO %I (%s) SELECT %s FROM %I WHERE %I IS NULL ORDER BY ctid DESC ON CONFLICT DO NOTHING',
+      p_table, v_columns, v_columns, v_old, p_key
+    );
+    GET DIAGNOSTICS v_total = ROW_COUNT;
+    v_copied := v_copied + v_total;
+
+    EXECUTE format(
+      'INSERT INTO %I (%I, created_utc) SELECT %I, created_utc FROM %I WHERE %I IS NOT NULL',
+      v_keys, p_key, p_key, p_table, p_key
+    );
+  END IF;
+  EXECUTE format('SELECT count(*) FROM %I', v_old) INTO v_total;
+  IF v_copied < v_total THEN
+    RAISE NOTICE '% of % rows of % were duplicates on % or (id, created_utc) and were not copied',
+      v_total - v_copied, v_total, v_old, p_key;
+  END IF;
+
+  FOREACH v_statement IN ARRAY v_replay LOOP
+    EXECUTE v_statement;
+  END LOOP;
+
+  IF v_key_type IS NOT NULL THEN
+    EXECUTE format(
+      'CREATE TRIGGER %I AFTER INSERT OR DELETE OR UPDATE OF %I, created_utc ON %I '
+      'FOR EACH ROW EXECUTE FUNCTION maintain_partition_keys(%L, %L, %L, %L)',
+      'maintain_' || v_keys, p_key, p_table,
+      format('%I.%I', current_schema(), v_keys), v_qualified, p_key, v_key_type
+    );
+  END IF;
+
+  EXECUTE format('ANALYZE %I', p_table);
+  RAISE NOTICE '% (%) is kept for rollback; drop it once % is verified (see the header)',
+    v_old, pg_size_pretty(pg_total_relation_size(to_regclass(v_old))), p_table;
+END;
+$$;
+
+-- ==============================================================================
+-- STEP 4: Convert the tables
+-- ==============================================================================
+-- submissions first: its pass replaces comments.submission_id -> submissions(id)
+-- with triggers, which the comments pass carries over. Otherwise the comments
+-- pass would try to recreate the foreign key against the partitioned table.
+
+SELECT pg_temp.partition_by_created_utc('submissions', 'submission_id');
+SELECT pg_temp.partition_by_created_utc('comments', 'comment_id');
+
+-- ==============================================================================
+-- STEP 5: Recent-window indexes
+-- ==============================================================================
+-- Created on the parents, so every partition (including future ones) gets them.
+
+-- The baseline schema keys submissions by subreddit_id; the collectors filter
+-- on the subreddit name column where it exists.
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = current_schema() AND table_name = 'submissions' AND column_name = 'subreddit'
+  ) THEN
+    CREATE INDEX IF NOT EXISTS idx_submissions_subreddit_created_utc
+    ON submissions (subreddit, created_utc DESC);
+    COMMENT ON INDEX idx_submissions_subreddit_created_utc IS 'Recent submissions of a subreddit, per month partition';
+  END IF;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_comments_submission_created_utc
+ON comments (submission_id, created_utc);
+
+-- ==============================================================================
+-- STEP 6: Future partitions
+-- ==============================================================================
+-- Without pg_cron, call ensure_monthly_partitions() from any scheduler at least
+-- monthly; rows of a missing month land in <table>_default until then.
+
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+    PERFORM cron.schedule(
+      'ensure-monthly-partitions',
+      '0 3 * * *',
+      $cron$SELECT ensure_monthly_partitions('submissions'); SELECT ensure_monthly_partitions('comments');$cron$
+    );
+  ELSE
+    RAISE NOTICE 'pg_cron is not installed; schedule ensure_monthly_partitions() for submissions and comments';
+  END IF;
+END;
+$$;
+
+COMMENT ON FUNCTION create_monthly_partition(TEXT, DATE) IS 'Create and attach the UTC month partition of a created_utc-partitioned table, moving its rows out of the default partition';
+COMMENT ON FUNCTION ensure_monthly_partitions(TEXT, INTEGER) IS 'Create the partitions of the current month and the given number of months ahead; returns how many were created';
+COMMENT ON FUNCTION detach_monthly_partition(TEXT, DATE) IS 'Detach one month partition for archival; returns its name, or NULL if it is not attached';
+COMMENT ON FUNCTION detach_partitions_older_than(TEXT, INTEGER) IS 'Detach month partitions older than the given number of months (at least 2); returns the detached names';
+COMMENT ON INDEX idx_comments_submission_created_utc IS 'Comments of a submission from its creation time onwards';
+COMMENT ON FUNCTION check_partitioned_reference() IS 'Trigger replacing the check of a foreign key into a created_utc-partitioned table';
+COMMENT ON FUNCTION apply_partitioned_reference_action() IS 'Trigger replacing the ON DELETE / ON UPDATE action of a foreign key into a created_utc-partitioned table';
@@ -170,6 +170,99 @@ class TestActivityValidation:
         assert isinstance(result, (int, float))
         assert 0 <= result <= 100
 
+    def test_prefetch_subreddits_batches_info_requests(self):
+        """Metadata is resolved through /api/info, 100 names per request."""
+        from core.activity_validation import prefetch_subreddits
+        from core.utils.rate_limiter import RequestRateLimiter
+
+        names = [f"sub{i}" for i in range(150)]
+        mock_reddit_client = Mock()
+        mock_reddit_client.info.return_value = [
+            Mock(display_name=name.upper()) for name in names[:149]
+        ]
+        limiter = RequestRateLimiter(max_requests_per_minute=1000)
+
+        result = prefetch_subreddits(mock_reddit_client, names + ["sub0"], limiter)
+
+        mock_reddit_client.info.assert_called_once_with(subreddits=names)
+        assert len(result) == 149
+        assert "sub149" not in result
+        assert limiter.get_remaining_requests() == 998
+
+    def test_snapshot_uses_prefetched_subreddits(self):
+        """Prefetched subreddits are measured without lazy per-name lookups."""
+        from core.activity_validation import ActivityMetrics, snapshot_active_subreddits
+
+        hydrated = Mock(display_name="SaaS", subreddit_type="public", subscribers=100000)
+        mock_reddit_client = Mock()
+        mock_reddit_client.info.return_value = [hydrated]
+        mock_reddit_client.subreddit.return_value = Mock(
+            display_name="missing", subreddit_type="public"
+        )
+
+        with patch('core.activity_validation.collect_activity_metrics') as mock_metrics, \
+             patch('core.activity_validation.score_activity_metrics') as mock_score:
+            mock_metrics.return_value = ActivityMetrics()
+            mock_score.return_value = 75.0
+
+            result = snapshot_active_subreddits(
+                mock_reddit_client, ["saas", "missing"], min_activity_score=50.0, max_workers=1
+            )
+
+        assert [activity.subreddit for activity in result][0] is hydrated
+        mock_reddit_client.subreddit.assert_called_once_with("missing")
+
+    def test_snapshot_gives_each_pool_worker_its_own_client(self):
+        """With a RedditClientPool every worker prefetches and measures on one client."""
+        from core.activity_validation import ActivityMetrics, snapshot_active_subreddits
+        from core.utils.reddit_client_pool import RedditClientPool, RedditCredential
+
+        def make_client(credential, rate_limiter):
+            client = Mock(name=credential.client_id)
+            client.info.side_effect = lambda subreddits: [
+                Mock(display_name=name, subreddit_type="public", client=client)
+                for name in subreddits
+            ]
+            return client
+
+        pool = RedditClientPool(
+            [RedditCredential(f"id{i}", "secret", "agent") for i in range(2)],
+            client_factory=make_client,
+        )
+        names = ["a", "b", "c", "d", "e"]
+
+        with patch('core.activity_validation.collect_activity_metrics') as mock_metrics, \
+             patch('core.activity_validation.score_activity_metrics', return_value=75.0):
+            mock_metrics.return_value = ActivityMetrics()
+            result = snapshot_active_subreddits(pool, names, max_workers=8)
+
+        assert [activity.subreddit.display_name for activity in result] == names
+        first, second = (member.client for member in pool.members)
+        first.info.assert_called_once_with(subreddits=["a", "c", "e"])
+        second.info.assert_called_once_with(subreddits=["b", "d"])
+
+    def test_snapshot_measures_single_client_sequentially(self):
+        """A plain PRAW client is never shared across threads."""
+        from core.activity_validation import snapshot_active_subreddits
+
+        mock_reddit_client = Mock()
+        mock_reddit_client.info.return_value = []
+
+        with patch('core.activity_validation.ThreadPoolExecutor') as executor, \
+             patch('core.activity_validation.measure_subreddit_activity', return_value=None):
+            snapshot_active_subreddits(mock_reddit_client, ["a", "b"], max_workers=8)
+
+        executor.assert_not_called()
+
+    def test_prefetch_failure_falls_back_to_lazy_lookups(self):
+        """A failed /api/info call leaves lazy lookups to the caller."""
+        from core.activity_validation import prefetch_subreddits
+
+        mock_reddit_client = Mock()
+        mock_reddit_client.info.side_effect = Exception("API Error")
+
+        assert prefetch_subreddits(mock_reddit_client, ["python"]) == {}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
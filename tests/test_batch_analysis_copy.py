@@ -0,0 +1,235 @@
+"""Tests for batch copying of existing Agno/Profiler analyses."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.deduplication import AgnoSkipLogic, ProfilerSkipLogic
+from core.deduplication.agno_skip_logic import PRIMARY_ANALYSIS_FUNCTION, PRIMARY_ANALYSIS_VIEW
+from core.deduplication.profiler_skip_logic import PRIMARY_PROFILE_FUNCTION, PRIMARY_PROFILE_VIEW
+from core.pipeline import DataSource, OpportunityPipeline, PipelineConfig
+
+AGNO_ROWS = [
+    {"business_concept_id": 1, "willingness_to_pay_score": 60, "analyzed_at": "2025-11-01",
+     "opportunity_id": "opp_a"},
+    {"business_concept_id": 1, "willingness_to_pay_score": 85, "analyzed_at": "2025-11-03",
+     "opportunity_id": "opp_b"},
+    {"business_concept_id": 2, "willingness_to_pay_score": 40, "analyzed_at": None,
+     "opportunity_id": "opp_c"},
+]
+PROFILE_ROWS = [
+    {"business_concept_id": 1, "app_name": "Chore Bot", "processed_at": "2025-11-02",
+     "opportunity_id": "opp_a"},
+]
+
+
+def _client(
+    tables: dict[str, list[dict]],
+    missing: tuple[str, ...] = (),
+    functions: dict[str, list[dict]] | None = None,
+):
+    """Supabase mock whose select queries and RPCs return the given rows.
+
+    RPCs not listed in functions fail as if the function were not deployed.
+    """
+    client = MagicMock()
+    queries = {}
+
+    def rpc(name, params=None):
+        call = MagicMock()
+        if functions is None or name not in functions:
+            call.execute.side_effect = RuntimeError(f"function {name} does not exist")
+        else:
+            call.execute.return_value = MagicMock(data=functions[name])
+        return call
+
+    def table(name):
+        if name not in queries:
+            query = MagicMock()
+            query.select.return_value = query
+            query.in_.return_value = query
+            query.eq.return_value = query
+            if name in missing:
+                query.execute.side_effect = RuntimeError(f"relation {name} does not exist")
+            else:
+                query.execute.return_value = MagicMock(data=tables.get(name, []))
+            queries[name] = query
+        return queries[name]
+
+    client.table.side_effect = table
+    client.rpc.side_effect = rpc
+    client.queries = queries
+    return client
+
+
+def _targets():
+    return [
+        ({"submission_id": "s1"}, 1),
+        ({"submission_id": "s2"}, 1),
+        ({"submission_id": "s3"}, 2),
+        ({"submission_id": "s4"}, 3),  # concept without a primary analysis
+        ({}, 1),  # no submission_id
+    ]
+
+
+def test_agno_batch_copy_uses_one_query_and_one_insert():
+    client = _client({PRIMARY_ANALYSIS_VIEW: AGNO_ROWS[1:]})
+    skip_logic = AgnoSkipLogic(client)
+
+    copies = skip_logic.copy_agno_analyses_batch(_targets())
+
+    assert set(copies) == {"s1", "s2", "s3"}
+    assert copies["s1"]["willingness_to_pay_score"] == 85
+    assert copies["s1"]["primary_opportunity_id"] == "opp_b"
+    assert copies["s3"]["copied_from_primary"] is True
+    view = client.queries[PRIMARY_ANALYSIS_VIEW]
+    view.in_.assert_called_once_with("business_concept_id", [1, 2, 3])
+    inserted = client.queries["llm_monetization_analysis"].insert.call_args.args[0]
+    assert [r["submission_id"] for r in inserted] == ["s1", "s2", "s3"]
+    assert skip_logic.get_statistics()["copied"] == 3
+
+
+def test_agno_batch_copy_falls_back_to_base_table():
+    client = _client({"llm_monetization_analysis": AGNO_ROWS}, missing=(PRIMARY_ANALYSIS_VIEW,))
+
+    latest = AgnoSkipLogic(client).fetch_primary_analyses([1, 2, 1])
+
+    assert latest[1]["willingness_to_pay_score"] == 85
+    assert latest[2]["opportunity_id"] == "opp_c"
+    client.queries["llm_monetization_analysis"].eq.assert_called_once_with(
+        "copied_from_primary", False
+    )
+
+
+def test_primary_lookups_prefer_database_functions():
+    client = _client(
+        {},
+        functions={
+            PRIMARY_ANALYSIS_FUNCTION: AGNO_ROWS[1:],
+            PRIMARY_PROFILE_FUNCTION: PROFILE_ROWS,
+        },
+    )
+
+    analyses = AgnoSkipLogic(client).fetch_primary_analyses([1, 2, 1])
+    profiles = ProfilerSkipLogic(client).fetch_primary_profiles([1])
+
+    assert analyses[1]["willingness_to_pay_score"] == 85
+    assert set(analyses) == {1, 2}
+    assert profiles[1]["app_name"] == "Chore Bot"
+    assert client.rpc.call_args_list[0].args == (
+        PRIMARY_ANALYSIS_FUNCTION,
+        {"p_concept_ids": [1, 2]},
+    )
+    client.table.assert_not_called()
+
+
+def test_primary_lookups_read_known_ids_directly():
+    rows = [{**AGNO_ROWS[1], "id": "lma_b"}, {**AGNO_ROWS[2], "id": "lma_c"}]
+    client = _client({"llm_monetization_analysis": rows})
+
+    latest = AgnoSkipLogic(client).fetch_primary_analyses(
+        [1, 2, 1], primary_ids={1: "lma_b", 2: "lma_c"}
+    )
+
+    assert latest[1]["willingness_to_pay_score"] == 85
+    assert latest[2]["opportunity_id"] == "opp_c"
+    client.queries["llm_monetization_analysis"].in_.assert_called_once_with(
+        "id", ["lma_b", "lma_c"]
+    )
+    client.rpc.assert_not_called()
+
+
+def test_primary_lookups_without_every_id_use_the_function():
+    client = _client({}, functions={PRIMARY_PROFILE_FUNCTION: PROFILE_ROWS})
+
+    profiles = ProfilerSkipLogic(client).fetch_primary_profiles(
+        [1, 2], primary_ids={1: "wr_a"}
+    )
+
+    assert profiles[1]["app_name"] == "Chore Bot"
+    client.table.assert_not_called()
+
+
+def test_profiler_batch_copy_matches_single_copy():
+    client = _client({PRIMARY_PROFILE_VIEW: PROFILE_ROWS, "workflow_results": PROFILE_ROWS})
+    skip_logic = ProfilerSkipLogic(client)
+
+    copies = skip_logic.copy_profiler_analyses_batch(_targets())
+    single = skip_logic.copy_profiler_analysis(submission={"submission_id": "s1"}, concept_id=1)
+
+    assert set(copies) == {"s1", "s2"}
+    strip = lambda d: {k: v for k, v in d.items() if k != "copy_timestamp"}  # noqa: E731
+    assert strip(copies["s1"]) == strip(single)
+
+
+def test_empty_batch_makes_no_queries():
+    client = _client({})
+
+    assert AgnoSkipLogic(client).copy_agno_analyses_batch([]) == {}
+    client.table.assert_not_called()
+
+
+class TestPipelineBatchCopy:
+    """OpportunityPipeline copies analyses for all deduplicated submissions at once."""
+
+    @pytest.fixture
+    def pipeline(self):
+        client = _client({PRIMARY_ANALYSIS_VIEW: AGNO_ROWS[1:], PRIMARY_PROFILE_VIEW: PROFILE_ROWS})
+        config = PipelineConfig(
+            data_source=DataSource.DATABASE,
+            enable_profiler=True,
+            enable_monetization=True,
+            supabase_client=client,
+            dry_run=True,
+        )
+        pipeline = OpportunityPipeline(config)
+        pipeline.services = {"monetization": MagicMock(), "profiler": MagicMock()}
+        return pipeline
+
+    def test_batch_copy_feeds_copy_existing_enrichment(self, pipeline):
+        submissions = [{"submission_id": f"s{i}"} for i in range(1, 5)]
+        metadata = {
+            "s1": {"concept_id": 1, "has_agno": True, "has_profiler": True},
+            "s2": {"concept_id": 1, "has_agno": True, "has_profiler": True},
+            "s3": {"concept_id": 2, "has_agno": True, "has_profiler": False},
+        }
+
+        copied = pipeline._batch_copy_existing_analyses(submissions, metadata)
+        results = [
+            pipeline._copy_existing_enrichment(sub, metadata[sub["submission_id"]]["concept_id"], copied)
+            for sub in submissions[:3]
+        ]
+
+        assert set(copied["monetization"]) == {"s1", "s2", "s3"}
+        assert set(copied["profiler"]) == {"s1", "s2"}
+        assert results[0]["app_name"] == "Chore Bot"
+        assert results[0]["profiler_evidence_source"] == "copied_agno"
+        assert results[2]["willingness_to_pay_score"] == 40
+        assert "app_name" not in results[2]
+        client = pipeline.config.supabase_client
+        assert client.queries[PRIMARY_ANALYSIS_VIEW].execute.call_count == 1
+        assert client.queries[PRIMARY_PROFILE_VIEW].execute.call_count == 1
+
+    def test_batch_copy_passes_primary_analysis_ids(self, pipeline):
+        metadata = {
+            "s1": {
+                "concept_id": 1,
+                "has_agno": True,
+                "has_profiler": True,
+                "primary_agno_analysis_id": "lma_b",
+                "primary_profiler_analysis_id": None,
+            }
+        }
+
+        with patch("core.deduplication.AgnoSkipLogic") as agno_class, patch(
+            "core.deduplication.ProfilerSkipLogic"
+        ) as profiler_class:
+            pipeline._batch_copy_existing_analyses([{"submission_id": "s1"}], metadata)
+
+        agno_kwargs = agno_class.return_value.copy_agno_analyses_batch.call_args.kwargs
+        profiler_call = profiler_class.return_value.copy_profiler_analyses_batch.call_args
+        assert agno_kwargs["primary_ids"] == {1: "lma_b"}
+        assert profiler_call.kwargs["primary_ids"] == {}
+
+    def test_nothing_to_copy(self, pipeline):
+        assert pipeline._batch_copy_existing_analyses([{"submission_id": "s1"}], {}) is None
@@ -0,0 +1,271 @@
+"""Tests for SimpleDeduplicator.process_opportunities (batch deduplication)."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from core.deduplication import simple_deduplicator
+from core.deduplication.concept_index import DEFAULT_SIMILARITY_THRESHOLD
+
+
+class FakeQuery:
+    """The subset of the PostgREST query builder SimpleDeduplicator uses."""
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.filters = []
+        self.rows_to_insert = None
+        self.ignore_duplicates = False
+        self.order_column = None
+        self.bounds = None
+
+    def select(self, _columns):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        values = set(values)
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def order(self, column):
+        self.order_column = column
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end + 1)
+        return self
+
+    def insert(self, rows):
+        self.rows_to_insert = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict, ignore_duplicates=False):
+        assert (self.table, on_conflict, ignore_duplicates) == (
+            "business_concepts", "concept_fingerprint", True
+        )
+        self.ignore_duplicates = True
+        return self.insert(rows)
+
+    def execute(self):
+        self.db.round_trips += 1
+        rows = self.db.tables[self.table]
+        if self.rows_to_insert is not None:
+            return SimpleNamespace(
+                data=self.db.insert(self.table, self.rows_to_insert, self.ignore_duplicates)
+            )
+        matched = [row for row in rows if all(f(row) for f in self.filters)]
+        if self.order_column:
+            matched.sort(key=lambda row: row[self.order_column])
+        if self.bounds:
+            matched = matched[slice(*self.bounds)]
+        return SimpleNamespace(data=[dict(row) for row in matched])
+
+
+class FakeSupabase:
+    """In-memory business_concepts / opportunities_unified with the dedup RPCs."""
+
+    def __init__(self):
+        self.tables = {"business_concepts": [], "opportunities_unified": []}
+        self.round_trips = 0
+        self._next_id = 1
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def insert(self, table, rows, ignore_duplicates=False):
+        if table == "business_concepts":
+            known = {c["concept_fingerprint"] for c in self.tables[table]}
+            if ignore_duplicates:
+                rows = [row for row in rows if row["concept_fingerprint"] not in known]
+            fingerprints = [row["concept_fingerprint"] for row in rows]
+            if len(set(fingerprints)) < len(fingerprints) or known & set(fingerprints):
+                raise RuntimeError("duplicate key value violates unique constraint")
+            created = []
+            for row in rows:
+                created.append({**row, "id": self._next_id})
+                self._next_id += 1
+            rows = created
+        self.tables[table].extend(dict(row) for row in rows)
+        return [dict(row) for row in rows]
+
+    def concept(self, concept_id):
+        return next(c for c in self.tables["business_concepts"] if c["id"] == concept_id)
+
+    def opportunity(self, opportunity_id):
+        return next(
+            (o for o in self.tables["opportunities_unified"] if o["id"] == opportunity_id), None
+        )
+
+    def _mark(self, opportunity_id, concept_id, is_duplicate, primary_opportunity_id=None):
+        opportunity = self.opportunity(opportunity_id)
+        if opportunity is None:
+            return False
+        opportunity.update(
+            business_concept_id=concept_id,
+            is_duplicate=is_duplicate,
+            duplicate_of_id=(
+                primary_opportunity_id or self.concept(concept_id)["primary_opportunity_id"]
+                if is_duplicate
+                else None
+            ),
+        )
+        if is_duplicate:
+            self.concept(concept_id)["submission_count"] += 1
+        return True
+
+    def rpc(self, name, params):
+        def execute():
+            self.round_trips += 1
+            if name == "increment_concept_count":
+                self.concept(params["concept_id"])["submission_count"] += 1
+                return SimpleNamespace(data=None)
+            if name == "increment_concept_counts":
+                for concept_id, n in zip(params["p_concept_ids"], params["p_increments"], strict=True):
+                    self.concept(concept_id)["submission_count"] += n
+                return SimpleNamespace(data=None)
+            if name == "mark_opportunity_duplicate":
+                return SimpleNamespace(data=self._mark(
+                    params["p_opportunity_id"], params["p_concept_id"], True,
+                    params["p_primary_opportunity_id"],
+                ))
+            if name == "mark_opportunity_unique":
+                return SimpleNamespace(
+                    data=self._mark(params["p_opportunity_id"], params["p_concept_id"], False)
+                )
+            if name == "mark_opportunities_batch":
+                last = {mark["opportunity_id"]: mark for mark in params["p_marks"]}
+                marked = [
+                    opportunity_id for opportunity_id, mark in last.items()
+                    if self._mark(
+                        opportunity_id, mark["concept_id"], mark["is_duplicate"],
+                        mark.get("primary_opportunity_id"),
+                    )
+                ]
+                return SimpleNamespace(data=marked)
+            raise AssertionError(f"unexpected rpc {name}")
+
+        return SimpleNamespace(execute=execute)
+
+    def snapshot(self):
+        concepts = sorted(
+            (c["concept_fingerprint"], c["primary_opportunity_id"], c["submission_count"])
+            for c in self.tables["business_concepts"]
+        )
+        opportunities = sorted(
+            (o["id"], o.get("is_duplicate"), o.get("duplicate_of_id"))
+            for o in self.tables["opportunities_unified"]
+        )
+        return concepts, opportunities
+
+
+OPPORTUNITIES = [
+    {"id": "opp-1", "app_concept": "App: Roommate chore tracker"},
+    {"id": "opp-2", "app_concept": "roommate chore tracker"},  # exact, same batch
+    {"id": "opp-3", "app_concept": "Chore tracking app for roommates"},  # similar, same batch
+    {"id": "opp-4", "app_concept": "Invoice automation for freelancers"},  # exists already
+    {"id": "opp-5", "app_concept": "Freelancer invoicing tool"},  # similar to existing
+    {"id": "opp-6", "app_concept": "Meal planner for students"},
+    {"id": "opp-7"},  # missing app_concept
+    {"id": "", "app_concept": "no id"},
+    {"id": "opp-8", "app_concept": "meal planner for students"},
+]
+
+
+@pytest.fixture
+def module():
+    return simple_deduplicator
+
+
+def _deduplicator(module, db, **kwargs):
+    kwargs.setdefault("similarity_threshold", DEFAULT_SIMILARITY_THRESHOLD)
+    with patch.object(module, "create_client", return_value=db):
+        return module.SimpleDeduplicator("url", "key", **kwargs)
+
+
+def _seeded_db(module):
+    """A database that already holds the invoicing concept."""
+    db = FakeSupabase()
+    seed = _deduplicator(module, db)
+    seed.process_opportunity({"id": "opp-0", "app_concept": "invoice automation for freelancers"})
+    db.round_trips = 0
+    return db
+
+
+def _comparable(results):
+    return [{k: v for k, v in r.items() if k != "processing_time"} for r in results]
+
+
+@pytest.mark.parametrize("cache_size", [None, 100])
+def test_batch_matches_per_row_processing(module, cache_size):
+    per_row_db, batch_db = _seeded_db(module), _seeded_db(module)
+
+    per_row = _deduplicator(module, per_row_db, fingerprint_cache_size=cache_size)
+    expected = [per_row.process_opportunity(opp) for opp in OPPORTUNITIES]
+    batched = _deduplicator(module, batch_db, fingerprint_cache_size=cache_size)
+    results = batched.process_opportunities(OPPORTUNITIES)
+
+    assert _comparable(results) == _comparable(expected)
+    assert batch_db.snapshot() == per_row_db.snapshot()
+    assert [r["match_type"] for r in results] == [
+        None, "exact", "similar", "exact", "similar", None, None, None, "exact",
+    ]
+    assert batch_db.round_trips < per_row_db.round_trips / 3
+
+
+def test_failed_insert_falls_back_to_per_row(module):
+    db = _seeded_db(module)
+    dedup = _deduplicator(module, db)
+    dedup.get_concept_index()
+    # Another process creates the concept after this one looked up its fingerprints
+    other = _deduplicator(module, db)
+    original = dedup.find_existing_concepts
+
+    def stale_lookup(fingerprints):
+        found = original(fingerprints)
+        other.process_opportunity({"id": "opp-x", "app_concept": "Meal planner for students"})
+        return found
+
+    dedup.find_existing_concepts = stale_lookup
+    results = dedup.process_opportunities(OPPORTUNITIES[5:6] + OPPORTUNITIES[8:])
+
+    assert [r["success"] for r in results] == [True, True]
+    assert [r["is_duplicate"] for r in results] == [True, True]
+    assert results[0]["concept_id"] == results[1]["concept_id"]
+
+
+def test_only_rows_of_concepts_created_elsewhere_fall_back(module):
+    db = _seeded_db(module)
+    dedup = _deduplicator(module, db)
+    dedup.get_concept_index()
+    other = _deduplicator(module, db)
+    original = dedup.find_existing_concepts
+
+    def stale_lookup(fingerprints):
+        found = original(fingerprints)
+        other.process_opportunity({"id": "opp-x", "app_concept": "Meal planner for students"})
+        return found
+
+    dedup.find_existing_concepts = stale_lookup
+    with patch.object(dedup, "process_opportunity", wraps=dedup.process_opportunity) as per_row:
+        results = dedup.process_opportunities([OPPORTUNITIES[0], OPPORTUNITIES[5]])
+
+    assert [r["success"] for r in results] == [True, True]
+    assert [r["is_duplicate"] for r in results] == [False, True]
+    per_row.assert_called_once_with(OPPORTUNITIES[5])
+
+
+def test_empty_and_invalid_batches(module):
+    dedup = _deduplicator(module, FakeSupabase())
+
+    assert dedup.process_opportunities([]) == []
+    results = dedup.process_opportunities([{}, {"id": "opp-1"}])
+    assert [r["error"] for r in results] == [
+        "Opportunity dictionary is required",
+        "Missing required field: app_concept",
+    ]
@@ -0,0 +1,116 @@
+"""Tests for columnar batch quality scoring.
+
+The batch scorer must reproduce the scalar path exactly: the same quality
+scores and the same filter reasons for every post, given the same clock.
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from core.quality_filters.batch_scorer import (
+    evaluate_submissions_batch,
+    score_submissions_batch,
+)
+from core.quality_filters.pre_filter import filter_submissions_batch, should_analyze_with_ai
+from core.quality_filters.quality_scorer import get_quality_breakdown
+from core.quality_filters.thresholds import PROBLEM_KEYWORDS
+
+NOW = 1_760_000_000.0
+
+
+def _random_posts(count: int, seed: int = 7) -> list[dict]:
+    """Posts covering every field variant and every filter outcome."""
+    rng = random.Random(seed)
+    words = ["the", "tool", "workflow", "Excel", "ERROR", "Pain", "report", "team"]
+    posts = []
+
+    for i in range(count):
+        body = " ".join(rng.choice(words + PROBLEM_KEYWORDS) for _ in range(rng.randint(0, 12)))
+        post = {"title": rng.choice(["", "Help", "Hard to invoice", None]), "id": str(i)}
+        post[rng.choice(["text", "content"])] = body or None
+        post[rng.choice(["upvotes", "score"])] = rng.choice([0, 3, 5, 12, 250, 7.5, None])
+        post[rng.choice(["num_comments", "comments_count"])] = rng.choice([0, 1, 4, 90, None])
+
+        age = rng.uniform(0, 60 * 24 * 3600)
+        created = rng.random()
+        if created < 0.4:
+            post["created_utc"] = NOW - age
+        elif created < 0.7:
+            post["created_utc"] = "2025-10-01T12:30:00Z"
+        elif created < 0.8:
+            post["created_utc"] = "2025-10-09T08:00:00+00:00"
+        posts.append(post)
+
+    return posts
+
+
+@pytest.fixture
+def posts():
+    return _random_posts(500)
+
+
+def test_scores_match_scalar_scorer(posts):
+    """Every component and the total match the scalar breakdown."""
+    with patch("core.quality_filters.quality_scorer.time.time", return_value=NOW):
+        expected = [get_quality_breakdown(post) for post in posts]
+
+    scores = score_submissions_batch(posts, now=NOW)
+
+    assert len(scores) == len(posts)
+    assert scores["quality_score"].tolist() == [e["total_score"] for e in expected]
+    assert scores["problem_keyword_count"].tolist() == [
+        e["problem_keyword_count"] for e in expected
+    ]
+    assert [round(v, 2) for v in scores["recency_score"]] == [e["recency_score"] for e in expected]
+
+
+@pytest.mark.parametrize("threshold,outcomes", [(0.0, 4), (15.0, 5), (42.5, 5)])
+def test_decisions_and_reasons_match_scalar_filter(posts, threshold, outcomes):
+    """Pass/fail, score and reason match should_analyze_with_ai() for every post."""
+    with patch("core.quality_filters.quality_scorer.time.time", return_value=NOW):
+        expected = [should_analyze_with_ai(post, threshold) for post in posts]
+
+    decisions, scores, reasons = evaluate_submissions_batch(posts, threshold, now=NOW)
+
+    assert list(zip(decisions.tolist(), scores, reasons)) == expected
+    # The sample exercises every gate (no post is below a zero threshold)
+    assert len({reason.split("(")[0] for reason in reasons}) == outcomes
+
+
+def test_filtering_disabled_passes_everything(posts):
+    decisions, scores, reasons = evaluate_submissions_batch(posts, enable_filtering=False, now=NOW)
+
+    assert decisions.all()
+    assert set(reasons) == {"Filtering disabled (test mode)"}
+    assert scores == score_submissions_batch(posts, now=NOW)["quality_score"].tolist()
+
+
+def test_missing_created_utc_scores_full_recency():
+    scores = score_submissions_batch([{"title": "problem"}], now=NOW)
+
+    assert scores["recency_score"].tolist() == [30.0]
+    assert scores["quality_score"].tolist() == [40.0]
+
+
+def test_empty_batch():
+    decisions, scores, reasons = evaluate_submissions_batch([])
+
+    assert score_submissions_batch([]).empty
+    assert decisions.size == 0
+    assert scores == [] and reasons == []
+
+
+def test_filter_submissions_batch_uses_batch_scores(posts):
+    """filter_submissions_batch keeps its output shape and order."""
+    with patch("core.quality_filters.batch_scorer.time.time", return_value=NOW):
+        passed, filtered = filter_submissions_batch(posts)
+    decisions, scores, reasons = evaluate_submissions_batch(posts, now=NOW)
+
+    assert [p["id"] for p in passed] == [
+        post["id"] for post, ok in zip(posts, decisions) if ok
+    ]
+    assert [(f["quality_score"], f["filter_reason"]) for f in filtered] == [
+        (score, reason) for score, reason, ok in zip(scores, reasons, decisions) if not ok
+    ]
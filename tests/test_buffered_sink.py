@@ -0,0 +1,119 @@
+"""Tests for the background-flushed collector sink."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.collection import collect_enhanced_submissions
+from core.dlt_collection import stream_problem_posts
+from core.storage.buffered_sink import BufferedSink
+
+
+def test_flushes_full_batches_and_remainder_on_close():
+    batches = []
+
+    with BufferedSink(batches.append, batch_size=3, flush_interval=60) as sink:
+        sink.extend({"id": i} for i in range(7))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert sink.stats.rows_flushed == 7
+    assert sink.stats.batches_flushed == 3
+
+
+def test_flushes_partial_batch_after_interval():
+    flushed = threading.Event()
+    sink = BufferedSink(lambda rows: flushed.set(), batch_size=100, flush_interval=0.05)
+
+    sink.add({"id": 1})
+
+    assert flushed.wait(timeout=2)
+    sink.close()
+    assert sink.stats.rows_flushed == 1
+
+
+def test_flush_is_a_barrier():
+    written = []
+
+    def slow_write(rows):
+        time.sleep(0.05)
+        written.extend(rows)
+
+    sink = BufferedSink(slow_write, batch_size=2, flush_interval=60)
+    sink.extend({"id": i} for i in range(5))
+    sink.flush()
+
+    assert len(written) == 5
+    sink.close()
+
+
+def test_add_blocks_when_writer_falls_behind():
+    release = threading.Event()
+    sink = BufferedSink(lambda rows: release.wait(), batch_size=1, flush_interval=60,
+                        max_pending_batches=1)
+    sink.add({"id": 1})  # taken by the writer, which blocks
+    sink.add({"id": 2})  # fills the queue
+
+    adder = threading.Thread(target=sink.add, args=({"id": 3},))
+    adder.start()
+    adder.join(timeout=0.2)
+    assert adder.is_alive()
+
+    release.set()
+    adder.join(timeout=2)
+    sink.close()
+    assert sink.stats.rows_flushed == 3
+
+
+def test_failed_batches_are_counted_not_raised():
+    def flaky(rows):
+        if rows[0]["id"] == 0:
+            raise RuntimeError("db down")
+        return False if rows[0]["id"] == 2 else True
+
+    with BufferedSink(flaky, batch_size=2, flush_interval=60) as sink:
+        sink.extend({"id": i} for i in range(6))
+
+    assert sink.stats.rows_flushed == 2
+    assert sink.stats.rows_failed == 4
+    assert sink.stats.batches_failed == 2
+    assert "db down" in sink.stats.errors
+
+
+def test_add_after_close_raises():
+    sink = BufferedSink(lambda rows: None)
+    sink.close()
+    with pytest.raises(RuntimeError):
+        sink.add({"id": 1})
+
+
+def test_stream_problem_posts_loads_in_batches():
+    with patch("core.dlt_collection.load_to_supabase", return_value=True) as mock_load:
+        stats = stream_problem_posts(["a", "b"], limit=5, test_mode=True, batch_size=4)
+
+    assert stats.rows_added == 10
+    assert stats.rows_flushed == 10
+    assert [len(call.args[0]) for call in mock_load.call_args_list] == [4, 4, 2]
+
+
+@pytest.mark.parametrize("upsert_fails, expected", [(False, True), (True, False)])
+def test_collect_enhanced_submissions_reports_failed_batches(upsert_fails, expected):
+    reddit = MagicMock()
+    reddit.subreddit.return_value.new.return_value = [
+        MagicMock(id=f"s{i}", title="Looking for a tool", selftext="", author="user",
+                  score=5, num_comments=1, created_utc=1704067200, url="", permalink="",
+                  over_18=False)
+        for i in range(3)
+    ]
+    supabase = MagicMock()
+    if upsert_fails:
+        supabase.table.return_value.upsert.return_value.execute.side_effect = RuntimeError("down")
+
+    with patch("core.collection.time.sleep"):
+        success = collect_enhanced_submissions(
+            reddit, supabase, {}, ["SaaS"], limit=3, sort_types=["new"],
+            time_filter="day", mask_pii=False, batch_size=2,
+        )
+
+    assert success is expected
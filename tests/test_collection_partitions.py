@@ -0,0 +1,77 @@
+"""Tests for the collector helpers that target the month-partitioned tables."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from core.collection import (
+    COMMENT_CONFLICT_KEY,
+    SUBMISSION_CONFLICT_KEY,
+    created_utc_window,
+    reddit_created_utc,
+    upsert_partitioned,
+    upsert_rows_fn,
+)
+
+
+def _client_with_stored_keys(stored):
+    client = MagicMock()
+    tables = {"keys": MagicMock(), "rows": MagicMock()}
+    client.table.side_effect = lambda name: tables["keys" if name.endswith("_keys") else "rows"]
+    tables["keys"].select.return_value.in_.return_value.execute.return_value.data = stored
+    return client, tables
+
+
+def test_reddit_created_utc_is_utc_regardless_of_local_zone():
+    assert reddit_created_utc(1704067200) == "2024-01-01T00:00:00+00:00"
+
+
+def test_created_utc_window_bounds_both_sides():
+    query = MagicMock()
+
+    created_utc_window(query, datetime(2024, 1, 1), "2024-01-02T00:00:00+00:00")
+
+    query.gte.assert_called_once_with("created_utc", "2024-01-01T00:00:00")
+    query.gte.return_value.lte.assert_called_once_with("created_utc", "2024-01-02T00:00:00+00:00")
+
+
+def test_created_utc_window_default_upper_bound_is_utc():
+    query = MagicMock()
+
+    created_utc_window(query, "2024-01-01T00:00:00+00:00")
+
+    until = datetime.fromisoformat(query.gte.return_value.lte.call_args[0][1])
+    assert until.utcoffset() == timedelta(0)
+    assert until > datetime.now(UTC)
+
+
+def test_upsert_rows_fn_collapses_rows_on_key():
+    client, tables = _client_with_stored_keys([])
+    upsert = upsert_rows_fn(client, "comments", COMMENT_CONFLICT_KEY)
+
+    upsert([
+        {"comment_id": "c1", "created_utc": "2024-01-01T00:00:00+00:00", "body": "old"},
+        {"comment_id": "c1", "created_utc": "2024-01-02T00:00:00+00:00", "body": "new"},
+        {"comment_id": "c2", "created_utc": "2024-01-01T00:00:00+00:00", "body": "other"},
+    ])
+
+    rows = tables["rows"].upsert.call_args[0][0]
+    assert [row["body"] for row in rows] == ["new", "other"]
+    assert tables["rows"].upsert.call_args[1]["on_conflict"] == "comment_id,created_utc"
+    tables["keys"].select.return_value.in_.assert_called_once_with("comment_id", ["c1", "c2"])
+
+
+def test_upsert_partitioned_uses_stored_created_utc_of_known_keys():
+    client, tables = _client_with_stored_keys(
+        [{"submission_id": "s1", "created_utc": "2023-12-31T23:00:00+00:00"}]
+    )
+
+    upsert_partitioned(client, "submissions", [
+        {"submission_id": "s1", "created_utc": "2024-01-01T00:00:00+00:00"},
+        {"submission_id": "s2", "created_utc": "2024-01-01T00:00:00+00:00"},
+    ], SUBMISSION_CONFLICT_KEY)
+
+    client.table.assert_any_call("submissions_keys")
+    assert tables["rows"].upsert.call_args[0][0] == [
+        {"submission_id": "s1", "created_utc": "2023-12-31T23:00:00+00:00"},
+        {"submission_id": "s2", "created_utc": "2024-01-01T00:00:00+00:00"},
+    ]
@@ -0,0 +1,177 @@
+"""Tests for the semantic near-duplicate concept index."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.deduplication import simple_deduplicator
+from core.deduplication.concept_index import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    LOG_FILE,
+    ConceptSimilarityIndex,
+    concept_tokens,
+    vectorize_concept,
+)
+
+
+def _similarity(a: str, b: str) -> float:
+    return float(vectorize_concept(a) @ vectorize_concept(b))
+
+
+def test_tokens_drop_boilerplate_and_fold_forms():
+    assert concept_tokens("App to track chores between roommates") == ["track", "chor", "roommat"]
+    assert concept_tokens("Roommate chore tracker") == ["roommat", "chor", "track"]
+
+
+def test_similarity_of_reworded_concepts():
+    assert _similarity("Roommate chore tracker", "Chore tracking app for roommates") == pytest.approx(1.0)
+    assert _similarity("Invoice automation for freelancers", "Freelancer invoicing tool") > 0.8
+    assert _similarity("Budget planner for students", "Meal planner for students") < 0.8
+    assert not vectorize_concept("the app for it").any()
+
+
+def test_best_match_respects_threshold():
+    index = ConceptSimilarityIndex()
+    index.add(1, "roommate chore tracker", "opp-1")
+    index.add(2, "meal planner for students", "opp-2")
+
+    match = index.best_match("Chore tracking app for roommates", threshold=0.8)
+    assert (match.concept_id, match.primary_opportunity_id) == (1, "opp-1")
+    assert index.best_match("App to split chores between roommates", threshold=0.8) is None
+    assert index.best_match("App to split chores between roommates", threshold=0.7).concept_id == 1
+    assert index.best_match("the app") is None
+
+
+def test_search_orders_matches_and_grows():
+    index = ConceptSimilarityIndex(dimensions=256)
+    for i in range(100):
+        index.add(i, f"concept number {i} widget")
+    index.add("top", "widget inventory tracker")
+    index.add(5, "widget inventory")  # replaces concept 5's text
+
+    matches = index.search("widget inventory tracker", threshold=0.5, top_k=3)
+
+    assert len(index) == 101
+    assert [m.concept_id for m in matches][:2] == ["top", 5]
+    assert matches[0].similarity >= matches[1].similarity
+
+
+def test_incremental_persistence(tmp_path):
+    index = ConceptSimilarityIndex.load(tmp_path / "index")
+    index.add(1, "roommate chore tracker", "opp-1")
+    index.save()
+    index.add(2, "freelancer invoice automation", "opp-2")
+
+    # The addition after the snapshot is only in the log
+    assert (tmp_path / "index" / LOG_FILE).read_text().count("\n") == 1
+
+    reloaded = ConceptSimilarityIndex.load(tmp_path / "index")
+    assert len(reloaded) == 2
+    assert reloaded.best_match("Freelancer invoicing").concept_id == 2
+    assert (
+        reloaded.search("roommate chores", threshold=0.1)[0].similarity
+        == index.search("roommate chores", threshold=0.1)[0].similarity
+    )
+
+    reloaded.save()
+    assert not (tmp_path / "index" / LOG_FILE).exists()
+    assert len(ConceptSimilarityIndex.load(tmp_path / "index")) == 2
+
+
+def test_from_concepts_skips_incomplete_rows():
+    index = ConceptSimilarityIndex.from_concepts(
+        [
+            {"id": 1, "concept_name": "roommate chore tracker", "primary_opportunity_id": None},
+            {"id": None, "concept_name": "orphan"},
+            {"id": 3, "concept_name": ""},
+        ]
+    )
+    assert len(index) == 1 and 1 in index
+
+
+class TestSimpleDeduplicatorNearDuplicates:
+    """process_opportunity attaches reworded concepts to an existing one."""
+
+    @pytest.fixture
+    def module(self):
+        return simple_deduplicator
+
+    @pytest.fixture
+    def deduplicator(self, module, tmp_path):
+        with patch.object(module, "create_client", return_value=MagicMock()):
+            dedup = module.SimpleDeduplicator(
+                "url", "key", DEFAULT_SIMILARITY_THRESHOLD, index_path=tmp_path / "index"
+            )
+        dedup.find_existing_concept = MagicMock(return_value=None)
+        dedup.create_business_concept = MagicMock(return_value=41)
+        dedup.mark_as_unique = MagicMock(return_value=True)
+        dedup.mark_as_duplicate = MagicMock(return_value=True)
+        dedup.update_concept_stats = MagicMock()
+        return dedup
+
+    def test_reworded_concept_becomes_duplicate(self, deduplicator):
+        first = deduplicator.process_opportunity(
+            {"id": "opp-a", "app_concept": "Roommate chore tracker"}
+        )
+        second = deduplicator.process_opportunity(
+            {"id": "opp-b", "app_concept": "Chore tracking app for roommates"}
+        )
+
+        assert first["is_duplicate"] is False and first["concept_id"] == 41
+        assert second["is_duplicate"] is True
+        assert second["match_type"] == "similar"
+        assert second["similarity"] == pytest.approx(1.0)
+        assert second["concept_id"] == 41
+        deduplicator.update_concept_stats.assert_called_once_with(41)
+        deduplicator.mark_as_duplicate.assert_called_once_with(
+            second["opportunity_id"], 41, first["opportunity_id"]
+        )
+        deduplicator.create_business_concept.assert_called_once()
+
+    def test_index_survives_restart(self, module, deduplicator, tmp_path):
+        deduplicator.process_opportunity({"id": "opp-a", "app_concept": "Roommate chore tracker"})
+
+        with patch.object(module, "create_client", return_value=MagicMock()):
+            restarted = module.SimpleDeduplicator(
+                "url", "key", DEFAULT_SIMILARITY_THRESHOLD, index_path=tmp_path / "index"
+            )
+
+        concept, _ = restarted.find_similar_concept("chore tracker for roommates")
+        assert concept["id"] == 41
+        # Loaded from disk, so business_concepts was not paged through
+        restarted.supabase.table.assert_not_called()
+
+    def test_threshold_from_pipeline_config(self, module):
+        from core.pipeline.config import PipelineConfig
+
+        with patch.object(module, "create_client", return_value=MagicMock()):
+            strict = module.SimpleDeduplicator.from_pipeline_config(
+                PipelineConfig(deduplication_threshold=0.95), "url", "key"
+            )
+            disabled = module.SimpleDeduplicator.from_pipeline_config(
+                PipelineConfig(enable_deduplication=False), "url", "key"
+            )
+
+        assert strict.similarity_threshold == 0.95
+        assert disabled.find_similar_concept("roommate chore tracker") is None
+
+    def test_near_duplicate_matching_is_opt_in(self, module):
+        with patch.object(module, "create_client", return_value=MagicMock()) as create:
+            dedup = module.SimpleDeduplicator("url", "key")
+
+        assert dedup.find_similar_concept("roommate chore tracker") is None
+        create.return_value.table.assert_not_called()
+
+    def test_index_bootstraps_from_business_concepts(self, module):
+        client = MagicMock()
+        query = client.table.return_value.select.return_value.order.return_value.range.return_value
+        query.execute.return_value = MagicMock(
+            data=[{"id": 7, "concept_name": "roommate chore tracker", "primary_opportunity_id": "p"}]
+        )
+        with patch.object(module, "create_client", return_value=client):
+            dedup = module.SimpleDeduplicator("url", "key", DEFAULT_SIMILARITY_THRESHOLD)
+
+        concept, _ = dedup.find_similar_concept("chores tracker roommates")
+
+        assert concept == {"id": 7, "concept_name": "roommate chore tracker", "primary_opportunity_id": "p"}
+        client.table.assert_called_with("business_concepts")
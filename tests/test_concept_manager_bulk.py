@@ -0,0 +1,94 @@
+"""Tests for BusinessConceptManager bulk operations."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.deduplication import BusinessConceptManager
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    query = client.table.return_value
+    query.upsert.return_value = query
+    query.select.return_value = query
+    query.update.return_value = query
+    query.in_.return_value = query
+    return client
+
+
+def test_get_or_create_concepts_uses_one_upsert(client):
+    rows = [
+        {"id": 1, "primary_submission_id": "s1", "has_agno_analysis": True},
+        {"id": 2, "primary_submission_id": "s2", "has_agno_analysis": False},
+    ]
+    client.table.return_value.execute.return_value = MagicMock(data=rows)
+
+    concepts = BusinessConceptManager(client).get_or_create_concepts(
+        [("s1", "old text"), ("s2", "Meal planner"), ("s1", "Chore app"), ("", "ignored")]
+    )
+
+    assert concepts == {"s1": rows[0], "s2": rows[1]}
+    query = client.table.return_value
+    query.upsert.assert_called_once_with(
+        [
+            {"primary_submission_id": "s1", "concept_text": "Chore app"},
+            {"primary_submission_id": "s2", "concept_text": "Meal planner"},
+        ],
+        on_conflict="primary_submission_id",
+        ignore_duplicates=True,
+        default_to_null=False,
+    )
+    query.select.assert_not_called()
+    query.execute.assert_called_once()
+
+
+def test_get_or_create_concepts_reads_existing_concepts_unchanged(client):
+    existing = {"id": 1, "primary_submission_id": "s1", "concept_text": "Chore app"}
+    created = {"id": 2, "primary_submission_id": "s2", "concept_text": "Meal planner"}
+    client.table.return_value.execute.side_effect = [
+        MagicMock(data=[created]),
+        MagicMock(data=[existing]),
+    ]
+
+    concepts = BusinessConceptManager(client).get_or_create_concepts(
+        [("s1", "Reworded chore app"), ("s2", "Meal planner")]
+    )
+
+    assert concepts == {"s1": existing, "s2": created}
+    query = client.table.return_value
+    query.select.assert_called_once_with("*")
+    query.in_.assert_called_once_with("primary_submission_id", ["s1"])
+
+
+def test_get_or_create_concepts_handles_empty_and_errors(client):
+    manager = BusinessConceptManager(client)
+    assert manager.get_or_create_concepts([]) == {}
+    client.table.assert_not_called()
+
+    client.table.return_value.execute.side_effect = RuntimeError("boom")
+    assert manager.get_or_create_concepts([("s1", "text")]) == {}
+
+
+def test_update_analysis_statuses(client):
+    manager = BusinessConceptManager(client)
+
+    assert manager.update_analysis_statuses([3, 4, 3], "profiler") is True
+
+    query = client.table.return_value
+    query.update.assert_called_once_with({"has_profiler_analysis": True})
+    query.in_.assert_called_once_with("id", [3, 4])
+    with pytest.raises(ValueError):
+        manager.update_analysis_statuses([3], "unknown")
+
+
+def test_increment_submission_counts_aggregates_repeats(client):
+    manager = BusinessConceptManager(client)
+
+    assert manager.increment_submission_counts([5, 6, 5]) is True
+    assert manager.increment_submission_counts([]) is True
+
+    client.rpc.assert_called_once_with(
+        "increment_concept_counts", {"p_concept_ids": [5, 6], "p_increments": [2, 1]}
+    )
@@ -0,0 +1,157 @@
+"""Tests for in-batch concept single-flight and the concept analysis lease."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.deduplication import BusinessConceptManager
+from core.pipeline import DataSource, OpportunityPipeline, PipelineConfig
+
+SUBMISSIONS = [
+    {"submission_id": "s1", "title": "Chore app"},
+    {"submission_id": "s2", "title": "Chores again"},
+    {"submission_id": "s3", "title": "Invoices"},
+    {"submission_id": "s4", "title": "Chores a third time"},
+    {"submission_id": "s5", "title": "No concept yet"},
+]
+METADATA = {
+    "s1": {"concept_id": 7, "has_agno": False, "has_profiler": False},
+    "s2": {"concept_id": 7, "has_agno": False, "has_profiler": False},
+    "s3": {"concept_id": 8, "has_agno": False, "has_profiler": False},
+    "s4": {"concept_id": 7, "has_agno": False, "has_profiler": False},
+}
+
+
+def _lease_client(acquired: bool):
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = MagicMock(data=acquired)
+    return client
+
+
+def _enrich(submission):
+    # Shaped like ProfilerService output, which derives opportunity_id from the submission
+    return {
+        **submission,
+        "final_score": 70,
+        "app_name": f"app for {submission['title']}",
+        "opportunity_id": f"opp_{submission['submission_id']}",
+    }, 0
+
+
+@pytest.fixture
+def run_pipeline():
+    def run(client):
+        config = PipelineConfig(
+            data_source=DataSource.DATABASE,
+            supabase_client=client,
+            dry_run=True,
+        )
+        with patch("core.fetchers.database_fetcher.DatabaseFetcher") as fetcher_class, patch(
+            "core.pipeline.orchestrator.ServiceFactory"
+        ) as factory_class:
+            fetcher_class.return_value.fetch.return_value = iter(SUBMISSIONS)
+            factory_class.return_value.create_services.return_value = {}
+            pipeline = OpportunityPipeline(config)
+            pipeline._batch_fetch_concept_metadata = MagicMock(return_value=METADATA)
+            pipeline._enrich_submission_with_error_tracking = MagicMock(side_effect=_enrich)
+            return pipeline, pipeline.run()
+
+    return run
+
+
+def test_each_new_concept_is_analyzed_once(run_pipeline):
+    client = _lease_client(acquired=True)
+
+    pipeline, result = run_pipeline(client)
+
+    analyzed = [
+        call.args[0]["submission_id"]
+        for call in pipeline._enrich_submission_with_error_tracking.call_args_list
+    ]
+    assert analyzed == ["s1", "s3", "s5"]
+    assert result["stats"]["analyzed"] == 3
+    assert result["stats"]["copied"] == 2
+
+    by_id = {r["submission_id"]: r for r in result["opportunities"]}
+    assert set(by_id) == {"s1", "s2", "s3", "s4", "s5"}
+    assert by_id["s4"]["app_name"] == "app for Chore app"
+    assert by_id["s4"]["title"] == "Chores a third time"
+    assert by_id["s4"]["primary_opportunity_id"] == "opp_s1"
+    assert by_id["s4"]["opportunity_id"] == "opp_s4"
+    assert by_id["s1"]["opportunity_id"] == "opp_s1"
+    assert "copied_from_primary" not in by_id["s1"]
+
+    rpc_calls = [(c.args[0], c.args[1]["p_concept_id"]) for c in client.rpc.call_args_list]
+    assert rpc_calls == [
+        ("acquire_concept_analysis_lease", 7),
+        ("acquire_concept_analysis_lease", 8),
+        ("release_concept_analysis_lease", 7),
+        ("release_concept_analysis_lease", 8),
+    ]
+
+
+def test_concept_leased_elsewhere_is_deferred(run_pipeline):
+    pipeline, result = run_pipeline(_lease_client(acquired=False))
+
+    analyzed = [
+        call.args[0]["submission_id"]
+        for call in pipeline._enrich_submission_with_error_tracking.call_args_list
+    ]
+    assert analyzed == ["s5"]
+    assert result["stats"]["deferred"] == 4
+    assert result["summary"]["total_deferred"] == 4
+    assert [s["submission_id"] for s in result["deferred"]] == ["s1", "s2", "s4", "s3"]
+
+
+def test_lease_only_checks_enabled_services():
+    client = _lease_client(acquired=True)
+    pipeline = OpportunityPipeline(
+        PipelineConfig(
+            data_source=DataSource.DATABASE,
+            supabase_client=client,
+            enable_monetization=False,
+        )
+    )
+    pipeline._enrich_submission_with_error_tracking = MagicMock(side_effect=_enrich)
+
+    pipeline._analyze_concept_group(SUBMISSIONS[0], 7, [], [])
+
+    params = client.rpc.call_args_list[0].args[1]
+    assert params["p_require_agno"] is False
+    assert params["p_require_profiler"] is True
+
+
+def test_failed_representative_releases_lease_and_analyzes_siblings():
+    client = _lease_client(acquired=True)
+    pipeline = OpportunityPipeline(
+        PipelineConfig(data_source=DataSource.DATABASE, supabase_client=client)
+    )
+    pipeline._enrich_submission_with_error_tracking = MagicMock(
+        side_effect=[(None, 1), _enrich(SUBMISSIONS[1])]
+    )
+    enriched = []
+
+    pipeline._analyze_concept_group(SUBMISSIONS[0], 7, [SUBMISSIONS[1]], enriched)
+
+    assert [r["submission_id"] for r in enriched] == ["s2"]
+    assert pipeline._held_leases == []
+    assert client.rpc.call_args.args[0] == "release_concept_analysis_lease"
+
+
+def test_lease_fails_open_without_rpc():
+    client = MagicMock()
+    client.rpc.return_value.execute.side_effect = RuntimeError("function does not exist")
+    manager = BusinessConceptManager(client)
+
+    assert manager.acquire_analysis_lease(7, "worker-1") is True
+    assert manager.release_analysis_lease(7, "worker-1") is False
+    assert client.rpc.call_args_list[0].args == (
+        "acquire_concept_analysis_lease",
+        {
+            "p_concept_id": 7,
+            "p_holder": "worker-1",
+            "p_ttl_seconds": 900,
+            "p_require_agno": True,
+            "p_require_profiler": True,
+        },
+    )
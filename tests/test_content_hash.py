@@ -0,0 +1,105 @@
+"""Tests for content-hash change detection in the storage services."""
+
+from unittest.mock import MagicMock
+
+from core.storage import HybridStore, OpportunityStore
+from core.storage.content_hash import (
+    CONTENT_HASH_COLUMN,
+    add_content_hashes,
+    compute_content_hash,
+    drop_unchanged_rows,
+)
+
+
+def _client(stored_rows, fail=False):
+    """Supabase mock returning stored (submission_id, content_hash) rows."""
+    client = MagicMock()
+    query = client.table.return_value
+    query.select.return_value = query
+    query.in_.return_value = query
+    if fail:
+        query.execute.side_effect = RuntimeError("column content_hash does not exist")
+    else:
+        query.execute.return_value = MagicMock(data=stored_rows)
+    return client
+
+
+def _opportunity(submission_id, score=70.0, **extra):
+    return {
+        "submission_id": submission_id,
+        "problem_description": "Chores are hard to split",
+        "app_concept": "Chore tracker",
+        "opportunity_score": score,
+        **extra,
+    }
+
+
+def test_hash_ignores_key_order_and_volatile_fields():
+    first = {"a": 1, "b": {"x": [1, 2]}, "analyzed_at": "2025-11-01"}
+    second = {"b": {"x": [1, 2]}, "a": 1, "analyzed_at": "2025-11-20"}
+
+    assert compute_content_hash(first) == compute_content_hash(second)
+    assert compute_content_hash(first) != compute_content_hash({**first, "a": 2})
+
+
+def test_drop_unchanged_rows_uses_one_query_per_chunk():
+    rows = add_content_hashes([_opportunity("s1"), _opportunity("s2"), _opportunity("s3")])
+    client = _client([
+        {"submission_id": "s1", CONTENT_HASH_COLUMN: rows[0][CONTENT_HASH_COLUMN]},
+        {"submission_id": "s2", CONTENT_HASH_COLUMN: "stale"},
+    ])
+
+    changed, unchanged = drop_unchanged_rows(rows, client, "app_opportunities")
+
+    assert [row["submission_id"] for row in changed] == ["s2", "s3"]
+    assert unchanged == 1
+    client.table.return_value.in_.assert_called_once_with("submission_id", ["s1", "s2", "s3"])
+
+
+def test_lookup_errors_load_every_row():
+    rows = add_content_hashes([_opportunity("s1")])
+
+    assert drop_unchanged_rows(rows, _client([], fail=True), "app_opportunities") == (rows, 0)
+    assert drop_unchanged_rows(rows, None, "app_opportunities") == (rows, 0)
+
+
+def test_opportunity_store_skips_load_when_nothing_changed():
+    opportunity = _opportunity("s1")
+    stored_hash = compute_content_hash(dict(opportunity))
+    loader = MagicMock()
+    store = OpportunityStore(
+        loader=loader,
+        supabase_client=_client([{"submission_id": "s1", CONTENT_HASH_COLUMN: stored_hash}]),
+    )
+
+    assert store.store([opportunity]) is True
+
+    loader.load.assert_not_called()
+    assert store.get_statistics()["unchanged"] == 1
+
+
+def test_hybrid_store_loads_only_changed_rows():
+    loader = MagicMock()
+    loader.load.return_value = True
+    unchanged_store = HybridStore(loader=MagicMock(), supabase_client=_client([]))
+    unchanged_store.loader.load.return_value = True
+    unchanged_store.store([_opportunity("s1", title="Post")])
+    opp_hash, profile_hash = (
+        call.kwargs["data"][0][CONTENT_HASH_COLUMN]
+        for call in unchanged_store.loader.load.call_args_list
+    )
+
+    client = _client([])
+    client.table.return_value.execute.side_effect = [
+        MagicMock(data=[]),  # existing trust data
+        MagicMock(data=[{"submission_id": "s1", CONTENT_HASH_COLUMN: opp_hash}]),
+        MagicMock(data=[{"submission_id": "s1", CONTENT_HASH_COLUMN: profile_hash}]),
+    ]
+    store = HybridStore(loader=loader, supabase_client=client)
+
+    assert store.store([_opportunity("s1", title="Post"), _opportunity("s2", title="New")])
+
+    loaded = {call.kwargs["table_name"]: call.kwargs["data"] for call in loader.load.call_args_list}
+    assert [row["submission_id"] for row in loaded["app_opportunities"]] == ["s2"]
+    assert [row["submission_id"] for row in loaded["submissions"]] == ["s2"]
+    assert store.stats.unchanged == 2
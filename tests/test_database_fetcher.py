@@ -163,6 +163,25 @@ def test_fetch_limited_empty_response(mock_supabase_client):
     assert fetcher.stats["fetched"] == 0
 
 
+def test_fetch_limited_with_max_age_hours(mock_supabase_client, sample_submissions):
+    """Test that max_age_hours bounds created_utc on both sides."""
+    window = mock_supabase_client.table.return_value.select.return_value.gte.return_value.lte
+    mock_response = Mock()
+    mock_response.data = sample_submissions
+    window.return_value.limit.return_value.execute.return_value = mock_response
+
+    fetcher = DatabaseFetcher(
+        mock_supabase_client, config={"table_name": "submissions", "max_age_hours": 24}
+    )
+    results = list(fetcher.fetch(limit=2))
+
+    assert len(results) == 2
+    since_column, since = mock_supabase_client.table.return_value.select.return_value.gte.call_args[0]
+    until_column, until = window.call_args[0]
+    assert since_column == until_column == "created_utc"
+    assert since < until
+
+
 def test_fetch_all_with_single_batch(mock_supabase_client, sample_submissions):
     """Test fetching all submissions (single batch)."""
     # Setup mock response - single batch
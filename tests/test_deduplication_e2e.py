@@ -374,7 +374,7 @@ class TestDeduplicationE2E:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
         # Create deduplicator with mocked Supabase
-        with patch('core.deduplication.create_client', return_value=mock_supabase):
+        with patch('core.deduplication.simple_deduplicator.create_client', return_value=mock_supabase):
             deduplicator = SimpleDeduplicator("mock_url", "mock_key")
 
         # Test processing unique opportunities
@@ -409,7 +409,7 @@ class TestDeduplicationE2E:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client', return_value=mock_supabase):
+        with patch('core.deduplication.simple_deduplicator.create_client', return_value=mock_supabase):
             deduplicator = SimpleDeduplicator("mock_url", "mock_key")
 
         # Process first food delivery opportunity (should be unique)
@@ -491,7 +491,7 @@ class TestDeduplicationE2E:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client', return_value=mock_supabase):
+        with patch('core.deduplication.simple_deduplicator.create_client', return_value=mock_supabase):
             deduplicator = SimpleDeduplicator("mock_url", "mock_key")
 
         # Test database error handling
@@ -518,7 +518,7 @@ class TestDeduplicationE2E:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client', return_value=mock_supabase):
+        with patch('core.deduplication.simple_deduplicator.create_client', return_value=mock_supabase):
             deduplicator = SimpleDeduplicator("mock_url", "mock_key")
 
         # Mock successful database responses
@@ -570,7 +570,7 @@ class TestDeduplicationE2E:
         ]
 
         # Mock Supabase client for deduplicator
-        with patch('core.deduplication.create_client', return_value=mock_supabase):
+        with patch('core.deduplication.simple_deduplicator.create_client', return_value=mock_supabase):
             submissions = sample_opportunities["unique_opportunities"]
 
             # Process batch with integration
@@ -44,7 +44,10 @@ class TestSemanticDeduplicationIntegration:
         if not SUPABASE_URL or not SUPABASE_KEY:
             pytest.skip("Supabase credentials not configured")
 
-        return SimpleDeduplicator(SUPABASE_URL, SUPABASE_KEY)
+        try:
+            return SimpleDeduplicator(SUPABASE_URL, SUPABASE_KEY)
+        except ImportError as e:
+            pytest.skip(f"SimpleDeduplicator not available - missing dependencies: {e}")
 
     @pytest.fixture
     def sample_opportunities(self):
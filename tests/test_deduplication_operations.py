@@ -44,10 +44,12 @@ class TestSimpleDeduplicatorDatabaseOperations:
     @pytest.fixture
     def deduplicator(self, mock_supabase_client):
         """Create SimpleDeduplicator instance with mocked Supabase client"""
+        # The fingerprint cache has its own tests (test_fingerprint_cache.py);
+        # these exercise the direct business_concepts queries
         with patch(
-            "core.deduplication.create_client", return_value=mock_supabase_client
+            "core.deduplication.simple_deduplicator.create_client", return_value=mock_supabase_client
         ):
-            return SimpleDeduplicator("test_url", "test_key")
+            return SimpleDeduplicator("test_url", "test_key", fingerprint_cache_size=None)
 
     def test_find_existing_concept_success(self, deduplicator, mock_supabase_client):
         """Test successful find_existing_concept operation"""
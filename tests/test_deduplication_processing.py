@@ -31,7 +31,7 @@ class TestProcessOpportunity:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
         # Mock Supabase client and methods
-        with patch("core.deduplication.create_client") as mock_create_client:
+        with patch("core.deduplication.simple_deduplicator.create_client") as mock_create_client:
             mock_client = Mock()
             mock_create_client.return_value = mock_client
 
@@ -90,7 +90,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client") as mock_create_client:
+        with patch("core.deduplication.simple_deduplicator.create_client") as mock_create_client:
             mock_client = Mock()
             mock_create_client.return_value = mock_client
 
@@ -151,7 +151,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Test missing 'id' field
@@ -182,7 +182,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             opportunity = {
@@ -200,7 +200,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Mock find_existing_concept to raise exception
@@ -219,7 +219,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Mock find_existing_concept to return None (unique)
@@ -247,7 +247,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Mock find_existing_concept to return None (unique)
@@ -281,7 +281,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Mock find_existing_concept to return existing concept
@@ -318,7 +318,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Mock find_existing_concept to return None for unique processing
@@ -372,7 +372,7 @@ class TestProcessOpportunity:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             with patch.object(SimpleDeduplicator, "find_existing_concept") as mock_find:
@@ -406,7 +406,7 @@ class TestProcessOpportunityIntegration:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch("core.deduplication.create_client"):
+        with patch("core.deduplication.simple_deduplicator.create_client"):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Test various realistic Reddit app concept formats
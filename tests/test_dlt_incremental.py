@@ -0,0 +1,140 @@
+"""Tests for created_utc incremental cursors on the Reddit DLT resources."""
+
+from unittest.mock import MagicMock, patch
+
+import dlt
+import pytest
+
+from core.activity_validation import SubredditActivity
+from core.dlt.incremental import reset_incremental_cursors
+from core.dlt_collection import load_to_supabase, submission_cursor_name
+from core.dlt_reddit_source import validated_comments
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    return dlt.pipeline(
+        pipeline_name="test_incremental",
+        destination=dlt.destinations.duckdb(str(tmp_path / "test.duckdb")),
+        pipelines_dir=str(tmp_path / "pipelines"),
+        dataset_name="test_data",
+    )
+
+
+def make_subreddit(comment_times):
+    subreddit = MagicMock()
+    subreddit.display_name = "SaaS"
+    submission = MagicMock(id="s1", title="Looking for a tool, struggling with invoices",
+                           score=200, created_utc=1704067200)
+    submission.comments.list.return_value = [
+        MagicMock(id=f"c{t}", body="Same problem, so frustrating", score=2,
+                  created_utc=t, author="user", edited=False, stickied=False,
+                  permalink="", parent_id="t3_s1")
+        for t in comment_times
+    ]
+    subreddit.top.return_value = [submission]
+    return subreddit
+
+
+def loaded_rows(pipeline, table):
+    return pipeline.last_trace.last_normalize_info.row_counts.get(table, 0)
+
+
+def run_comments(pipeline, comment_times):
+    activity = SubredditActivity(make_subreddit(comment_times), MagicMock(), 60.0, 10.0)
+    with patch("core.dlt_reddit_source.snapshot_active_subreddits", return_value=[activity]):
+        pipeline.run(validated_comments(MagicMock(), ["SaaS"], min_opportunity_score=0.0,
+                                        comments_per_post=50))
+
+
+def test_validated_comments_only_loads_new_comments(pipeline):
+    day = 86400
+    base = 1704067200
+    run_comments(pipeline, [base, base + day])
+    assert loaded_rows(pipeline, "validated_comments") == 2
+
+    # Comments older than the cursor minus its lag are skipped
+    run_comments(pipeline, [base, base + day, base + 2 * day])
+    assert loaded_rows(pipeline, "validated_comments") == 2
+
+
+def test_reset_incremental_cursors_allows_backfill(pipeline):
+    base = 1704067200
+    run_comments(pipeline, [base, base + 86400])
+
+    assert reset_incremental_cursors(pipeline, ["validated_comments"]) is True
+
+    run_comments(pipeline, [base, base + 86400])
+    assert loaded_rows(pipeline, "validated_comments") == 2
+
+
+def test_reset_on_new_pipeline_is_a_noop(pipeline):
+    assert reset_incremental_cursors(pipeline, ["validated_comments"]) is False
+
+
+def test_load_to_supabase_skips_posts_behind_cursor(pipeline):
+    posts = [
+        {"submission_id": "a", "title": "t", "subreddit": "SaaS",
+         "created_utc": "2024-01-01T00:00:00+00:00"},
+        {"submission_id": "b", "title": "t", "subreddit": "SaaS",
+         "created_utc": "2024-01-05T00:00:00+00:00"},
+    ]
+    with patch("core.dlt_collection.create_dlt_pipeline", return_value=pipeline):
+        assert load_to_supabase(posts, incremental=True)
+        assert load_to_supabase(posts + [
+            {"submission_id": "c", "title": "t", "subreddit": "SaaS",
+             "created_utc": "2024-01-06T00:00:00+00:00"}
+        ], incremental=True)
+
+    # Only the boundary post (inside the lag window) and the new one are re-merged
+    assert loaded_rows(pipeline, "submissions") == 2
+
+
+def test_load_to_supabase_keeps_a_cursor_per_subreddit(pipeline):
+    with patch("core.dlt_collection.create_dlt_pipeline", return_value=pipeline):
+        assert load_to_supabase([
+            {"submission_id": "a", "title": "t", "subreddit": "SaaS",
+             "created_utc": "2024-01-05T00:00:00+00:00"},
+        ], incremental=True)
+        # An older post from another subreddit is not behind SaaS's cursor
+        assert load_to_supabase([
+            {"submission_id": "b", "title": "t", "subreddit": "fitness",
+             "created_utc": "2024-01-01T00:00:00+00:00"},
+        ], incremental=True)
+
+    assert loaded_rows(pipeline, "submissions") == 1
+
+
+def test_load_to_supabase_is_not_incremental_by_default(pipeline):
+    posts = [
+        {"submission_id": "a", "title": "t", "subreddit": "SaaS",
+         "created_utc": "2024-01-05T00:00:00+00:00"},
+    ]
+    older = [
+        {"submission_id": "b", "title": "t", "subreddit": "SaaS",
+         "created_utc": "2024-01-01T00:00:00+00:00"},
+    ]
+    with patch("core.dlt_collection.create_dlt_pipeline", return_value=pipeline):
+        assert load_to_supabase(posts)
+        assert load_to_supabase(older)
+
+    assert loaded_rows(pipeline, "submissions") == 1
+
+
+def test_reset_submission_cursor_allows_backfill(pipeline):
+    posts = [
+        {"submission_id": "a", "title": "t", "subreddit": "SaaS",
+         "created_utc": "2024-01-05T00:00:00+00:00"},
+    ]
+    older = [
+        {"submission_id": "b", "title": "t", "subreddit": "SaaS",
+         "created_utc": "2024-01-01T00:00:00+00:00"},
+    ]
+    with patch("core.dlt_collection.create_dlt_pipeline", return_value=pipeline):
+        assert load_to_supabase(posts, incremental=True)
+        assert reset_incremental_cursors(pipeline, [submission_cursor_name("SaaS")])
+        assert load_to_supabase(older, incremental=True)
+
+    assert loaded_rows(pipeline, "submissions") == 1
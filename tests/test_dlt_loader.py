@@ -10,7 +10,7 @@ import pytest
 from unittest.mock import MagicMock, patch, call
 from typing import List, Dict, Any
 
-from core.storage.dlt_loader import DLTLoader, LoadStatistics
+from core.storage.dlt_loader import DLTLoader, LoadStatistics, _dlt_config, records_to_arrow
 
 
 # ===========================
@@ -381,13 +381,9 @@ def test_load_batch_success(mock_pipeline_func, sample_opportunities):
 
 @patch("core.storage.dlt_loader.dlt.pipeline")
 def test_load_batch_with_failures(mock_pipeline_func, sample_opportunities):
-    """Test batch loading with some failures."""
+    """Test a failed batch load fails every slice of its single package."""
     mock_pipeline = MagicMock()
-    # First batch succeeds, second fails
-    mock_pipeline.run.side_effect = [
-        MagicMock(started_at="2025-01-15"),
-        Exception("Batch 2 failed"),
-    ]
+    mock_pipeline.load.side_effect = Exception("Merge failed")
     mock_pipeline_func.return_value = mock_pipeline
 
     loader = DLTLoader()
@@ -398,9 +394,12 @@ def test_load_batch_with_failures(mock_pipeline_func, sample_opportunities):
         batch_size=2,
     )
 
-    assert results["successful_batches"] == 1
-    assert results["failed_batches"] == 1
-    assert results["success_rate"] == 0.5
+    assert results["successful_batches"] == 0
+    assert results["failed_batches"] == 2
+    assert results["success_rate"] == 0.0
+    assert results["failed"] == 3
+    assert loader.stats.failed == 3
+    mock_pipeline.drop_pending_packages.assert_called_once()
 
 
 def test_load_batch_with_empty_data():
@@ -422,7 +421,7 @@ def test_load_batch_with_empty_data():
 def test_load_batch_small_batch_size(mock_pipeline_func, sample_opportunities):
     """Test batch loading with batch size of 1."""
     mock_pipeline = MagicMock()
-    mock_pipeline.run.return_value = MagicMock(started_at="2025-01-15")
+    mock_pipeline.load.return_value = MagicMock(started_at="2025-01-15")
     mock_pipeline_func.return_value = mock_pipeline
 
     loader = DLTLoader()
@@ -434,7 +433,97 @@ def test_load_batch_small_batch_size(mock_pipeline_func, sample_opportunities):
     )
 
     assert results["batches"] == 3  # 3 records, batch_size 1 = 3 batches
-    assert mock_pipeline.run.call_count == 3
+    # All slices go into one package: one extract, normalize and load
+    mock_pipeline.extract.assert_called_once()
+    mock_pipeline.normalize.assert_called_once_with(workers=1)
+    mock_pipeline.load.assert_called_once_with(workers=4)
+    resource = mock_pipeline.extract.call_args[0][0]
+    assert list(resource) == sample_opportunities
+
+
+@patch("core.storage.dlt_loader.dlt.pipeline")
+def test_load_batch_single_package_options(mock_pipeline_func, sample_opportunities):
+    """Test worker counts, file rotation and compression reach dlt."""
+    pa = pytest.importorskip("pyarrow")
+    import os
+
+    seen_config = {}
+    mock_pipeline = MagicMock()
+    mock_pipeline.normalize.side_effect = lambda workers: seen_config.update(
+        {key: os.environ.get(key) for key in (
+            "NORMALIZE__DATA_WRITER__FILE_MAX_ITEMS",
+            "NORMALIZE__DATA_WRITER__DISABLE_COMPRESSION",
+        )}
+    )
+    mock_pipeline_func.return_value = mock_pipeline
+
+    loader = DLTLoader()
+    results = loader.load_batch(
+        data=sample_opportunities,
+        table_name="app_opportunities",
+        primary_key="submission_id",
+        batch_size=2,
+        columnar=True,
+        normalize_workers=3,
+        load_workers=8,
+        compress=False,
+    )
+
+    assert results["loaded"] == 3
+    mock_pipeline.normalize.assert_called_once_with(workers=3)
+    mock_pipeline.load.assert_called_once_with(workers=8)
+    assert seen_config == {
+        "NORMALIZE__DATA_WRITER__FILE_MAX_ITEMS": "2",
+        "NORMALIZE__DATA_WRITER__DISABLE_COMPRESSION": "True",
+    }
+    assert "NORMALIZE__DATA_WRITER__FILE_MAX_ITEMS" not in os.environ
+    extract_call = mock_pipeline.extract.call_args
+    assert extract_call.kwargs["loader_file_format"] == "csv"
+    slices = list(extract_call[0][0])
+    assert all(isinstance(batch, pa.Table) for batch in slices)
+    assert [batch.num_rows for batch in slices] == [2, 1]
+
+
+def test_load_batch_merges_once(tmp_path, sample_opportunities):
+    """Test a batch merge load lands every slice through one package."""
+    pytest.importorskip("duckdb")
+    import dlt
+
+    loader = DLTLoader(destination="duckdb")
+    pipeline = dlt.pipeline(
+        pipeline_name="batch_merge_once",
+        pipelines_dir=str(tmp_path),
+        destination=dlt.destinations.duckdb(str(tmp_path / "batch.duckdb")),
+        dataset_name="public",
+    )
+    loader._pipeline_cache["test_table_batch_loader"] = pipeline
+    for record in sample_opportunities:
+        record.pop("core_functions")
+
+    for final_score in (None, 99.0):
+        if final_score is not None:
+            sample_opportunities[0]["final_score"] = final_score
+        results = loader.load_batch(
+            data=sample_opportunities,
+            table_name="test_table",
+            primary_key="submission_id",
+            batch_size=1,
+        )
+
+        assert results["success_rate"] == 1.0
+        load_info = pipeline.last_trace.last_load_info
+        assert len(load_info.load_packages) == 1
+        merge_jobs = [
+            job for job in load_info.load_packages[0].jobs["completed_jobs"]
+            if job.job_file_info.file_format == "sql"
+        ]
+        assert len(merge_jobs) == 1
+
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql(
+            "SELECT submission_id, final_score FROM test_table ORDER BY submission_id"
+        )
+    assert rows == [("test001", 99.0), ("test002", 72.0), ("test003", 65.3)]
 
 
 # ===========================
@@ -490,6 +579,111 @@ def test_clear_pipeline_cache():
     assert len(loader._pipeline_cache) == 0
 
 
+# ===========================
+# Concurrency Tests
+# ===========================
+
+
+def test_workers_get_separate_working_dirs(tmp_path):
+    """Test each worker keeps its pipeline state in its own directory."""
+    first = DLTLoader(pipelines_dir=str(tmp_path), worker_id="worker-0")
+    second = DLTLoader(pipelines_dir=str(tmp_path), worker_id="worker-1")
+
+    assert first.working_dir == str(tmp_path / "workers" / "worker-0")
+    assert second.working_dir == str(tmp_path / "workers" / "worker-1")
+    assert DLTLoader(pipelines_dir=str(tmp_path)).worker_id.isdigit()
+
+
+@patch("core.storage.dlt_loader.dlt.pipeline")
+def test_forked_worker_recreates_pipelines(mock_pipeline_func, tmp_path, sample_opportunities):
+    """Test a forked child does not reuse its parent's pipelines."""
+    mock_pipeline_func.return_value.run.return_value = MagicMock(started_at="2025-01-15")
+    loader = DLTLoader(pipelines_dir=str(tmp_path))
+    loader.load(sample_opportunities, "table1", "merge", "submission_id")
+
+    with patch("core.storage.dlt_loader.os.getpid", return_value=424242):
+        loader.load(sample_opportunities, "table1", "merge", "submission_id")
+
+    assert mock_pipeline_func.call_count == 2
+    assert mock_pipeline_func.call_args.kwargs["pipelines_dir"] == str(
+        tmp_path / "workers" / "424242"
+    )
+
+
+@patch("core.storage.dlt_loader.dlt.pipeline")
+def test_schema_lock_held_for_first_load_only(mock_pipeline_func, sample_opportunities):
+    """Test only a worker's first load per pipeline takes the advisory lock."""
+    mock_pipeline = mock_pipeline_func.return_value
+    mock_pipeline.run.return_value = MagicMock(started_at="2025-01-15")
+    sql = mock_pipeline.sql_client.return_value.__enter__.return_value
+
+    loader = DLTLoader()
+    loader.load(sample_opportunities, "table1", "merge", "submission_id")
+    loader.load(sample_opportunities, "table1", "merge", "submission_id")
+
+    statements = [c.args[0] for c in sql.execute_sql.call_args_list]
+    assert statements == ["SELECT pg_advisory_lock(%s)", "SELECT pg_advisory_unlock(%s)"]
+    assert mock_pipeline.run.call_count == 2
+
+
+def test_close_removes_working_dir_unless_packages_pending(tmp_path):
+    """Test close() keeps the directory while a pipeline has pending data."""
+    loader = DLTLoader(pipelines_dir=str(tmp_path), worker_id="worker-0")
+    (tmp_path / "workers" / "worker-0").mkdir(parents=True)
+    loader._pipeline_cache["pending"] = MagicMock(has_pending_data=True)
+
+    assert loader.close() is False
+    assert (tmp_path / "workers" / "worker-0").exists()
+    assert loader._pipeline_cache == {}
+
+    assert loader.close() is True
+    assert not (tmp_path / "workers" / "worker-0").exists()
+
+
+def test_workers_load_same_pipeline_name_in_parallel(tmp_path, sample_opportunities):
+    """Test two workers merge into one destination with the same pipeline name."""
+    pytest.importorskip("duckdb")
+    import threading
+
+    import dlt
+
+    database = str(tmp_path / "shared.duckdb")
+    loaders = [
+        DLTLoader(destination="duckdb", pipelines_dir=str(tmp_path), worker_id=f"worker-{i}")
+        for i in range(2)
+    ]
+    for loader in loaders:
+        loader._pipeline_cache["opportunities"] = dlt.pipeline(
+            pipeline_name="opportunities",
+            pipelines_dir=loader.working_dir,
+            destination=dlt.destinations.duckdb(database),
+            dataset_name="public",
+        )
+    for record in sample_opportunities:
+        record.pop("core_functions")
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda loader=loader, rows=rows: results.append(
+                loader.load(rows, "test_table", "merge", "submission_id", "opportunities")
+            )
+        )
+        for loader, rows in zip(loaders, (sample_opportunities[:2], sample_opportunities[2:]))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True, True]
+    assert (tmp_path / "workers" / "worker-0" / "opportunities").is_dir()
+    assert (tmp_path / "workers" / "worker-1" / "opportunities").is_dir()
+    with loaders[0]._pipeline_cache["opportunities"].sql_client() as client:
+        rows = client.execute_sql("SELECT submission_id FROM test_table ORDER BY submission_id")
+    assert rows == [("test001",), ("test002",), ("test003",)]
+
+
 # ===========================
 # Statistics Methods Tests
 # ===========================
@@ -787,3 +981,191 @@ def test_load_with_empty_columns_fallback(mock_pipeline_func, sample_opportuniti
     call_args = mock_pipeline.run.call_args
     data_arg = call_args[0][0]
     assert data_arg == sample_opportunities
+
+
+# ===========================
+# Columnar (Arrow) Path Tests
+# ===========================
+
+
+def test_records_to_arrow_follows_column_hints():
+    """Test Arrow conversion types columns from dlt hints."""
+    pa = pytest.importorskip("pyarrow")
+    columns = {
+        "submission_id": {"data_type": "text", "nullable": False},
+        "ai_profile": {"data_type": "json"},
+        "core_functions": {"data_type": "text"},
+        "final_score": {"data_type": "double"},
+        "reddit_score": {"data_type": "bigint"},
+        "evidence_based": {"data_type": "bool"},
+        "analyzed_at": {"data_type": "timestamp"},
+    }
+    data = [
+        {
+            "submission_id": "test001",
+            "ai_profile": {"app_name": "ChoreMate"},
+            "core_functions": ["Tracking", "Reminders"],
+            "final_score": 78,
+            "reddit_score": 12,
+            "evidence_based": True,
+            "analyzed_at": "2025-01-15T10:00:00",
+            "subreddit": "startups",
+        },
+        {"submission_id": "test002", "final_score": 61.5},
+    ]
+
+    table = records_to_arrow(data, columns)
+
+    assert table.num_rows == 2
+    assert table.schema.field("ai_profile").type == pa.string()
+    assert table.schema.field("final_score").type == pa.float64()
+    assert table.schema.field("reddit_score").type == pa.int64()
+    assert table.schema.field("evidence_based").type == pa.bool_()
+    assert table.schema.field("analyzed_at").type == pa.timestamp("us", tz="UTC")
+    assert table.schema.field("subreddit").type == pa.string()
+    rows = table.to_pylist()
+    assert rows[0]["ai_profile"] == '{"app_name": "ChoreMate"}'
+    assert rows[0]["core_functions"] == '["Tracking", "Reminders"]'
+    assert rows[0]["analyzed_at"].isoformat() == "2025-01-15T10:00:00+00:00"
+    assert rows[1]["ai_profile"] is None
+    assert rows[1]["subreddit"] is None
+
+
+@patch("core.storage.dlt_loader.dlt.pipeline")
+def test_load_columnar_yields_arrow_table(mock_pipeline_func, sample_opportunities):
+    """Test columnar load hands dlt one Arrow table with the column hints."""
+    pa = pytest.importorskip("pyarrow")
+    mock_pipeline = MagicMock()
+    mock_pipeline.run.return_value = MagicMock(started_at="2025-01-15")
+    mock_pipeline_func.return_value = mock_pipeline
+    columns = {"submission_id": {"data_type": "text", "nullable": False}}
+
+    loader = DLTLoader()
+    success = loader.load(
+        data=sample_opportunities,
+        table_name="app_opportunities",
+        primary_key="submission_id",
+        columns=columns,
+        columnar=True,
+    )
+
+    assert success is True
+    assert loader.stats.loaded == 3
+    resource = mock_pipeline.run.call_args[0][0]
+    items = list(resource())
+    assert len(items) == 1
+    assert isinstance(items[0], pa.Table)
+    assert items[0].num_rows == 3
+    assert resource().columns["submission_id"]["nullable"] is False
+    assert mock_pipeline.run.call_args.kwargs["loader_file_format"] == "csv"
+
+
+@patch("core.storage.dlt_loader.dlt.pipeline")
+def test_load_accepts_arrow_table(mock_pipeline_func):
+    """Test load takes a pyarrow.Table directly and counts its rows."""
+    pa = pytest.importorskip("pyarrow")
+    mock_pipeline = MagicMock()
+    mock_pipeline.run.return_value = MagicMock(started_at="2025-01-15")
+    mock_pipeline_func.return_value = mock_pipeline
+    table = pa.table({"submission_id": ["a", "b"]})
+
+    loader = DLTLoader()
+    assert loader.load(data=table, table_name="submissions", primary_key="submission_id")
+    assert loader.stats.loaded == 2
+    assert list(mock_pipeline.run.call_args[0][0]()) == [table]
+
+    assert loader.load(data=table.slice(0, 0), table_name="submissions") is False
+
+
+@patch("core.storage.dlt_loader.dlt.pipeline")
+def test_load_columnar_falls_back_to_rows(mock_pipeline_func, sample_opportunities):
+    """Test values that do not fit their hinted type fall back to the dict path."""
+    pytest.importorskip("pyarrow")
+    mock_pipeline = MagicMock()
+    mock_pipeline.run.return_value = MagicMock(started_at="2025-01-15")
+    mock_pipeline_func.return_value = mock_pipeline
+    columns = {"final_score": {"data_type": "double"}}
+    sample_opportunities[0]["final_score"] = "high"
+
+    loader = DLTLoader()
+    success = loader.load(
+        data=sample_opportunities,
+        table_name="app_opportunities",
+        primary_key="submission_id",
+        columns=columns,
+        columnar=True,
+    )
+
+    assert success is True
+    records = list(mock_pipeline.run.call_args[0][0]())
+    assert records == sample_opportunities
+    assert "loader_file_format" not in mock_pipeline.run.call_args.kwargs
+
+
+def test_columnar_load_matches_dict_load(tmp_path, sample_opportunities):
+    """Test both paths store the same rows and JSON columns in a real destination."""
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("duckdb")
+    import dlt
+
+    columns = {
+        "submission_id": {"data_type": "text", "nullable": False},
+        "ai_profile": {"data_type": "json"},
+        "final_score": {"data_type": "double"},
+    }
+    for record in sample_opportunities:
+        record.pop("core_functions")
+        record["ai_profile"] = {"app_name": record["app_concept"]}
+
+    stored = {}
+    for columnar in (False, True):
+        name = f"arrow_equivalence_{columnar}"
+        loader = DLTLoader(destination="duckdb")
+        pipeline = dlt.pipeline(
+            pipeline_name=name,
+            pipelines_dir=str(tmp_path),
+            destination=dlt.destinations.duckdb(str(tmp_path / f"{name}.duckdb")),
+            dataset_name="public",
+        )
+        loader._pipeline_cache[name] = pipeline
+
+        assert loader.load(
+            data=sample_opportunities,
+            table_name="app_opportunities",
+            primary_key="submission_id",
+            pipeline_name=name,
+            columns=columns,
+            columnar=columnar,
+        )
+        with pipeline.sql_client() as client:
+            stored[columnar] = client.execute_sql(
+                "SELECT submission_id, json_extract_string(ai_profile, '$.app_name'), "
+                "final_score FROM app_opportunities ORDER BY submission_id"
+            )
+
+    assert stored[True] == stored[False]
+    assert stored[True][0] == ("test001", "Simple PM platform", 78.5)
+
+
+def test_dlt_config_overrides_do_not_interleave_across_threads(monkeypatch):
+    """Concurrent loads each see their own dlt settings in os.environ."""
+    import os
+    import threading
+    import time
+
+    monkeypatch.delenv("EXTRACT__DATA_WRITER__FILE_MAX_ITEMS", raising=False)
+    seen = {}
+
+    def load(batch_size):
+        with _dlt_config({"EXTRACT__DATA_WRITER__FILE_MAX_ITEMS": batch_size}):
+            time.sleep(0.05)
+            seen[batch_size] = os.environ["EXTRACT__DATA_WRITER__FILE_MAX_ITEMS"]
+
+    threads = [threading.Thread(target=load, args=(size,)) for size in (100, 5000)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {100: "100", 5000: "5000"}
+    assert "EXTRACT__DATA_WRITER__FILE_MAX_ITEMS" not in os.environ
@@ -12,7 +12,9 @@ import pytest
 
 # Import the module we're going to create
 try:
+    from core.activity_validation import SubredditActivity
     from core.dlt_reddit_source import (
+        ActivitySnapshot,
         active_subreddits,
         activity_trends,
         reddit_activity_aware,
@@ -92,22 +94,21 @@ class TestActiveSubredditsResource:
         mock_subreddit.subscribers = 1000000
         mock_subreddit.public_description = "Python discussions"
 
-        with patch('core.dlt_reddit_source.get_active_subreddits') as mock_get_active, \
-             patch('core.dlt_reddit_source.collect_activity_metrics') as mock_metrics, \
-             patch('core.dlt_reddit_source.calculate_trending_score') as mock_trending:
-
-            mock_get_active.return_value = [mock_subreddit]
-            mock_metrics.return_value = MagicMock(
-                comments_24h=100,
-                posts_24h=10,
-                avg_engagement_rate=10.0,
-                subscriber_base_score=80.0,
-                active_users_score=60.0,
-                quality_signals={},
-                trending_velocity=50.0,
-                activity_density=0.5
-            )
-            mock_trending.return_value = 85.5
+        metrics = MagicMock(
+            comments_24h=100,
+            posts_24h=10,
+            avg_engagement_rate=10.0,
+            subscriber_base_score=80.0,
+            active_users_score=60.0,
+            quality_signals={},
+            trending_velocity=50.0,
+            activity_density=0.5
+        )
+
+        with patch('core.dlt_reddit_source.snapshot_active_subreddits') as mock_snapshot:
+            mock_snapshot.return_value = [
+                SubredditActivity(mock_subreddit, metrics, 72.0, 85.5)
+            ]
 
             resource = active_subreddits(
                 reddit_client=mock_reddit_client,
@@ -122,6 +123,13 @@ class TestActiveSubredditsResource:
             assert hasattr(resource, 'name')
             assert resource.name in ["active_subreddits", "activity_trends"]
 
+            rows = list(resource)
+
+        assert len(rows) == 1
+        assert rows[0]["display_name"] == "python"
+        assert rows[0]["activity_score"] == 72.0
+        assert rows[0]["trending_score"] == 85.5
+
 
 class TestValidatedCommentsResource:
     """Test the validated_comments DLT resource."""
@@ -140,8 +148,7 @@ class TestValidatedCommentsResource:
 
         assert resource is not None
 
-    @patch('core.dlt_reddit_source.collect_activity_metrics')
-    def test_validated_comments_with_activity_validation(self, mock_metrics):
+    def test_validated_comments_with_activity_validation(self):
         """Test that validated_comments integrates with activity validation."""
         mock_reddit_client = MagicMock()
         mock_subreddit = MagicMock()
@@ -150,7 +157,7 @@ class TestValidatedCommentsResource:
 
         # Mock activity metrics
         from core.activity_validation import ActivityMetrics
-        mock_metrics.return_value = ActivityMetrics(
+        metrics = ActivityMetrics(
             recent_comments_count=100,
             post_engagement_score=75.0,
             subscriber_base_score=80.0,
@@ -160,15 +167,97 @@ class TestValidatedCommentsResource:
             avg_engagement_rate=10.0
         )
 
-        resource = validated_comments(
-            reddit_client=mock_reddit_client,
-            subreddits=["python"],
-            time_filter="day",
-            min_activity_score=50.0,
-            comments_per_post=5
+        with patch('core.dlt_reddit_source.snapshot_active_subreddits') as mock_snapshot:
+            mock_snapshot.return_value = [
+                SubredditActivity(mock_subreddit, metrics, 72.0, 40.0)
+            ]
+
+            resource = validated_comments(
+                reddit_client=mock_reddit_client,
+                subreddits=["python"],
+                time_filter="day",
+                min_activity_score=50.0,
+                comments_per_post=5
+            )
+
+            assert resource is not None
+
+    def test_validated_comments_skips_low_score_submissions_before_fetch(self):
+        """Comment trees are only fetched for submissions passing the quick score."""
+        mock_subreddit = MagicMock()
+        mock_subreddit.display_name = "SaaS"
+
+        promising = MagicMock(id="s1", title="I hate manual invoicing, is there a tool?",
+                              score=50, created_utc=1704067200)
+        comment = MagicMock(id="c1", body="Same problem here, so frustrating",
+                            score=3, created_utc=1704067300, author="someone")
+        promising.comments.list.return_value = [comment]
+        unpromising = MagicMock(id="s2", title="My cat", score=1, created_utc=1704067200)
+        mock_subreddit.top.return_value = [promising, unpromising]
+
+        with patch('core.dlt_reddit_source.snapshot_active_subreddits') as mock_snapshot, \
+             patch('core.dlt_reddit_source.quick_opportunity_score') as mock_quick:
+            mock_snapshot.return_value = [
+                SubredditActivity(mock_subreddit, MagicMock(), 72.0, 40.0)
+            ]
+            mock_quick.side_effect = lambda title, *_: 80.0 if title.startswith("I hate") else 5.0
+
+            rows = list(validated_comments(MagicMock(), ["SaaS"], min_opportunity_score=30.0))
+
+        assert [row["id"] for row in rows] == ["c1"]
+        assert rows[0]["quick_opportunity_score"] == 80.0
+        unpromising.comments.replace_more.assert_not_called()
+
+    def test_validated_comments_uses_one_pool_client_per_task(self):
+        """With a RedditClientPool, subreddits are collected on pool clients."""
+        from core.utils.reddit_client_pool import RedditClientPool, RedditCredential
+
+        def make_client(credential, rate_limiter):
+            client = MagicMock()
+            submission = MagicMock(id="s1", title="I hate manual invoicing, is there a tool?",
+                                   score=50, created_utc=1704067200)
+            submission.comments.list.return_value = [
+                MagicMock(id=f"c-{credential.client_id}", body="Same problem here, so frustrating",
+                          score=3, created_utc=1704067300, author="someone")
+            ]
+            client.subreddit.return_value.top.return_value = [submission]
+            client.subreddit.return_value.display_name = "SaaS"
+            return client
+
+        pool = RedditClientPool(
+            [RedditCredential(f"id{i}", "secret", "agent") for i in range(2)],
+            client_factory=make_client,
         )
+        snapshot_subreddit = MagicMock(display_name="SaaS")
 
-        assert resource is not None
+        with patch('core.dlt_reddit_source.snapshot_active_subreddits') as mock_snapshot, \
+             patch('core.dlt_reddit_source.quick_opportunity_score', return_value=80.0):
+            mock_snapshot.return_value = [
+                SubredditActivity(snapshot_subreddit, MagicMock(), 72.0, 40.0)
+            ]
+            rows = list(validated_comments(pool, ["SaaS"], min_opportunity_score=30.0))
+
+        assert len(rows) == 1
+        snapshot_subreddit.top.assert_not_called()
+        assert sum(member.client.subreddit.call_count for member in pool.members) == 1
+
+    def test_only_pool_resources_are_parallelized(self):
+        """A plain PRAW client is never used from several extract threads."""
+        from dlt.extract.resource import DltResource
+
+        from core.utils.reddit_client_pool import RedditClientPool, RedditCredential
+
+        pool = RedditClientPool(
+            [RedditCredential("id", "secret", "agent")],
+            client_factory=lambda credential, rate_limiter: MagicMock(),
+        )
+        with patch.object(DltResource, "parallelize", autospec=True,
+                          side_effect=lambda resource: resource) as parallelize:
+            reddit_activity_aware(MagicMock(), ["python"])
+            assert parallelize.call_count == 0
+
+            reddit_activity_aware(pool, ["python"])
+            assert parallelize.call_count == 3
 
     def test_validated_comments_incremental_loading(self):
         """Test that validated_comments supports incremental loading."""
@@ -207,11 +296,8 @@ class TestActivityTrendsResource:
         """Test that activity_trends returns correct data structure."""
         mock_reddit_client = MagicMock()
 
-        with patch('core.dlt_reddit_source.get_active_subreddits') as mock_get_active, \
-             patch('core.dlt_reddit_source.calculate_activity_score') as mock_score:
-
-            mock_get_active.return_value = []
-            mock_score.return_value = 85.5
+        with patch('core.dlt_reddit_source.snapshot_active_subreddits') as mock_snapshot:
+            mock_snapshot.return_value = []
 
             resource = activity_trends(
                 reddit_client=mock_reddit_client,
@@ -225,6 +311,42 @@ class TestActivityTrendsResource:
             # The resource should have DLT resource metadata
             assert hasattr(resource, 'name')
             assert resource.name in ["active_subreddits", "activity_trends"]
+            assert list(resource) == []
+
+
+class TestActivitySnapshot:
+    """Test the activity snapshot shared by the source's resources."""
+
+    def test_snapshot_computed_once(self):
+        """Repeated reads reuse the first measurement."""
+        with patch('core.dlt_reddit_source.snapshot_active_subreddits') as mock_snapshot:
+            mock_snapshot.return_value = []
+            snapshot = ActivitySnapshot(MagicMock(), ["python"])
+
+            snapshot.get()
+            snapshot.get()
+
+        assert mock_snapshot.call_count == 1
+        assert snapshot.collection_timestamp is not None
+
+    def test_source_resources_share_snapshot(self):
+        """All resources of the source are fed by a single measurement pass."""
+        mock_subreddit = MagicMock()
+        mock_subreddit.display_name = "python"
+        mock_subreddit.top.return_value = []
+        metrics = MagicMock(trending_velocity=0.0, quality_signals={},
+                            avg_engagement_rate=1.0, activity_density=0.1)
+
+        with patch('core.dlt_reddit_source.snapshot_active_subreddits') as mock_snapshot:
+            mock_snapshot.return_value = [SubredditActivity(mock_subreddit, metrics, 60.0, 10.0)]
+            source = reddit_activity_aware(MagicMock(), ["python"])
+
+            trends = list(source.activity_trends)
+            subs = list(source.active_subreddits)
+
+        assert mock_snapshot.call_count == 1
+        assert trends[0]["trend_direction"] == "stable"
+        assert subs[0]["display_name"] == "python"
 
 
 class TestIntegrationFeatures:
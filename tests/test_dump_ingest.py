@@ -0,0 +1,152 @@
+"""Tests for offline bulk ingest from Reddit dump files."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.dump_ingest import (
+    compile_keyword_pattern,
+    dump_comment_to_schema,
+    dump_submission_to_schema,
+    ingest_comments,
+    ingest_submissions,
+    iter_dump_records,
+    resolve_subreddits,
+)
+
+SUBMISSIONS = [
+    {"id": "s1", "subreddit": "SaaS", "title": "Invoicing is so tedious",
+     "selftext": "I hate doing this manually", "score": 12, "num_comments": 3,
+     "url": "https://reddit.com/s1", "created_utc": 1704067200, "author": "a"},
+    {"id": "s2", "subreddit": "SaaS", "title": "Show off my new logo",
+     "selftext": "", "score": 5, "num_comments": 0,
+     "url": "https://reddit.com/s2", "created_utc": "1704067300", "author": "b"},
+    {"id": "s3", "subreddit": "pics", "title": "This problem is annoying",
+     "selftext": "", "score": 1, "num_comments": 0,
+     "url": "https://reddit.com/s3", "created_utc": 1704067400, "author": "c"},
+]
+
+COMMENTS = [
+    {"id": "c1", "subreddit": "SaaS", "link_id": "t3_s1", "parent_id": "t3_s1",
+     "body": "Same problem here", "score": 4, "created_utc": 1704067500, "author": "d"},
+    {"id": "c2", "subreddit": "SaaS", "link_id": "t3_s1", "parent_id": "t1_c1",
+     "body": "I use a spreadsheet", "score": 2, "created_utc": 1704067600, "author": "e"},
+    {"id": "c3", "subreddit": "SaaS", "link_id": "t3_s1", "parent_id": "t3_s1",
+     "body": "[removed]", "score": 1, "created_utc": 1704067700, "author": "[deleted]"},
+]
+
+
+def write_ndjson(path, rows, extra_lines=()):
+    lines = [json.dumps(row) for row in rows] + list(extra_lines)
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def submissions_dump(tmp_path):
+    return write_ndjson(tmp_path / "RS_2024-01.ndjson", SUBMISSIONS, extra_lines=["{not json"])
+
+
+@pytest.fixture
+def comments_dump(tmp_path):
+    return write_ndjson(tmp_path / "RC_2024-01.ndjson", COMMENTS)
+
+
+def test_iter_dump_records_reads_zstd(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    payload = "\n".join(json.dumps(row) for row in SUBMISSIONS).encode()
+    path = tmp_path / "RS_2024-01.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(payload))
+
+    records = list(iter_dump_records(path))
+
+    assert [r["id"] for r in records] == ["s1", "s2", "s3"]
+
+
+def test_iter_dump_records_skips_malformed(submissions_dump):
+    records = list(iter_dump_records(submissions_dump))
+    assert len(records) == 3
+
+
+def test_resolve_subreddits_segment_and_unknown():
+    assert "saas" in resolve_subreddits(["technology_saas"])
+    assert "fitness" not in resolve_subreddits(["technology_saas"])
+    assert "fitness" in resolve_subreddits(None)
+    with pytest.raises(ValueError):
+        resolve_subreddits(["nope"])
+
+
+def test_compile_keyword_pattern_matches_substrings():
+    pattern = compile_keyword_pattern(["problem"])
+    assert pattern.search("This is TEDIOUS work")
+    assert not pattern.search("Show off my new logo")
+    assert compile_keyword_pattern([]) is None
+
+
+def test_dump_submission_to_schema_handles_string_timestamp():
+    row = dump_submission_to_schema(SUBMISSIONS[1])
+    assert row["submission_id"] == "s2"
+    assert row["created_at"].startswith("2024-01-01")
+    assert row["created_utc"] == "2024-01-01T00:01:40+00:00"
+
+
+def test_dump_comment_to_schema_strips_link_prefix():
+    top_level = dump_comment_to_schema(COMMENTS[0])
+    reply = dump_comment_to_schema(COMMENTS[1])
+
+    assert top_level["submission_id"] == "s1"
+    assert top_level["link_id"] == "s1"
+    assert top_level["depth"] == 0
+    assert "depth" not in reply and "comment_depth" not in reply
+
+
+def test_ingest_submissions_filters_and_loads_in_batches(submissions_dump):
+    loader = MagicMock()
+    loader.load.return_value = True
+
+    summary = ingest_submissions(
+        submissions_dump, segments=["technology_saas"], loader=loader, batch_size=1
+    )
+
+    assert summary["rows_matched"] == 1
+    assert summary["rows_loaded"] == 1
+    assert summary["rows_malformed"] == 1
+    loaded = loader.load.call_args.kwargs
+    assert loaded["table_name"] == "submissions"
+    assert loaded["primary_key"] == "submission_id"
+    assert [r["submission_id"] for r in loaded["data"]] == ["s1"]
+
+
+def test_ingest_submissions_time_window(submissions_dump):
+    summary = ingest_submissions(
+        submissions_dump, keyword_sets=None, since=1704067250, until=1704067350
+    )
+    assert summary["rows_matched"] == 1
+
+
+def test_ingest_comments_skips_deleted_and_counts_failures(comments_dump):
+    loader = MagicMock()
+    loader.load.return_value = False
+
+    summary = ingest_comments(comments_dump, loader=loader, batch_size=10)
+
+    assert summary["rows_matched"] == 2
+    assert summary["rows_loaded"] == 0
+    assert summary["failed_batches"] == 1
+    assert loader.load.call_args.kwargs["primary_key"] == "comment_id"
+
+
+def test_ingest_comments_only_for_ingested_submissions(submissions_dump, tmp_path):
+    comments_dump = write_ndjson(tmp_path / "RC_2024-01.ndjson", [
+        *COMMENTS,
+        {"id": "c4", "subreddit": "SaaS", "link_id": "t3_s2", "parent_id": "t3_s2",
+         "body": "Nice logo", "score": 1, "created_utc": 1704067800, "author": "f"},
+    ])
+    kept_ids: set[str] = set()
+
+    ingest_submissions(submissions_dump, kept_ids=kept_ids)
+    summary = ingest_comments(comments_dump, submission_ids=kept_ids)
+
+    assert kept_ids == {"s1"}
+    assert summary["rows_matched"] == 2
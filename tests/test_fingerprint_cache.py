@@ -0,0 +1,177 @@
+"""Tests for the in-process fingerprint -> concept cache."""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.deduplication import simple_deduplicator
+from core.deduplication.fingerprint_cache import (
+    DEFAULT_MAX_ENTRIES,
+    BloomFilter,
+    FingerprintCache,
+)
+
+
+def _fingerprint(i) -> str:
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def _concept(i) -> dict:
+    return {
+        "id": i,
+        "concept_name": f"concept {i}",
+        "concept_fingerprint": _fingerprint(i),
+        "primary_opportunity_id": f"opp-{i}",
+    }
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=5000, false_positive_rate=0.01)
+    for i in range(5000):
+        bloom.add(_fingerprint(i))
+
+    assert all(_fingerprint(i) in bloom for i in range(5000))
+    false_positives = sum(_fingerprint(i) in bloom for i in range(5000, 15000))
+    assert false_positives < 200
+
+
+def test_bloom_filter_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=0)
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, false_positive_rate=1.0)
+
+
+def test_cold_cache_defers_to_database():
+    cache = FingerprintCache()
+
+    assert not cache.is_warm
+    assert cache.get(_fingerprint(1)) is None
+    assert cache.might_contain(_fingerprint(1))
+
+
+def test_lru_eviction_and_counters():
+    cache = FingerprintCache(max_entries=2, expected_fingerprints=100)
+    cache.warm([_concept(1), _concept(2)])
+
+    assert cache.get(_fingerprint(1))["id"] == 1  # 1 is now most recent
+    cache.put(_fingerprint(3), _concept(3))  # evicts 2
+
+    assert cache.get(_fingerprint(2)) is None
+    assert cache.might_contain(_fingerprint(2))  # still known to the filter
+    assert not cache.might_contain(_fingerprint(99))
+
+    summary = cache.stats.get_summary()
+    assert summary["hits"] == 1
+    assert summary["misses"] == 1
+    assert summary["bloom_negatives"] == 1
+    assert summary["database_lookups"] == 1
+    assert summary["evictions"] == 1
+    assert summary["warmed_fingerprints"] == 2
+
+
+class TestSimpleDeduplicatorCache:
+    """find_existing_concept answers from the cache where it can."""
+
+    @pytest.fixture
+    def module(self):
+        return simple_deduplicator
+
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        bulk = client.table.return_value.select.return_value.order.return_value.range.return_value
+        bulk.execute.return_value = MagicMock(data=[_concept(1), _concept(2)])
+        return client
+
+    @pytest.fixture
+    def deduplicator(self, module, client):
+        with patch.object(module, "create_client", return_value=client):
+            dedup = module.SimpleDeduplicator(
+                "url", "key", fingerprint_cache_size=DEFAULT_MAX_ENTRIES
+            )
+        dedup._query_existing_concept = MagicMock(return_value=None)
+        return dedup
+
+    def test_cache_is_opt_in(self, module, client):
+        # The dedup scripts construct the package export with no options
+        from core.deduplication import SimpleDeduplicator
+
+        with patch.object(module, "create_client", return_value=client):
+            dedup = SimpleDeduplicator("url", "key")
+        dedup._query_existing_concept = MagicMock(return_value=_concept(2))
+
+        assert dedup.find_existing_concept(_fingerprint(2))["id"] == 2
+        dedup._query_existing_concept.assert_called_once_with(_fingerprint(2))
+        assert dedup.get_cache_statistics() == {}
+
+    def test_pipeline_config_enables_cache(self, module, client):
+        from core.pipeline.config import PipelineConfig
+
+        with patch.object(module, "create_client", return_value=client):
+            dedup = module.SimpleDeduplicator.from_pipeline_config(PipelineConfig(), "url", "key")
+        dedup._query_existing_concept = MagicMock()
+
+        assert dedup.find_existing_concept(_fingerprint(2))["id"] == 2
+        dedup._query_existing_concept.assert_not_called()
+
+    def test_hits_and_definite_misses_skip_database(self, deduplicator, client):
+        assert deduplicator.find_existing_concept(_fingerprint(1))["id"] == 1
+        assert deduplicator.find_existing_concept(_fingerprint(50)) is None
+        assert deduplicator.find_existing_concept(_fingerprint(1))["id"] == 1
+
+        deduplicator._query_existing_concept.assert_not_called()
+        # One bulk page loaded the cache
+        client.table.return_value.select.return_value.order.assert_called_once_with("id")
+        stats = deduplicator.get_cache_statistics()
+        assert (stats["hits"], stats["bloom_negatives"]) == (2, 1)
+
+    def test_created_concepts_are_cached(self, deduplicator, client):
+        insert = client.table.return_value.insert.return_value
+        insert.execute.return_value = MagicMock(data=[_concept(7)])
+        deduplicator._ensure_opportunity_exists = MagicMock(return_value=True)
+
+        concept_id = deduplicator.create_business_concept("concept 7", _fingerprint(7), "opp-7")
+
+        assert concept_id == 7
+        assert deduplicator.find_existing_concept(_fingerprint(7))["id"] == 7
+        deduplicator._query_existing_concept.assert_not_called()
+
+    def test_failed_warm_keeps_querying_database(self, module):
+        client = MagicMock()
+        client.table.side_effect = RuntimeError("connection refused")
+        with patch.object(module, "create_client", return_value=client):
+            dedup = module.SimpleDeduplicator(
+                "url", "key", fingerprint_cache_size=DEFAULT_MAX_ENTRIES
+            )
+        dedup._query_existing_concept = MagicMock(return_value=_concept(3))
+
+        assert dedup.find_existing_concept(_fingerprint(3))["id"] == 3
+        dedup._query_existing_concept.assert_called_once_with(_fingerprint(3))
+
+    def test_concept_created_elsewhere_becomes_duplicate(self, module, deduplicator):
+        # Not in the warmed filter, and the insert hits the unique constraint
+        concept = {**_concept(8), "concept_fingerprint": None}
+        deduplicator.create_business_concept = MagicMock(return_value=None)
+        deduplicator._query_existing_concept = MagicMock(return_value=concept)
+        deduplicator.update_concept_stats = MagicMock()
+        deduplicator.mark_as_duplicate = MagicMock(return_value=True)
+
+        result = deduplicator.process_opportunity({"id": "opp-x", "app_concept": "concept 8"})
+
+        assert result["success"] and result["is_duplicate"]
+        assert result["match_type"] == "exact"
+        assert result["concept_id"] == 8
+        deduplicator.update_concept_stats.assert_called_once_with(8)
+
+    def test_cache_can_be_disabled(self, module, client):
+        with patch.object(module, "create_client", return_value=client):
+            dedup = module.SimpleDeduplicator(
+                "url", "key", similarity_threshold=None, fingerprint_cache_size=None
+            )
+        dedup._query_existing_concept = MagicMock(return_value=None)
+
+        assert dedup.find_existing_concept(_fingerprint(1)) is None
+        assert dedup.get_cache_statistics() == {}
+        client.table.assert_not_called()
@@ -0,0 +1,177 @@
+"""Tests for per-subreddit listing high-water marks."""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from core.fetchers.high_water_marks import HighWaterMarkStore
+from core.fetchers.reddit_api_fetcher import RedditAPIFetcher
+
+
+def make_submission(submission_id: str, created_utc: float) -> Mock:
+    """Create a mock PRAW submission."""
+    submission = Mock()
+    submission.id = submission_id
+    submission.created_utc = created_utc
+    submission.title = "I have a problem with invoices"
+    submission.selftext = "It is frustrating"
+    submission.score = 10
+    submission.num_comments = 2
+    submission.url = f"https://reddit.com/{submission_id}"
+    return submission
+
+
+class CountingListing:
+    """Iterable that records how many items were pulled from it."""
+
+    def __init__(self, items):
+        self.items = items
+        self.pulled = 0
+
+    def __iter__(self):
+        for item in self.items:
+            self.pulled += 1
+            yield item
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HighWaterMarkStore(tmp_path / "marks.json")
+
+
+def test_first_crawl_yields_everything_and_sets_mark(store):
+    listing = [make_submission("c", 300), make_submission("b", 200), make_submission("a", 100)]
+
+    result = list(store.iter_unseen(listing, "SaaS", "new"))
+
+    assert [s.id for s in result] == ["c", "b", "a"]
+    mark = store.get("saas", "new")
+    assert mark.fullname == "t3_c"
+    assert mark.created_utc == 300
+
+
+def test_second_crawl_stops_at_seen_item(store):
+    store.update("SaaS", "new", "t3_b", 200)
+    listing = CountingListing(
+        [make_submission("d", 400), make_submission("c", 300), make_submission("b", 200),
+         make_submission("a", 100)]
+    )
+
+    result = list(store.iter_unseen(listing, "SaaS", "new"))
+
+    assert [s.id for s in result] == ["d", "c"]
+    assert listing.pulled == 3
+    assert store.get("SaaS", "new").fullname == "t3_d"
+    assert store.stats == {"yielded": 2, "stopped_early": 1}
+
+
+def test_stops_on_timestamp_when_marked_post_was_deleted(store):
+    store.update("SaaS", "new", "t3_gone", 250)
+    listing = [make_submission("c", 300), make_submission("b", 200)]
+
+    result = list(store.iter_unseen(listing, "SaaS", "new"))
+
+    assert [s.id for s in result] == ["c"]
+
+
+def test_ranking_listings_pass_through(store):
+    store.update("SaaS", "hot", "t3_b", 200)
+    listing = [make_submission("a", 100), make_submission("b", 200)]
+
+    result = list(store.iter_unseen(listing, "SaaS", "hot"))
+
+    assert [s.id for s in result] == ["a", "b"]
+    assert store.get("SaaS", "hot").fullname == "t3_b"
+
+
+def test_mark_not_advanced_until_listing_consumed(store):
+    listing = [make_submission("b", 200), make_submission("a", 100)]
+
+    iterator = store.iter_unseen(listing, "SaaS", "new")
+    next(iterator)
+
+    assert store.get("SaaS", "new") is None
+
+
+def test_update_never_moves_backwards(store):
+    assert store.update("SaaS", "new", "t3_b", 200) is True
+    assert store.update("SaaS", "new", "t3_a", 100) is False
+    assert store.get("SaaS", "new").fullname == "t3_b"
+
+
+def test_save_and_reload(tmp_path):
+    path = tmp_path / "state" / "marks.json"
+    store = HighWaterMarkStore(path)
+    store.update("SaaS", "new", "t3_b", 200)
+    store.save()
+
+    reloaded = HighWaterMarkStore(path)
+
+    assert reloaded.get("SaaS", "new").fullname == "t3_b"
+    assert json.loads(path.read_text())["saas:new"]["created_utc"] == 200
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    path = tmp_path / "marks.json"
+    path.write_text("not json")
+
+    store = HighWaterMarkStore(path)
+
+    assert store.get("SaaS", "new") is None
+
+
+def test_reset_by_subreddit(store):
+    store.update("SaaS", "new", "t3_b", 200)
+    store.update("startups", "new", "t3_x", 200)
+
+    store.reset("saas")
+
+    assert store.get("SaaS", "new") is None
+    assert store.get("startups", "new") is not None
+
+
+def test_reddit_api_fetcher_uses_marks(tmp_path):
+    store = HighWaterMarkStore(tmp_path / "marks.json")
+    store.update("SaaS", "new", "t3_b", 200)
+    client = MagicMock()
+    client.subreddit.return_value.new.return_value = [
+        make_submission("c", 300), make_submission("b", 200)
+    ]
+
+    fetcher = RedditAPIFetcher(client=client, config={"high_water_marks": store})
+    results = list(fetcher.fetch(limit=100, subreddit="SaaS"))
+
+    assert [r["submission_id"] for r in results] == ["c"]
+    assert store.get("SaaS", "new").fullname == "t3_c"
+    # Persisting is left to the caller, after the submissions are stored
+    assert HighWaterMarkStore(tmp_path / "marks.json").get("SaaS", "new") is None
+
+
+@pytest.mark.parametrize("stored, saved", [(True, "t3_c"), (False, "t3_b")])
+def test_pipeline_saves_marks_only_after_storing(tmp_path, stored, saved):
+    from core.pipeline import DataSource, OpportunityPipeline, PipelineConfig
+
+    store = HighWaterMarkStore(tmp_path / "marks.json")
+    store.update("SaaS", "new", "t3_b", 200)
+    store.save()
+    client = MagicMock()
+    client.subreddit.return_value.new.return_value = [make_submission("c", 300)]
+
+    with patch("core.pipeline.orchestrator.ServiceFactory") as factory_class:
+        factory_class.return_value.create_services.return_value = {}
+        pipeline = OpportunityPipeline(PipelineConfig(
+            data_source=DataSource.REDDIT_API,
+            reddit_client=client,
+            source_config={"high_water_marks": store},
+            enable_quality_filter=False,
+        ))
+    pipeline._enrich_submission_with_error_tracking = MagicMock(
+        side_effect=lambda submission: ({**submission, "final_score": 70}, 0)
+    )
+    pipeline._store_results = MagicMock(return_value=stored)
+    pipeline._update_concept_metadata = MagicMock()
+
+    pipeline.run(subreddit="SaaS")
+
+    assert HighWaterMarkStore(tmp_path / "marks.json").get("SaaS", "new").fullname == saved
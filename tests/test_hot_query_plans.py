@@ -0,0 +1,82 @@
+"""Tests for the EXPLAIN checks of the hot lookup indexes."""
+
+from scripts.database.check_hot_query_plans import (
+    MIGRATIONS,
+    build_checks,
+    iter_plan_nodes,
+    plan_problems,
+    submission_uuid,
+)
+
+INDEX_ONLY_PLAN = {
+    "Plan": {
+        "Node Type": "Nested Loop",
+        "Plans": [
+            {"Node Type": "Function Scan", "Function Name": "unnest"},
+            {
+                "Node Type": "Index Only Scan",
+                "Relation Name": "opportunities_unified",
+                "Index Name": "idx_opportunities_unified_submission_concept",
+            },
+        ],
+    }
+}
+BITMAP_PLAN = {
+    "Plan": {
+        "Node Type": "Bitmap Heap Scan",
+        "Relation Name": "comments",
+        "Plans": [
+            {"Node Type": "Bitmap Index Scan", "Index Name": "idx_comments_link_id"}
+        ],
+    }
+}
+SEQ_SCAN_PLAN = {
+    "Plan": {
+        "Node Type": "Hash Join",
+        "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "opportunities_unified"},
+            {
+                "Node Type": "Index Scan",
+                "Relation Name": "business_concepts",
+                "Index Name": "business_concepts_pkey",
+            },
+        ],
+    }
+}
+
+
+def test_iter_plan_nodes_walks_the_whole_tree():
+    node_types = [node["Node Type"] for node in iter_plan_nodes(INDEX_ONLY_PLAN)]
+
+    assert node_types == ["Nested Loop", "Function Scan", "Index Only Scan"]
+
+
+def test_expected_index_passes():
+    expected = "idx_opportunities_unified_submission_concept"
+
+    assert plan_problems(INDEX_ONLY_PLAN, expected, "opportunities_unified") == []
+    assert plan_problems(BITMAP_PLAN, "idx_comments_link_id", "comments") == []
+
+
+def test_seq_scan_and_missing_index_are_reported():
+    expected = "idx_opportunities_unified_submission_concept"
+
+    problems = plan_problems(SEQ_SCAN_PLAN, expected, "opportunities_unified")
+
+    assert problems == [
+        "idx_opportunities_unified_submission_concept not used "
+        "(indexes used: business_concepts_pkey)",
+        "sequential scan on opportunities_unified",
+    ]
+
+
+def test_checks_target_indexes_the_migration_creates_or_keeps():
+    migration = "".join(path.read_text() for path in MIGRATIONS)
+    checks = build_checks(1_000_000)
+
+    for check in checks:
+        assert check.expected_index in migration
+        assert all(len(param) == 50 for param in check.params)
+    metadata = checks[0]
+    assert metadata.params[0][0] == submission_uuid(1)
+    assert len(submission_uuid(1)) == 36
@@ -0,0 +1,119 @@
+"""Tests for HybridStore patch mode (per-service column write-back)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.pipeline import DataSource, OpportunityPipeline, PipelineConfig
+from core.storage import HybridStore
+from core.storage.content_hash import CONTENT_HASH_COLUMN
+
+
+def _client(updated_ids):
+    """Supabase mock whose patch_rows RPC reports updated_ids as existing."""
+    client = MagicMock()
+
+    def rpc(name, params):
+        ids = [row["submission_id"] for row in params["p_rows"]]
+        return MagicMock(
+            execute=MagicMock(return_value=MagicMock(data=[i for i in ids if i in updated_ids]))
+        )
+
+    client.rpc.side_effect = rpc
+    return client
+
+
+def _submission(submission_id, **extra):
+    return {
+        "submission_id": submission_id,
+        "problem_description": "Chores are hard to split",
+        "title": "Chore app",
+        "trust_score": 85.5,
+        "trust_level": "high",
+        "app_name": "ChoreMate",
+        **extra,
+    }
+
+
+def test_patch_sends_only_owned_columns_without_prefetch():
+    client = _client({"s1"})
+    loader = MagicMock()
+    store = HybridStore(loader=loader, supabase_client=client, patch_services=["trust"])
+
+    assert store.store([_submission("s1")]) is True
+
+    client.table.assert_not_called()  # no trust prefetch, no hash lookup
+    loader.load.assert_not_called()
+    opp_call, profile_call = (call.args for call in client.rpc.call_args_list)
+    assert opp_call[0] == "patch_rows"
+    assert opp_call[1]["p_table"] == "app_opportunities"
+    assert opp_call[1]["p_columns"] == [
+        "trust_score",
+        "trust_badge",
+        "activity_score",
+        "trust_level",
+        "trust_badges",
+        "analyzed_at",
+        "enrichment_version",
+        "pipeline_source",
+    ]
+    assert "app_name" not in opp_call[1]["p_rows"][0]
+    assert opp_call[1]["p_reset_columns"] == [CONTENT_HASH_COLUMN]
+    assert profile_call[1]["p_table"] == "submissions"
+    assert profile_call[1]["p_rows"] == [
+        {"submission_id": "s1", "trust_score": 85.5, "trust_level": "high"}
+    ]
+    assert store.get_statistics()["loaded"] == 1
+
+
+def test_new_rows_fall_back_to_merge_load():
+    loader = MagicMock()
+    loader.load.return_value = True
+    store = HybridStore(
+        loader=loader, supabase_client=_client({"s1"}), patch_services=["profiler", "trust"]
+    )
+
+    assert store.store([_submission("s1"), _submission("s2")]) is True
+
+    loaded = {call.kwargs["table_name"]: call.kwargs["data"] for call in loader.load.call_args_list}
+    assert [row["submission_id"] for row in loaded["app_opportunities"]] == ["s2"]
+    assert loaded["app_opportunities"][0]["app_name"] == "ChoreMate"
+    assert [row["submission_id"] for row in loaded["submissions"]] == ["s2"]
+
+
+def test_rpc_failure_falls_back_to_full_store():
+    client = MagicMock()
+    client.rpc.return_value.execute.side_effect = RuntimeError("function patch_rows does not exist")
+    client.table.return_value.select.return_value.in_.return_value.execute.return_value = (
+        MagicMock(data=[])
+    )
+    loader = MagicMock()
+    loader.load.return_value = True
+    store = HybridStore(loader=loader, supabase_client=client, patch_services=["trust"])
+
+    assert store.store([_submission("s1")]) is True
+
+    assert {call.kwargs["table_name"] for call in loader.load.call_args_list} == {
+        "app_opportunities",
+        "submissions",
+    }
+    assert store.patch_services == ["trust"]
+
+
+def test_unknown_service_is_rejected():
+    with pytest.raises(ValueError, match="Unknown enrichment services"):
+        HybridStore(loader=MagicMock(), patch_services=["sentiment"])
+
+
+def test_patch_write_mode_passes_enabled_services():
+    pipeline = OpportunityPipeline(
+        PipelineConfig(
+            data_source=DataSource.DATABASE,
+            supabase_client=MagicMock(),
+            storage_write_mode="patch",
+        )
+    )
+
+    store = pipeline._create_store()
+
+    assert store.patch_services == ["profiler", "opportunity", "monetization", "trust"]
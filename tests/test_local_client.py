@@ -0,0 +1,184 @@
+"""Tests for the embedded DuckDB stand-in for the Supabase client."""
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from core.deduplication import BusinessConceptManager
+from core.pipeline import DataSource, OpportunityPipeline, PipelineConfig
+from core.storage import DLTLoader, HybridStore, LocalAPIError, LocalSupabaseClient
+from core.storage.local_client import _split_sql_statements, _translate_statement
+
+
+@pytest.fixture
+def client():
+    local = LocalSupabaseClient()
+    yield local
+    local.close()
+
+
+def _concept(name, fingerprint, **extra):
+    return {"concept_name": name, "concept_fingerprint": fingerprint, **extra}
+
+
+def test_migrations_build_pipeline_tables(client):
+    columns = {
+        row["column_name"]
+        for row in client._fetch(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = 'business_concepts'"
+        )
+    }
+
+    assert {"id", "submission_count", "has_agno_analysis", "analysis_lease_holder"} <= columns
+    # Left for dlt, which cannot add NOT NULL columns to an existing DuckDB table
+    with pytest.raises(LocalAPIError):
+        client.table("submissions").select("*").execute()
+
+
+def test_translation_handles_postgres_only_syntax():
+    sql = """
+        -- comment; with a semicolon
+        CREATE TABLE IF NOT EXISTS things (
+          id BIGINT PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+          owner UUID REFERENCES owners(id) ON DELETE CASCADE,
+          meta JSONB DEFAULT '{}'::jsonb
+        );
+        CREATE FUNCTION f() RETURNS INT AS $$ BEGIN RETURN 1; END; $$ LANGUAGE plpgsql;
+        ALTER TABLE things ADD COLUMN IF NOT EXISTS a INT CHECK (a > (0)), ADD COLUMN IF NOT EXISTS b TEXT;
+    """
+    statements = _split_sql_statements(sql)
+    assert len(statements) == 3
+
+    create = _translate_statement(statements[0])
+    assert create[0] == "CREATE SEQUENCE IF NOT EXISTS things_id_seq"
+    assert "DEFAULT nextval('things_id_seq')" in create[1]
+    assert "REFERENCES" not in create[1] and "JSON DEFAULT '{}'::JSON" in create[1]
+    assert _translate_statement(statements[1]) == []
+    assert _translate_statement(statements[2]) == [
+        "ALTER TABLE things ADD COLUMN IF NOT EXISTS a INT",
+        "ALTER TABLE things ADD COLUMN IF NOT EXISTS b TEXT",
+    ]
+
+
+def test_insert_select_update_delete(client):
+    inserted = client.table("business_concepts").insert(
+        [_concept("Chores", "fp1", metadata={"tags": ["home"]}), _concept("Invoices", "fp2")]
+    ).execute().data
+    assert [row["id"] for row in inserted] == [1, 2]
+    assert inserted[0]["metadata"] == {"tags": ["home"]}
+
+    response = (
+        client.table("business_concepts")
+        .select("id, concept_name", count="exact")
+        .in_("id", [1, 2])
+        .order("id", desc=True)
+        .range(0, 0)
+        .execute()
+    )
+    assert response.data == [{"id": 2, "concept_name": "Invoices"}]
+    assert response.count == 2
+
+    updated = (
+        client.table("business_concepts").update({"has_agno_analysis": True}).eq("id", 1).execute()
+    )
+    assert updated.data[0]["has_agno_analysis"] is True
+    assert client.table("business_concepts").select("id").or_(
+        "has_agno_analysis.is.true,concept_fingerprint.eq.fp2"
+    ).order("id").execute().data == [{"id": 1}, {"id": 2}]
+
+    client.table("business_concepts").delete().eq("concept_fingerprint", "fp2").execute()
+    single = client.table("business_concepts").select("concept_name").eq("id", 1).single().execute()
+    assert single.data == {"concept_name": "Chores"}
+    with pytest.raises(LocalAPIError):
+        client.table("business_concepts").select("*").eq("id", 2).single().execute()
+
+
+def test_upsert_updates_only_given_columns(client):
+    client.table("business_concepts").insert(
+        _concept("Chores", "fp1", submission_count=5)
+    ).execute()
+
+    rows = client.table("business_concepts").upsert(
+        [_concept("Chore tracker", "fp1"), _concept("Invoices", "fp2")],
+        on_conflict="concept_fingerprint",
+    ).execute().data
+
+    stored = client.table("business_concepts").select(
+        "concept_fingerprint, concept_name, submission_count"
+    ).order("id").execute().data
+    assert len(rows) == 2
+    assert stored == [
+        {"concept_fingerprint": "fp1", "concept_name": "Chore tracker", "submission_count": 5},
+        {"concept_fingerprint": "fp2", "concept_name": "Invoices", "submission_count": 1},
+    ]
+
+
+def test_pipeline_rpcs_run_locally(client):
+    manager = BusinessConceptManager(client)
+    concept_id = client.table("business_concepts").insert(
+        _concept("Chore tracker", "fp1")
+    ).execute().data[0]["id"]
+
+    assert manager.increment_submission_counts([concept_id, concept_id]) is True
+    assert manager.acquire_analysis_lease(concept_id, "worker-1") is True
+    assert manager.acquire_analysis_lease(concept_id, "worker-2") is False
+    assert manager.release_analysis_lease(concept_id, "worker-1") is True
+    client.table("business_concepts").update({"has_agno_analysis": True}).eq(
+        "id", concept_id
+    ).execute()
+    assert manager.acquire_analysis_lease(concept_id, "worker-2") is False
+    assert manager.acquire_analysis_lease(concept_id, "worker-2", require_agno=False) is True
+    assert client.table("business_concepts").select("submission_count").eq(
+        "id", concept_id
+    ).execute().data == [{"submission_count": 3}]
+    with pytest.raises(LocalAPIError):
+        client.rpc("patch_rows", {}).execute()
+
+
+def test_hybrid_store_round_trip_through_dsn(tmp_path):
+    client = LocalSupabaseClient(tmp_path / "local.duckdb")
+    loader = DLTLoader(connection_string=client.dsn, pipelines_dir=str(tmp_path))
+    store = HybridStore(loader=loader, supabase_client=client)
+    rows = [
+        {
+            "submission_id": f"s{i}",
+            "title": f"Post {i}",
+            "problem_description": "Chores are hard to split",
+            "opportunity_score": 50.0 + i,
+            "trust_score": 80.0,
+            "ai_profile": {"app_name": "ChoreMate"},
+        }
+        for i in range(3)
+    ]
+
+    assert loader.destination == "duckdb"
+    assert store.store(rows) is True
+    assert store.store(rows) is True  # unchanged rows are skipped
+
+    opportunities = client.table("app_opportunities").select(
+        "submission_id, ai_profile"
+    ).order("submission_id").execute().data
+    assert [row["submission_id"] for row in opportunities] == ["s0", "s1", "s2"]
+    assert opportunities[0]["ai_profile"] == {"app_name": "ChoreMate"}
+    assert client.table("submissions").select("title").eq("submission_id", "s1").execute().data == [
+        {"title": "Post 1"}
+    ]
+    assert store.get_statistics()["unchanged"] == 6
+    client.close()
+
+
+def test_pipeline_storage_dsn_selects_local_loader(tmp_path):
+    dsn = f"duckdb:///{tmp_path / 'local.duckdb'}"
+    pipeline = OpportunityPipeline(
+        PipelineConfig(
+            data_source=DataSource.DATABASE,
+            supabase_client=LocalSupabaseClient(),
+            storage_dsn=dsn,
+        )
+    )
+
+    store = pipeline._create_store()
+
+    assert store.loader.destination == "duckdb"
+    assert store.loader.connection_string == dsn
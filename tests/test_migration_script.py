@@ -32,6 +32,13 @@ from scripts.deduplication.migrate_existing_opportunities import (
 class TestMigrationScript:
     """Test the MigrationScript class functionality."""
 
+    def test_script_uses_package_deduplicator(self):
+        """The script imports SimpleDeduplicator from the core.deduplication package."""
+        from core.deduplication import SimpleDeduplicator
+        from scripts.deduplication import migrate_existing_opportunities
+
+        assert migrate_existing_opportunities.SimpleDeduplicator is SimpleDeduplicator
+
     def test_init_with_valid_config(self):
         """Test script initialization with valid configuration."""
         with patch('scripts.deduplication.migrate_existing_opportunities.SimpleDeduplicator') as mock_dedup:
@@ -142,7 +149,7 @@ class TestMigrationScript:
                 mock_dedup.return_value = mock_dedup_instance
 
                 # Mock deduplication results
-                mock_dedup_instance.process_opportunity.side_effect = [
+                mock_dedup_instance.process_opportunities.return_value = [
                     {
                         'success': True,
                         'is_duplicate': False,
@@ -193,8 +200,11 @@ class TestMigrationScript:
                 assert script.statistics['duplicates_found'] == 1
                 assert script.statistics['errors'] == 0
 
+                # Both opportunities went through one batch call
+                mock_dedup_instance.process_opportunities.assert_called_once_with(opportunities)
+
                 # Verify progress was printed
-                assert mock_print.call_count >= 2  # Should print progress for each opportunity
+                assert mock_print.call_count >= 2
 
     def test_process_opportunities_with_errors(self):
         """Test processing opportunities with some errors."""
@@ -208,20 +218,22 @@ class TestMigrationScript:
                 mock_dedup_instance = MagicMock()
                 mock_dedup.return_value = mock_dedup_instance
 
-                mock_dedup_instance.process_opportunity.side_effect = [
-                    {
-                        'success': True,
-                        'is_duplicate': False,
-                        'concept_id': 1,
-                        'opportunity_id': 'opp1',
-                        'message': 'Success'
-                    },
-                    {
-                        'success': False,
-                        'error': 'Missing app_concept field',
-                        'opportunity_id': 'opp2',
-                        'message': 'Processing failed: missing app concept'
-                    },
+                mock_dedup_instance.process_opportunities.side_effect = [
+                    [
+                        {
+                            'success': True,
+                            'is_duplicate': False,
+                            'concept_id': 1,
+                            'opportunity_id': 'opp1',
+                            'message': 'Success'
+                        },
+                        {
+                            'success': False,
+                            'error': 'Missing app_concept field',
+                            'opportunity_id': 'opp2',
+                            'message': 'Processing failed: missing app concept'
+                        },
+                    ],
                     Exception("Unexpected error")
                 ]
 
@@ -236,12 +248,13 @@ class TestMigrationScript:
                     supabase_key="test-key"
                 )
 
-                # Process opportunities
+                # Process opportunities; the second batch raises
                 with patch('builtins.print'):
-                    results = script.process_opportunities(opportunities)
+                    results = script.process_opportunities(opportunities, batch_size=2)
 
                 # Verify results
                 assert len(results) == 3
+                assert results[2]['opportunity_id'] == 'opp3'
                 assert results[0]['success'] is True
                 assert results[1]['success'] is False
                 assert results[2]['success'] is False
@@ -353,14 +366,17 @@ class TestMigrationScript:
                 mock_dedup_instance = MagicMock()
                 mock_dedup.return_value = mock_dedup_instance
 
-                # Mock successful processing
-                mock_dedup_instance.process_opportunity.return_value = {
-                    'success': True,
-                    'is_duplicate': False,
-                    'concept_id': 1,
-                    'opportunity_id': 'opp1',
-                    'message': 'Success'
-                }
+                # Mock successful processing of each batch
+                mock_dedup_instance.process_opportunities.side_effect = lambda batch: [
+                    {
+                        'success': True,
+                        'is_duplicate': False,
+                        'concept_id': 1,
+                        'opportunity_id': opp['id'],
+                        'message': 'Success'
+                    }
+                    for opp in batch
+                ]
 
                 # Create 205 opportunities
                 opportunities = [
@@ -382,8 +398,9 @@ class TestMigrationScript:
                     if 'Progress:' in str(call) and '/' in str(call)
                 ]
 
-                # Should have progress updates at 100 and 200
+                # Should have progress updates after each batch of 100
                 assert len(progress_calls) >= 2
+                assert mock_dedup_instance.process_opportunities.call_count == 3
                 # Check that progress calls contain the expected numbers
                 progress_text = ' '.join(str(call) for call in progress_calls)
                 assert '100/205' in progress_text
@@ -434,28 +451,29 @@ class TestMainFunction:
                         mock_args.output_file = 'test_results.json'
                         mock_args.batch_size = 100
                         mock_args.verbose = False
+                        mock_args.dry_run = False
                         mock_parse.return_value = mock_args
 
-                    # Setup mock script instance
-                    mock_script = MagicMock()
-                    mock_script_class.return_value = mock_script
-                    mock_script.fetch_opportunities_without_concept_id.return_value = [
-                        {'id': 'opp1', 'app_concept': 'test idea'}
-                    ]
-                    mock_script.process_opportunities.return_value = [{'success': True}]
+                        # Setup mock script instance
+                        mock_script = MagicMock()
+                        mock_script_class.return_value = mock_script
+                        mock_script.fetch_opportunities_without_concept_id.return_value = [
+                            {'id': 'opp1', 'app_concept': 'test idea'}
+                        ]
+                        mock_script.process_opportunities.return_value = [{'success': True}]
 
-                    # Run main
-                    with patch('builtins.print'):
-                        main()
+                        # Run main
+                        with patch('builtins.print'):
+                            main()
 
-                    # Verify script was called correctly
-                    mock_script_class.assert_called_once_with(
-                        supabase_url='http://test-url',
-                        supabase_key='test-key'
-                    )
-                    mock_script.fetch_opportunities_without_concept_id.assert_called_once()
-                    mock_script.process_opportunities.assert_called_once()
-                    mock_script.save_results_to_json.assert_called_once()
+                        # Verify script was called correctly
+                        mock_script_class.assert_called_once_with(
+                            supabase_url='http://test-url',
+                            supabase_key='test-key'
+                        )
+                        mock_script.fetch_opportunities_without_concept_id.assert_called_once()
+                        mock_script.process_opportunities.assert_called_once()
+                        mock_script.save_results_to_json.assert_called_once()
 
     def test_main_missing_config(self):
         """Test main function with missing configuration."""
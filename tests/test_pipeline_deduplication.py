@@ -13,8 +13,16 @@ from core.pipeline import DataSource, OpportunityPipeline, PipelineConfig
 
 @pytest.fixture
 def mock_supabase():
-    """Create a mock Supabase client."""
+    """Create a mock Supabase client without the get_concept_metadata function."""
     client = MagicMock()
+    rpc = client.rpc
+
+    def call_rpc(name, params=None):
+        if name == "get_concept_metadata":
+            raise Exception("function get_concept_metadata does not exist")
+        return rpc.return_value
+
+    rpc.side_effect = call_rpc
     return client
 
 
@@ -105,6 +113,41 @@ class TestBatchFetchConceptMetadata:
         assert metadata["sub_002"]["has_agno"] is False
         assert metadata["sub_002"]["has_profiler"] is True
 
+    def test_batch_fetch_uses_concept_metadata_function(self, sample_submissions):
+        """Test batch fetch reads everything with one RPC call when available."""
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = MagicMock(
+            data=[
+                {
+                    "submission_id": "sub_001",
+                    "concept_id": 123,
+                    "has_agno_analysis": True,
+                    "has_profiler_analysis": False,
+                    "primary_agno_analysis_id": "lma_1",
+                    "primary_profiler_analysis_id": None,
+                }
+            ]
+        )
+        pipeline = OpportunityPipeline(
+            PipelineConfig(data_source=DataSource.DATABASE, supabase_client=client)
+        )
+
+        metadata = pipeline._batch_fetch_concept_metadata(sample_submissions)
+
+        assert metadata == {
+            "sub_001": {
+                "concept_id": 123,
+                "has_agno": True,
+                "has_profiler": False,
+                "primary_agno_analysis_id": "lma_1",
+                "primary_profiler_analysis_id": None,
+            }
+        }
+        client.rpc.assert_called_once_with(
+            "get_concept_metadata", {"p_submission_ids": ["sub_001", "sub_002"]}
+        )
+        client.table.assert_not_called()
+
     def test_batch_fetch_with_no_concepts(self, basic_config, sample_submissions):
         """Test batch fetch when no concepts exist."""
         pipeline = OpportunityPipeline(basic_config)
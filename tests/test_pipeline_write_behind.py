@@ -0,0 +1,91 @@
+"""Tests for OpportunityPipeline write-behind storage."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.pipeline import DataSource, OpportunityPipeline, PipelineConfig
+
+SUBMISSIONS = [{"submission_id": f"s{i}", "title": f"Post {i}"} for i in range(5)]
+
+
+@pytest.fixture
+def run_pipeline():
+    def run(store_results=None, **config_overrides):
+        events = []
+        first_store = threading.Event()
+        if config_overrides.get("dry_run"):
+            first_store.set()  # Nothing will be stored
+        store = MagicMock()
+        store.get_statistics.return_value = {"loaded": 0, "failed": 0}
+
+        def store_batch(batch):
+            events.append(("store", [r["submission_id"] for r in batch]))
+            first_store.set()
+            return store_results.pop(0) if store_results else True
+
+        store.store.side_effect = store_batch
+
+        def enrich(submission):
+            if submission["submission_id"] == "s4":
+                # Enrichment is still running when the first batch is written
+                first_store.wait(timeout=2)
+            events.append(("enrich", submission["submission_id"]))
+            return {**submission, "final_score": 70}, 0
+
+        config = PipelineConfig(
+            data_source=DataSource.DATABASE,
+            supabase_client=MagicMock(),
+            enable_trust=False,
+            enable_profiler=False,
+            storage_write_behind=True,
+            storage_batch_size=2,
+            storage_flush_interval=60,
+            **config_overrides,
+        )
+        with patch("core.fetchers.database_fetcher.DatabaseFetcher") as fetcher_class, patch(
+            "core.pipeline.orchestrator.ServiceFactory"
+        ) as factory_class, patch(
+            "core.pipeline.orchestrator.OpportunityStore", return_value=store
+        ):
+            fetcher_class.return_value.fetch.return_value = iter(SUBMISSIONS)
+            factory_class.return_value.create_services.return_value = {}
+            pipeline = OpportunityPipeline(config)
+            pipeline._batch_fetch_concept_metadata = MagicMock(return_value={})
+            pipeline._enrich_submission_with_error_tracking = MagicMock(side_effect=enrich)
+            pipeline._update_concept_metadata = MagicMock()
+            result = pipeline.run()
+        return pipeline, result, store, events
+
+    return run
+
+
+def test_results_are_stored_in_batches_while_enriching(run_pipeline):
+    pipeline, result, store, events = run_pipeline()
+
+    stored_batches = [ids for kind, ids in events if kind == "store"]
+    assert stored_batches == [["s0", "s1"], ["s2", "s3"], ["s4"]]
+    first_store = events.index(("store", ["s0", "s1"]))
+    assert first_store < events.index(("enrich", "s4"))
+    assert result["stats"]["stored"] == 5
+    stored = pipeline._update_concept_metadata.call_args.args[0]
+    assert [r["submission_id"] for r in stored] == ["s0", "s1", "s2", "s3", "s4"]
+    assert pipeline._storage_sink is None
+
+
+def test_failed_batch_is_not_counted_as_stored(run_pipeline):
+    pipeline, result, _, _ = run_pipeline(store_results=[True, False, True])
+
+    assert result["success"] is True
+    assert result["stats"]["stored"] == 3
+    stored = pipeline._update_concept_metadata.call_args.args[0]
+    assert [r["submission_id"] for r in stored] == ["s0", "s1", "s4"]
+
+
+def test_dry_run_does_not_open_a_sink(run_pipeline):
+    _, result, store, events = run_pipeline(dry_run=True)
+
+    store.store.assert_not_called()
+    assert not [event for event in events if event[0] == "store"]
+    assert result["stats"]["stored"] == 0
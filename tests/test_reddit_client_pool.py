@@ -0,0 +1,87 @@
+"""Tests for the multi-credential Reddit client pool."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.fetchers.reddit_api_fetcher import RedditAPIFetcher
+from core.utils.reddit_client_pool import (
+    RateLimitedRequestor,
+    RedditClientPool,
+    RedditCredential,
+    load_reddit_credentials,
+)
+
+
+def make_pool(count: int, requests_per_minute: int = 10) -> RedditClientPool:
+    credentials = [RedditCredential(f"id{i}", f"secret{i}", "ua") for i in range(count)]
+    return RedditClientPool(
+        credentials,
+        requests_per_minute=requests_per_minute,
+        client_factory=lambda credential, limiter: MagicMock(name=credential.client_id),
+    )
+
+
+def test_load_reddit_credentials_reads_numbered_pairs():
+    environ = {
+        "REDDIT_PUBLIC": "a", "REDDIT_SECRET": "b", "REDDIT_USER_AGENT": "ua",
+        "REDDIT_PUBLIC_2": "c", "REDDIT_SECRET_2": "d", "REDDIT_USER_AGENT_2": "ua2",
+        "REDDIT_PUBLIC_4": "skipped", "REDDIT_SECRET_4": "skipped",
+    }
+
+    credentials = load_reddit_credentials(environ)
+
+    assert credentials == [
+        RedditCredential("a", "b", "ua"),
+        RedditCredential("c", "d", "ua2"),
+    ]
+
+
+def test_pool_requires_credentials():
+    with pytest.raises(ValueError):
+        RedditClientPool([])
+
+
+def test_lookups_spread_round_robin_when_budgets_equal():
+    pool = make_pool(3)
+
+    clients = [pool.client() for _ in range(6)]
+
+    assert [c._extract_mock_name() for c in clients] == ["id0", "id1", "id2"] * 2
+    assert pool.requests_per_minute == 30
+
+
+def test_lookup_goes_to_credential_with_most_remaining_budget():
+    pool = make_pool(2)
+    pool.members[0].rate_limiter.acquire(cost=1)
+    pool.members[1].rate_limiter.acquire(cost=5)
+
+    pool.subreddit("SaaS")
+
+    pool.members[0].client.subreddit.assert_called_once_with("SaaS")
+    pool.members[1].client.subreddit.assert_not_called()
+    assert [s["assignments"] for s in pool.get_statistics()] == [1, 0]
+
+
+def test_created_clients_charge_their_own_limiter():
+    pool = RedditClientPool([RedditCredential("a", "b", "ua"), RedditCredential("c", "d", "ua")])
+
+    requestors = [member.client._core.requestor for member in pool.members]
+
+    assert all(isinstance(r, RateLimitedRequestor) for r in requestors)
+    assert requestors[0].rate_limiter is pool.members[0].rate_limiter
+    assert requestors[1].rate_limiter is pool.members[1].rate_limiter
+
+
+def test_reddit_api_fetcher_accepts_pool():
+    pool = make_pool(2)
+    submission = MagicMock(id="abc", title="Invoicing problem", selftext="so frustrating",
+                           score=1, num_comments=0, url="u", created_utc=1704067200)
+    for member in pool.members:
+        member.client.subreddit.return_value.new.return_value = [submission]
+
+    fetcher = RedditAPIFetcher(client=pool)
+    results = list(fetcher.fetch(limit=10, subreddits=["SaaS", "startups"]))
+
+    assert len(results) == 2
+    assert all(member.assignments == 1 for member in pool.members)
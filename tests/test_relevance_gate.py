@@ -0,0 +1,150 @@
+"""Tests for the learned pre-AI relevance gate."""
+
+import random
+
+import numpy as np
+import pytest
+
+from core.quality_filters.pre_filter import filter_submissions_batch, get_filter_stats
+from core.quality_filters.relevance_gate import (
+    RelevanceGate,
+    apply_relevance_gate,
+    choose_decision_threshold,
+    extract_features,
+    labels_from_scores,
+    roc_auc,
+)
+
+RELEVANT_PHRASES = [
+    "we pay for three tools and still export invoices by hand",
+    "our clinic needs to automate appointment reminders",
+    "would pay for a tool that reconciles payroll",
+]
+NOISE_PHRASES = [
+    "this meme is so funny lol",
+    "what is your favorite pizza topping",
+    "just finished my first marathon",
+]
+
+
+def _exported_rows(count: int, seed: int = 3) -> list[dict]:
+    """Rows shaped like an app_opportunities export with final_score."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        relevant = rng.random() < 0.3
+        phrase = rng.choice(RELEVANT_PHRASES if relevant else NOISE_PHRASES)
+        rows.append({
+            "title": f"Post {i}: this is a problem",
+            "content": f"{phrase}. It is frustrating.",
+            "score": rng.randint(5, 300),
+            "num_comments": rng.randint(1, 80),
+            "subreddit": rng.choice(["smallbusiness", "SaaS", "funny"]),
+            "final_score": rng.uniform(55, 90) if relevant else rng.uniform(5, 35),
+        })
+    return rows
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return _exported_rows(600)
+
+
+@pytest.fixture(scope="module")
+def gate(rows):
+    # The synthetic classes separate cleanly, so no relevant post needs to be dropped
+    return RelevanceGate.train(
+        rows, labels_from_scores(rows), n_features=2**12, epochs=150, target_recall=1.0
+    )
+
+
+def test_features_are_stable_and_normalized():
+    post = {"title": "Invoice problem", "text": "Manual invoice work", "score": 10}
+
+    indices, values = extract_features(post, n_features=1024)
+    again, _ = extract_features(dict(post), n_features=1024)
+
+    assert np.array_equal(indices, again)
+    assert indices[:-4].max() < 1024
+    assert np.isclose(np.linalg.norm(values[:-4]), 1.0)
+
+
+def test_labels_from_scores_handles_missing_values():
+    labels = labels_from_scores(
+        [{"final_score": 75}, {"final_score": "20.5"}, {"final_score": None}, {}]
+    )
+    assert labels.tolist() == [True, False, False, False]
+
+
+def test_roc_auc_and_threshold():
+    labels = np.array([False, False, True, True])
+
+    assert roc_auc(labels, np.array([0.1, 0.4, 0.35, 0.8])) == 0.75
+    assert roc_auc(labels, np.array([0.5, 0.5, 0.5, 0.5])) == 0.5
+    # Keep every positive at recall 1.0, drop the lower one at recall 0.5
+    probs = np.array([0.1, 0.4, 0.35, 0.8])
+    assert choose_decision_threshold(labels, probs, target_recall=1.0) == 0.35
+    assert choose_decision_threshold(labels, probs, target_recall=0.5) == 0.8
+
+
+def test_training_separates_relevant_posts(gate):
+    evaluation = gate.metadata["evaluation"]
+
+    assert evaluation["auc"] > 0.95
+    assert evaluation["recall"] >= 0.95
+    assert evaluation["skip_rate"] > 0.4
+    assert evaluation["wasted_calls_after"] < evaluation["wasted_calls_before"]
+
+
+def test_training_requires_both_classes(rows):
+    with pytest.raises(ValueError, match="both"):
+        RelevanceGate.train(rows, np.ones(len(rows), dtype=bool), n_features=256)
+
+
+def test_training_evaluates_on_a_separate_test_split(gate, rows):
+    assert gate.metadata["validation_rows"] == gate.metadata["test_rows"] == 120
+    assert gate.metadata["train_rows"] == 360
+    assert gate.metadata["evaluation"]["posts"] == gate.metadata["test_rows"]
+
+
+def test_training_requires_relevant_held_out_posts(rows):
+    labels = np.zeros(len(rows), dtype=bool)
+    labels[:3] = True
+
+    with pytest.raises(ValueError, match="split has no relevant posts"):
+        RelevanceGate.train(rows, labels, n_features=256, validation_fraction=0.01)
+
+
+def test_save_load_round_trip(gate, rows, tmp_path):
+    path = tmp_path / "models" / "gate.npz"
+    gate.save(path)
+
+    loaded = RelevanceGate.load(path)
+
+    assert loaded.decision_threshold == gate.decision_threshold
+    assert loaded.metadata["evaluation"] == gate.metadata["evaluation"]
+    assert np.array_equal(loaded.predict_proba(rows[:50]), gate.predict_proba(rows[:50]))
+
+
+def test_gate_as_quality_filter_stage(gate):
+    posts = [
+        {**row, "created_utc": 1_760_000_000.0}
+        for row in _exported_rows(40, seed=11)
+    ]
+
+    heuristic_passed, _ = filter_submissions_batch(posts)
+    passed, filtered = filter_submissions_batch(posts, relevance_gate=gate)
+
+    assert len(passed) < len(heuristic_passed)
+    assert all(p["relevance_probability"] >= gate.decision_threshold for p in passed)
+    # The threshold was calibrated on other posts, so a borderline relevant
+    # post may fall just below it
+    assert sum(p["final_score"] >= 40 for p in passed) >= 0.9 * sum(
+        p["final_score"] >= 40 for p in heuristic_passed
+    )
+    assert all(p["final_score"] >= 40 for p in passed)
+    assert "Predicted low relevance" in get_filter_stats(filtered)
+
+
+def test_apply_relevance_gate_empty(gate):
+    assert apply_relevance_gate([], gate) == ([], [])
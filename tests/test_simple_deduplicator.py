@@ -30,7 +30,7 @@ class TestSimpleDeduplicatorInit:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client') as mock_create_client:
+        with patch('core.deduplication.simple_deduplicator.create_client') as mock_create_client:
             mock_client = Mock()
             mock_create_client.return_value = mock_client
 
@@ -50,7 +50,7 @@ class TestSimpleDeduplicatorInit:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client') as mock_create_client:
+        with patch('core.deduplication.simple_deduplicator.create_client') as mock_create_client:
             mock_client = Mock()
             mock_create_client.return_value = mock_client
 
@@ -68,7 +68,7 @@ class TestNormalizeConcept:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             result = deduplicator.normalize_concept("FITNESS TRACKING APP")
@@ -79,7 +79,7 @@ class TestNormalizeConcept:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             result = deduplicator.normalize_concept("  Mobile   App:   FitnessFAQ   ")
@@ -90,7 +90,7 @@ class TestNormalizeConcept:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Test various prefixes
@@ -116,7 +116,7 @@ class TestNormalizeConcept:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             assert deduplicator.normalize_concept("") == ""
@@ -128,7 +128,7 @@ class TestNormalizeConcept:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             concept1 = "FitnessFAQ App for Tracking Workouts"
@@ -150,7 +150,7 @@ class TestGenerateFingerprint:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             concept = "fitness tracking app"
@@ -169,7 +169,7 @@ class TestGenerateFingerprint:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             concept1 = "FitnessFAQ App for Tracking Workouts"
@@ -185,7 +185,7 @@ class TestGenerateFingerprint:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             concept1 = "fitness tracking app"
@@ -201,7 +201,7 @@ class TestGenerateFingerprint:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             fp_empty = deduplicator.generate_fingerprint("")
@@ -220,7 +220,7 @@ class TestIntegration:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             # Test with a realistic Reddit-sourced app concept
@@ -248,7 +248,7 @@ class TestErrorHandling:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client') as mock_create_client:
+        with patch('core.deduplication.simple_deduplicator.create_client') as mock_create_client:
             mock_create_client.side_effect = Exception("Supabase connection failed")
 
             # The implementation should propagate the exception
@@ -260,7 +260,7 @@ class TestErrorHandling:
         if SimpleDeduplicator is None:
             pytest.skip("SimpleDeduplicator not implemented yet")
 
-        with patch('core.deduplication.create_client'):
+        with patch('core.deduplication.simple_deduplicator.create_client'):
             deduplicator = SimpleDeduplicator("test_url", "test_key")
 
             concept = "Fitnéss-Tracker! 🏃‍♂️ App for Workout$"